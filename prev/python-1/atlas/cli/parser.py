@@ -153,6 +153,12 @@ def add_cli_args(parser: argparse.ArgumentParser) -> None:
         help="Directory containing documents to ingest",
     )
 
+    parser.add_argument(
+        "--archive",
+        type=str,
+        help="Tar or zip archive of documents to ingest without extracting it",
+    )
+
     parser.add_argument(
         "--collection",
         type=str,
@@ -177,7 +183,7 @@ def add_cli_args(parser: argparse.ArgumentParser) -> None:
         "--embedding",
         type=str,
         default="default",
-        help="Embedding strategy for document ingestion",
+        help="Embedding strategy for document ingestion (default, anthropic or hashing)",
     )
 
     parser.add_argument(
@@ -186,6 +192,62 @@ def add_cli_args(parser: argparse.ArgumentParser) -> None:
         help="Disable deduplication during ingestion",
     )
 
+    parser.add_argument(
+        "--include",
+        type=str,
+        action="append",
+        help="Gitignore-style pattern of files to ingest (repeatable, default: markdown)",
+    )
+
+    parser.add_argument(
+        "--exclude",
+        type=str,
+        action="append",
+        help="Gitignore-style pattern of files to skip during ingestion (repeatable)",
+    )
+
+    parser.add_argument(
+        "--near-duplicates",
+        type=int,
+        metavar="BITS",
+        help="Detect near-duplicate chunks within this many differing SimHash bits (e.g. 3)",
+    )
+
+    parser.add_argument(
+        "--duplicate-action",
+        type=str,
+        choices=["reuse", "drop"],
+        default="reuse",
+        help="Reuse the original's embedding for duplicate chunks or drop them",
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted ingestion from its last checkpoint",
+    )
+
+    parser.add_argument(
+        "--chunk-tokens",
+        type=int,
+        metavar="TOKENS",
+        help="Size chunks by token budget instead of characters (e.g. 512)",
+    )
+
+    parser.add_argument(
+        "--token-estimator",
+        type=str,
+        choices=["auto", "tiktoken", "heuristic"],
+        default="auto",
+        help="Token estimator used with --chunk-tokens (auto uses tiktoken if installed)",
+    )
+
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Print ingestion metrics as JSON when ingestion finishes",
+    )
+
     # Controller and worker mode args
     parser.add_argument(
         "--experimental",
@@ -14,7 +14,7 @@ from dataclasses import dataclass
 from functools import wraps
 from typing import Any, TypeVar, cast
 
-from atlas.core.errors import APIError, RateLimitError
+from atlas.core.errors import APIError, AtlasError, RateLimitError
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +120,8 @@ def is_retryable_error(error: Exception, config: RetryConfig, retry_count: int)
     # Check if the error explicitly indicates it's retryable
     if hasattr(error, "retry_possible") and error.retry_possible:
         return True
+    if isinstance(error, AtlasError) and error.details.get("retry_possible"):
+        return True
 
     # Check if it's an APIError with a status code we should retry
     if isinstance(error, APIError) and hasattr(error, "details"):
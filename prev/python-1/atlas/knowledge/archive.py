@@ -0,0 +1,223 @@
+"""
+Archive sources for the Atlas knowledge system.
+
+This module streams the members of tar and zip archives so they can be chunked straight
+from the archive, without extracting them to disk first. Tar archives are read in
+streaming mode, so even compressed multi-gigabyte bundles are decompressed in a single
+forward pass and members that are skipped are never buffered.
+
+Members are identified by virtual paths of the form ``<archive>!/<member>``, which the
+ingestion manifest tracks like regular file paths.
+"""
+
+import functools
+import posixpath
+import tarfile
+import zipfile
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import IO
+
+from atlas.core import logging
+from atlas.knowledge.reader import FileContent, read_stream
+
+logger = logging.get_logger(__name__)
+
+# Separator between the archive path and the member name in virtual member paths
+ARCHIVE_SEPARATOR = "!/"
+
+# Archive extensions by format
+TAR_EXTENSIONS = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+ZIP_EXTENSIONS = (".zip",)
+ARCHIVE_EXTENSIONS = TAR_EXTENSIONS + ZIP_EXTENSIONS
+
+# Errors raised while reading a damaged or unsupported archive
+ARCHIVE_ERRORS = (OSError, EOFError, tarfile.TarError, zipfile.BadZipFile)
+
+
+def is_archive(path: str) -> bool:
+    """Check whether a path names a supported archive.
+
+    Args:
+        path: The path to check.
+
+    Returns:
+        True if the path has a tar or zip extension, False otherwise.
+    """
+    return path.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def member_path(archive_path: str, name: str) -> str:
+    """Build the virtual path of an archive member.
+
+    Args:
+        archive_path: Path to the archive.
+        name: Normalized name of the member inside the archive.
+
+    Returns:
+        The virtual path of the member.
+    """
+    return f"{archive_path}{ARCHIVE_SEPARATOR}{name}"
+
+
+def normalize_member_name(name: str) -> str | None:
+    """Normalize the name of an archive member into a relative POSIX path.
+
+    Args:
+        name: The member name as stored in the archive.
+
+    Returns:
+        The normalized name, or None if the name points outside the archive root.
+    """
+    normalized = posixpath.normpath(name.replace("\\", "/").lstrip("/"))
+    if normalized in (".", "..") or normalized.startswith("../"):
+        return None
+    return normalized
+
+
+@dataclass
+class ArchiveMember:
+    """A regular file inside an archive.
+
+    The contents of a member can only be read while the archive is positioned at it,
+    that is before the reader yields the next member.
+    """
+
+    name: str  # Normalized path of the member inside the archive
+    path: str  # Virtual path of the member, used as its manifest key
+    size: int  # Uncompressed size in bytes
+    mtime_ns: int  # Modification time recorded in the archive, in nanoseconds
+    _open: Callable[[], IO[bytes]] = field(repr=False, compare=False)
+
+    def read(self) -> FileContent:
+        """Hash and decode the member contents in a single pass.
+
+        Returns:
+            The decoded contents and their hash.
+
+        Raises:
+            OSError: If the member cannot be read.
+            UnicodeDecodeError: If the member is not valid UTF-8.
+        """
+        with self._open() as stream:
+            return read_stream(stream)
+
+
+class ArchiveReader:
+    """Iterates over the regular files of a tar or zip archive."""
+
+    def __init__(self, archive_path: str):
+        """Initialize the reader.
+
+        Args:
+            archive_path: Path to the archive.
+
+        Raises:
+            ValueError: If the path does not name a supported archive.
+        """
+        if not is_archive(archive_path):
+            raise ValueError(
+                f"Unsupported archive '{archive_path}', "
+                f"expected one of: {', '.join(ARCHIVE_EXTENSIONS)}"
+            )
+        self.archive_path = archive_path
+
+    def __iter__(self) -> Iterator[ArchiveMember]:
+        """Yield the regular files of the archive in archive order.
+
+        Directories, links and members whose names point outside the archive root are
+        skipped.
+
+        Yields:
+            The archive members.
+
+        Raises:
+            OSError: If the archive cannot be opened or read.
+            tarfile.TarError: If a tar archive is damaged.
+            zipfile.BadZipFile: If a zip archive is damaged.
+        """
+        if self.archive_path.lower().endswith(ZIP_EXTENSIONS):
+            yield from self._iter_zip()
+        else:
+            yield from self._iter_tar()
+
+    def _iter_tar(self) -> Iterator[ArchiveMember]:
+        """Stream the regular files of a possibly compressed tar archive.
+
+        Yields:
+            The archive members.
+        """
+        # Streaming mode never seeks, so the data of skipped members is read past once
+        with tarfile.open(self.archive_path, mode="r|*") as tar:
+            for info in tar:
+                if not info.isfile():
+                    continue
+                name = self._checked_name(info.name)
+                if name is None:
+                    continue
+
+                yield ArchiveMember(
+                    name=name,
+                    path=member_path(self.archive_path, name),
+                    size=info.size,
+                    mtime_ns=round(info.mtime * 1_000_000_000),
+                    _open=functools.partial(self._open_tar_member, tar, info),
+                )
+
+    @staticmethod
+    def _open_tar_member(tar: tarfile.TarFile, info: tarfile.TarInfo) -> IO[bytes]:
+        """Open the data of a regular file in a tar archive.
+
+        Args:
+            tar: The tar archive, positioned at the member.
+            info: The member to open.
+
+        Returns:
+            A binary stream of the member contents.
+
+        Raises:
+            OSError: If the archive has no data for the member.
+        """
+        stream = tar.extractfile(info)
+        if stream is None:
+            raise OSError(f"No data for archive member '{info.name}'")
+        return stream
+
+    def _iter_zip(self) -> Iterator[ArchiveMember]:
+        """Iterate over the regular files of a zip archive using its central directory.
+
+        Yields:
+            The archive members.
+        """
+        with zipfile.ZipFile(self.archive_path) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                name = self._checked_name(info.filename)
+                if name is None:
+                    continue
+
+                # Zip timestamps are local times with a two second resolution
+                mtime = datetime(*info.date_time).timestamp()
+                yield ArchiveMember(
+                    name=name,
+                    path=member_path(self.archive_path, name),
+                    size=info.file_size,
+                    mtime_ns=int(mtime) * 1_000_000_000,
+                    _open=functools.partial(archive.open, info),
+                )
+
+    def _checked_name(self, name: str) -> str | None:
+        """Normalize a member name, logging members that are skipped.
+
+        Args:
+            name: The member name as stored in the archive.
+
+        Returns:
+            The normalized name, or None if the member is skipped.
+        """
+        normalized = normalize_member_name(name)
+        if normalized is None:
+            logger.warning(f"Skipping archive member outside the archive root: {name}")
+        return normalized
@@ -0,0 +1,214 @@
+"""
+Resumable ingestion checkpoints for the Atlas knowledge system.
+
+This module records how far a directory ingestion run has committed its work, as a
+cursor into the walk order of the directory. The checkpoint is saved next to the
+ingestion manifest after every committed batch, so an interrupted run can be resumed
+without walking, hashing or embedding the files it already committed.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, ClassVar
+
+from atlas.core import logging
+from atlas.knowledge.walker import walk_order_key
+
+logger = logging.get_logger(__name__)
+
+
+class IngestionCheckpoint:
+    """Thread-safe, JSON-persisted progress record of a directory ingestion run.
+
+    A checkpoint is active from the start of a run until it finishes. The cursor is the
+    last file, relative to the ingested directory, whose batch was committed; every file
+    the walk yields up to and including the cursor is committed to the manifest.
+    """
+
+    # Class constants
+    FORMAT_VERSION: ClassVar[int] = 1
+
+    def __init__(self, path: str | None = None):
+        """Initialize the checkpoint.
+
+        Args:
+            path: Optional path of the JSON file backing the checkpoint. If None, the
+                checkpoint is kept in memory only.
+        """
+        self.path = path
+        self.directory: str | None = None  # Absolute path of the directory being ingested
+        self.recursive = True
+        self.cursor: str | None = None  # Last committed file, relative to the directory
+        self.files_committed = 0
+        self.chunks_committed = 0
+        self.batches_committed = 0
+        self.started_at = 0.0
+        self.updated_at = 0.0
+        self._lock = threading.RLock()
+        self._dirty = False
+
+        if self.path:
+            self.load()
+
+    @property
+    def active(self) -> bool:
+        """Check whether a run is in progress or was interrupted.
+
+        Returns:
+            True if a run started and did not finish, False otherwise.
+        """
+        return self.directory is not None
+
+    def load(self) -> None:
+        """Load the checkpoint from the backing file, if it exists."""
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable ingestion checkpoint {self.path}: {e}")
+            return
+
+        if data.get("version") != self.FORMAT_VERSION:
+            logger.warning(
+                f"Ignoring ingestion checkpoint {self.path} with unsupported version "
+                f"{data.get('version')}"
+            )
+            return
+
+        with self._lock:
+            self.directory = data.get("directory")
+            self.recursive = data.get("recursive", True)
+            self.cursor = data.get("cursor")
+            self.files_committed = data.get("files_committed", 0)
+            self.chunks_committed = data.get("chunks_committed", 0)
+            self.batches_committed = data.get("batches_committed", 0)
+            self.started_at = data.get("started_at", 0.0)
+            self.updated_at = data.get("updated_at", 0.0)
+            self._dirty = False
+
+    def save(self) -> None:
+        """Atomically write the checkpoint to the backing file if anything changed.
+
+        An inactive checkpoint removes the backing file.
+        """
+        if not self.path:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+
+            if not self.active:
+                if os.path.exists(self.path):
+                    os.unlink(self.path)
+                self._dirty = False
+                return
+
+            data: dict[str, Any] = {
+                "version": self.FORMAT_VERSION,
+                "directory": self.directory,
+                "recursive": self.recursive,
+                "cursor": self.cursor,
+                "files_committed": self.files_committed,
+                "chunks_committed": self.chunks_committed,
+                "batches_committed": self.batches_committed,
+                "started_at": self.started_at,
+                "updated_at": self.updated_at,
+            }
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+
+            # Write to a temporary file first so a crash never leaves a truncated checkpoint
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+            self._dirty = False
+
+    def matches(self, directory: str, recursive: bool = True) -> bool:
+        """Check whether the checkpoint belongs to an ingestion run of a directory.
+
+        Args:
+            directory: The directory being ingested.
+            recursive: Whether subdirectories are ingested.
+
+        Returns:
+            True if an unfinished run of the same directory and mode was recorded.
+        """
+        with self._lock:
+            return (
+                self.active
+                and self.directory == os.path.abspath(directory)
+                and self.recursive == recursive
+            )
+
+    def start(self, directory: str, recursive: bool = True) -> None:
+        """Start recording a new ingestion run, replacing any previous checkpoint.
+
+        Args:
+            directory: The directory being ingested.
+            recursive: Whether subdirectories are ingested.
+        """
+        with self._lock:
+            self.directory = os.path.abspath(directory)
+            self.recursive = recursive
+            self.cursor = None
+            self.files_committed = 0
+            self.chunks_committed = 0
+            self.batches_committed = 0
+            self.started_at = self.updated_at = time.time()
+            self._dirty = True
+
+    def advance(self, file_path: str, files: int, chunks: int) -> None:
+        """Record a committed batch.
+
+        Args:
+            file_path: Path of the last file of the batch, in walk order.
+            files: Number of files in the batch.
+            chunks: Number of chunks the batch stored or deleted.
+        """
+        with self._lock:
+            if not self.active:
+                return
+            self.cursor = os.path.relpath(os.path.abspath(file_path), self.directory)
+            self.files_committed += files
+            self.chunks_committed += chunks
+            self.batches_committed += 1
+            self.updated_at = time.time()
+            self._dirty = True
+
+    def is_committed(self, file_path: str) -> bool:
+        """Check whether a file was committed by the recorded run.
+
+        Args:
+            file_path: Path of a file in the ingested directory.
+
+        Returns:
+            True if the file comes at or before the cursor in walk order.
+        """
+        with self._lock:
+            if not self.active or self.cursor is None:
+                return False
+            rel_path = os.path.relpath(os.path.abspath(file_path), self.directory)
+            return walk_order_key(rel_path) <= walk_order_key(self.cursor)
+
+    def finish(self) -> None:
+        """Mark the recorded run as complete."""
+        with self._lock:
+            if self.active:
+                self.directory = None
+                self.cursor = None
+                self._dirty = True
@@ -0,0 +1,316 @@
+"""
+Near-duplicate chunk detection for the Atlas knowledge system.
+
+This module fingerprints chunks with 64-bit SimHash signatures over word shingles and
+indexes them so that chunks within a small Hamming distance of an already indexed chunk,
+such as the boilerplate sections of templated documentation pages, are found in roughly
+constant time. The index is JSON-persisted so duplicates are recognized across runs.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import re
+import tempfile
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from atlas.core import logging
+
+if TYPE_CHECKING:
+    from atlas.knowledge.ingest import DocumentChunk
+
+logger = logging.get_logger(__name__)
+
+# Number of bits in a SimHash signature
+SIMHASH_BITS = 64
+
+# Pattern that splits text into the words shingles are built from
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """Compute the SimHash signature of a text.
+
+    The text is lowercased and split into overlapping word shingles. Every bit of the
+    signature is set if the shingles whose hash has that bit set outweigh those that do
+    not, so texts sharing most shingles get signatures that differ in only a few bits.
+
+    Args:
+        text: The text to fingerprint.
+        shingle_size: Number of consecutive words per shingle.
+
+    Returns:
+        The signature as an unsigned 64-bit integer.
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) <= shingle_size:
+        shingles = [" ".join(words)]
+    else:
+        shingles = [
+            " ".join(words[i : i + shingle_size]) for i in range(len(words) - shingle_size + 1)
+        ]
+
+    total_weight = 0
+    set_weights = [0] * SIMHASH_BITS
+    for shingle, weight in Counter(shingles).items():
+        value = int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little"
+        )
+        total_weight += weight
+
+        # Only visit the bits that are set
+        while value:
+            lowest = value & -value
+            set_weights[lowest.bit_length() - 1] += weight
+            value ^= lowest
+
+    signature = 0
+    for bit, set_weight in enumerate(set_weights):
+        if 2 * set_weight > total_weight:
+            signature |= 1 << bit
+    return signature
+
+
+class NearDuplicateDetector:
+    """Thread-safe, JSON-persisted SimHash index of stored chunks.
+
+    Signatures are split into max_distance + 1 blocks and indexed by block value. Two
+    signatures within max_distance bits of each other must agree on at least one block,
+    so only chunks sharing a block are compared. Chunks matching an indexed chunk get a
+    `duplicate_of` metadata entry naming it; all other chunks are added to the index.
+    """
+
+    # Class constants
+    FORMAT_VERSION: ClassVar[int] = 1
+    DEFAULT_MAX_DISTANCE: ClassVar[int] = 3
+    DEFAULT_SHINGLE_SIZE: ClassVar[int] = 3
+
+    def __init__(
+        self,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        path: str | None = None,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+    ):
+        """Initialize the detector.
+
+        Args:
+            max_distance: Maximum number of differing signature bits for two chunks to
+                count as near-duplicates. 0 only matches identical signatures.
+            path: Optional path of the JSON file backing the index. If None, the index is
+                kept in memory only.
+            shingle_size: Number of consecutive words per shingle.
+        """
+        if not 0 <= max_distance < SIMHASH_BITS // 2:
+            raise ValueError(f"max_distance must be between 0 and {SIMHASH_BITS // 2 - 1}")
+
+        self.max_distance = max_distance
+        self.path = path
+        self.shingle_size = shingle_size
+
+        # Bit offset and mask of each signature block
+        block_count = max_distance + 1
+        bounds = [round(i * SIMHASH_BITS / block_count) for i in range(block_count + 1)]
+        self._blocks = [
+            (start, (1 << (end - start)) - 1) for start, end in itertools.pairwise(bounds)
+        ]
+
+        self._signatures: dict[str, int] = {}  # Chunk ID -> signature
+        self._tables: list[dict[int, set[str]]] = [{} for _ in self._blocks]
+        self._lock = threading.RLock()
+        self._dirty = False
+
+        if self.path:
+            self.load()
+
+    def __len__(self) -> int:
+        """Get the number of indexed chunks."""
+        with self._lock:
+            return len(self._signatures)
+
+    def load(self) -> None:
+        """Load the index from the backing file, if it exists."""
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable near-duplicate index {self.path}: {e}")
+            return
+
+        if (
+            data.get("version") != self.FORMAT_VERSION
+            or data.get("shingle_size") != self.shingle_size
+        ):
+            logger.warning(f"Ignoring incompatible near-duplicate index {self.path}")
+            return
+
+        with self._lock:
+            self.reset()
+            for chunk_id, signature in data.get("signatures", {}).items():
+                self._add(chunk_id, int(signature, 16))
+            self._dirty = False
+
+        logger.info(f"Loaded near-duplicate index with {len(self)} chunks from {self.path}")
+
+    def save(self) -> None:
+        """Atomically write the index to the backing file if anything changed."""
+        if not self.path:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+
+            data: dict[str, Any] = {
+                "version": self.FORMAT_VERSION,
+                "shingle_size": self.shingle_size,
+                "signatures": {
+                    chunk_id: f"{signature:016x}"
+                    for chunk_id, signature in self._signatures.items()
+                },
+            }
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+
+            # Write to a temporary file first so a crash never leaves a truncated index
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".simhash-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+            self._dirty = False
+
+        logger.debug(f"Saved near-duplicate index with {len(data['signatures'])} chunks")
+
+    def _block_keys(self, signature: int) -> list[int]:
+        """Split a signature into its block values.
+
+        Args:
+            signature: The signature to split.
+
+        Returns:
+            The value of each block, in block order.
+        """
+        return [(signature >> start) & mask for start, mask in self._blocks]
+
+    def _add(self, chunk_id: str, signature: int) -> None:
+        """Index a chunk, replacing any previous signature it had.
+
+        Args:
+            chunk_id: ID of the chunk.
+            signature: SimHash signature of the chunk.
+        """
+        self._discard(chunk_id)
+        self._signatures[chunk_id] = signature
+        for table, key in zip(self._tables, self._block_keys(signature), strict=True):
+            table.setdefault(key, set()).add(chunk_id)
+        self._dirty = True
+
+    def _discard(self, chunk_id: str) -> None:
+        """Remove a chunk from the index if it is indexed.
+
+        Args:
+            chunk_id: ID of the chunk.
+        """
+        signature = self._signatures.pop(chunk_id, None)
+        if signature is None:
+            return
+
+        for table, key in zip(self._tables, self._block_keys(signature), strict=True):
+            bucket = table.get(key)
+            if bucket is not None:
+                bucket.discard(chunk_id)
+                if not bucket:
+                    del table[key]
+        self._dirty = True
+
+    def find(self, signature: int, exclude_ids: Iterable[str] = ()) -> str | None:
+        """Find the indexed chunk closest to a signature within max_distance bits.
+
+        Args:
+            signature: The signature to look up.
+            exclude_ids: Chunk IDs to ignore, usually the chunk being looked up.
+
+        Returns:
+            ID of the closest indexed chunk, or None if there is none within range.
+        """
+        with self._lock:
+            candidates: set[str] = set()
+            for table, key in zip(self._tables, self._block_keys(signature), strict=True):
+                candidates.update(table.get(key, ()))
+            candidates.difference_update(exclude_ids)
+
+            best: tuple[int, str] | None = None
+            for chunk_id in candidates:
+                distance = (signature ^ self._signatures[chunk_id]).bit_count()
+                if distance <= self.max_distance and (best is None or (distance, chunk_id) < best):
+                    best = (distance, chunk_id)
+
+        return best[1] if best else None
+
+    def process_chunks(
+        self, chunks: list["DocumentChunk"], exclude_ids: Iterable[str] = ()
+    ) -> list["DocumentChunk"]:
+        """Mark near-duplicates of indexed chunks and index the others.
+
+        Args:
+            chunks: List of document chunks to process.
+            exclude_ids: IDs of indexed chunks that cannot be originals unless one of the
+                chunks reuses the ID, usually the chunks the file produced last time.
+
+        Returns:
+            The same chunks, with near-duplicates marked by `duplicate_of` metadata.
+        """
+        signatures = [simhash(chunk.text, self.shingle_size) for chunk in chunks]
+        excluded = set(exclude_ids)
+
+        with self._lock:
+            for chunk, signature in zip(chunks, signatures, strict=True):
+                excluded.discard(chunk.id)
+                original_id = self.find(signature, exclude_ids=excluded | {chunk.id})
+                if original_id is not None:
+                    logger.debug(f"Chunk {chunk.id} is a near-duplicate of {original_id}")
+                    chunk.metadata["duplicate_of"] = original_id
+                    # Only originals are indexed, so duplicates never point at another duplicate
+                    self._discard(chunk.id)
+                else:
+                    self._add(chunk.id, signature)
+
+        return chunks
+
+    def remove(self, chunk_ids: Iterable[str]) -> None:
+        """Remove deleted chunks from the index.
+
+        Args:
+            chunk_ids: IDs of the chunks to remove.
+        """
+        with self._lock:
+            for chunk_id in chunk_ids:
+                self._discard(chunk_id)
+
+    def get_unique_chunk_count(self) -> int:
+        """Get the number of indexed, non-duplicate chunks.
+
+        Returns:
+            The number of unique chunks.
+        """
+        return len(self)
+
+    def reset(self) -> None:
+        """Clear the index."""
+        with self._lock:
+            self._signatures = {}
+            self._tables = [{} for _ in self._blocks]
+            self._dirty = True
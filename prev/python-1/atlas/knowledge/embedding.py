@@ -5,15 +5,35 @@ This module provides interfaces and implementations for different embedding stra
 to optimize vector representations of document chunks for retrieval.
 """
 
+import contextlib
+import hashlib
 import logging
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import ClassVar
 
+import anthropic
 from anthropic import Anthropic
 
 from atlas.core import env
+from atlas.core.errors import APIError, RateLimitError
+from atlas.core.retry import RetryConfig, calculate_delay, is_retryable_error
 
 logger = logging.getLogger(__name__)
 
+# NumPy is optional; it is only needed by the hashing embedding strategy
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 class EmbeddingStrategy(ABC):
     """Base class for embedding strategies."""
@@ -44,13 +64,31 @@ class EmbeddingStrategy(ABC):
 
 
 class AnthropicEmbeddingStrategy(EmbeddingStrategy):
-    """Embedding strategy that uses Anthropic's embedding models."""
+    """Embedding strategy that requests embeddings through the Anthropic client.
+
+    Texts are sent as multi-input batch requests to an embeddings endpoint relative to the
+    client's base URL, with a bounded number of requests in flight. A rate limit response
+    pauses every worker for the advertised retry-after period, transient failures are
+    retried with exponential backoff, and failures that persist raise an error instead of
+    producing placeholder vectors.
+    """
+
+    # Class constants
+    DEFAULT_ENDPOINT: ClassVar[str] = "/v1/embeddings"
+    DEFAULT_BATCH_SIZE: ClassVar[int] = 64
+    DEFAULT_MAX_CONCURRENCY: ClassVar[int] = 4
 
     def __init__(
         self,
         api_key: str | None = None,
         model: str = "claude-3-haiku-20240307",
         dimensions: int = 1536,
+        base_url: str | None = None,
+        endpoint: str = DEFAULT_ENDPOINT,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        retry_config: RetryConfig | None = None,
+        timeout: float = 60.0,
     ):
         """Initialize the Anthropic embedding strategy.
 
@@ -58,10 +96,150 @@ class AnthropicEmbeddingStrategy(EmbeddingStrategy):
             api_key: Optional API key for Anthropic.
             model: The model ID to use for embeddings.
             dimensions: Embedding vector dimensions.
+            base_url: Optional base URL of the API, e.g. a proxy or local stand-in.
+            endpoint: Path of the embeddings endpoint relative to the base URL.
+            batch_size: Maximum number of texts sent in a single request.
+            max_concurrency: Maximum number of requests in flight at once.
+            retry_config: Retry behavior for rate limits and transient failures.
+            timeout: Request timeout in seconds.
         """
-        self.client = Anthropic(api_key=api_key or env.get_string("ANTHROPIC_API_KEY"))
+        # Retries are handled here, so they can honor rate limits across all workers
+        self.client = Anthropic(
+            api_key=api_key or env.get_string("ANTHROPIC_API_KEY"),
+            base_url=base_url,
+            max_retries=0,
+            timeout=timeout,
+        )
         self.model = model
         self.dimensions = dimensions
+        self.endpoint = endpoint
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.retry_config = retry_config or RetryConfig()
+
+        # Monotonic time until which no request may be sent after a rate limit response
+        self._rate_limited_until = 0.0
+        self._rate_limit_lock = threading.Lock()
+
+    def _translate_error(self, error: Exception) -> Exception:
+        """Convert an Anthropic client error into an Atlas error.
+
+        Args:
+            error: The error raised by the client.
+
+        Returns:
+            A RateLimitError or APIError describing whether the request can be retried, or
+            the original error if it did not come from the client.
+        """
+        if isinstance(error, anthropic.RateLimitError):
+            retry_after = None
+            header = error.response.headers.get("retry-after")
+            if header:
+                with contextlib.suppress(ValueError):
+                    retry_after = float(header)
+            return RateLimitError(
+                message=f"Embedding request was rate limited: {error}",
+                cause=error,
+                provider="anthropic",
+                retry_after=retry_after,
+            )
+
+        if isinstance(error, anthropic.APIStatusError):
+            return APIError(
+                message=f"Embedding request failed with HTTP {error.status_code}: {error}",
+                details={"status_code": error.status_code},
+                cause=error,
+                retry_possible=error.status_code in self.retry_config.retryable_status_codes,
+            )
+
+        if isinstance(error, anthropic.APIConnectionError):
+            return APIError(
+                message=f"Embedding request could not reach the API: {error}",
+                cause=error,
+                retry_possible=True,
+            )
+
+        return error
+
+    def _wait_for_rate_limit(self) -> None:
+        """Block until any rate limit pause announced by the API has passed."""
+        while True:
+            with self._rate_limit_lock:
+                remaining = self._rate_limited_until - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+    def _request_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Send a single batch request.
+
+        Args:
+            texts: The texts to embed in one request.
+
+        Returns:
+            The embedding vectors in the order of the texts.
+
+        Raises:
+            APIError: If the response does not contain one embedding per text.
+        """
+        response = self.client.post(
+            self.endpoint,
+            body={"model": self.model, "input": texts, "dimensions": self.dimensions},
+            cast_to=object,
+        )
+
+        data = response.get("data") if isinstance(response, dict) else None
+        if not isinstance(data, list) or len(data) != len(texts):
+            raise APIError(
+                message=f"Embedding response did not contain {len(texts)} embeddings",
+                details={"response_type": type(response).__name__},
+            )
+
+        return [item["embedding"] for item in sorted(data, key=lambda item: item.get("index", 0))]
+
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed one batch, retrying rate limits and transient failures.
+
+        Args:
+            texts: The texts to embed in one request.
+
+        Returns:
+            The embedding vectors in the order of the texts.
+
+        Raises:
+            APIError: If the batch could not be embedded.
+        """
+        retry_count = 0
+        while True:
+            self._wait_for_rate_limit()
+            try:
+                return self._request_embeddings(texts)
+            except Exception as e:
+                error = self._translate_error(e)
+                if not is_retryable_error(error, self.retry_config, retry_count):
+                    if error is e:
+                        raise
+                    raise error from e
+
+                retry_count += 1
+                delay = calculate_delay(retry_count, self.retry_config)
+
+                retry_after = (
+                    error.details.get("retry_after") if isinstance(error, RateLimitError) else None
+                )
+                if retry_after is not None:
+                    # Pause every worker, not just this one, until the limit resets
+                    delay = max(delay, retry_after)
+                    with self._rate_limit_lock:
+                        self._rate_limited_until = max(
+                            self._rate_limited_until, time.monotonic() + retry_after
+                        )
+
+                logger.warning(
+                    f"{error}. Retrying in {delay:.2f}s "
+                    f"({retry_count}/{self.retry_config.max_retries})"
+                )
+                time.sleep(delay)
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for a list of document texts using Anthropic.
@@ -71,38 +249,30 @@ class AnthropicEmbeddingStrategy(EmbeddingStrategy):
 
         Returns:
             List of embedding vectors for each text.
+
+        Raises:
+            APIError: If any batch could not be embedded.
         """
         if not texts:
             return []
 
-        embeddings = []
-        # Process in batches to avoid rate limits
-        batch_size = 20
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            batch_embeddings = []
-
-            for text in batch:
-                try:
-                    response = self.client.embeddings.create(
-                        model=self.model,
-                        input=text,
-                        dimensions=self.dimensions,
-                    )
-                    embedding = response.embedding
-                    batch_embeddings.append(embedding)
-                except Exception as e:
-                    logger.error(f"Error generating embedding: {e}")
-                    # Return a zero vector as fallback
-                    batch_embeddings.append([0.0] * self.dimensions)
-
-            embeddings.extend(batch_embeddings)
-
-            if len(texts) > batch_size:
-                logger.info(
-                    f"Embedded batch {i // batch_size + 1}/{(len(texts) - 1) // batch_size + 1}"
-                )
+        batches = [texts[i : i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        if len(batches) == 1:
+            return self._embed_batch(batches[0])
+
+        workers = min(self.max_concurrency, len(batches))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="atlas-embed") as pool:
+            futures = [pool.submit(self._embed_batch, batch) for batch in batches]
+            embeddings = []
+            try:
+                for i, future in enumerate(futures):
+                    embeddings.extend(future.result())
+                    logger.debug(f"Embedded batch {i + 1}/{len(batches)}")
+            except Exception:
+                # Don't start batches whose results would be thrown away
+                for future in futures:
+                    future.cancel()
+                raise
 
         return embeddings
 
@@ -114,18 +284,11 @@ class AnthropicEmbeddingStrategy(EmbeddingStrategy):
 
         Returns:
             Embedding vector for the query.
+
+        Raises:
+            APIError: If the query could not be embedded.
         """
-        try:
-            response = self.client.embeddings.create(
-                model=self.model,
-                input=query,
-                dimensions=self.dimensions,
-            )
-            return response.embedding
-        except Exception as e:
-            logger.error(f"Error generating query embedding: {e}")
-            # Return a zero vector as fallback
-            return [0.0] * self.dimensions
+        return self._embed_batch([query])[0]
 
 
 class ChromaDefaultEmbeddingStrategy(EmbeddingStrategy):
@@ -156,6 +319,114 @@ class ChromaDefaultEmbeddingStrategy(EmbeddingStrategy):
         return None
 
 
+class HashingEmbeddingStrategy(EmbeddingStrategy):
+    """Local embedding strategy based on a signed hashing vectorizer.
+
+    Each token is hashed to a fixed dimension and sign, term frequencies are scaled
+    sublinearly (1 + log(tf)) and every vector is L2 normalized. Embeddings are
+    deterministic across processes and need no model or network access, which makes the
+    strategy suitable for load testing ingestion and retrieval. Requires NumPy.
+    """
+
+    # Class constants
+    DEFAULT_DIMENSIONS: ClassVar[int] = 384
+    DEFAULT_TOKEN_PATTERN: ClassVar[str] = r"\w+"
+    DEFAULT_CACHE_SIZE: ClassVar[int] = 65536
+
+    def __init__(
+        self,
+        dimensions: int = DEFAULT_DIMENSIONS,
+        token_pattern: str = DEFAULT_TOKEN_PATTERN,
+        lowercase: bool = True,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """Initialize the hashing embedding strategy.
+
+        Args:
+            dimensions: Dimension of the produced embeddings.
+            token_pattern: Regular expression that matches a single token.
+            lowercase: Whether to lowercase texts before tokenizing.
+            cache_size: Maximum number of token hashes to cache.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for HashingEmbeddingStrategy")
+        if dimensions < 1:
+            raise ValueError("dimensions must be at least 1")
+
+        self.dimensions = dimensions
+        self.lowercase = lowercase
+        self._token_re = re.compile(token_pattern)
+        self._hash_token = lru_cache(maxsize=cache_size)(self._compute_token_hash)
+
+    def _compute_token_hash(self, token: str) -> tuple[int, float]:
+        """Hash a token to a column index and a sign.
+
+        Args:
+            token: The token to hash.
+
+        Returns:
+            A (column index, sign) tuple.
+        """
+        value = int.from_bytes(
+            hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little"
+        )
+        return value % self.dimensions, -1.0 if value >> 63 else 1.0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Generate hashed embeddings for a list of document texts.
+
+        Args:
+            texts: List of text strings to embed.
+
+        Returns:
+            List of L2 normalized embedding vectors, one per text. Texts without tokens
+            embed as zero vectors.
+        """
+        if not texts:
+            return []
+
+        rows: list[int] = []
+        columns: list[int] = []
+        signs: list[float] = []
+        counts: list[int] = []
+        for row, text in enumerate(texts):
+            if self.lowercase:
+                text = text.lower()
+            for token, count in Counter(self._token_re.findall(text)).items():
+                column, sign = self._hash_token(token)
+                rows.append(row)
+                columns.append(column)
+                signs.append(sign)
+                counts.append(count)
+
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        if counts:
+            weights = (1.0 + np.log(np.asarray(counts, dtype=np.float32))) * np.asarray(
+                signs, dtype=np.float32
+            )
+            # Colliding tokens within a text add up, like in any hashing vectorizer
+            np.add.at(matrix, (np.asarray(rows), np.asarray(columns)), weights)
+
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+        return matrix.tolist()
+
+    def embed_query(self, query: str) -> list[float]:
+        """Generate a hashed embedding for a query string.
+
+        Args:
+            query: Query text to embed.
+
+        Returns:
+            L2 normalized embedding vector for the query.
+        """
+        return self.embed_documents([query])[0]
+
+
 class HybridEmbeddingStrategy(EmbeddingStrategy):
     """Embedding strategy that combines multiple embedding approaches."""
 
@@ -203,22 +474,195 @@ class HybridEmbeddingStrategy(EmbeddingStrategy):
         return self.strategies[0][0].embed_query(query)
 
 
+class CoalescingEmbeddingStrategy(EmbeddingStrategy):
+    """Wrapper that coalesces concurrent query embeddings into batched requests.
+
+    Queries arriving from many threads within max_wait seconds of each other are embedded
+    together with a single embed_documents call on the wrapped strategy, and each caller
+    receives its own vector. Document embedding is passed through unchanged.
+    """
+
+    # Class constants
+    DEFAULT_MAX_BATCH_SIZE: ClassVar[int] = 64
+    DEFAULT_MAX_WAIT: ClassVar[float] = 0.005
+
+    def __init__(
+        self,
+        strategy: EmbeddingStrategy,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ):
+        """Initialize the coalescing wrapper.
+
+        Args:
+            strategy: The strategy that performs the embedding.
+            max_batch_size: Maximum number of queries embedded in one call.
+            max_wait: Maximum seconds the first query of a batch waits for others.
+        """
+        self.strategy = strategy
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait
+
+        self._pending: list[tuple[str, Future]] = []
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+        # Statistics
+        self._queries = 0
+        self._batches = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for a list of document texts with the wrapped strategy.
+
+        Args:
+            texts: List of text strings to embed.
+
+        Returns:
+            List of embedding vectors for each text.
+        """
+        return self.strategy.embed_documents(texts)
+
+    def embed_query(self, query: str) -> list[float]:
+        """Generate an embedding for a query, batched with concurrent queries.
+
+        Args:
+            query: Query text to embed.
+
+        Returns:
+            Embedding vector for the query.
+        """
+        future: Future = Future()
+        with self._condition:
+            if self._closed:
+                return self.strategy.embed_query(query)
+
+            self._pending.append((query, future))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="atlas-embed-coalescer", daemon=True
+                )
+                self._thread.start()
+
+            # Wake the dispatcher for a new batch or once the batch is full
+            if len(self._pending) == 1 or len(self._pending) >= self.max_batch_size:
+                self._condition.notify_all()
+
+        return future.result()
+
+    def _run(self) -> None:
+        """Dispatcher loop that collects queries into batches and embeds them."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+
+                # Give concurrent callers a short window to join the batch
+                deadline = time.monotonic() + self.max_wait
+                while len(self._pending) < self.max_batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                batch = self._pending[: self.max_batch_size]
+                del self._pending[: self.max_batch_size]
+
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: list[tuple[str, Future]]) -> None:
+        """Embed a batch of queries and fan the results out to their callers.
+
+        Args:
+            batch: Pairs of query text and the future awaiting its embedding.
+        """
+        # Identical queries in the same batch are only embedded once
+        unique_queries = list(dict.fromkeys(query for query, _ in batch))
+
+        try:
+            embeddings = self.strategy.embed_documents(unique_queries)
+            if embeddings is None:
+                # The wrapped strategy defers embedding to ChromaDB
+                embeddings = [None] * len(unique_queries)
+            embeddings_by_query = dict(zip(unique_queries, embeddings, strict=True))
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        with self._condition:
+            self._queries += len(batch)
+            self._batches += 1
+
+        for query, future in batch:
+            future.set_result(embeddings_by_query[query])
+
+    def close(self) -> None:
+        """Embed any pending queries and stop the dispatcher thread.
+
+        Queries made after closing are embedded directly by the wrapped strategy.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+
+        if thread is not None:
+            thread.join()
+
+    def get_stats(self) -> dict[str, float]:
+        """Get coalescing statistics.
+
+        Returns:
+            Dictionary with the number of queries, batches and the mean batch size.
+        """
+        with self._condition:
+            return {
+                "queries": self._queries,
+                "batches": self._batches,
+                "mean_batch_size": self._queries / self._batches if self._batches else 0.0,
+                "pending": len(self._pending),
+            }
+
+
 class EmbeddingStrategyFactory:
     """Factory for creating embedding strategies."""
 
     @staticmethod
-    def create_strategy(strategy_type: str = "default", **kwargs) -> EmbeddingStrategy:
+    def create_strategy(
+        strategy_type: str = "default",
+        coalesce_queries: bool = False,
+        coalesce_max_batch_size: int = CoalescingEmbeddingStrategy.DEFAULT_MAX_BATCH_SIZE,
+        coalesce_max_wait: float = CoalescingEmbeddingStrategy.DEFAULT_MAX_WAIT,
+        **kwargs,
+    ) -> EmbeddingStrategy:
         """Create an embedding strategy based on the specified type.
 
         Args:
-            strategy_type: Type of embedding strategy to create.
+            strategy_type: Type of embedding strategy to create ("anthropic", "hashing",
+                "hybrid" or "default").
+            coalesce_queries: Whether to wrap the strategy in a CoalescingEmbeddingStrategy
+                so concurrent query embeddings are batched.
+            coalesce_max_batch_size: Maximum number of coalesced queries embedded in one
+                call.
+            coalesce_max_wait: Maximum seconds the first coalesced query waits for others.
             **kwargs: Additional parameters for the strategy.
 
         Returns:
             An EmbeddingStrategy instance.
         """
+        if coalesce_queries:
+            strategy = EmbeddingStrategyFactory.create_strategy(strategy_type, **kwargs)
+            return CoalescingEmbeddingStrategy(
+                strategy, max_batch_size=coalesce_max_batch_size, max_wait=coalesce_max_wait
+            )
+
         if strategy_type == "anthropic":
             return AnthropicEmbeddingStrategy(**kwargs)
+        elif strategy_type == "hashing":
+            return HashingEmbeddingStrategy(**kwargs)
         elif strategy_type == "hybrid":
             # Extract strategies from kwargs if provided
             strategies = kwargs.get("strategies")
@@ -5,29 +5,88 @@ This module handles processing documents into a format suitable for vector stora
 with support for adaptive chunking, deduplication, and real-time directory monitoring.
 """
 
-import glob
+import ast
+import bisect
 import hashlib
+import json
 import os
+import posixpath
 import re
+import threading
 import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections import ChainMap, OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar, cast
 
 import chromadb
 import pathspec
 from anthropic import Anthropic
+from chromadb.api.types import Embeddings, Metadata
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
 from atlas.core import env, logging
+from atlas.knowledge.archive import (
+    ARCHIVE_ERRORS,
+    ARCHIVE_SEPARATOR,
+    ArchiveMember,
+    ArchiveReader,
+    is_archive,
+    member_path,
+)
+from atlas.knowledge.checkpoint import IngestionCheckpoint
+from atlas.knowledge.dedup import NearDuplicateDetector
 from atlas.knowledge.embedding import EmbeddingStrategy, EmbeddingStrategyFactory
+from atlas.knowledge.manifest import IngestionManifest, ManifestEntry
+from atlas.knowledge.metrics import IngestionMetrics
+from atlas.knowledge.reader import FileContent, hash_file, read_file
+from atlas.knowledge.tokens import TokenEstimator, TokenEstimatorFactory
+from atlas.knowledge.walker import GITIGNORE_FILENAME, GitignoreWalker
+from atlas.knowledge.watcher import IngestionQueue
 
 logger = logging.get_logger(__name__)
 
+# File extensions routed to each chunking strategy
+MARKDOWN_EXTENSIONS = (".md", ".markdown", ".mdown")
+CODE_EXTENSIONS = (
+    ".py",
+    ".js",
+    ".jsx",
+    ".ts",
+    ".tsx",
+    ".java",
+    ".kt",
+    ".scala",
+    ".c",
+    ".cc",
+    ".cpp",
+    ".h",
+    ".hpp",
+    ".go",
+    ".rb",
+    ".php",
+    ".cs",
+)
+
+# Files ingested when no include patterns are given
+DEFAULT_INCLUDE_PATTERNS = [f"*{extension}" for extension in MARKDOWN_EXTENSIONS]
+
+# Number of chunks embedded and stored per batch
+EMBEDDING_BATCH_SIZE = 256
+
+# Seconds between progress log lines while embedding
+PROGRESS_LOG_INTERVAL = 5.0
+
+# Number of pending chunk writes after which process_directory commits a checkpoint
+CHECKPOINT_CHUNK_INTERVAL = 1024
+
+# What to do with chunks detected as duplicates of a stored chunk
+DUPLICATE_ACTIONS = ("reuse", "drop")
+
 
 @dataclass
 class DocumentChunk:
@@ -35,7 +94,7 @@ class DocumentChunk:
 
     id: str
     text: str
-    metadata: dict[str, Any]
+    metadata: dict[str, Any] | ChainMap[str, Any]  # Converted to a dict when stored
     content_hash: str = ""
 
     def __post_init__(self):
@@ -52,16 +111,9 @@ class DocumentChunk:
         Removes excess whitespace, converts to lowercase, and other normalizations
         to ensure semantically identical content produces the same hash.
         """
-        # Convert to lowercase
-        text = text.lower()
-
-        # Replace multiple spaces, newlines, tabs with single space
-        text = re.sub(r"\s+", " ", text)
-
-        # Remove leading/trailing whitespace
-        text = text.strip()
-
-        return text
+        # Lowercase, collapse runs of whitespace to single spaces and trim the ends;
+        # str.split() uses the same definition of whitespace as the regex \s
+        return " ".join(text.lower().split())
 
 
 @dataclass
@@ -75,11 +127,62 @@ class FileMetadata:
     last_modified: str  # File modification timestamp
     version: str = "current"  # Document version
     size_bytes: int = 0  # File size in bytes
-    simple_id: str = ""  # Simplified ID format (parent_dir/filename)
+    simple_id: str = ""  # Chunk ID base, the POSIX form of the relative path
+
+
+@dataclass
+class ChunkDiff:
+    """Difference between the stored chunks of a file and its newly produced chunks."""
+
+    file_path: str  # Path to the file the chunks belong to
+    changed: list[DocumentChunk] = field(default_factory=list)  # New or modified, need embedding
+    moved: list[tuple[DocumentChunk, str]] = field(default_factory=list)  # (chunk, old ID)
+    unchanged: list[DocumentChunk] = field(default_factory=list)  # Same ID and text
+    duplicates: list[tuple[DocumentChunk, str]] = field(default_factory=list)  # (chunk, original)
+    deleted: list[str] = field(default_factory=list)  # Stored IDs that no longer exist
+
+    @property
+    def has_changes(self) -> bool:
+        """Check whether applying the diff would modify the collection.
+
+        Returns:
+            True if any chunk needs to be written or deleted, False otherwise.
+        """
+        return bool(self.changed or self.moved or self.duplicates or self.deleted)
+
+    @property
+    def write_count(self) -> int:
+        """Get the number of chunks that have to be written to the collection.
+
+        Returns:
+            The number of changed, moved and duplicate chunks.
+        """
+        return len(self.changed) + len(self.moved) + len(self.duplicates)
+
+
+def chunk_fingerprint(chunk: DocumentChunk) -> str:
+    """Hash the exact text of a chunk to detect edits between ingestion runs.
+
+    Unlike DocumentChunk.content_hash, which normalizes text for deduplication, this
+    changes whenever the stored document text would change.
+
+    Args:
+        chunk: The chunk to fingerprint.
+
+    Returns:
+        A hex digest of the chunk text.
+    """
+    return hashlib.blake2b(chunk.text.encode("utf-8"), digest_size=16).hexdigest()
 
 
 class ChunkingStrategy(ABC):
-    """Base class for document chunking strategies."""
+    """Base class for document chunking strategies.
+
+    Chunk sizes are measured in characters, or in tokens if the chunker has a token
+    estimator.
+    """
+
+    token_estimator: TokenEstimator | None = None
 
     @abstractmethod
     def chunk_document(self, content: str, metadata: dict[str, Any]) -> list[DocumentChunk]:
@@ -94,7 +197,7 @@ class ChunkingStrategy(ABC):
         """
         pass
 
-    def _create_chunk_id(self, metadata: dict[str, Any], chunk_index: int) -> str:
+    def _create_chunk_id(self, metadata: Mapping[str, Any], chunk_index: int) -> str:
         """Create a unique ID for a chunk.
 
         Args:
@@ -108,19 +211,45 @@ class ChunkingStrategy(ABC):
         id_base = metadata.get("simple_id", metadata.get("source", "unknown"))
         return f"{id_base}#{chunk_index}"
 
+    def _measure(self, text: str) -> int:
+        """Measure a text in the unit chunk sizes are given in.
+
+        Args:
+            text: The text to measure.
+
+        Returns:
+            The estimated number of tokens if the chunker has a token estimator, otherwise
+            the number of characters.
+        """
+        if self.token_estimator is None:
+            return len(text)
+        return self.token_estimator.count(text)
+
 
 class FixedSizeChunker(ChunkingStrategy):
     """Simple chunking strategy that splits documents into fixed-size chunks."""
 
-    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
+    # Words with their trailing whitespace, the units token-sized chunks are built from
+    WORD_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"\S+\s*")
+
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        token_estimator: TokenEstimator | None = None,
+    ):
         """Initialize the fixed size chunker.
 
         Args:
-            chunk_size: The target size of each chunk in characters.
-            chunk_overlap: The overlap between chunks in characters.
+            chunk_size: The target size of each chunk in characters, or in tokens with a
+                token estimator.
+            chunk_overlap: The overlap between chunks in characters, or in tokens with a
+                token estimator.
+            token_estimator: Optional estimator to measure chunk sizes in tokens.
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.token_estimator = token_estimator
 
     def chunk_document(self, content: str, metadata: dict[str, Any]) -> list[DocumentChunk]:
         """Split a document into fixed-size chunks with overlap.
@@ -135,7 +264,7 @@ class FixedSizeChunker(ChunkingStrategy):
         chunks = []
 
         # For very small documents, don't split
-        if len(content) <= self.chunk_size:
+        if self._measure(content) <= self.chunk_size:
             chunk_id = self._create_chunk_id(metadata, 0)
             chunks.append(
                 DocumentChunk(
@@ -146,6 +275,9 @@ class FixedSizeChunker(ChunkingStrategy):
             )
             return chunks
 
+        if self.token_estimator is not None:
+            return self._chunk_by_tokens(content, metadata)
+
         # For larger documents, split with overlap
         start = 0
         chunk_index = 0
@@ -177,6 +309,55 @@ class FixedSizeChunker(ChunkingStrategy):
 
         return chunks
 
+    def _chunk_by_tokens(self, content: str, metadata: dict[str, Any]) -> list[DocumentChunk]:
+        """Split a document into chunks of whole words that fit the token budget.
+
+        Args:
+            content: The document content to chunk.
+            metadata: Metadata about the document.
+
+        Returns:
+            A list of DocumentChunk objects.
+        """
+        # Start offset and cumulative token count of every word
+        starts = []
+        totals = [0]
+        for match in self.WORD_PATTERN.finditer(content):
+            starts.append(match.start())
+            totals.append(totals[-1] + self._measure(match.group()))
+        if not starts:
+            return []
+        starts[0] = 0  # Leading whitespace belongs to the first chunk
+        starts.append(len(content))
+
+        chunks: list[DocumentChunk] = []
+        first = 0
+        while True:
+            # Take as many words as fit, but at least one
+            last = bisect.bisect_right(totals, totals[first] + self.chunk_size) - 1
+            last = max(last, first + 1)
+
+            chunk_text = content[starts[first] : starts[last]]
+            chunk_index = len(chunks)
+            chunks.append(
+                DocumentChunk(
+                    id=self._create_chunk_id(metadata, chunk_index),
+                    text=chunk_text,
+                    metadata={
+                        **metadata,
+                        "chunk_index": chunk_index,
+                        "chunk_size": len(chunk_text),
+                    },
+                )
+            )
+
+            if last >= len(starts) - 1:
+                return chunks
+
+            # Start the next chunk at the earliest word within the overlap
+            overlap_start = bisect.bisect_left(totals, totals[last] - self.chunk_overlap)
+            first = max(overlap_start, first + 1)
+
 
 class SemanticChunker(ChunkingStrategy):
     """Chunking strategy that respects semantic boundaries like paragraphs and sections."""
@@ -186,17 +367,22 @@ class SemanticChunker(ChunkingStrategy):
         max_chunk_size: int = 2000,
         min_chunk_size: int = 200,
         overlap_size: int = 100,
+        token_estimator: TokenEstimator | None = None,
     ):
         """Initialize the semantic chunker.
 
         Args:
-            max_chunk_size: Maximum size of a chunk in characters.
-            min_chunk_size: Minimum size of a chunk in characters.
+            max_chunk_size: Maximum size of a chunk in characters, or in tokens with a
+                token estimator.
+            min_chunk_size: Minimum size of a chunk in characters, or in tokens with a
+                token estimator.
             overlap_size: Size of overlap to add between chunks.
+            token_estimator: Optional estimator to measure chunk sizes in tokens.
         """
         self.max_chunk_size = max_chunk_size
         self.min_chunk_size = min_chunk_size
         self.overlap_size = overlap_size
+        self.token_estimator = token_estimator
 
     def chunk_document(self, content: str, metadata: dict[str, Any]) -> list[DocumentChunk]:
         """Split a document into chunks respecting semantic boundaries.
@@ -217,7 +403,7 @@ class SemanticChunker(ChunkingStrategy):
 
         for section_title, section_content in sections:
             # For small sections, keep them as a single chunk
-            if len(section_content) <= self.max_chunk_size:
+            if self._measure(section_content) <= self.max_chunk_size:
                 chunk_id = self._create_chunk_id(metadata, chunk_index)
                 chunks.append(
                     DocumentChunk(
@@ -327,15 +513,16 @@ class SemanticChunker(ChunkingStrategy):
         for paragraph in paragraphs:
             # If adding this paragraph would exceed max size and we already have content,
             # finish the current chunk and start a new one
+            paragraph_size = self._measure(paragraph)
             if (
-                current_size + len(paragraph) > self.max_chunk_size
+                current_size + paragraph_size > self.max_chunk_size
                 and current_size >= self.min_chunk_size
             ):
                 chunks.append("\n\n".join(current_chunk))
 
                 # Start new chunk with section heading for context
                 current_chunk = [section_heading]
-                current_size = len(section_heading)
+                current_size = self._measure(section_heading)
 
                 # If this paragraph contains the section heading, skip it as we already added it
                 if paragraph.startswith(section_heading):
@@ -343,7 +530,7 @@ class SemanticChunker(ChunkingStrategy):
 
             # Add paragraph to current chunk
             current_chunk.append(paragraph)
-            current_size += len(paragraph) + 2  # +2 for the newlines
+            current_size += paragraph_size + 2  # +2 for the newlines
 
         # Add the last chunk if there's anything left
         if current_chunk:
@@ -353,22 +540,54 @@ class SemanticChunker(ChunkingStrategy):
 
 
 class MarkdownChunker(SemanticChunker):
-    """Specialized chunker for Markdown documents that respects markdown structure."""
+    """Specialized chunker for Markdown documents that respects markdown structure.
+
+    Produces the same chunks as the SemanticChunker after setting frontmatter aside, but
+    finds headings and paragraph breaks in a single scan of the document, tracks chunks
+    as offsets into it and only slices out chunk text once all boundaries are known.
+    Chunk metadata layers the per-chunk fields over one read-only mapping of the file
+    metadata shared by every chunk of the file.
+    """
+
+    # Headings and paragraph breaks (blank lines), matched in one pass. Both start with a
+    # newline so the scan can skip ahead to candidate positions; a break leaves its last
+    # newline unconsumed so a heading right after it is still found.
+    BOUNDARY_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"\n(?:(#{1,6})\s+(.+)$|\s*(?=\n))", re.MULTILINE
+    )
+
+    # A heading on the first line of the document body
+    HEADING_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"(#{1,6})\s+(.+)$", re.MULTILINE)
+
+    # A section's first line that can be repeated as the heading of its parts
+    HEADING_LINE_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"#{1,6}\s+.+")
+
+    # Frontmatter between --- (YAML) or +++ (TOML) delimiters
+    FRONTMATTER_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"^---\s*$\n(.*?)\n^---\s*$\n", re.MULTILINE | re.DOTALL
+    )
+    TOML_FRONTMATTER_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"^\+\+\+\s*$\n(.*?)\n^\+\+\+\s*$\n", re.MULTILINE | re.DOTALL
+    )
 
     def __init__(
         self,
         max_chunk_size: int = 2000,
         min_chunk_size: int = 200,
         overlap_size: int = 100,
+        token_estimator: TokenEstimator | None = None,
     ):
         """Initialize the markdown chunker.
 
         Args:
-            max_chunk_size: Maximum size of a chunk in characters.
-            min_chunk_size: Minimum size of a chunk in characters.
+            max_chunk_size: Maximum size of a chunk in characters, or in tokens with a
+                token estimator.
+            min_chunk_size: Minimum size of a chunk in characters, or in tokens with a
+                token estimator.
             overlap_size: Size of overlap to add between chunks.
+            token_estimator: Optional estimator to measure chunk sizes in tokens.
         """
-        super().__init__(max_chunk_size, min_chunk_size, overlap_size)
+        super().__init__(max_chunk_size, min_chunk_size, overlap_size, token_estimator)
 
     def chunk_document(self, content: str, metadata: dict[str, Any]) -> list[DocumentChunk]:
         """Split a markdown document into chunks respecting markdown structure.
@@ -380,18 +599,208 @@ class MarkdownChunker(SemanticChunker):
         Returns:
             A list of DocumentChunk objects.
         """
-        # Preserve frontmatter if present
-        frontmatter, content_without_frontmatter = self._extract_frontmatter(content)
+        # Preserve frontmatter if present, scanning the rest of the document in place
+        frontmatter = self._match_frontmatter(content)
+        start = len(frontmatter)
+
+        headings: list[tuple[int, str]] = []  # (offset, title)
+        breaks: list[tuple[int, int]] = []  # (start, end) of blank line runs
+        scan_start = start
+        match = self.HEADING_PATTERN.match(content, start)
+        if match:
+            headings.append((start, match.group(2).strip()))
+            scan_start = match.end()
+        for match in self.BOUNDARY_PATTERN.finditer(content, scan_start):
+            if match.group(1) is not None:
+                headings.append((match.start(1), match.group(2).strip()))
+            else:
+                breaks.append((match.start(), match.end() + 1))
+
+        # Each planned chunk is a section title and the pieces its text is joined from
+        plans: list[tuple[str, list[str | tuple[int, int]]]] = []
 
-        # Get chunks using the semantic chunker
-        chunks = super().chunk_document(content_without_frontmatter, metadata)
+        if not headings:
+            # Treat the entire document as one section
+            title = self._guess_title(content, start)
+            plans.extend(self._plan_section(content, start, len(content), title, breaks))
+        else:
+            # Text before the first heading is not part of any section
+            for i, (section_start, title) in enumerate(headings):
+                section_end = headings[i + 1][0] if i + 1 < len(headings) else len(content)
+                section_start, section_end = self._strip_span(content, section_start, section_end)
+                plans.extend(self._plan_section(content, section_start, section_end, title, breaks))
+
+        # Materialize chunk text and metadata. Chunks share one copy of the file metadata
+        # under their own fields, and ChainMap writes only go to the per-chunk fields.
+        file_metadata = dict(metadata)
+        chunks = []
+        for chunk_index, (section_title, pieces) in enumerate(plans):
+            text = "\n\n".join(
+                piece if isinstance(piece, str) else content[piece[0] : piece[1]]
+                for piece in pieces
+            )
+            chunk_metadata = {
+                "chunk_index": chunk_index,
+                "section_title": section_title,
+                "chunk_size": len(text),
+            }
+            chunks.append(
+                DocumentChunk(
+                    id=self._create_chunk_id(file_metadata, chunk_index),
+                    text=text,
+                    metadata=ChainMap(chunk_metadata, file_metadata),
+                )
+            )
 
-        # Add frontmatter to the first chunk if present
+        # Add frontmatter to the first chunk, leaving it out of the deduplication hash
         if frontmatter and chunks:
             chunks[0].text = frontmatter + "\n\n" + chunks[0].text
 
         return chunks
 
+    def _plan_section(
+        self, content: str, start: int, end: int, title: str, breaks: list[tuple[int, int]]
+    ) -> list[tuple[str, list[str | tuple[int, int]]]]:
+        """Plan the chunks of one section.
+
+        Args:
+            content: The document content.
+            start: Offset of the section in the content.
+            end: End offset of the section in the content.
+            title: The title of the section.
+            breaks: Offsets of all paragraph breaks in the document, in order.
+
+        Returns:
+            A list of (section title, pieces) tuples, where pieces are strings or
+            (start, end) offsets into the content, to be joined by blank lines.
+        """
+        # For small sections, keep them as a single chunk
+        if self._measure_span(content, start, end) <= self.max_chunk_size:
+            return [(title, [(start, end)])]
+
+        # Always include the section heading in each part for context
+        line_end = content.find("\n", start, end)
+        if line_end == -1:
+            line_end = end
+        if self.HEADING_LINE_PATTERN.fullmatch(content, start, line_end):
+            section_heading = content[start:line_end]
+        else:
+            section_heading = f"# {title}"
+
+        parts: list[list[str | tuple[int, int]]] = []
+        current: list[str | tuple[int, int]] = []
+        current_size = 0
+
+        # Paragraphs are the spans between the breaks inside the section
+        paragraphs = []
+        paragraph_start = start
+        i = bisect.bisect_left(breaks, (start,))
+        while i < len(breaks) and breaks[i][1] <= end:
+            paragraphs.append(self._strip_span(content, paragraph_start, breaks[i][0]))
+            paragraph_start = breaks[i][1]
+            i += 1
+        paragraphs.append(self._strip_span(content, paragraph_start, end))
+
+        for paragraph_start, paragraph_end in paragraphs:
+            if paragraph_start == paragraph_end:
+                continue
+            paragraph_size = self._measure_span(content, paragraph_start, paragraph_end)
+
+            # If adding this paragraph would exceed max size and we already have content,
+            # finish the current chunk and start a new one
+            if (
+                current_size + paragraph_size > self.max_chunk_size
+                and current_size >= self.min_chunk_size
+            ):
+                parts.append(current)
+
+                # Start new chunk with section heading for context
+                current = [section_heading]
+                current_size = self._measure(section_heading)
+
+                # If this paragraph contains the section heading, skip it as we already added it
+                if content.startswith(section_heading, paragraph_start, paragraph_end):
+                    continue
+
+            current.append((paragraph_start, paragraph_end))
+            current_size += paragraph_size + 2  # +2 for the newlines
+
+        if current:
+            parts.append(current)
+
+        return [
+            (f"{title} (Part {i + 1}/{len(parts)})", part) for i, part in enumerate(parts)
+        ]
+
+    def _measure_span(self, content: str, start: int, end: int) -> int:
+        """Measure a span of the content without slicing it out unless counting tokens.
+
+        Args:
+            content: The document content.
+            start: Start offset of the span.
+            end: End offset of the span.
+
+        Returns:
+            The size of the span in the unit chunk sizes are given in.
+        """
+        if self.token_estimator is None:
+            return end - start
+        return self.token_estimator.count(content[start:end])
+
+    @staticmethod
+    def _strip_span(content: str, start: int, end: int) -> tuple[int, int]:
+        """Narrow a span of the content to exclude surrounding whitespace.
+
+        Args:
+            content: The document content.
+            start: Start offset of the span.
+            end: End offset of the span.
+
+        Returns:
+            The (start, end) offsets of the stripped span, equal if it is blank.
+        """
+        while start < end and content[start].isspace():
+            start += 1
+        while end > start and content[end - 1].isspace():
+            end -= 1
+        return start, end
+
+    @staticmethod
+    def _guess_title(content: str, start: int) -> str:
+        """Use the first line of a document without headings as its title.
+
+        Args:
+            content: The document content.
+            start: Offset of the document body in the content.
+
+        Returns:
+            The first non-blank line, or "Document" if it is missing or too long.
+        """
+        line_start, body_end = MarkdownChunker._strip_span(content, start, len(content))
+        if line_start == body_end:
+            return "Document"
+
+        line_end = content.find("\n", line_start, body_end)
+        if line_end == -1:
+            line_end = body_end
+        if line_end - line_start > 50:  # Too long to be a sensible title
+            return "Document"
+        return content[line_start:line_end]
+
+    def _match_frontmatter(self, content: str) -> str:
+        """Find frontmatter at the start of markdown content.
+
+        Args:
+            content: The markdown content.
+
+        Returns:
+            The frontmatter including its delimiters, or an empty string.
+        """
+        match = self.FRONTMATTER_PATTERN.match(content) or self.TOML_FRONTMATTER_PATTERN.match(
+            content
+        )
+        return match.group(0) if match else ""
+
     def _extract_frontmatter(self, content: str) -> tuple[str, str]:
         """Extract frontmatter from markdown content if present.
 
@@ -401,41 +810,71 @@ class MarkdownChunker(SemanticChunker):
         Returns:
             Tuple of (frontmatter, content_without_frontmatter)
         """
-        # Look for frontmatter between --- or +++ delimiters
-        frontmatter_pattern = re.compile(r"^---\s*$\n(.*?)\n^---\s*$\n", re.MULTILINE | re.DOTALL)
-        match = frontmatter_pattern.match(content)
+        frontmatter = self._match_frontmatter(content)
+        return frontmatter, content[len(frontmatter) :]
 
-        if not match:
-            # Try +++ delimiter
-            frontmatter_pattern = re.compile(
-                r"^\+\+\+\s*$\n(.*?)\n^\+\+\+\s*$\n", re.MULTILINE | re.DOTALL
-            )
-            match = frontmatter_pattern.match(content)
 
-        if match:
-            frontmatter = match.group(0)
-            content_without_frontmatter = content[len(frontmatter) :]
-            return frontmatter, content_without_frontmatter
-        else:
-            return "", content
+@dataclass(frozen=True)
+class CodeSpan:
+    """A planned chunk of a source file, as a range of its lines."""
+
+    start: int  # Index of the first line
+    end: int  # Index after the last line
+    definition_type: str  # "class", "function", "statement" or "group" for merged spans
+    definition_line: str  # First line of the first definition in the span
+    context: tuple[str, ...] = ()  # Header lines of the enclosing definitions, if split
 
 
 class CodeChunker(ChunkingStrategy):
-    """Specialized chunker for code files that respects code structure."""
+    """Specialized chunker for code files that respects code structure.
+
+    Python files are chunked on the definitions of their syntax tree by default, falling
+    back to regex-based chunking for files that do not parse.
+    """
+
+    # Class constants
+    PYTHON_MODES: ClassVar[tuple[str, ...]] = ("ast", "regex")
+    PARSE_CACHE_SIZE: ClassVar[int] = 256
+
+    # Lines as the Python parser counts them, with their line endings
+    LINE_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"[^\n]*\n|[^\n]+")
 
     def __init__(
         self,
         max_chunk_size: int = 2500,
         min_chunk_size: int = 200,
+        python_mode: str = "ast",
+        token_estimator: TokenEstimator | None = None,
     ):
         """Initialize the code chunker.
 
         Args:
-            max_chunk_size: Maximum size of a chunk in characters.
-            min_chunk_size: Minimum size of a chunk in characters.
+            max_chunk_size: Maximum size of a chunk in characters, or in tokens with a
+                token estimator.
+            min_chunk_size: Minimum size of a chunk in characters, or in tokens with a
+                token estimator. Not used when chunking along the syntax tree, which
+                merges neighbouring definitions while they fit and never exceeds
+                max_chunk_size, so chunks are only smaller where a merge would exceed it.
+            python_mode: How Python files are chunked: "ast" splits on the definitions of
+                the syntax tree and merges small neighbouring definitions, "regex" splits
+                at top-level class and def lines.
+            token_estimator: Optional estimator to measure chunk sizes in tokens.
         """
+        if python_mode not in self.PYTHON_MODES:
+            raise ValueError(
+                f"Invalid Python chunking mode '{python_mode}', "
+                f"expected one of: {', '.join(self.PYTHON_MODES)}"
+            )
+
         self.max_chunk_size = max_chunk_size
         self.min_chunk_size = min_chunk_size
+        self.python_mode = python_mode
+        self.token_estimator = token_estimator
+
+        # Planned spans of recently chunked Python files by content hash; None if the file
+        # does not parse
+        self._span_cache: OrderedDict[str, list[CodeSpan] | None] = OrderedDict()
+        self._span_cache_lock = threading.Lock()
 
     def chunk_document(self, content: str, metadata: dict[str, Any]) -> list[DocumentChunk]:
         """Split a code file into chunks respecting code structure.
@@ -453,6 +892,10 @@ class CodeChunker(ChunkingStrategy):
 
         # Use language-specific chunking if available
         if file_extension in ["py", "python"]:
+            if self.python_mode == "ast":
+                chunks = self._chunk_python_ast(content, metadata)
+                if chunks is not None:
+                    return chunks
             return self._chunk_python(content, metadata)
         elif file_extension in ["js", "jsx", "ts", "tsx"]:
             return self._chunk_javascript(content, metadata)
@@ -487,6 +930,268 @@ class CodeChunker(ChunkingStrategy):
 
         return self._create_chunks_from_definitions(content, definitions, metadata)
 
+    def _chunk_python_ast(
+        self, content: str, metadata: dict[str, Any]
+    ) -> list[DocumentChunk] | None:
+        """Split Python code into chunks along the definitions of its syntax tree.
+
+        Args:
+            content: The Python code.
+            metadata: Metadata about the document.
+
+        Returns:
+            A list of DocumentChunk objects, or None if the code does not parse.
+        """
+        spans = self._get_python_spans(content)
+        if spans is None:
+            return None
+
+        lines = self.LINE_PATTERN.findall(content)
+        chunks = []
+        for chunk_index, span in enumerate(spans):
+            text = "".join(lines[span.start : span.end])
+            if span.context:
+                text = "\n".join(span.context) + "\n" + text
+
+            chunks.append(
+                DocumentChunk(
+                    id=self._create_chunk_id(metadata, chunk_index),
+                    text=text,
+                    metadata={
+                        **metadata,
+                        "chunk_index": chunk_index,
+                        "definition_type": span.definition_type,
+                        "definition_line": span.definition_line,
+                        "line_start": span.start + 1,
+                        "line_end": span.end,
+                        "chunk_size": len(text),
+                    },
+                )
+            )
+
+        return chunks
+
+    def _get_python_spans(self, content: str) -> list[CodeSpan] | None:
+        """Get the planned chunk spans of Python code, reusing recent results.
+
+        Args:
+            content: The Python code.
+
+        Returns:
+            A list of CodeSpan objects, or None if the code does not parse.
+        """
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+        with self._span_cache_lock:
+            if content_hash in self._span_cache:
+                self._span_cache.move_to_end(content_hash)
+                return self._span_cache[content_hash]
+
+        spans = self._plan_python_spans(content)
+
+        with self._span_cache_lock:
+            self._span_cache[content_hash] = spans
+            if len(self._span_cache) > self.PARSE_CACHE_SIZE:
+                self._span_cache.popitem(last=False)
+
+        return spans
+
+    def _plan_python_spans(self, content: str) -> list[CodeSpan] | None:
+        """Plan the chunks of Python code from its syntax tree.
+
+        Args:
+            content: The Python code.
+
+        Returns:
+            A list of CodeSpan objects, or None if the code does not parse.
+        """
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError) as e:
+            logger.debug(f"Falling back to regex chunking for unparseable Python: {e}")
+            return None
+
+        lines = self.LINE_PATTERN.findall(content)
+        last = tree.body[-1] if tree.body else None
+        if last is not None and (last.end_lineno or last.lineno) > len(lines):
+            # Line breaks the parser counts differently, such as lone carriage returns
+            return None
+
+        # Total size of the lines before every line
+        totals = [0]
+        for line in lines:
+            totals.append(totals[-1] + self._measure(line))
+
+        spans = self._plan_python_body(tree.body, lines, totals, 0, len(lines), ())
+        return [
+            span for span in spans if any(line.strip() for line in lines[span.start : span.end])
+        ]
+
+    def _plan_python_body(
+        self,
+        nodes: list[ast.stmt],
+        lines: list[str],
+        totals: list[int],
+        start: int,
+        end: int,
+        context: tuple[str, ...],
+    ) -> list[CodeSpan]:
+        """Plan the chunks of a range of lines holding a sequence of statements.
+
+        Every statement starts a span at its first decorator, or at the comment lines
+        directly above it, and the span runs until the next statement. Spans that exceed
+        the maximum chunk size are split along the statements of their body, or into lines,
+        and neighbouring spans are merged as long as they fit.
+
+        Args:
+            nodes: The statements in the range.
+            lines: The lines of the code.
+            totals: The total size of the lines before every line.
+            start: Index of the first line of the range.
+            end: Index after the last line of the range.
+            context: Header lines of the definitions enclosing the range.
+
+        Returns:
+            A list of CodeSpan objects covering the range.
+        """
+        if not nodes:
+            return self._split_python_lines(start, end, "statement", "", lines, totals, context)
+
+        # First line of each statement, including its decorators and leading comments
+        boundaries = [start]
+        previous_end = start
+        for i, node in enumerate(nodes):
+            node_start = min(
+                [node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])]
+            ) - 1
+            while node_start > previous_end and lines[node_start - 1].lstrip().startswith("#"):
+                node_start -= 1
+            if i > 0:
+                boundaries.append(max(node_start, boundaries[-1]))
+            previous_end = node.end_lineno or node.lineno
+        boundaries.append(end)
+
+        context_size = sum(self._measure(line) + 1 for line in context)
+        spans: list[CodeSpan] = []
+        for node, span_start, span_end in zip(nodes, boundaries, boundaries[1:], strict=False):
+            if isinstance(node, ast.ClassDef):
+                definition_type = "class"
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                definition_type = "function"
+            else:
+                definition_type = "statement"
+            definition_line = lines[node.lineno - 1].strip()
+
+            if context_size + totals[span_end] - totals[span_start] <= self.max_chunk_size:
+                spans.append(
+                    CodeSpan(span_start, span_end, definition_type, definition_line, context)
+                )
+            elif isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                # Split a large definition along its body, repeating its header in every
+                # part after the first
+                header = self._python_header(node, lines)
+                body_spans = self._plan_python_body(
+                    node.body, lines, totals, span_start, span_end, context + header
+                )
+                spans.append(
+                    replace(
+                        body_spans[0],
+                        definition_type=definition_type,
+                        definition_line=definition_line,
+                        context=context,
+                    )
+                )
+                spans.extend(body_spans[1:])
+            else:
+                spans.extend(
+                    self._split_python_lines(
+                        span_start,
+                        span_end,
+                        definition_type,
+                        definition_line,
+                        lines,
+                        totals,
+                        context,
+                    )
+                )
+
+        # Merge neighbouring spans that share their context while they fit
+        merged: list[CodeSpan] = []
+        for span in spans:
+            previous = merged[-1] if merged else None
+            if (
+                previous is not None
+                and previous.context == span.context
+                and previous.end == span.start
+                and sum(self._measure(line) + 1 for line in span.context)
+                + totals[span.end]
+                - totals[previous.start]
+                <= self.max_chunk_size
+            ):
+                merged[-1] = replace(previous, end=span.end, definition_type="group")
+            else:
+                merged.append(span)
+
+        return merged
+
+    @staticmethod
+    def _python_header(
+        node: ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef, lines: list[str]
+    ) -> tuple[str, ...]:
+        """Get the header lines of a definition, such as a signature split over lines.
+
+        Args:
+            node: The class or function definition.
+            lines: The lines of the code.
+
+        Returns:
+            The lines from the definition line up to its body, without trailing blank and
+            comment lines.
+        """
+        first = node.body[0]
+        body_start = min([first.lineno] + [d.lineno for d in getattr(first, "decorator_list", [])])
+
+        header_start = node.lineno - 1
+        header_end = max(body_start - 1, header_start + 1)
+        while header_end - 1 > header_start and (
+            not lines[header_end - 1].strip() or lines[header_end - 1].lstrip().startswith("#")
+        ):
+            header_end -= 1
+        return tuple(line.rstrip() for line in lines[header_start:header_end])
+
+    def _split_python_lines(
+        self,
+        start: int,
+        end: int,
+        definition_type: str,
+        definition_line: str,
+        lines: list[str],
+        totals: list[int],
+        context: tuple[str, ...],
+    ) -> list[CodeSpan]:
+        """Split a range of lines into spans of at most the maximum chunk size.
+
+        Args:
+            start: Index of the first line of the range.
+            end: Index after the last line of the range.
+            definition_type: The type of definition the lines belong to.
+            definition_line: First line of the definition the lines belong to.
+            lines: The lines of the code.
+            totals: The total size of the lines before every line.
+            context: Header lines of the definitions enclosing the range.
+
+        Returns:
+            A list of CodeSpan objects covering the range.
+        """
+        budget = self.max_chunk_size - sum(self._measure(line) + 1 for line in context)
+        spans = []
+        span_start = start
+        for i in range(start + 1, end + 1):
+            if i == end or totals[i + 1] - totals[span_start] > budget:
+                spans.append(CodeSpan(span_start, i, definition_type, definition_line, context))
+                span_start = i
+        return spans
+
     def _chunk_javascript(self, content: str, metadata: dict[str, Any]) -> list[DocumentChunk]:
         """Split JavaScript/TypeScript code into semantic chunks.
 
@@ -591,7 +1296,7 @@ class CodeChunker(ChunkingStrategy):
         chunk_index = 0
 
         for line in lines:
-            line_size = len(line) + 1  # +1 for the newline
+            line_size = self._measure(line) + 1  # +1 for the newline
 
             # If adding this line would exceed max size and we already have content,
             # finish the current chunk and start a new one
@@ -697,7 +1402,7 @@ class CodeChunker(ChunkingStrategy):
             def_type = "class" if "class" in def_line else "function"
 
             # If chunk is too large, split it further
-            if len(definition_text) > self.max_chunk_size:
+            if self._measure(definition_text) > self.max_chunk_size:
                 subcontent = definition_text
                 lines = subcontent.split("\n")
 
@@ -708,10 +1413,10 @@ class CodeChunker(ChunkingStrategy):
                 # Always include definition line
                 definition_line = lines[0]
                 current_lines.append(definition_line)
-                current_size = len(definition_line) + 1
+                current_size = self._measure(definition_line) + 1
 
                 for line in lines[1:]:
-                    line_size = len(line) + 1
+                    line_size = self._measure(line) + 1
 
                     if (
                         current_size + line_size > self.max_chunk_size
@@ -737,7 +1442,8 @@ class CodeChunker(ChunkingStrategy):
 
                         # Start new chunk with definition line again for context
                         current_lines = [definition_line + " /* continued */"]
-                        current_size = len(definition_line) + 15  # +15 for "/* continued */"
+                        # +15 for "/* continued */"
+                        current_size = self._measure(definition_line) + 15
                         chunk_index += 1
                         subcontent_index += 1
 
@@ -821,11 +1527,10 @@ class ChunkingStrategyFactory:
             The detected document type.
         """
         # First check file extension
-        if file_path.endswith((".md", ".markdown", ".mdown")):
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension in MARKDOWN_EXTENSIONS:
             return "markdown"
-        elif file_path.endswith(
-            (".py", ".js", ".ts", ".java", ".c", ".cpp", ".h", ".go", ".rb", ".php", ".cs")
-        ):
+        elif extension in CODE_EXTENSIONS:
             return "code"
 
         # If content is provided, try to detect based on content
@@ -845,39 +1550,58 @@ class ChunkingStrategyFactory:
 
 
 class DuplicateContentDetector:
-    """Detect and manage duplicate content across document chunks."""
+    """Detect and manage duplicate content across document chunks.
+
+    The detector is thread-safe, since files are chunked on a worker pool while earlier
+    batches delete their chunks.
+    """
 
     def __init__(self):
         """Initialize the duplicate content detector."""
         self.content_hashes = {}  # Map from content hash to document ID
+        self.chunk_hashes = {}  # Map from document ID to the content hash it was seen with
+        self._lock = threading.RLock()
 
-    def process_chunks(self, chunks: list[DocumentChunk]) -> list[DocumentChunk]:
+    def process_chunks(
+        self, chunks: list[DocumentChunk], exclude_ids: Iterable[str] = ()
+    ) -> list[DocumentChunk]:
         """Process chunks to detect and mark duplicates.
 
         Args:
             chunks: List of document chunks to process.
+            exclude_ids: IDs of known chunks that cannot be originals unless one of the
+                chunks reuses the ID, usually the chunks the file produced last time.
 
         Returns:
             List of chunks with duplicates marked or removed.
         """
         unique_chunks = []
+        excluded = set(exclude_ids)
+
+        with self._lock:
+            for chunk in chunks:
+                excluded.discard(chunk.id)
+                original_id = self.content_hashes.get(chunk.content_hash)
+                if (
+                    original_id is not None
+                    and original_id != chunk.id
+                    and original_id not in excluded
+                ):
+                    # This is a duplicate - add reference to the original in metadata
+                    logger.info(
+                        f"Detected duplicate content: chunk {chunk.id} duplicates {original_id}"
+                    )
 
-        for chunk in chunks:
-            if chunk.content_hash in self.content_hashes:
-                # This is a duplicate - add reference to the original in metadata
-                original_id = self.content_hashes[chunk.content_hash]
-                logger.info(
-                    f"Detected duplicate content: chunk {chunk.id} duplicates {original_id}"
-                )
-
-                # We could either skip this chunk or add with duplicate reference
-                # Here we choose to add it with a reference
-                chunk.metadata["duplicate_of"] = original_id
-                unique_chunks.append(chunk)
-            else:
-                # This is a new chunk
-                self.content_hashes[chunk.content_hash] = chunk.id
-                unique_chunks.append(chunk)
+                    # The processor decides whether to store it with the original's
+                    # embedding or to drop it
+                    chunk.metadata["duplicate_of"] = original_id
+                    unique_chunks.append(chunk)
+                else:
+                    # This is a new chunk, or a known chunk seen again
+                    self.remove([chunk.id])
+                    self.content_hashes[chunk.content_hash] = chunk.id
+                    self.chunk_hashes[chunk.id] = chunk.content_hash
+                    unique_chunks.append(chunk)
 
         return unique_chunks
 
@@ -887,11 +1611,26 @@ class DuplicateContentDetector:
         Returns:
             The number of unique chunks.
         """
-        return len(self.content_hashes)
+        with self._lock:
+            return len(self.content_hashes)
+
+    def remove(self, chunk_ids: list[str]) -> None:
+        """Forget chunks that were deleted or whose content changed.
+
+        Args:
+            chunk_ids: IDs of the chunks to forget.
+        """
+        with self._lock:
+            for chunk_id in chunk_ids:
+                content_hash = self.chunk_hashes.pop(chunk_id, None)
+                if content_hash is not None and self.content_hashes.get(content_hash) == chunk_id:
+                    del self.content_hashes[content_hash]
 
     def reset(self) -> None:
         """Reset the duplicate detector state."""
-        self.content_hashes = {}
+        with self._lock:
+            self.content_hashes = {}
+            self.chunk_hashes = {}
 
 
 class DocumentProcessor:
@@ -910,6 +1649,15 @@ class DocumentProcessor:
         db_path: str | None = None,
         enable_deduplication: bool = True,
         embedding_strategy: str | EmbeddingStrategy | None = None,
+        manifest_path: str | None = None,
+        include_patterns: list[str] | None = None,
+        exclude_patterns: list[str] | None = None,
+        document_types: dict[str, str] | None = None,
+        near_duplicate_distance: int | None = None,
+        duplicate_action: str = "reuse",
+        python_chunking: str = "ast",
+        chunk_token_budget: int | None = None,
+        token_estimator: str | TokenEstimator | None = None,
     ):
         """Initialize the document processor.
 
@@ -919,7 +1667,38 @@ class DocumentProcessor:
             db_path: Optional path for ChromaDB storage.
             enable_deduplication: Whether to enable content deduplication.
             embedding_strategy: Strategy to use for embeddings.
+            manifest_path: Optional path for the ingestion manifest. Defaults to a file
+                next to the ChromaDB storage named after the collection.
+            include_patterns: Gitignore-style patterns of files to ingest. Defaults to
+                markdown files.
+            exclude_patterns: Gitignore-style patterns of files to skip, on top of the
+                gitignore patterns.
+            document_types: Optional mapping of gitignore-style pattern to document type
+                ("markdown", "code", "semantic" or "fixed"), overriding type detection.
+            near_duplicate_distance: Optional maximum SimHash distance in bits for chunks
+                to count as near-duplicates. If None, only exact duplicates are detected.
+                Requires deduplication to be enabled.
+            duplicate_action: What to do with duplicate chunks: "reuse" stores them with
+                the embedding of the chunk they duplicate, "drop" does not store them.
+                Dropped chunks are only reconsidered once their file changes.
+            python_chunking: How code chunking splits Python files: "ast" along the
+                definitions of the syntax tree, "regex" at top-level class and def lines.
+            chunk_token_budget: Optional maximum size of a chunk in tokens. If None, chunks
+                are sized in characters with the defaults of each chunker.
+            token_estimator: Estimator used with a token budget, or the type of estimator
+                to create ("auto", "tiktoken" or "heuristic"). Defaults to "auto".
         """
+        if duplicate_action not in DUPLICATE_ACTIONS:
+            raise ValueError(
+                f"Invalid duplicate action '{duplicate_action}', "
+                f"expected one of: {', '.join(DUPLICATE_ACTIONS)}"
+            )
+        if python_chunking not in CodeChunker.PYTHON_MODES:
+            raise ValueError(
+                f"Invalid Python chunking mode '{python_chunking}', "
+                f"expected one of: {', '.join(CodeChunker.PYTHON_MODES)}"
+            )
+
         self.anthropic_client = Anthropic(
             api_key=anthropic_api_key or os.environ.get("ANTHROPIC_API_KEY")
         )
@@ -959,21 +1738,65 @@ class DocumentProcessor:
         else:
             self.embedding_strategy = EmbeddingStrategyFactory.create_strategy("default")
 
-        # Initialize deduplication if enabled
-        self.enable_deduplication = enable_deduplication
-        self.duplicate_detector = DuplicateContentDetector() if enable_deduplication else None
-
         # Load gitignore patterns
         self.gitignore_spec = self._load_gitignore()
 
-        # Track processed files to avoid reprocessing
-        self.processed_files: dict[str, str] = {}  # file_path -> hash
+        # Compile file selection and type routing patterns
+        self.include_spec = pathspec.PathSpec.from_lines(
+            "gitwildmatch", include_patterns or DEFAULT_INCLUDE_PATTERNS
+        )
+        self.exclude_spec = pathspec.PathSpec.from_lines("gitwildmatch", exclude_patterns or [])
+        self.walker = GitignoreWalker(base_specs=[self.gitignore_spec, self.exclude_spec])
+        self.document_type_specs = [
+            (pathspec.PathSpec.from_lines("gitwildmatch", [pattern]), document_type)
+            for pattern, document_type in (document_types or {}).items()
+        ]
 
-        # Initialize directory watchers
-        self.watchers: dict[str, Observer] = {}  # directory -> Observer
+        # Chunkers keep no per-file state, so one instance per document type is reused
+        self.python_chunking = python_chunking
+        self.chunk_token_budget = chunk_token_budget
+        self.token_estimator: TokenEstimator | None = None
+        if chunk_token_budget is not None:
+            if isinstance(token_estimator, TokenEstimator):
+                self.token_estimator = token_estimator
+            else:
+                self.token_estimator = TokenEstimatorFactory.create_estimator(
+                    token_estimator or "auto"
+                )
+            logger.info(
+                f"Sizing chunks to {chunk_token_budget} tokens with "
+                f"{type(self.token_estimator).__name__}"
+            )
+        self.chunking_strategies: dict[str, ChunkingStrategy] = {}
 
-    def _initialize_chroma_db(self) -> None:
-        """Initialize the ChromaDB client and collection."""
+        # Track processed files across runs to avoid reprocessing
+        self.manifest = self._load_manifest(manifest_path)
+
+        # Record committed progress of directory runs so they can be resumed
+        self.checkpoint = self._load_checkpoint()
+
+        # Initialize deduplication if enabled
+        self.enable_deduplication = enable_deduplication
+        self.duplicate_action = duplicate_action
+        self.duplicate_detector: DuplicateContentDetector | NearDuplicateDetector | None = None
+        if enable_deduplication:
+            if near_duplicate_distance is not None:
+                self.duplicate_detector = self._load_near_duplicate_detector(
+                    near_duplicate_distance
+                )
+            else:
+                self.duplicate_detector = DuplicateContentDetector()
+
+        # Measure what the ingestion pipeline actually does
+        self.metrics = IngestionMetrics()
+
+        # Initialize directory watchers
+        self.watchers: dict[str, Observer] = {}  # directory -> Observer
+        self.watch_callbacks: dict[str, Callable[[str], None]] = {}  # directory -> callback
+        self.ingestion_queue: IngestionQueue | None = None
+
+    def _initialize_chroma_db(self) -> None:
+        """Initialize the ChromaDB client and collection."""
         try:
             # List contents of DB directory
             if os.path.exists(self.db_path):
@@ -988,6 +1811,7 @@ class DocumentProcessor:
 
             # Initialize ChromaDB client
             self.chroma_client = chromadb.PersistentClient(path=self.db_path)
+            self.is_persistent = True
             logger.info(
                 f"ChromaDB client initialized successfully with persistence at: {self.db_path}"
             )
@@ -1014,9 +1838,100 @@ class DocumentProcessor:
             # Fallback to in-memory if persistence fails
             logger.warning("Falling back to in-memory ChromaDB")
             self.chroma_client = chromadb.Client()
+            self.is_persistent = False
             self.collection = self.chroma_client.get_or_create_collection(name=self.collection_name)
             self.initial_doc_count = 0
 
+    def _load_manifest(self, manifest_path: str | None) -> IngestionManifest:
+        """Load the ingestion manifest that tracks previously ingested files.
+
+        Args:
+            manifest_path: Optional explicit path for the manifest file.
+
+        Returns:
+            The ingestion manifest, kept in memory only if ChromaDB is not persistent.
+        """
+        if not self.is_persistent:
+            # An in-memory collection starts empty, so nothing on disk can describe it
+            return IngestionManifest()
+
+        manifest = IngestionManifest(
+            manifest_path or os.path.join(self.db_path, f"{self.collection_name}.manifest.json")
+        )
+
+        # A manifest without stored documents is stale (e.g. the collection was deleted)
+        if len(manifest) > 0 and self.initial_doc_count == 0:
+            logger.warning(
+                f"Collection '{self.collection_name}' is empty, resetting ingestion manifest"
+            )
+            manifest.clear()
+            manifest.save()
+
+        return manifest
+
+    def _load_checkpoint(self) -> IngestionCheckpoint:
+        """Load the checkpoint of an interrupted directory ingestion run.
+
+        Returns:
+            The ingestion checkpoint, kept in memory only if ChromaDB or the manifest is
+            not persistent.
+        """
+        manifest_path = self.manifest.path
+        if not self.is_persistent or manifest_path is None:
+            return IngestionCheckpoint()
+
+        manifest_dir = os.path.dirname(os.path.abspath(manifest_path))
+        checkpoint = IngestionCheckpoint(
+            os.path.join(manifest_dir, f"{self.collection_name}.checkpoint.json")
+        )
+
+        # Nothing committed by the run survives if the collection was emptied
+        if checkpoint.active and self.initial_doc_count == 0:
+            logger.warning(
+                f"Collection '{self.collection_name}' is empty, discarding ingestion checkpoint"
+            )
+            checkpoint.finish()
+            checkpoint.save()
+
+        return checkpoint
+
+    def _load_near_duplicate_detector(self, max_distance: int) -> NearDuplicateDetector:
+        """Load the near-duplicate index of the chunks stored in the collection.
+
+        Args:
+            max_distance: Maximum SimHash distance in bits for chunks to count as
+                near-duplicates.
+
+        Returns:
+            The near-duplicate detector, kept in memory only if ChromaDB is not persistent.
+        """
+        if not self.is_persistent:
+            return NearDuplicateDetector(max_distance)
+
+        detector = NearDuplicateDetector(
+            max_distance, path=os.path.join(self.db_path, f"{self.collection_name}.simhash.json")
+        )
+
+        # Like the manifest, an index without stored documents is stale
+        if len(detector) > 0 and self.initial_doc_count == 0:
+            logger.warning(
+                f"Collection '{self.collection_name}' is empty, resetting near-duplicate index"
+            )
+            detector.reset()
+            detector.save()
+
+        return detector
+
+    def save_state(self) -> None:
+        """Persist the ingestion manifest, the near-duplicate index and the checkpoint.
+
+        The checkpoint is saved last so it never records work the manifest does not.
+        """
+        self.manifest.save()
+        if isinstance(self.duplicate_detector, NearDuplicateDetector):
+            self.duplicate_detector.save()
+        self.checkpoint.save()
+
     def _load_gitignore(self) -> pathspec.PathSpec:
         """Load the gitignore patterns from the repository.
 
@@ -1070,7 +1985,9 @@ class DocumentProcessor:
         return pathspec.PathSpec.from_lines("gitwildmatch", gitignore_patterns)
 
     def is_ignored(self, path: str) -> bool:
-        """Check if a path should be ignored based on gitignore patterns.
+        """Check if a path should be ignored based on gitignore and exclude patterns.
+
+        Nested .gitignore files between the working directory and the path are honored.
 
         Args:
             path: The path to check.
@@ -1078,10 +1995,75 @@ class DocumentProcessor:
         Returns:
             True if the path should be ignored, False otherwise.
         """
-        # Convert to relative path
-        rel_path = os.path.relpath(path, os.getcwd())
+        return self.walker.is_ignored(path)
+
+    def is_included(self, path: str) -> bool:
+        """Check if a path matches the include patterns.
+
+        Args:
+            path: The path to check.
+
+        Returns:
+            True if the path matches an include pattern, False otherwise.
+        """
+        rel_path = os.path.relpath(path, self.walker.root)
         # Explicitly cast to bool to avoid Any return type
-        return bool(self.gitignore_spec.match_file(rel_path))
+        return bool(self.include_spec.match_file(rel_path))
+
+    def should_ingest(self, path: str) -> bool:
+        """Check if a file matches the include patterns and is neither excluded nor ignored.
+
+        Args:
+            path: The path to check.
+
+        Returns:
+            True if the file should be ingested, False otherwise.
+        """
+        return self.is_included(path) and not self.is_ignored(path)
+
+    def should_ingest_member(self, name: str) -> bool:
+        """Check if an archive member matches the include patterns and is not skipped.
+
+        Members are matched by their path inside the archive against the include,
+        exclude and gitignore patterns of the working directory.
+
+        Args:
+            name: Normalized path of the member inside the archive.
+
+        Returns:
+            True if the member should be ingested, False otherwise.
+        """
+        if not self.include_spec.match_file(name):
+            return False
+        return not (self.gitignore_spec.match_file(name) or self.exclude_spec.match_file(name))
+
+    def iter_files(self, base_dir: str, recursive: bool = True) -> Iterator[str]:
+        """Lazily yield the files to ingest in the specified directory.
+
+        Ignored and excluded directories are pruned without being traversed.
+
+        Args:
+            base_dir: The base directory to search from.
+            recursive: Whether to include files in subdirectories.
+
+        Yields:
+            Paths to files matching the include patterns.
+        """
+        for file_path in self.walker.walk(base_dir, recursive=recursive):
+            if self.is_included(file_path):
+                yield file_path
+
+    def get_all_files(self, base_dir: str, recursive: bool = True) -> list[str]:
+        """Get all files to ingest in the specified directory.
+
+        Args:
+            base_dir: The base directory to search from.
+            recursive: Whether to include files in subdirectories.
+
+        Returns:
+            A list of paths to files matching the include patterns.
+        """
+        return list(self.iter_files(base_dir, recursive=recursive))
 
     def get_all_markdown_files(self, base_dir: str) -> list[str]:
         """Get all markdown files in the specified directory and its subdirectories.
@@ -1092,17 +2074,67 @@ class DocumentProcessor:
         Returns:
             A list of paths to markdown files.
         """
-        all_md_files = glob.glob(f"{base_dir}/**/*.md", recursive=True)
+        return [f for f in self.get_all_files(base_dir) if f.endswith(MARKDOWN_EXTENSIONS)]
 
-        # Filter out ignored files
-        filtered_files = [f for f in all_md_files if not self.is_ignored(f)]
+    def get_document_type(self, file_path: str, content: str | None = None) -> str:
+        """Get the document type of a file, honoring configured type routing.
 
-        if len(all_md_files) != len(filtered_files):
-            logger.info(
-                f"Excluded {len(all_md_files) - len(filtered_files)} files due to gitignore patterns"
+        Args:
+            file_path: Path to the document.
+            content: Optional document content for more accurate detection.
+
+        Returns:
+            The document type.
+        """
+        if self.document_type_specs:
+            rel_path = os.path.relpath(file_path, os.getcwd())
+            for spec, document_type in self.document_type_specs:
+                if spec.match_file(rel_path):
+                    return document_type
+
+        return ChunkingStrategyFactory.detect_document_type(file_path, content)
+
+    def get_chunking_strategy(self, document_type: str) -> ChunkingStrategy:
+        """Get the cached chunking strategy for a document type.
+
+        Args:
+            document_type: The type of document to chunk.
+
+        Returns:
+            A ChunkingStrategy instance.
+        """
+        strategy = self.chunking_strategies.get(document_type)
+        if strategy is None:
+            strategy = ChunkingStrategyFactory.create_strategy(
+                document_type, **self._get_chunker_options(document_type)
             )
+            self.chunking_strategies[document_type] = strategy
+        return strategy
+
+    def _get_chunker_options(self, document_type: str) -> dict[str, Any]:
+        """Get the options to create the chunker for a document type with.
 
-        return filtered_files
+        Args:
+            document_type: The type of document to chunk.
+
+        Returns:
+            Keyword arguments for ChunkingStrategyFactory.create_strategy.
+        """
+        options: dict[str, Any] = {}
+        if document_type == "code":
+            options["python_mode"] = self.python_chunking
+
+        budget = self.chunk_token_budget
+        if budget is not None:
+            options["token_estimator"] = self.token_estimator
+            if document_type in ("markdown", "semantic", "code"):
+                options["max_chunk_size"] = budget
+                options["min_chunk_size"] = budget // 10
+            else:
+                options["chunk_size"] = budget
+                options["chunk_overlap"] = budget // 5
+
+        return options
 
     def get_file_hash(self, file_path: str) -> str:
         """Generate a hash of the file contents.
@@ -1114,38 +2146,156 @@ class DocumentProcessor:
             Hash of the file contents.
         """
         try:
-            with open(file_path, "rb") as f:
-                return hashlib.md5(f.read()).hexdigest()
+            return hash_file(file_path)
         except Exception as e:
             logger.error(f"Error generating hash for {file_path}: {e}")
             return ""
 
+    def _stat_if_changed(self, file_path: str) -> os.stat_result | None:
+        """Stat a file and check it against the manifest without reading it.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            The stat result if the file may have changed, or None if its size and
+            modification time are unchanged or it cannot be accessed.
+        """
+        try:
+            file_stat = os.stat(file_path)
+        except OSError as e:
+            logger.error(f"Error reading file status for {file_path}: {e}")
+            return None
+
+        previous = self.manifest.get(file_path)
+        if previous and previous.matches_stat(file_stat):
+            return None  # Same size and mtime, no need to hash
+
+        return file_stat
+
+    def _record_file_hash(
+        self, file_path: str, size: int, mtime_ns: int, content_hash: str
+    ) -> bool:
+        """Compare a file's content hash with the manifest and record the outcome.
+
+        A changed file is staged in the manifest until its chunks are stored, while a
+        file that was only touched gets its recorded stat refreshed.
+
+        Args:
+            file_path: Path to the file.
+            size: Size in bytes the hash was computed for.
+            mtime_ns: Modification time in nanoseconds the hash was computed for.
+            content_hash: Hash of the current file contents.
+
+        Returns:
+            True if the file has changed, False otherwise.
+        """
+        previous = self.manifest.get(file_path)
+        if previous and previous.content_hash == content_hash:
+            # File was touched but not modified, refresh its stat for the next check
+            previous.size = size
+            previous.mtime_ns = mtime_ns
+            self.manifest.update(file_path, previous)
+            return False
+
+        # File is new or has changed
+        self.manifest.stage(
+            file_path, ManifestEntry(size=size, mtime_ns=mtime_ns, content_hash=content_hash)
+        )
+        return True
+
     def has_file_changed(self, file_path: str) -> bool:
         """Check if a file has changed since last processing.
 
+        Unchanged size and modification time short-circuit the check without reading the
+        file. Otherwise the content hash is compared, and a changed file is staged in the
+        manifest until its chunks are stored.
+
         Args:
             file_path: Path to the file.
 
         Returns:
             True if the file has changed, False otherwise.
         """
-        current_hash = self.get_file_hash(file_path)
-        previous_hash = self.processed_files.get(file_path)
+        file_stat = self._stat_if_changed(file_path)
+        if file_stat is None:
+            return False
 
+        current_hash = self.get_file_hash(file_path)
         if not current_hash:
             return False  # Error reading file
 
-        if not previous_hash:
-            # File not processed before
-            self.processed_files[file_path] = current_hash
-            return True
+        return self._record_file_hash(
+            file_path, file_stat.st_size, file_stat.st_mtime_ns, current_hash
+        )
 
-        if current_hash != previous_hash:
-            # File has changed
-            self.processed_files[file_path] = current_hash
-            return True
+    def read_changed_file(self, file_path: str) -> FileContent | None:
+        """Read a file if it has changed since last processing.
+
+        Works like has_file_changed, but hashes and decodes the file from a single memory
+        mapping so changed files are only read once.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            The file contents if the file has changed, None otherwise.
+        """
+        file_stat = self._stat_if_changed(file_path)
+        if file_stat is None:
+            return None
+
+        try:
+            with self.metrics.time_stage("read"):
+                content = read_file(file_path)
+        except Exception as e:
+            logger.error(f"Error reading file {file_path}: {e!s}")
+            self.metrics.increment("errors")
+            return None
+
+        self.metrics.increment("files_read")
+        self.metrics.increment("bytes_read", content.size)
+
+        if not self._record_file_hash(
+            file_path, file_stat.st_size, file_stat.st_mtime_ns, content.content_hash
+        ):
+            return None
 
-        return False  # File unchanged
+        return content
+
+    def read_changed_member(self, member: ArchiveMember) -> FileContent | None:
+        """Read an archive member if it has changed since last processing.
+
+        Works like read_changed_file, with the size and modification time recorded in
+        the archive taking the place of the file's stat.
+
+        Args:
+            member: The archive member, positioned for reading.
+
+        Returns:
+            The member contents if the member has changed, None otherwise.
+        """
+        previous = self.manifest.get(member.path)
+        if previous and previous.matches(member.size, member.mtime_ns):
+            return None  # Same size and mtime, no need to decompress
+
+        try:
+            with self.metrics.time_stage("read"):
+                content = member.read()
+        except Exception as e:
+            logger.error(f"Error reading archive member {member.path}: {e!s}")
+            self.metrics.increment("errors")
+            return None
+
+        self.metrics.increment("files_read")
+        self.metrics.increment("bytes_read", content.size)
+
+        if not self._record_file_hash(
+            member.path, member.size, member.mtime_ns, content.content_hash
+        ):
+            return None
+
+        return content
 
     def create_file_metadata(self, file_path: str) -> FileMetadata:
         """Create metadata for a document file.
@@ -1154,7 +2304,7 @@ class DocumentProcessor:
             file_path: Path to the document.
 
         Returns:
-            File metadata with simplified ID format.
+            File metadata whose ID is unique to the file path.
         """
         file_stat = os.stat(file_path)
         rel_path = os.path.relpath(file_path, start=os.getcwd())
@@ -1169,14 +2319,9 @@ class DocumentProcessor:
         created_at = datetime.fromtimestamp(file_stat.st_ctime).isoformat()
         last_modified = datetime.fromtimestamp(file_stat.st_mtime).isoformat()
 
-        # Create simplified ID (parent_dir/filename format)
-        path_parts = Path(rel_path).parts
-        if len(path_parts) > 1:
-            # Use parent directory and filename
-            simple_id = f"{path_parts[-2]}/{file_name}"
-        else:
-            # Just use filename if no parent directory
-            simple_id = file_name
+        # Chunk IDs are built from the whole relative path, since files with the same
+        # name in different directories would otherwise overwrite each other's chunks
+        simple_id = Path(rel_path).as_posix()
 
         return FileMetadata(
             source=rel_path,
@@ -1189,11 +2334,47 @@ class DocumentProcessor:
             simple_id=simple_id,
         )
 
-    def process_file(self, file_path: str) -> list[DocumentChunk]:
+    def create_member_metadata(self, archive_path: str, member: ArchiveMember) -> FileMetadata:
+        """Create metadata for a document inside an archive.
+
+        Args:
+            archive_path: Path to the archive.
+            member: The archive member.
+
+        Returns:
+            File metadata whose source and ID are qualified with the archive.
+        """
+        rel_archive = os.path.relpath(archive_path, start=os.getcwd())
+        file_name = posixpath.basename(member.name)
+        file_type = os.path.splitext(file_name)[1].lower()[1:]  # Remove leading dot
+
+        # Extract version from the member path if available
+        version_match = re.search(r"(?:^|/)v(\d+(?:\.\d+)?)/", member.name)
+        version = version_match.group(1) if version_match else "current"
+
+        # Archives only record a modification time
+        last_modified = datetime.fromtimestamp(member.mtime_ns / 1_000_000_000).isoformat()
+
+        source = member_path(rel_archive, member.name)
+
+        return FileMetadata(
+            source=source,
+            file_name=file_name,
+            file_type=file_type,
+            created_at=last_modified,
+            last_modified=last_modified,
+            version=version,
+            size_bytes=member.size,
+            # Qualified with the archive, so it cannot clash with files on disk
+            simple_id=Path(source).as_posix(),
+        )
+
+    def process_file(self, file_path: str, previous_path: str | None = None) -> list[DocumentChunk]:
         """Process a file into chunks.
 
         Args:
             file_path: Path to the file.
+            previous_path: Optional original path if the file was renamed.
 
         Returns:
             A list of document chunks.
@@ -1203,210 +2384,535 @@ class DocumentProcessor:
             logger.info(f"Skipping ignored file: {file_path}")
             return []
 
-        # Check if file has changed
-        if not self.has_file_changed(file_path):
+        # Read the file in a single pass, unless it has not changed
+        file_content = self.read_changed_file(file_path)
+        if file_content is None:
             logger.info(f"Skipping unchanged file: {file_path}")
+            self.metrics.increment("files_skipped")
             return []
+        content = file_content.text
 
         # Log processing at the info level
         logger.info(f"Processing file: {file_path}")
 
+        # Create document metadata
+        metadata = self.create_file_metadata(file_path)
+
+        # Detect document type and chunk the file
+        document_type = self.get_document_type(file_path, content)
+        return self.chunk_content(
+            file_path, file_content, metadata, document_type, previous_path=previous_path
+        )
+
+    def chunk_content(
+        self,
+        file_path: str,
+        file_content: FileContent,
+        metadata: FileMetadata,
+        document_type: str,
+        previous_path: str | None = None,
+    ) -> list[DocumentChunk]:
+        """Chunk the contents of a changed file and stage its chunks in the manifest.
+
+        Args:
+            file_path: Path to the file, staged in the manifest by the caller.
+            file_content: The decoded file contents.
+            metadata: Metadata about the file.
+            document_type: The document type that selects the chunking strategy.
+            previous_path: Optional original path if the file was renamed.
+
+        Returns:
+            A list of document chunks.
+        """
+        content = file_content.text
+
         # Check file size and warn if it's very large
-        file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+        file_size_mb = file_content.size / (1024 * 1024)
         if file_size_mb > 10:
             logger.warning(f"Processing large file ({file_size_mb:.1f} MB): {file_path}")
 
-        # Read file content
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-        except Exception as e:
-            logger.error(f"Error reading file {file_path}: {e!s}")
-            return []
-
-        # Create document metadata
-        metadata = self.create_file_metadata(file_path)
-
-        # Detect document type and create appropriate chunking strategy
-        document_type = ChunkingStrategyFactory.detect_document_type(file_path, content)
-        chunking_strategy = ChunkingStrategyFactory.create_strategy(document_type)
+        chunking_strategy = self.get_chunking_strategy(document_type)
 
         # Create chunks
-        chunks = chunking_strategy.chunk_document(
-            content,
-            vars(metadata),  # Convert dataclass to dict
-        )
+        with self.metrics.time_stage("chunk"):
+            chunks = chunking_strategy.chunk_document(
+                content,
+                vars(metadata),  # Convert dataclass to dict
+            )
+        self.metrics.increment("chunks_produced", len(chunks))
 
         # Process for duplicates if enabled
-        if self.enable_deduplication and self.duplicate_detector:
-            chunks = self.duplicate_detector.process_chunks(chunks)
+        if self.enable_deduplication and self.duplicate_detector is not None:
+            # The file's stored chunks are deleted once its new chunks are stored, so
+            # chunks that merely shifted must not be marked as duplicates of them
+            previous = self._previous_entry(file_path, previous_path)
+            chunks = self.duplicate_detector.process_chunks(
+                chunks, exclude_ids=previous.chunk_ids if previous else ()
+            )
+            duplicate_count = sum(1 for chunk in chunks if "duplicate_of" in chunk.metadata)
+            self.metrics.increment("chunks_duplicate", duplicate_count)
+
+            # Dropped duplicates are never stored, so the manifest does not track them
+            if duplicate_count and self.duplicate_action == "drop":
+                chunks = [chunk for chunk in chunks if "duplicate_of" not in chunk.metadata]
+
+        # Remember which chunks the file produced
+        self.manifest.stage_chunks(
+            file_path, {chunk.id: chunk_fingerprint(chunk) for chunk in chunks}
+        )
 
         return chunks
 
-    def generate_embeddings(self, chunks: list[DocumentChunk]) -> None:
-        """Generate embeddings for document chunks and store them in ChromaDB.
+    def _previous_entry(
+        self, file_path: str, previous_path: str | None = None
+    ) -> ManifestEntry | None:
+        """Get the committed manifest entry holding the chunks stored for a file.
 
         Args:
-            chunks: List of document chunks to embed.
+            file_path: Path to the file.
+            previous_path: Optional original path of a renamed file, used when the file
+                has no entry of its own.
+
+        Returns:
+            The manifest entry, or None if the file has no stored chunks.
         """
-        if not chunks:
-            return
+        previous = self.manifest.get(file_path)
+        if previous is None and previous_path:
+            previous = self.manifest.get(previous_path)
+        return previous
 
-        # Prepare data for Chroma
-        chunk_count = len(chunks)
-        ids = [chunk.id for chunk in chunks]
-        texts = [chunk.text for chunk in chunks]
-        metadatas = [chunk.metadata for chunk in chunks]
+    def diff_chunks(
+        self, file_path: str, chunks: list[DocumentChunk], previous_path: str | None = None
+    ) -> ChunkDiff:
+        """Compare newly produced chunks of a file with the chunks stored for it.
 
-        logger.info(f"Embedding Generation - Total chunks to embed: {chunk_count}")
+        Args:
+            file_path: Path to the file.
+            chunks: The chunks just produced for the file.
+            previous_path: Optional original path of a renamed file, whose stored chunks
+                are used as the baseline when the file has none of its own.
+
+        Returns:
+            The chunk-level difference against the committed manifest entry.
+        """
+        previous = self._previous_entry(file_path, previous_path)
+        previous_hashes = previous.chunk_hashes if previous else {}
 
-        # Calculate batch sizes for embedding
-        estimated_token_count = sum(len(text.split()) * 1.3 for text in texts)  # Rough estimate
-        estimated_embedding_time = (
-            estimated_token_count / 15000
-        )  # Rough estimate of tokens per second
+        # Index stored chunks by text so shifted chunks can reuse their embedding
+        ids_by_hash = {chunk_hash: chunk_id for chunk_id, chunk_hash in previous_hashes.items()}
 
-        logger.info(
-            f"Estimated tokens: ~{int(estimated_token_count):,}, estimated time: ~{estimated_embedding_time:.1f} seconds"
+        diff = ChunkDiff(file_path=file_path)
+        new_ids = set()
+        for chunk in chunks:
+            new_ids.add(chunk.id)
+            fingerprint = chunk_fingerprint(chunk)
+            if previous_hashes.get(chunk.id) == fingerprint:
+                diff.unchanged.append(chunk)
+            elif fingerprint in ids_by_hash:
+                diff.moved.append((chunk, ids_by_hash[fingerprint]))
+            elif "duplicate_of" in chunk.metadata:
+                diff.duplicates.append((chunk, chunk.metadata["duplicate_of"]))
+            else:
+                diff.changed.append(chunk)
+
+        diff.deleted = [chunk_id for chunk_id in previous_hashes if chunk_id not in new_ids]
+        return diff
+
+    def prepare_file(self, file_path: str, previous_path: str | None = None) -> ChunkDiff | None:
+        """Process a file and diff its chunks against the previously stored ones.
+
+        Args:
+            file_path: Path to the file.
+            previous_path: Optional original path if the file was renamed, so chunks whose
+                text did not change can reuse their stored embeddings.
+
+        Returns:
+            The chunk diff for the file, or None if the file is ignored or unchanged.
+        """
+        chunks = self.process_file(file_path, previous_path=previous_path)
+
+        # Only files that changed since the last run are staged in the manifest
+        if self.manifest.get_staged(file_path) is None:
+            return None
+
+        return self.diff_chunks(file_path, chunks, previous_path=previous_path)
+
+    def prepare_member(self, archive_path: str, member: ArchiveMember) -> ChunkDiff | None:
+        """Process an archive member and diff its chunks against the stored ones.
+
+        Args:
+            archive_path: Path to the archive.
+            member: The archive member, positioned for reading.
+
+        Returns:
+            The chunk diff for the member, or None if the member is unchanged or cannot
+            be read.
+        """
+        file_content = self.read_changed_member(member)
+        if file_content is None:
+            logger.debug(f"Skipping unchanged archive member: {member.path}")
+            self.metrics.increment("files_skipped")
+            return None
+
+        logger.info(f"Processing archive member: {member.path}")
+        metadata = self.create_member_metadata(archive_path, member)
+
+        # Route by the path inside the archive, like files relative to the working tree
+        document_type = self.get_document_type(member.name, file_content.text)
+        chunks = self.chunk_content(member.path, file_content, metadata, document_type)
+        return self.diff_chunks(member.path, chunks)
+
+    def _store_with_embeddings_of(
+        self, pairs: list[tuple[DocumentChunk, str]]
+    ) -> list[DocumentChunk]:
+        """Store chunks with the embeddings already stored for other chunk IDs.
+
+        Args:
+            pairs: (chunk, ID of the stored chunk whose embedding it reuses) tuples.
+
+        Returns:
+            The chunks whose source embedding is missing from the collection and that
+            still have to be embedded.
+        """
+        if not pairs:
+            return []
+
+        stored = self.collection.get(
+            ids=list({source_id for _, source_id in pairs}), include=["embeddings"]
         )
+        embeddings = stored["embeddings"]
+        if embeddings is None:
+            return [chunk for chunk, _ in pairs]
 
-        # Progress tracking variables
-        import threading
-        import time
-
-        start_time = time.time()
-        progress_active = True
-
-        # Create a progress reporter thread that logs progress
-        def show_progress():
-            step = 0
-            phases = ["Preparing", "Embedding", "Storing in database"]
-            phase_index = 0
-            last_log_time = time.time()
-
-            while progress_active:
-                # Update phase based on elapsed time
-                elapsed = time.time() - start_time
-
-                # Update phase based on time estimates
-                if phase_index == 0 and elapsed > 2.0:
-                    phase_index = 1  # Move to embedding phase after 2 seconds
-                    logger.info(f"Phase: Embedding {chunk_count} chunks...")
-                elif phase_index == 1 and elapsed > estimated_embedding_time * 0.7:
-                    phase_index = 2  # Move to storing phase
-                    logger.info(f"Phase: Storing {chunk_count} chunks in database...")
-
-                # Log progress every 5 seconds
-                current_time = time.time()
-                if current_time - last_log_time > 5.0:
-                    current_phase = phases[min(phase_index, len(phases) - 1)]
-                    logger.debug(f"{current_phase}: {elapsed:.1f}s elapsed")
-                    last_log_time = current_time
+        embeddings_by_id = dict(zip(stored["ids"], embeddings, strict=False))
+        reusable = [
+            (chunk, source_id) for chunk, source_id in pairs if source_id in embeddings_by_id
+        ]
+
+        if reusable:
+            with self.metrics.time_stage("store"):
+                self.collection.upsert(
+                    ids=[chunk.id for chunk, _ in reusable],
+                    documents=[chunk.text for chunk, _ in reusable],
+                    metadatas=[dict(chunk.metadata) for chunk, _ in reusable],
+                    embeddings=[embeddings_by_id[source_id] for _, source_id in reusable],
+                )
+            self.metrics.increment("chunks_reused", len(reusable))
+            self.metrics.increment("chunks_stored", len(reusable))
 
-                # Sleep to avoid consuming too much CPU
-                step += 1
-                time.sleep(0.5)
+        return [chunk for chunk, source_id in pairs if source_id not in embeddings_by_id]
+
+    def apply_chunk_diffs(self, diffs: list[ChunkDiff]) -> bool:
+        """Write a set of chunk diffs to ChromaDB.
+
+        Only changed chunks are embedded. Chunks whose text merely moved reuse their stored
+        embedding, duplicates reuse the embedding of the chunk they duplicate, unchanged
+        chunks only get refreshed metadata, and vanished chunks are deleted. On success the
+        affected files are committed to the manifest.
+
+        Args:
+            diffs: The chunk diffs to apply.
+
+        Returns:
+            True if all diffs were applied, False otherwise.
+        """
+        file_paths = [diff.file_path for diff in diffs]
+        changed = [chunk for diff in diffs for chunk in diff.changed]
+        moved = [pair for diff in diffs for pair in diff.moved]
+        unchanged = [chunk for diff in diffs for chunk in diff.unchanged]
+        duplicates = [pair for diff in diffs for pair in diff.duplicates]
+        deleted = [chunk_id for diff in diffs for chunk_id in diff.deleted]
 
-        # Start progress thread
-        progress_thread = threading.Thread(target=show_progress)
-        progress_thread.daemon = True
-        progress_thread.start()
+        logger.info(
+            f"Applying chunk changes for {len(diffs)} files: {len(changed)} changed, "
+            f"{len(moved)} moved, {len(duplicates)} duplicate, {len(unchanged)} unchanged, "
+            f"{len(deleted)} deleted"
+        )
 
         try:
-            # Phase 1: Start embedding process
-            embedding_start = time.time()
+            # Fetch reusable embeddings before anything is overwritten. Anything missing
+            # from the collection has to be embedded again.
+            changed.extend(self._store_with_embeddings_of(moved))
+
+            if unchanged:
+                # Keep file-level metadata such as last_modified current without re-embedding
+                with self.metrics.time_stage("store"):
+                    self.collection.update(
+                        ids=[chunk.id for chunk in unchanged],
+                        metadatas=[dict(chunk.metadata) for chunk in unchanged],
+                    )
 
-            # Phase 2: Get embeddings from the strategy
-            embeddings = self.embedding_strategy.embed_documents(texts)
-            embedding_end = time.time()
-            embedding_duration = embedding_end - embedding_start
+            if not self.generate_embeddings(changed):
+                self.manifest.discard(file_paths)
+                return False
 
-            # Phase 3: Store in database
-            db_start = time.time()
+            # Originals are stored by now, including those first seen in this batch
+            missing = self._store_with_embeddings_of(duplicates)
+            if not self.generate_embeddings(missing):
+                self.manifest.discard(file_paths)
+                return False
 
-            # Add data to Chroma collection
-            if embeddings:
-                self.collection.add(
-                    ids=ids, documents=texts, metadatas=metadatas, embeddings=embeddings
-                )
-            else:
-                self.collection.add(ids=ids, documents=texts, metadatas=metadatas)
+            if deleted:
+                with self.metrics.time_stage("store"):
+                    self.collection.delete(ids=deleted)
+                self.metrics.increment("chunks_deleted", len(deleted))
+                if self.duplicate_detector is not None:
+                    self.duplicate_detector.remove(deleted)
 
-            db_end = time.time()
-            db_duration = db_end - db_start
-            total_duration = time.time() - start_time
+        except Exception as e:
+            logger.error(f"Error applying chunk changes to ChromaDB: {e}")
+            self.metrics.increment("errors")
+            self.manifest.discard(file_paths)
+            return False
 
-            # Stop progress reporting
-            progress_active = False
-            progress_thread.join(timeout=1.0)
+        self.manifest.commit(file_paths)
+        return True
+
+    def remove_files(self, file_paths: list[str]) -> int:
+        """Remove files from the manifest and delete their chunks from ChromaDB.
+
+        Args:
+            file_paths: Paths of the files to remove.
+
+        Returns:
+            Number of chunks deleted.
+        """
+        chunk_ids = []
+        for file_path in file_paths:
+            entry = self.manifest.remove(file_path)
+            if entry is not None:
+                chunk_ids.extend(entry.chunk_ids)
 
-            # Log completion
-            logger.info(f"Added {chunk_count} document chunks to Chroma DB")
+        if not chunk_ids:
+            return 0
 
-            # Log performance stats
-            logger.info(f"Embedding completed in {embedding_duration:.2f}s")
-            logger.info(f"Database storage completed in {db_duration:.2f}s")
-            logger.info(f"Total processing time: {total_duration:.2f}s")
-            logger.info(f"Throughput: {chunk_count / total_duration:.1f} chunks/second")
+        if self.duplicate_detector is not None:
+            self.duplicate_detector.remove(chunk_ids)
 
+        try:
+            # Delete in batches to avoid any potential limitations
+            batch_size = 1000
+            for i in range(0, len(chunk_ids), batch_size):
+                with self.metrics.time_stage("store"):
+                    self.collection.delete(ids=chunk_ids[i : i + batch_size])
         except Exception as e:
-            # Stop progress reporting
-            progress_active = False
-            progress_thread.join(timeout=1.0)
+            logger.error(f"Error deleting chunks for {len(file_paths)} removed files: {e}")
+            self.metrics.increment("errors")
+            return 0
+
+        self.metrics.increment("chunks_deleted", len(chunk_ids))
+
+        return len(chunk_ids)
+
+    def generate_embeddings(self, chunks: list[DocumentChunk]) -> bool:
+        """Generate embeddings for document chunks and store them in ChromaDB.
+
+        Chunks are embedded and stored in batches of EMBEDDING_BATCH_SIZE, and progress is
+        logged with an ETA based on the measured throughput.
+
+        Args:
+            chunks: List of document chunks to embed.
+
+        Returns:
+            True if the chunks were stored (or there was nothing to store), False otherwise.
+        """
+        if not chunks:
+            return True
+
+        chunk_count = len(chunks)
+        logger.info(f"Embedding Generation - Total chunks to embed: {chunk_count}")
+        self.metrics.expect("chunks_stored", chunk_count)
+
+        start_time = time.monotonic()
+        last_log_time = start_time
+        stored = 0
 
-            # Log error
+        try:
+            for i in range(0, chunk_count, EMBEDDING_BATCH_SIZE):
+                batch = chunks[i : i + EMBEDDING_BATCH_SIZE]
+                ids = [chunk.id for chunk in batch]
+                texts = [chunk.text for chunk in batch]
+                metadatas = cast(list[Metadata], [dict(chunk.metadata) for chunk in batch])
+
+                with self.metrics.time_stage("embed"):
+                    embeddings = self.embedding_strategy.embed_documents(texts)
+                self.metrics.increment("chunks_embedded", len(batch))
+
+                # Upsert data into Chroma collection so re-ingested chunks replace stale ones
+                with self.metrics.time_stage("store"):
+                    if embeddings:
+                        self.collection.upsert(
+                            ids=ids,
+                            documents=texts,
+                            metadatas=metadatas,
+                            embeddings=cast(Embeddings, embeddings),
+                        )
+                    else:
+                        self.collection.upsert(ids=ids, documents=texts, metadatas=metadatas)
+                self.metrics.increment("chunks_stored", len(batch))
+                stored += len(batch)
+
+                current_time = time.monotonic()
+                if current_time - last_log_time >= PROGRESS_LOG_INTERVAL and stored < chunk_count:
+                    eta = self.metrics.eta("chunks_stored")
+                    eta_text = f", ETA {eta:.0f}s" if eta is not None else ""
+                    logger.info(f"Progress: stored {stored}/{chunk_count} chunks{eta_text}")
+                    last_log_time = current_time
+
+        except Exception as e:
             logger.error(f"Error adding documents to ChromaDB: {e}")
             logger.error(
-                f"Failed to add documents to ChromaDB after {time.time() - start_time:.2f}s"
+                f"Failed after storing {stored}/{chunk_count} chunks in "
+                f"{time.monotonic() - start_time:.2f}s"
             )
+            self.metrics.increment("errors")
+            return False
 
-    def process_directory(self, directory: str, recursive: bool = True) -> int:
+        total_duration = time.monotonic() - start_time
+        stages = self.metrics.snapshot()["stages"]
+        logger.info(f"Stored {chunk_count} document chunks in Chroma DB")
+        logger.info(
+            f"Embedding took {stages['embed']['total_ms'] / 1000:.2f}s, "
+            f"database storage took {stages['store']['total_ms'] / 1000:.2f}s (cumulative)"
+        )
+        if total_duration > 0:
+            logger.info(
+                f"Total processing time: {total_duration:.2f}s, "
+                f"throughput: {chunk_count / total_duration:.1f} chunks/second"
+            )
+        return True
+
+    def _commit_batch(self, diffs: list[ChunkDiff], last_file: str, file_count: int) -> bool:
+        """Apply a batch of chunk diffs and checkpoint the files it covers.
+
+        Args:
+            diffs: The chunk diffs of the batch, possibly empty if no file changed.
+            last_file: Path of the last file of the batch in walk order.
+            file_count: Number of files in the batch, including unchanged ones.
+
+        Returns:
+            True if the batch was committed, False otherwise.
+        """
+        if diffs and not self.apply_chunk_diffs(diffs):
+            return False
+
+        self.checkpoint.advance(last_file, file_count, sum(diff.write_count for diff in diffs))
+        self.save_state()
+        return True
+
+    def process_directory(
+        self, directory: str, recursive: bool = True, resume: bool = False
+    ) -> int:
         """Process all files in a directory and its subdirectories.
 
+        Chunk changes are committed in batches of about CHECKPOINT_CHUNK_INTERVAL chunks.
+        After every batch the manifest and a checkpoint of the last committed file are
+        saved, so an interrupted run loses at most one batch of work. Once the walk is
+        complete, the chunks of files under the directory that were deleted since they
+        were ingested are deleted as well.
+
         Args:
             directory: The directory to process.
             recursive: Whether to process subdirectories.
+            resume: Whether to continue an interrupted run of the same directory, skipping
+                every file it committed without reading or hashing it.
 
         Returns:
             Number of documents added.
         """
-        # Find all markdown files in the directory
-        files = (
-            self.get_all_markdown_files(directory) if recursive else glob.glob(f"{directory}/*.md")
-        )
-        total_files = len(files)
-        logger.info(f"Found {total_files} markdown files to process in {directory}")
-
-        if total_files == 0:
-            logger.info("No files to process.")
-            return 0
+        checkpoint = self.checkpoint
+        if resume and checkpoint.matches(directory, recursive):
+            logger.info(
+                f"Resuming ingestion of {directory} after {checkpoint.cursor} "
+                f"({checkpoint.files_committed} files committed in "
+                f"{checkpoint.batches_committed} batches)"
+            )
+        else:
+            if resume:
+                logger.info(f"No interrupted ingestion of {directory} to resume")
+            elif checkpoint.active:
+                logger.info(
+                    f"Discarding checkpoint of interrupted ingestion of {checkpoint.directory}"
+                )
+            checkpoint.start(directory, recursive)
+            checkpoint.save()
+
+        # Process each file as the walk finds it and commit its chunk changes in batches
+        batch: list[ChunkDiff] = []
+        batch_files = 0
+        batch_writes = 0
+        last_file = ""
+        seen: set[str] = set()
+        total_files = 0
+        resumed_files = 0
+        total_chunks = 0
+        logger.info(f"Processing files in {directory}...")
+
+        for file_path in self.iter_files(directory, recursive=recursive):
+            seen.add(os.path.abspath(file_path))
+            if checkpoint.is_committed(file_path):
+                resumed_files += 1
+                continue
 
-        # Process each file and collect chunks
-        all_chunks = []
-        logger.info(f"Processing {total_files} files...")
+            total_files += 1
+            self.metrics.increment("files_seen")
 
-        for i, file_path in enumerate(files):
             # Log progress periodically
-            if i % 10 == 0 or i == total_files - 1:
-                progress = (i / total_files) * 100
-                logger.info(f"Progress: {progress:.0f}% - Processing file {i + 1}/{total_files}")
+            if total_files % 100 == 0:
+                logger.info(f"Progress: processed {total_files} files")
 
             # For each file, log at debug level
             file_name = os.path.basename(file_path)
-            logger.debug(f"Processing: {file_name} ({i + 1}/{total_files})")
+            logger.debug(f"Processing: {file_name} ({total_files})")
 
             # Process the file
-            chunks = self.process_file(file_path)
-            all_chunks.extend(chunks)
+            diff = self.prepare_file(file_path)
+            batch_files += 1
+            last_file = file_path
+            if diff is not None:
+                batch.append(diff)
+                batch_writes += diff.write_count
+                total_chunks += diff.write_count + len(diff.unchanged)
+
+            if batch_writes >= CHECKPOINT_CHUNK_INTERVAL:
+                logger.info(f"Committing batch of {len(batch)} changed files...")
+                if not self._commit_batch(batch, last_file, batch_files):
+                    logger.error(
+                        f"Stopped ingesting {directory} after a failed batch, "
+                        "resume to continue from the last checkpoint"
+                    )
+                    return 0
+                batch = []
+                batch_files = 0
+                batch_writes = 0
+
+        if resumed_files:
+            logger.info(f"Skipped {resumed_files} files committed before the interruption")
 
-        logger.info("File processing complete!")
+        self._remove_missing_files(directory, seen)
 
-        # Generate embeddings for all chunks
-        if all_chunks:
+        if total_files == 0:
+            logger.info("No files to process.")
+            checkpoint.finish()
+            self.save_state()
+            return 0
+
+        logger.info(f"File processing complete! Found {total_files} files in {directory}")
+
+        # Embed and store only the chunks that changed
+        if batch:
             logger.info("Starting embedding process...")
-            self.generate_embeddings(all_chunks)
         else:
             logger.info("No new content to process.")
+        if batch_files and not self._commit_batch(batch, last_file, batch_files):
+            logger.error(
+                f"Stopped ingesting {directory} after a failed batch, "
+                "resume to continue from the last checkpoint"
+            )
+            return 0
+
+        checkpoint.finish()
+        self.save_state()
 
         # Report stats
         try:
@@ -1414,21 +2920,139 @@ class DocumentProcessor:
             new_docs = final_doc_count - self.initial_doc_count
 
             logger.info("Final Processing Summary:")
-            logger.info(f"Successfully processed {total_files} files into {len(all_chunks)} chunks")
+            logger.info(f"Successfully processed {total_files} files into {total_chunks} chunks")
             logger.info(
                 f"Added {new_docs} new documents to collection (now contains {final_doc_count} total)"
             )
 
-            if self.enable_deduplication and self.duplicate_detector:
-                dupes_found = len(all_chunks) - self.duplicate_detector.get_unique_chunk_count()
-                if dupes_found > 0:
-                    logger.info(f"Detected {dupes_found} duplicate chunks")
+            dupes_found = self.metrics.snapshot()["counters"]["chunks_duplicate"]
+            if dupes_found > 0:
+                action = "reused embeddings for" if self.duplicate_action == "reuse" else "dropped"
+                logger.info(f"Detected and {action} {dupes_found} duplicate chunks")
 
             return new_docs
         except Exception as e:
             logger.error(f"Error getting final collection stats: {e}")
             return 0
 
+    def _remove_missing_files(self, directory: str, seen: set[str]) -> None:
+        """Remove the files under a directory that no longer exist on disk.
+
+        Files the walk skipped, for example outside a non-recursive walk or newly
+        excluded, are only removed if they are gone. Archive members are kept as long as
+        their archive exists, since process_archive tracks their removal.
+
+        Args:
+            directory: The directory that was walked.
+            seen: Absolute paths of the files found by the walk.
+        """
+        prefix = os.path.join(os.path.abspath(directory), "")
+        removed = [
+            path
+            for path in self.manifest.paths()
+            if path.startswith(prefix)
+            and path not in seen
+            and not os.path.exists(path.split(ARCHIVE_SEPARATOR, 1)[0])
+        ]
+        if removed:
+            deleted = self.remove_files(removed)
+            logger.info(f"Removed {len(removed)} deleted files ({deleted} chunks)")
+
+    def process_archive(self, archive_path: str) -> int:
+        """Process the files inside a tar or zip archive without extracting it.
+
+        Members are streamed from the archive in archive order and go through the same
+        change detection, chunking and batched commits as the files of a directory.
+        Unchanged members are skipped by their recorded size and modification time
+        without being decompressed into memory. Once the whole archive has been read,
+        the chunks of members that no longer exist in it are deleted.
+
+        Args:
+            archive_path: Path to the archive.
+
+        Returns:
+            Number of documents added.
+
+        Raises:
+            ValueError: If the path does not name a supported archive.
+        """
+        archive_path = os.path.abspath(archive_path)
+        logger.info(f"Processing archive {archive_path}...")
+
+        batch: list[ChunkDiff] = []
+        batch_writes = 0
+        seen: set[str] = set()
+        total_members = 0
+        total_chunks = 0
+
+        try:
+            for member in ArchiveReader(archive_path):
+                if member.path in seen:
+                    logger.warning(f"Skipping repeated archive member: {member.path}")
+                    continue
+                seen.add(member.path)
+
+                if not self.should_ingest_member(member.name):
+                    continue
+
+                total_members += 1
+                self.metrics.increment("files_seen")
+                if total_members % 100 == 0:
+                    logger.info(f"Progress: processed {total_members} archive members")
+
+                diff = self.prepare_member(archive_path, member)
+                if diff is not None:
+                    batch.append(diff)
+                    batch_writes += diff.write_count
+                    total_chunks += diff.write_count + len(diff.unchanged)
+
+                if batch_writes >= CHECKPOINT_CHUNK_INTERVAL:
+                    logger.info(f"Committing batch of {len(batch)} changed archive members...")
+                    if not self.apply_chunk_diffs(batch):
+                        logger.error(f"Stopped ingesting {archive_path} after a failed batch")
+                        self.save_state()
+                        return 0
+                    self.save_state()
+                    batch = []
+                    batch_writes = 0
+
+        except ARCHIVE_ERRORS as e:
+            logger.error(f"Error reading archive {archive_path}: {e}")
+            self.metrics.increment("errors")
+            self.manifest.discard([diff.file_path for diff in batch])
+            self.save_state()
+            return 0
+
+        logger.info(f"Archive processing complete! Found {total_members} files to ingest")
+
+        if batch and not self.apply_chunk_diffs(batch):
+            logger.error(f"Stopped ingesting {archive_path} after a failed batch")
+            self.save_state()
+            return 0
+
+        # The archive was read completely, so any member missing from it was removed
+        prefix = member_path(archive_path, "")
+        removed = [
+            path for path in self.manifest.paths() if path.startswith(prefix) and path not in seen
+        ]
+        if removed:
+            deleted = self.remove_files(removed)
+            logger.info(f"Removed {len(removed)} archive members ({deleted} chunks)")
+
+        self.save_state()
+
+        try:
+            final_doc_count = self.collection.count()
+            new_docs = final_doc_count - self.initial_doc_count
+            logger.info(
+                f"Successfully processed {total_members} archive members into "
+                f"{total_chunks} chunks, collection now contains {final_doc_count} documents"
+            )
+            return new_docs
+        except Exception as e:
+            logger.error(f"Error getting final collection stats: {e}")
+            return 0
+
     def delete_directory_documents(self, directory: str) -> int:
         """Delete all documents from a directory from the collection.
 
@@ -1489,72 +3113,77 @@ class DocumentProcessor:
         directory: str,
         recursive: bool = True,
         callback: Callable[[str], None] | None = None,
+        debounce: float = IngestionQueue.DEFAULT_DEBOUNCE,
+        max_workers: int = IngestionQueue.DEFAULT_MAX_WORKERS,
     ) -> None:
         """Set up a file watcher for a directory to enable real-time updates.
 
+        File events are only recorded by the watcher thread. They are coalesced and
+        debounced by a shared IngestionQueue, which processes them in batches off-thread.
+
         Args:
             directory: The directory to watch.
             recursive: Whether to watch subdirectories.
             callback: Optional callback function to call when changes are detected.
+            debounce: Seconds a file must be quiet before it is ingested. Only used when
+                the first directory is watched.
+            max_workers: Number of threads used to chunk changed files. Only used when the
+                first directory is watched.
         """
         if directory in self.watchers:
             logger.warning(f"Already watching directory: {directory}")
             return
 
+        if callback:
+            self.watch_callbacks[directory] = callback
+
+        if self.ingestion_queue is None:
+            self.ingestion_queue = IngestionQueue(
+                self,
+                debounce=debounce,
+                max_workers=max_workers,
+                callback=self._notify_watch_callbacks,
+            )
+            self.ingestion_queue.start()
+
         # Create a file event handler
         class FileChangeHandler(FileSystemEventHandler):
-            def __init__(self, processor: DocumentProcessor, callback: Callable | None):
+            def __init__(self, processor: DocumentProcessor, queue: IngestionQueue):
                 self.processor = processor
-                self.callback = callback
-                # Track recent events to avoid duplicate processing
-                self.recent_events: dict[str, float] = {}
-                # Set a cooldown period (in seconds)
-                self.cooldown = 2.0
+                self.queue = queue
+
+            def _is_relevant(self, path: str) -> bool:
+                # Only process files matching the include patterns that are not ignored
+                return self.processor.should_ingest(path)
 
             def on_any_event(self, event: FileSystemEvent) -> None:
                 if event.is_directory:
                     return
 
-                # Only process markdown files
-                if not event.src_path.endswith((".md", ".markdown", ".mdown")):
-                    return
-
-                # Check if file is ignored
-                if self.processor.is_ignored(event.src_path):
+                src_path = os.fsdecode(event.src_path)
+                if os.path.basename(src_path) == GITIGNORE_FILENAME:
+                    # Pick up edited ignore rules for subsequent events
+                    self.processor.walker.invalidate(os.path.dirname(src_path))
                     return
 
-                # Check for cooldown to avoid processing the same file multiple times
-                current_time = time.time()
-                if event.src_path in self.recent_events:
-                    last_time = self.recent_events[event.src_path]
-                    if current_time - last_time < self.cooldown:
-                        return
-
-                # Update recent events
-                self.recent_events[event.src_path] = current_time
-
-                # Process the file
-                logger.info(f"File change detected: {event.src_path}, event={event.event_type}")
-                if event.event_type in ["created", "modified"]:
-                    # Process the file
-                    chunks = self.processor.process_file(event.src_path)
-                    if chunks:
-                        self.processor.generate_embeddings(chunks)
-                        logger.info(f"Updated {len(chunks)} chunks for {event.src_path}")
+                if event.event_type in ["created", "modified", "closed"]:
+                    if self._is_relevant(src_path):
+                        self.queue.enqueue(src_path, "upsert")
                 elif event.event_type == "deleted":
-                    # Remove the file from tracked files
-                    if event.src_path in self.processor.processed_files:
-                        del self.processor.processed_files[event.src_path]
-
-                    # Note: We don't delete from Chroma here as we might want to keep historical data
-                    logger.info(f"File deleted: {event.src_path}")
-
-                # Call callback if provided
-                if self.callback:
-                    self.callback(event.src_path)
+                    if self._is_relevant(src_path):
+                        self.queue.enqueue(src_path, "delete")
+                elif event.event_type == "moved":
+                    dest_path = os.fsdecode(event.dest_path)
+                    src_relevant = self._is_relevant(src_path)
+                    if self._is_relevant(dest_path):
+                        # Editors often save by renaming a temporary file over the original
+                        previous_path = src_path if src_relevant else None
+                        self.queue.enqueue(dest_path, "upsert", previous_path=previous_path)
+                    elif src_relevant:
+                        self.queue.enqueue(src_path, "delete")
 
         # Create and start the observer
-        event_handler = FileChangeHandler(self, callback)
+        event_handler = FileChangeHandler(self, self.ingestion_queue)
         observer = Observer()
         observer.schedule(event_handler, directory, recursive=recursive)
         observer.start()
@@ -1567,6 +3196,9 @@ class DocumentProcessor:
     def stop_watching(self, directory: str | None = None) -> None:
         """Stop watching a directory or all directories.
 
+        Once no directories are watched, pending changes are drained and the ingestion
+        queue is stopped.
+
         Args:
             directory: The directory to stop watching, or None to stop all watchers.
         """
@@ -1577,6 +3209,7 @@ class DocumentProcessor:
                 observer.stop()
                 observer.join()
                 del self.watchers[directory]
+                self.watch_callbacks.pop(directory, None)
                 logger.info(f"Stopped watching directory: {directory}")
             else:
                 logger.warning(f"Not watching directory: {directory}")
@@ -1589,6 +3222,23 @@ class DocumentProcessor:
             self.watchers.clear()
             logger.info("Stopped watching all directories")
 
+        if not self.watchers and self.ingestion_queue is not None:
+            self.ingestion_queue.stop(drain=True)
+            self.ingestion_queue = None
+            self.watch_callbacks.clear()
+
+    def _notify_watch_callbacks(self, file_path: str) -> None:
+        """Call the callbacks of every watched directory that contains a processed file.
+
+        Args:
+            file_path: Path of the processed file.
+        """
+        abs_path = os.path.abspath(file_path)
+        for directory, callback in list(self.watch_callbacks.items()):
+            abs_directory = os.path.abspath(directory)
+            if os.path.commonpath([abs_directory, abs_path]) == abs_directory:
+                callback(file_path)
+
     def get_watcher_status(self) -> dict[str, bool]:
         """Get the status of all directory watchers.
 
@@ -1597,6 +3247,24 @@ class DocumentProcessor:
         """
         return {dir_path: observer.is_alive() for dir_path, observer in self.watchers.items()}
 
+    def get_ingestion_metrics(self) -> dict[str, Any]:
+        """Get counters, stage latencies, throughput and ETA for ingestion so far.
+
+        Returns:
+            Dictionary snapshot of the ingestion metrics.
+        """
+        return self.metrics.snapshot()
+
+    def get_watcher_metrics(self) -> dict[str, Any]:
+        """Get queue depth, lag and throughput metrics for live ingestion.
+
+        Returns:
+            Dictionary of ingestion queue metrics, empty if no directory is watched.
+        """
+        if self.ingestion_queue is None:
+            return {}
+        return self.ingestion_queue.get_metrics()
+
     def __del__(self) -> None:
         """Clean up resources when the processor is destroyed."""
         self.stop_watching()
@@ -1608,6 +3276,13 @@ def live_ingest_directory(
     db_path: str | None = None,
     recursive: bool = True,
     enable_deduplication: bool = True,
+    include_patterns: list[str] | None = None,
+    exclude_patterns: list[str] | None = None,
+    near_duplicate_distance: int | None = None,
+    duplicate_action: str = "reuse",
+    resume: bool = False,
+    chunk_token_budget: int | None = None,
+    token_estimator: str | None = None,
 ) -> DocumentProcessor:
     """Set up live ingestion for a directory.
 
@@ -1617,6 +3292,14 @@ def live_ingest_directory(
         db_path: Optional path for ChromaDB storage.
         recursive: Whether to watch subdirectories.
         enable_deduplication: Whether to enable content deduplication.
+        include_patterns: Gitignore-style patterns of files to ingest.
+        exclude_patterns: Gitignore-style patterns of files to skip.
+        near_duplicate_distance: Optional maximum SimHash distance in bits for chunks to
+            count as near-duplicates.
+        duplicate_action: What to do with duplicate chunks ("reuse" or "drop").
+        resume: Whether to resume an interrupted initial ingestion of the directory.
+        chunk_token_budget: Optional maximum size of a chunk in tokens.
+        token_estimator: Type of token estimator used with a token budget.
 
     Returns:
         The document processor instance.
@@ -1625,10 +3308,16 @@ def live_ingest_directory(
         collection_name=collection_name,
         db_path=db_path,
         enable_deduplication=enable_deduplication,
+        include_patterns=include_patterns,
+        exclude_patterns=exclude_patterns,
+        near_duplicate_distance=near_duplicate_distance,
+        duplicate_action=duplicate_action,
+        chunk_token_budget=chunk_token_budget,
+        token_estimator=token_estimator,
     )
 
     # Process existing files first
-    processor.process_directory(directory, recursive=recursive)
+    processor.process_directory(directory, recursive=recursive, resume=resume)
 
     # Set up watcher for future changes
     processor.watch_directory(directory, recursive=recursive)
@@ -1642,6 +3331,11 @@ def main():
 
     parser = argparse.ArgumentParser(description="Enhanced document ingestion for Atlas")
     parser.add_argument("-d", "--directory", help="Directory to process", default="./docs")
+    parser.add_argument(
+        "--archive",
+        help="Tar or zip archive to ingest without extracting it, instead of a directory",
+        default=None,
+    )
     parser.add_argument(
         "-c", "--collection", help="Collection name", default="atlas_knowledge_base"
     )
@@ -1650,11 +3344,61 @@ def main():
     parser.add_argument("--watch", help="Watch directory for changes", action="store_true")
     parser.add_argument(
         "--embedding",
-        help="Embedding strategy to use (default, anthropic, hybrid)",
+        help="Embedding strategy to use (default, anthropic, hashing, hybrid)",
         default="default",
     )
+    parser.add_argument(
+        "--include",
+        help="Gitignore-style pattern of files to ingest (repeatable, default: markdown)",
+        action="append",
+        default=None,
+    )
+    parser.add_argument(
+        "--exclude",
+        help="Gitignore-style pattern of files to skip (repeatable)",
+        action="append",
+        default=None,
+    )
+    parser.add_argument(
+        "--near_duplicates",
+        help="Detect near-duplicate chunks within this many differing SimHash bits (e.g. 3)",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--duplicates",
+        help="Reuse the original's embedding for duplicate chunks or drop them",
+        choices=DUPLICATE_ACTIONS,
+        default="reuse",
+    )
+    parser.add_argument(
+        "--resume",
+        help="Resume an interrupted ingestion of the directory from its last checkpoint",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--chunk_tokens",
+        help="Size chunks by token budget instead of characters (e.g. 512)",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--token_estimator",
+        help="Token estimator used with --chunk_tokens",
+        choices=["auto", "tiktoken", "heuristic"],
+        default="auto",
+    )
+    parser.add_argument(
+        "--metrics",
+        help="Print ingestion metrics as JSON when ingestion finishes",
+        action="store_true",
+    )
 
     args = parser.parse_args()
+    if args.archive and not is_archive(args.archive):
+        parser.error(f"--archive must be a tar or zip archive: {args.archive}")
+    if args.archive and args.watch:
+        parser.error("--watch cannot be used with --archive")
 
     if args.watch:
         # Set up live ingestion
@@ -1663,6 +3407,13 @@ def main():
             collection_name=args.collection,
             db_path=args.db_path,
             enable_deduplication=not args.no_dedup,
+            include_patterns=args.include,
+            exclude_patterns=args.exclude,
+            near_duplicate_distance=args.near_duplicates,
+            duplicate_action=args.duplicates,
+            resume=args.resume,
+            chunk_token_budget=args.chunk_tokens,
+            token_estimator=args.token_estimator,
         )
 
         # Keep process running
@@ -1674,6 +3425,8 @@ def main():
             logger.info("Stopping watchers...")
             processor.stop_watching()
             logger.info("Done")
+            if args.metrics:
+                print(json.dumps(processor.get_ingestion_metrics(), indent=2))
     else:
         # One-time processing
         processor = DocumentProcessor(
@@ -1681,8 +3434,19 @@ def main():
             db_path=args.db_path,
             enable_deduplication=not args.no_dedup,
             embedding_strategy=args.embedding,
+            include_patterns=args.include,
+            exclude_patterns=args.exclude,
+            near_duplicate_distance=args.near_duplicates,
+            duplicate_action=args.duplicates,
+            chunk_token_budget=args.chunk_tokens,
+            token_estimator=args.token_estimator,
         )
-        processor.process_directory(args.directory)
+        if args.archive:
+            processor.process_archive(args.archive)
+        else:
+            processor.process_directory(args.directory, resume=args.resume)
+        if args.metrics:
+            print(json.dumps(processor.get_ingestion_metrics(), indent=2))
 
 
 if __name__ == "__main__":
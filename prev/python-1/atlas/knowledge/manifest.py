@@ -0,0 +1,297 @@
+"""
+Persistent ingestion manifest for the Atlas knowledge system.
+
+This module records which files have been ingested and what they produced, so repeated
+ingestion runs can skip unchanged files with a cheap stat check before falling back to
+content hashing, even across process restarts.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from typing import Any, ClassVar
+
+from atlas.core import logging
+
+logger = logging.get_logger(__name__)
+
+
+@dataclass
+class ManifestEntry:
+    """Ingestion record for a single file."""
+
+    size: int  # File size in bytes at ingestion time
+    mtime_ns: int  # File modification time in nanoseconds at ingestion time
+    content_hash: str  # Hash of the raw file contents
+    chunk_hashes: dict[str, str] = field(default_factory=dict)  # Stored chunk ID -> text hash
+
+    @property
+    def chunk_ids(self) -> list[str]:
+        """Get the IDs of the chunks stored for the file.
+
+        Returns:
+            A list of chunk IDs.
+        """
+        return list(self.chunk_hashes)
+
+    def matches_stat(self, file_stat: os.stat_result) -> bool:
+        """Check whether a stat result matches the recorded size and modification time.
+
+        Args:
+            file_stat: The current stat result for the file.
+
+        Returns:
+            True if neither size nor modification time changed, False otherwise.
+        """
+        return self.matches(file_stat.st_size, file_stat.st_mtime_ns)
+
+    def matches(self, size: int, mtime_ns: int) -> bool:
+        """Check whether a size and modification time match the recorded ones.
+
+        Args:
+            size: The current size in bytes.
+            mtime_ns: The current modification time in nanoseconds.
+
+        Returns:
+            True if neither size nor modification time changed, False otherwise.
+        """
+        return self.size == size and self.mtime_ns == mtime_ns
+
+
+class IngestionManifest:
+    """Thread-safe, JSON-persisted map of file path to ingestion record.
+
+    Entries are first staged while a file is being processed and only become part of the
+    committed manifest once its chunks are stored, so a failed run never marks files as
+    ingested.
+    """
+
+    # Class constants
+    FORMAT_VERSION: ClassVar[int] = 2
+
+    def __init__(self, path: str | None = None):
+        """Initialize the manifest.
+
+        Args:
+            path: Optional path of the JSON file backing the manifest. If None, the
+                manifest is kept in memory only.
+        """
+        self.path = path
+        self._entries: dict[str, ManifestEntry] = {}
+        self._staged: dict[str, ManifestEntry] = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+
+        if self.path:
+            self.load()
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        """Normalize a file path into a manifest key.
+
+        Args:
+            file_path: The file path to normalize.
+
+        Returns:
+            The absolute, normalized path.
+        """
+        return os.path.abspath(file_path)
+
+    def load(self) -> None:
+        """Load committed entries from the backing file, if it exists."""
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable ingestion manifest {self.path}: {e}")
+            return
+
+        if data.get("version") != self.FORMAT_VERSION:
+            logger.warning(
+                f"Ignoring ingestion manifest {self.path} with unsupported version "
+                f"{data.get('version')}"
+            )
+            return
+
+        with self._lock:
+            self._entries = {
+                path: ManifestEntry(**entry) for path, entry in data.get("files", {}).items()
+            }
+            self._dirty = False
+
+        logger.info(f"Loaded ingestion manifest with {len(self._entries)} files from {self.path}")
+
+    def save(self) -> None:
+        """Atomically write committed entries to the backing file if anything changed."""
+        if not self.path:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+
+            data: dict[str, Any] = {
+                "version": self.FORMAT_VERSION,
+                "files": {path: asdict(entry) for path, entry in self._entries.items()},
+            }
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+
+            # Write to a temporary file first so a crash never leaves a truncated manifest
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".manifest-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+            self._dirty = False
+
+        logger.debug(f"Saved ingestion manifest with {len(data['files'])} files to {self.path}")
+
+    def get(self, file_path: str) -> ManifestEntry | None:
+        """Get the committed entry for a file.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            The committed entry, or None if the file has not been ingested.
+        """
+        with self._lock:
+            return self._entries.get(self._key(file_path))
+
+    def update(self, file_path: str, entry: ManifestEntry) -> None:
+        """Replace the committed entry for a file directly.
+
+        Args:
+            file_path: Path to the file.
+            entry: The new committed entry.
+        """
+        with self._lock:
+            self._entries[self._key(file_path)] = entry
+            self._dirty = True
+
+    def remove(self, file_path: str) -> ManifestEntry | None:
+        """Remove a file from the manifest.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            The removed committed entry, or None if the file was not tracked.
+        """
+        key = self._key(file_path)
+        with self._lock:
+            self._staged.pop(key, None)
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._dirty = True
+            return entry
+
+    def stage(self, file_path: str, entry: ManifestEntry) -> None:
+        """Stage a pending entry for a file that is being (re)processed.
+
+        Args:
+            file_path: Path to the file.
+            entry: The pending entry.
+        """
+        with self._lock:
+            self._staged[self._key(file_path)] = entry
+
+    def stage_chunks(self, file_path: str, chunk_hashes: dict[str, str]) -> None:
+        """Record the chunks produced for a staged file.
+
+        Args:
+            file_path: Path to the file.
+            chunk_hashes: Mapping of chunk ID to a hash of the chunk text.
+        """
+        with self._lock:
+            entry = self._staged.get(self._key(file_path))
+            if entry is not None:
+                entry.chunk_hashes = dict(chunk_hashes)
+
+    def get_staged(self, file_path: str) -> ManifestEntry | None:
+        """Get the pending entry for a file.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            The staged entry, or None if nothing is staged for the file.
+        """
+        with self._lock:
+            return self._staged.get(self._key(file_path))
+
+    def commit(self, file_paths: Iterable[str] | None = None) -> int:
+        """Promote staged entries to committed entries.
+
+        Args:
+            file_paths: Files to commit, or None to commit everything staged.
+
+        Returns:
+            The number of entries committed.
+        """
+        with self._lock:
+            keys = list(self._staged) if file_paths is None else [self._key(p) for p in file_paths]
+            committed = 0
+            for key in keys:
+                entry = self._staged.pop(key, None)
+                if entry is not None:
+                    self._entries[key] = entry
+                    committed += 1
+            if committed:
+                self._dirty = True
+            return committed
+
+    def discard(self, file_paths: Iterable[str] | None = None) -> None:
+        """Drop staged entries without committing them.
+
+        Args:
+            file_paths: Files to discard, or None to discard everything staged.
+        """
+        with self._lock:
+            if file_paths is None:
+                self._staged.clear()
+            else:
+                for file_path in file_paths:
+                    self._staged.pop(self._key(file_path), None)
+
+    def clear(self) -> None:
+        """Remove all committed and staged entries."""
+        with self._lock:
+            if self._entries:
+                self._dirty = True
+            self._entries.clear()
+            self._staged.clear()
+
+    def paths(self) -> list[str]:
+        """Get the paths of all committed files.
+
+        Returns:
+            A list of absolute file paths.
+        """
+        with self._lock:
+            return list(self._entries)
+
+    def __contains__(self, file_path: object) -> bool:
+        """Check whether a file has a committed entry."""
+        if not isinstance(file_path, str):
+            return False
+        with self._lock:
+            return self._key(file_path) in self._entries
+
+    def __len__(self) -> int:
+        """Get the number of committed entries."""
+        with self._lock:
+            return len(self._entries)
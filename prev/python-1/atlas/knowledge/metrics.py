@@ -0,0 +1,286 @@
+"""
+Ingestion metrics for the Atlas knowledge system.
+
+This module tracks what the ingestion pipeline actually did: per-stage counters,
+per-stage latency histograms, measured throughput and an ETA for in-progress work. Metrics
+are available as a snapshot dictionary and, when telemetry is enabled, are mirrored to
+OpenTelemetry counters and histograms.
+"""
+
+import bisect
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, ClassVar
+
+from atlas.core import telemetry
+
+# Counters tracked by the ingestion pipeline
+INGESTION_COUNTERS = (
+    "files_seen",  # Files found by the directory walk or watcher
+    "files_skipped",  # Files skipped because they were unchanged
+    "files_read",  # Changed files read from disk
+    "bytes_read",  # Bytes of changed files read from disk
+    "chunks_produced",  # Chunks produced by the chunkers
+    "chunks_embedded",  # Chunks sent to the embedding strategy
+    "chunks_reused",  # Chunks stored with an existing embedding
+    "chunks_duplicate",  # Chunks detected as (near-)duplicates of a stored chunk
+    "chunks_stored",  # Chunks written to ChromaDB
+    "chunks_deleted",  # Chunks deleted from ChromaDB
+    "errors",  # Failed reads, embeddings or writes
+)
+
+# Pipeline stages with latency histograms
+INGESTION_STAGES = ("read", "chunk", "embed", "store")
+
+
+class LatencyHistogram:
+    """Thread-safe latency histogram with fixed millisecond buckets."""
+
+    # Upper bounds of the histogram buckets in milliseconds
+    BUCKETS_MS: ClassVar[tuple[float, ...]] = (
+        1,
+        2,
+        5,
+        10,
+        25,
+        50,
+        100,
+        250,
+        500,
+        1000,
+        2500,
+        5000,
+        10000,
+        30000,
+        60000,
+    )
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self._lock = threading.Lock()
+        self._bucket_counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    def record(self, duration_ms: float) -> None:
+        """Record a single latency.
+
+        Args:
+            duration_ms: The latency in milliseconds.
+        """
+        index = bisect.bisect_left(self.BUCKETS_MS, duration_ms)
+        with self._lock:
+            self._bucket_counts[index] += 1
+            self._count += 1
+            self._total_ms += duration_ms
+            self._max_ms = max(self._max_ms, duration_ms)
+
+    def percentile(self, percent: float) -> float:
+        """Estimate a percentile from the bucket counts.
+
+        Args:
+            percent: The percentile to estimate, between 0 and 100.
+
+        Returns:
+            The upper bound of the bucket containing the percentile, capped at the
+            maximum recorded latency, or 0.0 if nothing was recorded.
+        """
+        with self._lock:
+            if self._count == 0:
+                return 0.0
+
+            rank = percent / 100 * self._count
+            cumulative = 0
+            for index, bucket_count in enumerate(self._bucket_counts):
+                cumulative += bucket_count
+                if cumulative >= rank and bucket_count:
+                    if index < len(self.BUCKETS_MS):
+                        return min(self.BUCKETS_MS[index], self._max_ms)
+                    break
+            return self._max_ms
+
+    def summary(self) -> dict[str, float]:
+        """Summarize the recorded latencies.
+
+        Returns:
+            Dictionary with the count, total, mean, p50, p95 and max latency in ms.
+        """
+        p50 = self.percentile(50)
+        p95 = self.percentile(95)
+        with self._lock:
+            return {
+                "count": self._count,
+                "total_ms": self._total_ms,
+                "mean_ms": self._total_ms / self._count if self._count else 0.0,
+                "p50_ms": p50,
+                "p95_ms": p95,
+                "max_ms": self._max_ms,
+            }
+
+
+class IngestionMetrics:
+    """Counters, stage latencies, throughput and ETA for the ingestion pipeline."""
+
+    def __init__(self):
+        """Initialize the metrics."""
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(INGESTION_COUNTERS, 0)
+        self._histograms = {stage: LatencyHistogram() for stage in INGESTION_STAGES}
+        self._targets: dict[str, tuple[int, int, float]] = {}  # counter -> (total, start, time)
+        self._start_time = time.monotonic()
+
+        # OpenTelemetry instruments, created lazily when telemetry is enabled
+        self._otel_counters: dict[str, Any] = {}
+        self._otel_histograms: dict[str, Any] = {}
+
+    def reset(self) -> None:
+        """Reset all counters, histograms and targets."""
+        with self._lock:
+            self._counters = dict.fromkeys(INGESTION_COUNTERS, 0)
+            self._histograms = {stage: LatencyHistogram() for stage in INGESTION_STAGES}
+            self._targets.clear()
+            self._start_time = time.monotonic()
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increment a counter.
+
+        Args:
+            name: Name of the counter, one of INGESTION_COUNTERS.
+            value: Amount to add.
+        """
+        if not value:
+            return
+
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+        if telemetry.is_telemetry_enabled():
+            if name not in self._otel_counters:
+                self._otel_counters[name] = telemetry.create_counter(
+                    name=f"atlas.ingest.{name}", description=f"Ingestion {name.replace('_', ' ')}"
+                )
+            counter = self._otel_counters[name]
+            if counter is not None:
+                counter.add(value)
+
+    def record_latency(self, stage: str, seconds: float) -> None:
+        """Record the latency of one pass through a pipeline stage.
+
+        Args:
+            stage: Name of the stage, one of INGESTION_STAGES.
+            seconds: Duration of the stage in seconds.
+        """
+        duration_ms = seconds * 1000
+        with self._lock:
+            histogram = self._histograms.setdefault(stage, LatencyHistogram())
+        histogram.record(duration_ms)
+
+        if telemetry.is_telemetry_enabled():
+            if stage not in self._otel_histograms:
+                self._otel_histograms[stage] = telemetry.create_histogram(
+                    name=f"atlas.ingest.{stage}.duration",
+                    description=f"Time taken by the ingestion {stage} stage",
+                )
+            otel_histogram = self._otel_histograms[stage]
+            if otel_histogram is not None:
+                otel_histogram.record(duration_ms)
+
+    @contextmanager
+    def time_stage(self, stage: str) -> Iterator[None]:
+        """Time a block of code as one pass through a pipeline stage.
+
+        Args:
+            stage: Name of the stage, one of INGESTION_STAGES.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_latency(stage, time.perf_counter() - start)
+
+    def expect(self, name: str, total: int) -> None:
+        """Declare how much more work a counter is expected to count, for the ETA.
+
+        Args:
+            name: Name of the counter that tracks the work.
+            total: Number of units expected from now on.
+        """
+        with self._lock:
+            self._targets[name] = (total, self._counters.get(name, 0), time.monotonic())
+
+    def eta(self, name: str) -> float | None:
+        """Estimate the seconds left for expected work from its measured throughput.
+
+        Args:
+            name: Name of the counter that tracks the work.
+
+        Returns:
+            The estimated seconds remaining, 0.0 if the work is done, or None if there is
+            no target or no throughput has been measured yet.
+        """
+        with self._lock:
+            if name not in self._targets:
+                return None
+            total, start_count, start_time = self._targets[name]
+            done = self._counters.get(name, 0) - start_count
+
+        remaining = total - done
+        if remaining <= 0:
+            return 0.0
+
+        elapsed = time.monotonic() - start_time
+        if done <= 0 or elapsed <= 0:
+            return None
+        return remaining / (done / elapsed)
+
+    def progress(self, name: str) -> tuple[int, int] | None:
+        """Get the progress of expected work.
+
+        Args:
+            name: Name of the counter that tracks the work.
+
+        Returns:
+            A (done, total) tuple, or None if no work is expected.
+        """
+        with self._lock:
+            if name not in self._targets:
+                return None
+            total, start_count, _ = self._targets[name]
+            return min(self._counters.get(name, 0) - start_count, total), total
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get a snapshot of all metrics.
+
+        Returns:
+            Dictionary with counters, per-stage latency summaries, throughput since the
+            metrics were created or reset, and progress/ETA of expected work.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = dict(self._histograms)
+            targets = list(self._targets)
+            elapsed = time.monotonic() - self._start_time
+
+        rate = 1 / elapsed if elapsed > 0 else 0.0
+        progress = {}
+        for name in targets:
+            done_total = self.progress(name)
+            if done_total is not None:
+                done, total = done_total
+                progress[name] = {"done": done, "total": total, "eta_seconds": self.eta(name)}
+
+        return {
+            "elapsed_seconds": elapsed,
+            "counters": counters,
+            "stages": {stage: histogram.summary() for stage, histogram in histograms.items()},
+            "throughput": {
+                "files_per_second": counters["files_read"] * rate,
+                "bytes_per_second": counters["bytes_read"] * rate,
+                "chunks_embedded_per_second": counters["chunks_embedded"] * rate,
+                "chunks_stored_per_second": counters["chunks_stored"] * rate,
+            },
+            "progress": progress,
+        }
@@ -0,0 +1,149 @@
+"""
+Single-pass file reading for the Atlas knowledge system.
+
+This module memory-maps files so that hashing and decoding share one mapping instead of
+reading the file twice, and hashes incrementally with blake2b so large files never need
+an extra in-memory copy of their raw bytes.
+"""
+
+import hashlib
+import mmap
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import IO
+
+# Size of the blocks fed to the hash function
+HASH_BLOCK_SIZE = 1 << 20  # 1 MiB
+
+# Digest size of content hashes in bytes
+HASH_DIGEST_SIZE = 16
+
+
+@dataclass
+class FileContent:
+    """Decoded file contents together with the hash of the raw bytes."""
+
+    text: str  # Decoded file contents
+    content_hash: str  # Hex digest of the raw file contents
+    size: int  # Size of the raw file contents in bytes
+
+
+@contextmanager
+def map_file(file_path: str) -> Iterator[mmap.mmap | bytes]:
+    """Memory-map a file for reading.
+
+    Empty files cannot be mapped, so they yield an empty bytes object instead.
+
+    Args:
+        file_path: Path to the file.
+
+    Yields:
+        A read-only mapping of the file contents.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _hash_mapping(data: mmap.mmap | bytes, block_size: int) -> str:
+    """Hash a mapping incrementally in fixed-size blocks.
+
+    Args:
+        data: The mapped file contents.
+        block_size: Number of bytes hashed per update.
+
+    Returns:
+        The hex digest of the contents.
+    """
+    hasher = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+    with memoryview(data) as view:
+        for offset in range(0, len(view), block_size):
+            hasher.update(view[offset : offset + block_size])
+    return hasher.hexdigest()
+
+
+def hash_file(file_path: str, block_size: int = HASH_BLOCK_SIZE) -> str:
+    """Hash the contents of a file without loading it into memory.
+
+    Args:
+        file_path: Path to the file.
+        block_size: Number of bytes hashed per update.
+
+    Returns:
+        The hex digest of the file contents.
+    """
+    with map_file(file_path) as data:
+        return _hash_mapping(data, block_size)
+
+
+def read_file(file_path: str, block_size: int = HASH_BLOCK_SIZE) -> FileContent:
+    """Hash and decode a file from a single memory mapping.
+
+    Args:
+        file_path: Path to the file.
+        block_size: Number of bytes hashed per update.
+
+    Returns:
+        The decoded contents and their hash.
+
+    Raises:
+        OSError: If the file cannot be opened or mapped.
+        UnicodeDecodeError: If the file is not valid UTF-8.
+    """
+    with map_file(file_path) as data:
+        content_hash = _hash_mapping(data, block_size)
+        # Decode straight from the mapping, without an intermediate bytes copy
+        text = str(data, "utf-8")
+        size = len(data)
+
+    return FileContent(text=_normalize_newlines(text), content_hash=content_hash, size=size)
+
+
+def read_stream(stream: IO[bytes], block_size: int = HASH_BLOCK_SIZE) -> FileContent:
+    """Hash and decode the contents of a binary stream in a single pass.
+
+    Used for sources that cannot be memory-mapped, such as archive members, which are
+    hashed block by block as they are read so the hash matches that of the same bytes
+    read with read_file.
+
+    Args:
+        stream: The stream to read until its end.
+        block_size: Number of bytes read and hashed per update.
+
+    Returns:
+        The decoded contents and their hash.
+
+    Raises:
+        OSError: If the stream cannot be read.
+        UnicodeDecodeError: If the contents are not valid UTF-8.
+    """
+    hasher = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+    data = bytearray()
+    while block := stream.read(block_size):
+        hasher.update(block)
+        data += block
+
+    text = data.decode("utf-8")
+    return FileContent(
+        text=_normalize_newlines(text), content_hash=hasher.hexdigest(), size=len(data)
+    )
+
+
+def _normalize_newlines(text: str) -> str:
+    """Match the universal newline handling of text-mode reads.
+
+    Args:
+        text: The decoded text.
+
+    Returns:
+        The text with CRLF and CR line endings replaced by LF.
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
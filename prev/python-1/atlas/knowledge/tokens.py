@@ -0,0 +1,243 @@
+"""
+Token count estimation for the Atlas knowledge system.
+
+This module estimates how many tokens a text takes up in an embedding request or a
+model's context window, so chunkers can size chunks by token budget rather than by
+characters. Counts come from a real tokenizer when one is installed and from a
+calibrated heuristic otherwise, and are cached per text.
+"""
+
+import math
+import string
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any, ClassVar
+
+from atlas.core import logging
+
+# Optional tokenizer
+try:
+    import tiktoken  # type: ignore[import-not-found]
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+logger = logging.get_logger(__name__)
+
+
+def _build_byte_classes() -> bytes:
+    """Build a translation table that maps every byte to its character class.
+
+    Returns:
+        A 256-byte table mapping ASCII word characters to "w", ASCII whitespace to " " and
+        all other bytes to "s".
+    """
+    table = bytearray(b"s" * 256)
+    for char in string.ascii_letters + string.digits + "_":
+        table[ord(char)] = ord("w")
+    for char in string.whitespace:
+        table[ord(char)] = ord(" ")
+    return bytes(table)
+
+
+class TokenEstimator(ABC):
+    """Base class for token count estimators.
+
+    Counts of short texts, such as the lines and paragraphs chunkers measure while
+    packing chunks, are cached, so measuring the same text again is a dictionary lookup.
+    """
+
+    # Texts longer than this are counted without caching, so whole documents are not kept
+    MAX_CACHED_LENGTH: ClassVar[int] = 4096
+
+    def __init__(self, cache_size: int = 16384):
+        """Initialize the estimator.
+
+        Args:
+            cache_size: Maximum number of texts whose count is cached.
+        """
+        self._cached_count = lru_cache(maxsize=cache_size)(self._count)
+
+    def count(self, text: str) -> int:
+        """Estimate the number of tokens of a text.
+
+        Args:
+            text: The text to measure.
+
+        Returns:
+            The estimated number of tokens.
+        """
+        if len(text) > self.MAX_CACHED_LENGTH:
+            return self._count(text)
+        return self._cached_count(text)
+
+    def clear_cache(self) -> None:
+        """Forget all cached counts."""
+        self._cached_count.cache_clear()
+
+    @abstractmethod
+    def _count(self, text: str) -> int:
+        """Count the tokens of a text without caching.
+
+        Args:
+            text: The text to measure.
+
+        Returns:
+            The estimated number of tokens.
+        """
+        pass
+
+
+class HeuristicTokenEstimator(TokenEstimator):
+    """Tokenizer-free estimator based on word, character and symbol counts.
+
+    A text is estimated as a weighted sum of its words, the characters in them and the
+    symbols between them, times a scale factor that can be calibrated against a real
+    tokenizer. The default weights approximate byte pair encodings of English prose and
+    source code. Counting works on the UTF-8 bytes of the text, classified with a single
+    translate, so non-ASCII characters count as one symbol per byte, much like byte-level
+    tokenizers split them.
+    """
+
+    # Class constants
+    BYTE_CLASSES: ClassVar[bytes] = _build_byte_classes()
+
+    def __init__(
+        self,
+        word_weight: float = 0.75,
+        char_weight: float = 0.1,
+        symbol_weight: float = 0.6,
+        scale: float = 1.0,
+        cache_size: int = 16384,
+    ):
+        """Initialize the heuristic estimator.
+
+        Args:
+            word_weight: Tokens per word.
+            char_weight: Tokens per word character.
+            symbol_weight: Tokens per byte that is neither a word character nor
+                whitespace.
+            scale: Factor applied to the weighted sum.
+            cache_size: Maximum number of texts whose count is cached.
+        """
+        super().__init__(cache_size)
+        self.word_weight = word_weight
+        self.char_weight = char_weight
+        self.symbol_weight = symbol_weight
+        self.scale = scale
+
+    def _raw_count(self, text: str) -> float:
+        """Compute the weighted sum of a text before scaling.
+
+        Args:
+            text: The text to measure.
+
+        Returns:
+            The unscaled estimate.
+        """
+        classes = text.encode("utf-8", "surrogatepass").translate(self.BYTE_CLASSES)
+        word_chars = classes.count(b"w")
+        symbols = classes.count(b"s")
+        words = classes.count(b" w") + classes.count(b"sw") + classes.startswith(b"w")
+        return (
+            words * self.word_weight
+            + word_chars * self.char_weight
+            + symbols * self.symbol_weight
+        )
+
+    def _count(self, text: str) -> int:
+        """Estimate the tokens of a text from its words and symbols.
+
+        Args:
+            text: The text to measure.
+
+        Returns:
+            The estimated number of tokens.
+        """
+        return math.ceil(self._raw_count(text) * self.scale)
+
+    def calibrate(self, texts: Iterable[str], reference: TokenEstimator) -> float:
+        """Fit the scale factor so that estimates match a reference estimator on average.
+
+        Args:
+            texts: Sample texts representative of the ingested content.
+            reference: Estimator with exact counts, usually a real tokenizer.
+
+        Returns:
+            The new scale factor.
+        """
+        raw_total = 0.0
+        reference_total = 0
+        for text in texts:
+            raw_total += self._raw_count(text)
+            reference_total += reference.count(text)
+
+        if raw_total > 0 and reference_total > 0:
+            self.scale = reference_total / raw_total
+            self.clear_cache()
+        return self.scale
+
+
+class TiktokenEstimator(TokenEstimator):
+    """Exact token counts from a tiktoken encoding."""
+
+    def __init__(self, encoding_name: str = "cl100k_base", cache_size: int = 16384):
+        """Initialize the tiktoken estimator.
+
+        Args:
+            encoding_name: Name of the tiktoken encoding. Its ranks are downloaded on first
+                use unless they are cached locally.
+            cache_size: Maximum number of texts whose count is cached.
+
+        Raises:
+            ImportError: If tiktoken is not installed.
+        """
+        if not TIKTOKEN_AVAILABLE:
+            raise ImportError("tiktoken is required for TiktokenEstimator")
+
+        super().__init__(cache_size)
+        self.encoding_name = encoding_name
+        self.encoding = tiktoken.get_encoding(encoding_name)
+
+    def _count(self, text: str) -> int:
+        """Count the tokens of a text with the encoding.
+
+        Args:
+            text: The text to measure.
+
+        Returns:
+            The number of tokens.
+        """
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+
+class TokenEstimatorFactory:
+    """Factory for creating token estimators."""
+
+    @staticmethod
+    def create_estimator(estimator_type: str = "auto", **kwargs: Any) -> TokenEstimator:
+        """Create a token estimator.
+
+        Args:
+            estimator_type: Type of estimator: "tiktoken", "heuristic", or "auto" for
+                tiktoken when it is installed and usable and the heuristic otherwise.
+            **kwargs: Additional parameters for the estimator, not used by "auto".
+
+        Returns:
+            A TokenEstimator instance.
+        """
+        if estimator_type == "tiktoken":
+            return TiktokenEstimator(**kwargs)
+        elif estimator_type == "heuristic":
+            return HeuristicTokenEstimator(**kwargs)
+        elif estimator_type == "auto":
+            if TIKTOKEN_AVAILABLE:
+                try:
+                    return TiktokenEstimator()
+                except Exception as e:
+                    logger.warning(f"Falling back to heuristic token estimation: {e}")
+            return HeuristicTokenEstimator()
+        else:
+            raise ValueError(f"Unknown token estimator type: {estimator_type}")
@@ -0,0 +1,235 @@
+"""
+Gitignore-aware directory walking for the Atlas knowledge system.
+
+This module walks directory trees with os.scandir, applying gitignore rules (including
+nested .gitignore files) to directories before descending into them, so large ignored
+trees such as node_modules or virtualenvs are never traversed.
+"""
+
+import os
+import threading
+from collections.abc import Iterator
+
+import pathspec
+
+from atlas.core import logging
+
+logger = logging.get_logger(__name__)
+
+GITIGNORE_FILENAME = ".gitignore"
+
+
+def walk_order_key(rel_path: str) -> tuple[tuple[int, str], ...]:
+    """Get a sort key that orders paths the way GitignoreWalker.walk yields them.
+
+    The walker yields the files of a directory in sorted order before descending into its
+    subdirectories in sorted order, so paths compare component by component with files
+    ranking before directories.
+
+    Args:
+        rel_path: Path relative to the walked directory.
+
+    Returns:
+        A tuple that sorts in walk order.
+    """
+    parts = os.path.normpath(rel_path).split(os.sep)
+    return (*((1, part) for part in parts[:-1]), (0, parts[-1]))
+
+
+class GitignoreWalker:
+    """Lazy directory walker that prunes ignored directories.
+
+    Paths are matched against a set of base specs relative to the root directory, and
+    against every .gitignore file found between the root and the path, relative to the
+    directory containing it. A path is ignored if any of these specs matches it.
+    """
+
+    def __init__(
+        self,
+        root: str | None = None,
+        base_specs: list[pathspec.PathSpec] | None = None,
+        nested_gitignore: bool = True,
+    ):
+        """Initialize the walker.
+
+        Args:
+            root: Directory that base spec patterns are relative to. Defaults to the
+                current working directory.
+            base_specs: Specs applied to every path, such as default ignore patterns and
+                the root .gitignore.
+            nested_gitignore: Whether to honor .gitignore files below the root.
+        """
+        self.root = os.path.abspath(root or os.getcwd())
+        self.base_specs = base_specs or []
+        self.nested_gitignore = nested_gitignore
+        self._gitignores: dict[str, pathspec.PathSpec | None] = {}
+        self._lock = threading.Lock()
+
+    def _load_gitignore(self, directory: str) -> pathspec.PathSpec | None:
+        """Load and cache the .gitignore file of a directory.
+
+        Args:
+            directory: Absolute path of the directory.
+
+        Returns:
+            The compiled patterns, or None if the directory has no usable .gitignore.
+        """
+        with self._lock:
+            if directory in self._gitignores:
+                return self._gitignores[directory]
+
+        spec = None
+        gitignore_path = os.path.join(directory, GITIGNORE_FILENAME)
+        try:
+            with open(gitignore_path, encoding="utf-8") as f:
+                spec = pathspec.PathSpec.from_lines("gitwildmatch", f)
+            if not spec.patterns:
+                spec = None
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Error loading {gitignore_path}: {e!s}")
+
+        with self._lock:
+            self._gitignores[directory] = spec
+        return spec
+
+    def invalidate(self, directory: str | None = None) -> None:
+        """Forget cached .gitignore files, e.g. after one of them changed.
+
+        Args:
+            directory: Directory whose .gitignore changed, or None to clear the cache.
+        """
+        with self._lock:
+            if directory is None:
+                self._gitignores.clear()
+            else:
+                self._gitignores.pop(os.path.abspath(directory), None)
+
+    def _nested_specs(self, directory: str) -> list[tuple[str, pathspec.PathSpec]]:
+        """Get the .gitignore specs that apply inside a directory.
+
+        The root .gitignore is expected to be part of the base specs, so only the
+        directories strictly below the root are considered.
+
+        Args:
+            directory: Absolute path of the directory.
+
+        Returns:
+            A list of (directory, spec) pairs ordered from the root downwards.
+        """
+        if not self.nested_gitignore:
+            return []
+
+        rel_dir = os.path.relpath(directory, self.root)
+        if rel_dir == "." or rel_dir.startswith(os.pardir):
+            return []
+
+        specs = []
+        current = self.root
+        for part in rel_dir.split(os.sep):
+            current = os.path.join(current, part)
+            spec = self._load_gitignore(current)
+            if spec is not None:
+                specs.append((current, spec))
+        return specs
+
+    def _matches(
+        self,
+        path: str,
+        is_dir: bool,
+        nested_specs: list[tuple[str, pathspec.PathSpec]],
+    ) -> bool:
+        """Check a path against the base specs and the applicable nested specs.
+
+        Args:
+            path: Absolute path to check.
+            is_dir: Whether the path is a directory.
+            nested_specs: The nested .gitignore specs of the path's parent directory.
+
+        Returns:
+            True if any spec matches the path, False otherwise.
+        """
+        # Directory-only patterns such as "build/" need a trailing slash to match
+        suffix = "/" if is_dir else ""
+
+        rel_path = os.path.relpath(path, self.root) + suffix
+        for spec in self.base_specs:
+            if spec.match_file(rel_path):
+                return True
+
+        for spec_dir, spec in nested_specs:
+            if spec.match_file(os.path.relpath(path, spec_dir) + suffix):
+                return True
+
+        return False
+
+    def is_ignored(self, path: str) -> bool:
+        """Check if a single path is ignored.
+
+        Args:
+            path: The path to check.
+
+        Returns:
+            True if the path should be ignored, False otherwise.
+        """
+        abs_path = os.path.abspath(path)
+        nested_specs = self._nested_specs(os.path.dirname(abs_path))
+        return self._matches(abs_path, os.path.isdir(abs_path), nested_specs)
+
+    def walk(self, directory: str, recursive: bool = True) -> Iterator[str]:
+        """Lazily yield the files in a directory that are not ignored.
+
+        Ignored directories are pruned before they are read. Symbolic links to
+        directories are not followed. Files are yielded in sorted order per directory,
+        and paths keep the form of the given directory (relative or absolute).
+
+        Args:
+            directory: The directory to walk.
+            recursive: Whether to descend into subdirectories.
+
+        Yields:
+            Paths of files that are not ignored.
+        """
+        abs_dir = os.path.abspath(directory)
+        nested_specs = self._nested_specs(abs_dir)
+        if self.nested_gitignore and os.path.relpath(abs_dir, self.root).startswith(os.pardir):
+            # Outside the root, only the walked directory's own .gitignore applies
+            spec = self._load_gitignore(abs_dir)
+            if spec is not None:
+                nested_specs = [(abs_dir, spec)]
+
+        stack = [(abs_dir, directory, nested_specs)]
+        while stack:
+            current, display, specs = stack.pop()
+
+            try:
+                entries = list(os.scandir(current))
+            except OSError as e:
+                logger.warning(f"Error reading directory {current}: {e!s}")
+                continue
+
+            files = []
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and not self._matches(entry.path, True, specs):
+                            subdirs.append(entry.name)
+                    elif entry.is_file() and not self._matches(entry.path, False, specs):
+                        files.append(entry.name)
+                except OSError as e:
+                    logger.warning(f"Error reading {entry.path}: {e!s}")
+
+            for name in sorted(files):
+                yield os.path.join(display, name)
+
+            # Push in reverse so subdirectories are visited in sorted order
+            for name in sorted(subdirs, reverse=True):
+                subdir = os.path.join(current, name)
+                subdir_specs = specs
+                if self.nested_gitignore:
+                    spec = self._load_gitignore(subdir)
+                    if spec is not None:
+                        subdir_specs = [*specs, (subdir, spec)]
+                stack.append((subdir, os.path.join(display, name), subdir_specs))
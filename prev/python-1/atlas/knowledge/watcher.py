@@ -0,0 +1,364 @@
+"""
+Live ingestion queue for the Atlas knowledge system.
+
+This module decouples file system notifications from ingestion work. Events are
+coalesced per path and debounced, so a burst of writes (an editor save, a git checkout
+touching thousands of files) turns into a few batches that are chunked on a worker pool
+and embedded together, without ever blocking the watcher thread.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
+
+from atlas.core import logging
+
+if TYPE_CHECKING:
+    from atlas.knowledge.ingest import ChunkDiff, DocumentProcessor
+
+logger = logging.get_logger(__name__)
+
+ChangeKind = Literal["upsert", "delete"]
+
+
+@dataclass
+class PendingChange:
+    """A coalesced change waiting to be ingested."""
+
+    path: str  # Path of the changed file
+    kind: ChangeKind  # Latest kind of change seen for the path
+    first_seen: float  # Monotonic time of the first event since the last flush
+    last_seen: float  # Monotonic time of the most recent event
+    previous_path: str | None = None  # Original path if the file was renamed
+    event_count: int = 1  # Number of events coalesced into this change
+
+
+class IngestionQueue:
+    """Debounced, coalescing work queue that feeds file changes into a DocumentProcessor.
+
+    Each path is processed once it has been quiet for the debounce window (or has been
+    pending for max_delay), which avoids ingesting files mid-write. Ready changes are
+    processed in batches: files are chunked concurrently on a worker pool and all of
+    their chunk changes are embedded and stored in one call.
+    """
+
+    # Class constants
+    DEFAULT_DEBOUNCE: ClassVar[float] = 0.5
+    DEFAULT_MAX_DELAY: ClassVar[float] = 5.0
+    DEFAULT_MAX_BATCH_SIZE: ClassVar[int] = 256
+    DEFAULT_MAX_WORKERS: ClassVar[int] = 4
+
+    def __init__(
+        self,
+        processor: "DocumentProcessor",
+        debounce: float = DEFAULT_DEBOUNCE,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        callback: Callable[[str], None] | None = None,
+    ):
+        """Initialize the ingestion queue.
+
+        Args:
+            processor: The document processor that performs ingestion.
+            debounce: Seconds a path must be quiet before it is processed.
+            max_delay: Maximum seconds a path may stay pending under continuous writes.
+            max_batch_size: Maximum number of paths processed in one batch.
+            max_workers: Number of threads used to read and chunk files.
+            callback: Optional function called with each path after it is processed.
+        """
+        self.processor = processor
+        self.debounce = debounce
+        self.max_delay = max(max_delay, debounce)
+        self.max_batch_size = max_batch_size
+        self.max_workers = max_workers
+        self.callback = callback
+
+        self._pending: dict[str, PendingChange] = {}
+        self._condition = threading.Condition()
+        self._executor: ThreadPoolExecutor | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self._drain = True
+
+        # Metrics
+        self._in_flight = 0
+        self._events_received = 0
+        self._events_coalesced = 0
+        self._files_processed = 0
+        self._files_deleted = 0
+        self._batches = 0
+        self._errors = 0
+        self._last_batch_size = 0
+        self._last_batch_duration = 0.0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+
+    def start(self) -> None:
+        """Start the dispatcher thread and the worker pool."""
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._stopping = False
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="atlas-ingest"
+            )
+            self._thread = threading.Thread(
+                target=self._run, name="atlas-ingest-dispatcher", daemon=True
+            )
+            self._thread.start()
+
+        logger.debug(
+            f"Started ingestion queue with debounce={self.debounce}s, "
+            f"max_batch_size={self.max_batch_size}, max_workers={self.max_workers}"
+        )
+
+    def stop(self, drain: bool = True, timeout: float | None = None) -> None:
+        """Stop the queue.
+
+        Args:
+            drain: Whether to process pending changes before stopping.
+            timeout: Maximum seconds to wait for the dispatcher thread to finish.
+        """
+        with self._condition:
+            self._stopping = True
+            self._drain = drain
+            self._condition.notify_all()
+            thread = self._thread
+
+        if thread is not None:
+            thread.join(timeout)
+
+        with self._condition:
+            self._thread = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+        logger.debug("Stopped ingestion queue")
+
+    def enqueue(self, path: str, kind: ChangeKind, previous_path: str | None = None) -> None:
+        """Record a file change, coalescing it with any pending change for the same path.
+
+        Args:
+            path: Path of the changed file.
+            kind: "upsert" for created/modified files, "delete" for removed files.
+            previous_path: Original path if the file was renamed to this path.
+        """
+        now = time.monotonic()
+        with self._condition:
+            self._events_received += 1
+            pending = self._pending.get(path)
+            if pending is None:
+                self._pending[path] = PendingChange(
+                    path=path,
+                    kind=kind,
+                    first_seen=now,
+                    last_seen=now,
+                    previous_path=previous_path,
+                )
+            else:
+                # The latest event wins, and the debounce window restarts
+                self._events_coalesced += 1
+                pending.kind = kind
+                pending.last_seen = now
+                pending.event_count += 1
+                pending.previous_path = previous_path or pending.previous_path
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Process every pending change immediately on the calling thread."""
+        while True:
+            with self._condition:
+                batch = self._take_batch(time.monotonic(), force=True)
+            if not batch:
+                return
+            self._process_batch(batch)
+
+    def _ready_at(self, change: PendingChange) -> float:
+        """Get the monotonic time at which a pending change becomes ready.
+
+        Args:
+            change: The pending change.
+
+        Returns:
+            The ready time.
+        """
+        return min(change.last_seen + self.debounce, change.first_seen + self.max_delay)
+
+    def _take_batch(self, now: float, force: bool = False) -> list[PendingChange]:
+        """Remove and return the oldest ready changes. Must be called with the lock held.
+
+        Args:
+            now: The current monotonic time.
+            force: Whether to take changes regardless of the debounce window.
+
+        Returns:
+            Up to max_batch_size ready changes.
+        """
+        ready = [
+            change
+            for change in self._pending.values()
+            if force or self._ready_at(change) <= now
+        ]
+        ready.sort(key=lambda change: change.first_seen)
+        batch = ready[: self.max_batch_size]
+
+        for change in batch:
+            del self._pending[change.path]
+        self._in_flight = len(batch)
+        return batch
+
+    def _run(self) -> None:
+        """Dispatcher loop that waits for ready changes and processes them in batches."""
+        while True:
+            with self._condition:
+                while True:
+                    if self._stopping:
+                        if not self._drain or not self._pending:
+                            return
+                        batch = self._take_batch(time.monotonic(), force=True)
+                        break
+
+                    if not self._pending:
+                        self._condition.wait()
+                        continue
+
+                    now = time.monotonic()
+                    next_ready = min(self._ready_at(change) for change in self._pending.values())
+                    if next_ready > now:
+                        self._condition.wait(next_ready - now)
+                        continue
+
+                    batch = self._take_batch(now)
+                    break
+
+            self._process_batch(batch)
+
+    def _prepare(self, change: PendingChange) -> "ChunkDiff | None":
+        """Read and chunk a changed file on a worker thread.
+
+        Args:
+            change: The pending upsert.
+
+        Returns:
+            The chunk diff for the file, or None if there is nothing to store.
+        """
+        return self.processor.prepare_file(change.path, previous_path=change.previous_path)
+
+    def _process_batch(self, batch: list[PendingChange]) -> None:
+        """Ingest a batch of coalesced changes.
+
+        Args:
+            batch: The changes to process.
+        """
+        if not batch:
+            return
+
+        start_time = time.monotonic()
+
+        # A file that disappeared before we got to it is a delete
+        upserts = [c for c in batch if c.kind == "upsert" and os.path.exists(c.path)]
+        upsert_paths = {c.path for c in upserts}
+        deletes = [c.path for c in batch if c.path not in upsert_paths]
+
+        try:
+            self.processor.metrics.increment("files_seen", len(upserts))
+            if upserts:
+                if self._executor is not None and len(upserts) > 1:
+                    diffs = list(self._executor.map(self._prepare, upserts))
+                else:
+                    diffs = [self._prepare(change) for change in upserts]
+
+                prepared = [diff for diff in diffs if diff is not None]
+                stored = not prepared or self.processor.apply_chunk_diffs(prepared)
+                if not stored:
+                    with self._condition:
+                        self._errors += 1
+
+                # Renamed files are removed from their old location once the new one is
+                # stored, either by this batch or by an earlier run if it was unchanged
+                for change, diff in zip(upserts, diffs, strict=True):
+                    if not change.previous_path:
+                        continue
+                    if diff is not None:
+                        if stored:
+                            deletes.append(change.previous_path)
+                    elif self.processor.manifest.get(change.path) is not None:
+                        deletes.append(change.previous_path)
+
+            if deletes:
+                removed = self.processor.remove_files(deletes)
+                logger.info(f"Removed {removed} chunks for {len(deletes)} deleted files")
+
+            self.processor.save_state()
+
+        except Exception as e:
+            logger.error(f"Error processing ingestion batch of {len(batch)} changes: {e}")
+            with self._condition:
+                self._errors += 1
+
+        end_time = time.monotonic()
+        batch_lag = max(end_time - change.first_seen for change in batch)
+
+        with self._condition:
+            self._in_flight = 0
+            self._batches += 1
+            self._files_processed += len(upserts)
+            self._files_deleted += len(deletes)
+            self._last_batch_size = len(batch)
+            self._last_batch_duration = end_time - start_time
+            self._last_lag = batch_lag
+            self._max_lag = max(self._max_lag, batch_lag)
+
+        logger.info(
+            f"Ingested batch of {len(batch)} changes ({len(upserts)} updated, "
+            f"{len(deletes)} deleted) in {end_time - start_time:.2f}s, lag {batch_lag:.2f}s"
+        )
+
+        if self.callback:
+            for change in batch:
+                try:
+                    self.callback(change.path)
+                except Exception as e:
+                    logger.error(f"Error in ingestion callback for {change.path}: {e}")
+
+    @property
+    def depth(self) -> int:
+        """Get the number of changes waiting to be processed.
+
+        Returns:
+            The number of pending paths.
+        """
+        with self._condition:
+            return len(self._pending)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get queue depth, lag and throughput metrics.
+
+        Returns:
+            Dictionary of queue metrics. Lag values are in seconds.
+        """
+        now = time.monotonic()
+        with self._condition:
+            oldest = min((change.first_seen for change in self._pending.values()), default=now)
+            return {
+                "queue_depth": len(self._pending),
+                "in_flight": self._in_flight,
+                "oldest_pending_age": now - oldest,
+                "events_received": self._events_received,
+                "events_coalesced": self._events_coalesced,
+                "files_processed": self._files_processed,
+                "files_deleted": self._files_deleted,
+                "batches": self._batches,
+                "errors": self._errors,
+                "last_batch_size": self._last_batch_size,
+                "last_batch_duration": self._last_batch_duration,
+                "last_lag": self._last_lag,
+                "max_lag": self._max_lag,
+            }
@@ -71,6 +71,11 @@ class BufferConfigSchema(AtlasSchema):
     paused = fields.Boolean(required=False, load_default=False)
     closed = fields.Boolean(required=False, load_default=False)
     name = fields.String(required=False, allow_none=True)
+    fast = fields.Boolean(required=False, load_default=False)
+    debug = fields.Boolean(required=False, load_default=False)
+    asynchronous = fields.Boolean(required=False, load_default=False)
+    max_bytes = fields.Integer(required=False, allow_none=True, load_default=64 * 1024 * 1024)
+    low_watermark = fields.Integer(required=False, allow_none=True)
 
     @validates("max_size")
     def validate_max_size(self, value: int, **kwargs) -> None:
@@ -86,6 +91,30 @@ class BufferConfigSchema(AtlasSchema):
         if value <= 0:
             raise ValidationError("Maximum buffer size must be greater than 0")
 
+    @validates_schema
+    def validate_watermarks(self, data: dict[str, Any], **kwargs) -> None:
+        """Validate the byte watermarks.
+
+        Args:
+            data: The data to validate.
+            **kwargs: Additional arguments passed by Marshmallow.
+
+        Raises:
+            ValidationError: If a watermark is not positive or the low watermark exceeds
+                the high watermark.
+        """
+        max_bytes = data.get("max_bytes")
+        low_watermark = data.get("low_watermark")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValidationError("Maximum buffer bytes must be greater than 0", "max_bytes")
+        if low_watermark is not None:
+            if low_watermark < 0:
+                raise ValidationError("Low watermark must not be negative", "low_watermark")
+            if max_bytes is not None and low_watermark > max_bytes:
+                raise ValidationError(
+                    "Low watermark must not exceed the maximum buffer bytes", "low_watermark"
+                )
+
 
 class BufferItemSchema(AtlasSchema):
     """Schema for items stored in buffer."""
@@ -0,0 +1,4 @@
+"""Benchmarks for Atlas.
+
+Tools for measuring the throughput of Atlas components.
+"""
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark service buffer throughput.
+
+Compares push and pop throughput of the MemoryBuffer with schema validation and in fast
+mode, and of the single-producer single-consumer RingBuffer, both single-threaded and
+with a producer and a consumer thread that block in put and get_many.
+"""
+
+import argparse
+import threading
+import time
+
+from atlas.services.buffer import MemoryBuffer, RingBuffer
+
+
+def run_sequential(buffer: MemoryBuffer | RingBuffer, items: int) -> tuple[float, float]:
+    """Time pushing all items, then popping them again.
+
+    Args:
+        buffer: The buffer to benchmark, large enough to hold all items.
+        items: Number of items to push and pop.
+
+    Returns:
+        The push and pop durations in seconds.
+    """
+    payload = {"text": "token", "index": 0}
+
+    start = time.perf_counter()
+    for _ in range(items):
+        buffer.push(payload)
+    pushed = time.perf_counter()
+    while buffer.pop() is not None:
+        pass
+    popped = time.perf_counter()
+
+    return pushed - start, popped - pushed
+
+
+def run_threaded(buffer: MemoryBuffer | RingBuffer, items: int) -> float:
+    """Time a producer thread pushing items to a consumer thread.
+
+    Args:
+        buffer: The buffer to benchmark.
+        items: Number of items to pass through the buffer.
+
+    Returns:
+        The duration in seconds until the consumer received every item.
+    """
+    payload = {"text": "token", "index": 0}
+
+    def produce():
+        for _ in range(items):
+            buffer.put(payload)
+
+    def consume():
+        received = 0
+        while received < items:
+            received += len(buffer.get_many(64))
+
+    producer = threading.Thread(target=produce)
+    consumer = threading.Thread(target=consume)
+    start = time.perf_counter()
+    consumer.start()
+    producer.start()
+    producer.join()
+    consumer.join()
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the buffer benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark service buffer throughput")
+    parser.add_argument("--items", type=int, default=100_000, help="Number of items per pass")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed passes")
+    parser.add_argument(
+        "--max_size", type=int, default=1024, help="Buffer size of the threaded benchmark"
+    )
+    args = parser.parse_args()
+
+    print(f"\nItems: {args.items:,}\n")
+
+    buffer_types = (
+        ("validated", lambda max_size: MemoryBuffer(max_size=max_size)),
+        ("fast", lambda max_size: MemoryBuffer(max_size=max_size, fast=True)),
+        ("ring", lambda max_size: RingBuffer(max_size=max_size)),
+    )
+    for name, create in buffer_types:
+        push_best = pop_best = threaded_best = float("inf")
+        for _ in range(args.repeat):
+            push_time, pop_time = run_sequential(create(args.items), args.items)
+            push_best = min(push_best, push_time)
+            pop_best = min(pop_best, pop_time)
+            threaded_best = min(threaded_best, run_threaded(create(args.max_size), args.items))
+
+        print(
+            f"{name:>10}: push {args.items / push_best:,.0f}/s  "
+            f"pop {args.items / pop_best:,.0f}/s  "
+            f"producer/consumer {args.items / threaded_best:,.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Benchmark markdown chunking throughput.
+
+Compares the single-pass MarkdownChunker with a frozen copy of the previous markdown
+chunker, which chunked the document body section by section with the SemanticChunker,
+on a markdown tree on disk or on a generated one, and checks that both produce
+identical chunks.
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import re
+import time
+from typing import Any
+
+from atlas.knowledge.ingest import DocumentChunk, MarkdownChunker
+
+WORDS = [
+    "agent",
+    "knowledge",
+    "retrieval",
+    "embedding",
+    "chunk",
+    "section",
+    "document",
+    "query",
+    "context",
+    "model",
+    "provider",
+    "stream",
+    "buffer",
+    "event",
+    "metadata",
+    "collection",
+    "vector",
+    "index",
+    "ingest",
+    "markdown",
+]
+
+
+def generate_documents(count: int, seed: int = 0) -> list[tuple[str, str]]:
+    """Generate markdown documents with frontmatter, nested headings and long sections.
+
+    Args:
+        count: Number of documents to generate.
+        seed: Seed of the random generator.
+
+    Returns:
+        A list of (path, content) tuples.
+    """
+    rng = random.Random(seed)
+
+    def paragraph() -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(10, 150))) + "."
+
+    documents = []
+    for i in range(count):
+        parts = []
+        if rng.random() < 0.5:
+            parts.append(f"---\ntitle: Page {i}\ntags: [docs]\n---\n")
+        parts.append(f"# Page {i}\n\n{paragraph()}\n")
+        for section in range(rng.randint(2, 12)):
+            level = "#" * rng.randint(2, 4)
+            parts.append(f"{level} Section {section}\n")
+            parts.extend(paragraph() + "\n" for _ in range(rng.randint(1, 15)))
+        documents.append((f"generated/page_{i}.md", "\n".join(parts)))
+    return documents
+
+
+def load_documents(directory: str) -> list[tuple[str, str]]:
+    """Load the markdown files of a directory tree.
+
+    Args:
+        directory: The directory to read.
+
+    Returns:
+        A list of (path, content) tuples.
+    """
+    documents = []
+    for root, _, files in os.walk(directory):
+        for file in sorted(files):
+            if file.endswith(".md"):
+                path = os.path.join(root, file)
+                with open(path, encoding="utf-8", errors="replace") as f:
+                    documents.append((os.path.relpath(path, directory), f.read()))
+    return documents
+
+
+class LegacyMarkdownChunker:
+    """Frozen copy of the markdown chunker before the single-pass rewrite.
+
+    Kept verbatim, including the regex-based content hash normalization, so the
+    benchmark measures against the original implementation rather than the current
+    SemanticChunker.
+    """
+
+    def __init__(self, max_chunk_size: int = 2000, min_chunk_size: int = 200):
+        """Initialize the legacy chunker.
+
+        Args:
+            max_chunk_size: Maximum size of a chunk in characters.
+            min_chunk_size: Minimum size of a chunk in characters.
+        """
+        self.max_chunk_size = max_chunk_size
+        self.min_chunk_size = min_chunk_size
+
+    @staticmethod
+    def _content_hash(text: str) -> str:
+        """Hash a chunk text like DocumentChunk did before the rewrite."""
+        text = text.lower()
+        text = re.sub(r"\s+", " ", text)
+        text = text.strip()
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _create_chunk(self, metadata: dict[str, Any], chunk_index: int, text: str, title: str):
+        """Create a chunk with a full copy of the file metadata."""
+        id_base = metadata.get("simple_id", metadata.get("source", "unknown"))
+        return DocumentChunk(
+            id=f"{id_base}#{chunk_index}",
+            text=text,
+            metadata={
+                **metadata,
+                "chunk_index": chunk_index,
+                "section_title": title,
+                "chunk_size": len(text),
+            },
+            content_hash=self._content_hash(text),
+        )
+
+    def chunk_document(self, content: str, metadata: dict[str, Any]) -> list[DocumentChunk]:
+        """Split a markdown document into chunks.
+
+        Args:
+            content: The document content to chunk.
+            metadata: Metadata about the document.
+
+        Returns:
+            A list of DocumentChunk objects.
+        """
+        frontmatter, body = self._extract_frontmatter(content)
+
+        chunks = []
+        chunk_index = 0
+        for section_title, section_content in self._split_by_semantic_boundaries(body):
+            if len(section_content) <= self.max_chunk_size:
+                chunks.append(
+                    self._create_chunk(metadata, chunk_index, section_content, section_title)
+                )
+                chunk_index += 1
+                continue
+
+            section_chunks = self._split_section_by_paragraphs(section_content, section_title)
+            for i, chunk_text in enumerate(section_chunks):
+                title = f"{section_title} (Part {i + 1}/{len(section_chunks)})"
+                chunks.append(self._create_chunk(metadata, chunk_index, chunk_text, title))
+                chunk_index += 1
+
+        if frontmatter and chunks:
+            chunks[0].text = frontmatter + "\n\n" + chunks[0].text
+        return chunks
+
+    def _split_by_semantic_boundaries(self, content: str) -> list[tuple[str, str]]:
+        """Split content into (title, text) sections at headings."""
+        heading_pattern = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+        headings = list(heading_pattern.finditer(content))
+
+        if not headings:
+            first_line = content.strip().split("\n", 1)[0] if content.strip() else "Document"
+            if len(first_line) > 50:
+                first_line = "Document"
+            return [(first_line, content)]
+
+        sections = []
+        for i, match in enumerate(headings):
+            end_pos = headings[i + 1].start() if i < len(headings) - 1 else len(content)
+            sections.append((match.group(2).strip(), content[match.start() : end_pos].strip()))
+        return sections
+
+    def _split_section_by_paragraphs(self, section: str, section_title: str) -> list[str]:
+        """Split a section into chunk texts at paragraph boundaries."""
+        paragraphs = re.split(r"\n\s*\n", section)
+        paragraphs = [p.strip() for p in paragraphs if p.strip()]
+
+        chunks = []
+        current_chunk: list[str] = []
+        current_size = 0
+
+        heading_match = re.match(r"^(#{1,6}\s+.+)$", section.split("\n", 1)[0], re.MULTILINE)
+        section_heading = heading_match.group(1) if heading_match else f"# {section_title}"
+
+        for paragraph in paragraphs:
+            if (
+                current_size + len(paragraph) > self.max_chunk_size
+                and current_size >= self.min_chunk_size
+            ):
+                chunks.append("\n\n".join(current_chunk))
+                current_chunk = [section_heading]
+                current_size = len(section_heading)
+                if paragraph.startswith(section_heading):
+                    continue
+
+            current_chunk.append(paragraph)
+            current_size += len(paragraph) + 2
+
+        if current_chunk:
+            chunks.append("\n\n".join(current_chunk))
+        return chunks
+
+    def _extract_frontmatter(self, content: str) -> tuple[str, str]:
+        """Split leading --- or +++ frontmatter from the content."""
+        frontmatter_pattern = re.compile(r"^---\s*$\n(.*?)\n^---\s*$\n", re.MULTILINE | re.DOTALL)
+        match = frontmatter_pattern.match(content)
+        if not match:
+            frontmatter_pattern = re.compile(
+                r"^\+\+\+\s*$\n(.*?)\n^\+\+\+\s*$\n", re.MULTILINE | re.DOTALL
+            )
+            match = frontmatter_pattern.match(content)
+
+        if match:
+            frontmatter = match.group(0)
+            return frontmatter, content[len(frontmatter) :]
+        return "", content
+
+
+def run(
+    documents: list[tuple[str, str]],
+    chunker: MarkdownChunker | LegacyMarkdownChunker,
+    repeat: int,
+) -> tuple[float, int]:
+    """Time chunking every document.
+
+    Args:
+        documents: The (path, content) tuples to chunk.
+        chunker: The markdown chunker to use.
+        repeat: Number of timed passes; the fastest is reported.
+
+    Returns:
+        The fastest pass in seconds and the number of chunks produced per pass.
+    """
+    best = float("inf")
+    chunk_count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chunk_count = 0
+        for path, content in documents:
+            metadata = {"path": path, "source": "benchmark", "simple_id": path}
+            chunk_count += len(chunker.chunk_document(content, metadata))
+        best = min(best, time.perf_counter() - start)
+    return best, chunk_count
+
+
+def main():
+    """Run the chunking benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark markdown chunking throughput")
+    parser.add_argument(
+        "--directory", type=str, help="Markdown tree to chunk (default: generated documents)"
+    )
+    parser.add_argument("--files", type=int, default=2000, help="Number of documents to generate")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed passes")
+    parser.add_argument(
+        "--max_chunk_size", type=int, default=2000, help="Maximum chunk size in characters"
+    )
+    args = parser.parse_args()
+
+    documents = load_documents(args.directory) if args.directory else generate_documents(args.files)
+    if not documents:
+        print("No markdown documents found")
+        return
+
+    total_bytes = sum(len(content.encode("utf-8")) for _, content in documents)
+    chunker = MarkdownChunker(max_chunk_size=args.max_chunk_size)
+    legacy_chunker = LegacyMarkdownChunker(max_chunk_size=args.max_chunk_size)
+
+    # Both implementations must agree before their speed is worth comparing
+    for path, content in documents:
+        metadata = {"path": path, "source": "benchmark", "simple_id": path}
+        expected = legacy_chunker.chunk_document(content, metadata)
+        actual = chunker.chunk_document(content, metadata)
+        if [(c.id, c.text, c.metadata, c.content_hash) for c in expected] != [
+            (c.id, c.text, dict(c.metadata), c.content_hash) for c in actual
+        ]:
+            print(f"Chunk mismatch in {path}")
+            return
+
+    print(f"\nDocuments: {len(documents)} ({total_bytes / 1e6:.1f} MB)")
+
+    results = {}
+    for name, timed_chunker in (("previous", legacy_chunker), ("single-pass", chunker)):
+        elapsed, chunk_count = run(documents, timed_chunker, args.repeat)
+        results[name] = elapsed
+        print(
+            f"{name:>12}: {elapsed:.3f}s  "
+            f"{len(documents) / elapsed:,.0f} docs/s  "
+            f"{total_bytes / 1e6 / elapsed:,.1f} MB/s  "
+            f"{chunk_count / elapsed:,.0f} chunks/s"
+        )
+
+    print(f"\nSpeedup: {results['previous'] / results['single-pass']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
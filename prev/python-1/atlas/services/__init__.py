@@ -3,7 +3,7 @@ Core service components for Atlas.
 
 This module provides essential services that other components can build upon,
 including:
-- Thread-safe buffer system with flow control
+- Thread-safe buffer system with flow control, with asyncio variants
 - Event-based communication with subscription
 - State management with versioning and transitions
 - Command pattern with execution/undo capabilities
@@ -11,7 +11,19 @@ including:
 """
 
 # Import and re-export service components
-from .buffer import BatchingBuffer, MemoryBuffer, RateLimitedBuffer, create_buffer
+from .async_buffer import (
+    AsyncBatchingBuffer,
+    AsyncBuffer,
+    AsyncMemoryBuffer,
+    AsyncRateLimitedBuffer,
+)
+from .buffer import (
+    BatchingBuffer,
+    MemoryBuffer,
+    RateLimitedBuffer,
+    RingBuffer,
+    create_buffer,
+)
 from .commands import Command, CommandExecutor, create_command_executor
 from .events import EventSubscription, EventSystem, create_event_system
 
@@ -25,7 +37,12 @@ __all__ = [
     "MemoryBuffer",
     "RateLimitedBuffer",
     "BatchingBuffer",
+    "RingBuffer",
     "create_buffer",
+    "AsyncBuffer",
+    "AsyncMemoryBuffer",
+    "AsyncRateLimitedBuffer",
+    "AsyncBatchingBuffer",
     # Event system
     "EventSystem",
     "EventSubscription",
@@ -0,0 +1,716 @@
+"""
+Asyncio buffers with flow control.
+
+This module provides asyncio variants of the memory, rate-limited and batching buffers.
+Each one wraps the corresponding thread-safe buffer, so items are validated, limited and
+batched exactly the same way, and adds awaitable put, get and drain operations as well
+as async iteration on top of it.
+
+Waiting coroutines park on futures that are resolved when the buffer changes, so they
+wake as soon as an item, space or a batch becomes available instead of polling. The
+buffers are meant to be used from a single event loop. Other threads must hand items
+over with loop.call_soon_threadsafe rather than calling the buffer directly.
+"""
+
+import asyncio
+import time
+from typing import Any, Self, TypeGuard
+
+from atlas.core.errors import BufferError
+from atlas.core.logging import get_logger
+from atlas.schemas.services import BufferProtocol
+from atlas.services.buffer import (
+    BatchingBuffer,
+    MemoryBuffer,
+    RateLimitedBuffer,
+    Sizer,
+    estimate_size,
+)
+
+# Create a logger for this module
+logger = get_logger(__name__)
+
+
+class AsyncBuffer(BufferProtocol):
+    """Asyncio interface to a memory buffer.
+
+    The non-blocking operations of the wrapped buffer are available unchanged, while
+    put, get, get_many and drain are coroutines that wait for the buffer to change.
+    Iterating over the buffer with async for yields items until it is closed and
+    drained. Subclasses declare the type of the buffer they wrap, so they can use the
+    operations specific to it.
+    """
+
+    _buffer: MemoryBuffer
+
+    def __init__(self, buffer: MemoryBuffer):
+        """Initialize the async buffer.
+
+        Args:
+            buffer: The buffer that stores the items.
+        """
+        self._buffer = buffer
+        # Futures of coroutines waiting for items, and for space or removals
+        self._getters: set[asyncio.Future] = set()
+        self._putters: set[asyncio.Future] = set()
+
+    def push(self, item: dict[str, Any]) -> bool:
+        """Push an item to the buffer without waiting.
+
+        Args:
+            item: The item to push to the buffer.
+
+        Returns:
+            True if the item was pushed, False otherwise.
+
+        Raises:
+            ClosedBufferError: If the buffer is closed.
+            BufferError: If there is an error pushing the item.
+        """
+        pushed: bool = self._buffer.push(item)
+        if pushed:
+            self._wake(self._getters)
+        return pushed
+
+    def pop(self) -> dict[str, Any] | None:
+        """Pop an item from the buffer without waiting.
+
+        Returns:
+            The item if available, None if the buffer is empty.
+        """
+        item = self._buffer.pop()
+        if item is not None:
+            self._wake(self._putters)
+        return item
+
+    def peek(self) -> dict[str, Any] | None:
+        """Peek at the next item in the buffer without removing it.
+
+        Returns:
+            The next item if available, None if the buffer is empty.
+
+        Raises:
+            ClosedBufferError: If the buffer is closed.
+        """
+        item: dict[str, Any] | None = self._buffer.peek()
+        return item
+
+    def clear(self) -> None:
+        """Clear all items from the buffer.
+
+        Raises:
+            ClosedBufferError: If the buffer is closed.
+        """
+        self._buffer.clear()
+        self._wake(self._putters)
+
+    def is_closed(self) -> bool:
+        """Check if the buffer is closed.
+
+        Returns:
+            True if the buffer is closed, False otherwise.
+        """
+        return self._buffer.is_closed()
+
+    def close(self) -> None:
+        """Close the buffer and wake all waiting coroutines.
+
+        Producers waiting in put raise ClosedBufferError, while consumers keep receiving
+        the remaining items until the buffer is drained.
+        """
+        self._buffer.close()
+        self._wake(self._getters)
+        self._wake(self._putters)
+
+    def pause(self) -> Self:
+        """Pause the buffer.
+
+        While paused, push operations are rejected and put operations wait.
+
+        Returns:
+            Self for method chaining.
+        """
+        self._buffer.pause()
+        return self
+
+    def resume(self) -> Self:
+        """Resume the buffer.
+
+        Returns:
+            Self for method chaining.
+        """
+        self._buffer.resume()
+        self._wake(self._putters)
+        return self
+
+    async def put(self, item: dict[str, Any], timeout: float | None = None) -> bool:
+        """Push an item to the buffer, waiting while it cannot take the item.
+
+        Args:
+            item: The item to push to the buffer.
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            True if the item was pushed, False if the timeout expired.
+
+        Raises:
+            ClosedBufferError: If the buffer is closed, also while waiting.
+            BufferError: If there is an error pushing the item.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            if self.push(item):
+                return True
+            if not await self._wait(self._putters, self._push_delay(item), deadline):
+                return False
+
+    async def get(self, timeout: float | None = None) -> dict[str, Any] | None:
+        """Pop an item from the buffer, waiting until one is available.
+
+        Args:
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            The item, or None if the timeout expired or the buffer is closed and drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            item = self.pop()
+            if item is not None:
+                return item
+            if not await self._wait_for_items(deadline):
+                return None
+
+    async def get_many(
+        self, max_items: int, timeout: float | None = None
+    ) -> list[dict[str, Any]]:
+        """Pop up to a number of items, waiting until at least one is available.
+
+        Args:
+            max_items: The maximum number of items to pop.
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            The popped items in order, empty if the timeout expired or the buffer is closed
+            and drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        items: list[dict[str, Any]] = []
+
+        while True:
+            while len(items) < max_items:
+                item = self.pop()
+                if item is None:
+                    break
+                items.append(item)
+
+            if items or not await self._wait_for_items(deadline):
+                return items
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """Wait until consumers have taken every item from the buffer.
+
+        Args:
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            True if the buffer is empty, False if the timeout expired.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while not self._buffer.is_empty:
+            # Removals wake the producers, which includes coroutines waiting to drain
+            if not await self._wait(self._putters, None, deadline):
+                return False
+        return True
+
+    async def wait_until_not_empty(self, timeout: float | None = None) -> bool:
+        """Wait until the buffer has at least one item.
+
+        Args:
+            timeout: The maximum time to wait in seconds.
+
+        Returns:
+            True if the buffer has items or is closed, False if timeout occurred.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while self._buffer.is_empty and not self._buffer.is_closed():
+            if not await self._wait(self._getters, None, deadline):
+                return False
+        return True
+
+    async def wait_until_not_full(self, timeout: float | None = None) -> bool:
+        """Wait until the buffer has space for more items.
+
+        Args:
+            timeout: The maximum time to wait in seconds.
+
+        Returns:
+            True if the buffer has space or is closed, False if timeout occurred.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while self._buffer.is_full and not self._buffer.is_closed():
+            if not await self._wait(self._putters, None, deadline):
+                return False
+        return True
+
+    def __aiter__(self) -> Self:
+        """Iterate over the items of the buffer until it is closed and drained."""
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        """Wait for the next item of the buffer.
+
+        Returns:
+            The next item.
+
+        Raises:
+            StopAsyncIteration: If the buffer is closed and drained.
+        """
+        item = await self.get()
+        if item is None:
+            raise StopAsyncIteration
+        return item
+
+    def _push_delay(self, item: dict[str, Any]) -> float | None:
+        """Get the time after which a rejected push should be retried.
+
+        Args:
+            item: The item that was rejected.
+
+        Returns:
+            The delay in seconds, or None if only a removal or resume can make room.
+        """
+        return None
+
+    async def _wait_for_items(self, deadline: float | None) -> bool:
+        """Wait once for items to arrive or become ready.
+
+        Args:
+            deadline: Monotonic time after which to stop waiting, or None.
+
+        Returns:
+            False if the deadline has passed or the buffer is closed and drained, True
+            after waking up, in which case the caller checks the buffer again.
+        """
+        if self._buffer.is_closed() and self._buffer.is_empty:
+            return False
+        return await self._wait(self._getters, self._buffer.ready_delay(), deadline)
+
+    async def _wait(
+        self, waiters: set[asyncio.Future], delay: float | None, deadline: float | None
+    ) -> bool:
+        """Wait until the waiters are woken, a delay elapses or the deadline passes.
+
+        Args:
+            waiters: The waiters to join.
+            delay: The maximum time to wait in seconds, or None.
+            deadline: Monotonic time after which to stop waiting, or None.
+
+        Returns:
+            False if the deadline had already passed, True otherwise.
+        """
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            delay = remaining if delay is None else min(delay, remaining)
+
+        future = asyncio.get_running_loop().create_future()
+        waiters.add(future)
+        try:
+            async with asyncio.timeout(delay):
+                await future
+        except TimeoutError:
+            pass
+        finally:
+            waiters.discard(future)
+        return True
+
+    @staticmethod
+    def _wake(waiters: set[asyncio.Future]) -> None:
+        """Wake all waiters, which then check the buffer again.
+
+        Args:
+            waiters: The waiters to wake.
+        """
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+        waiters.clear()
+
+    @property
+    def size(self) -> int:
+        """Get the current size of the buffer.
+
+        Returns:
+            The number of items in the buffer.
+        """
+        return self._buffer.size
+
+    @property
+    def max_size(self) -> int:
+        """Get the maximum size of the buffer.
+
+        Returns:
+            The maximum number of items the buffer can hold.
+        """
+        return self._buffer.max_size
+
+    @property
+    def size_bytes(self) -> int:
+        """Get the estimated payload bytes held by the buffer.
+
+        Returns:
+            The estimated bytes, always 0 if the buffer does not bound its bytes.
+        """
+        return self._buffer.size_bytes
+
+    @property
+    def max_bytes(self) -> int | None:
+        """Get the high watermark of the buffer.
+
+        Returns:
+            The maximum estimated payload bytes, or None if only items are counted.
+        """
+        return self._buffer.max_bytes
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if the buffer is empty.
+
+        Returns:
+            True if the buffer is empty, False otherwise.
+        """
+        return self._buffer.is_empty
+
+    @property
+    def is_full(self) -> bool:
+        """Check if the buffer is full.
+
+        Returns:
+            True if the buffer is full, False otherwise.
+        """
+        return self._buffer.is_full
+
+    @property
+    def is_paused(self) -> bool:
+        """Check if the buffer is paused.
+
+        Returns:
+            True if the buffer is paused, False otherwise.
+        """
+        return self._buffer.is_paused
+
+    @property
+    def is_fast(self) -> bool:
+        """Check if the buffer stores items as compact records.
+
+        Returns:
+            True if the buffer runs in fast mode, False otherwise.
+        """
+        return self._buffer.is_fast
+
+
+class AsyncMemoryBuffer(AsyncBuffer):
+    """Asyncio variant of the MemoryBuffer."""
+
+    def __init__(
+        self,
+        max_size: int = MemoryBuffer.MAX_DEFAULT_SIZE,
+        fast: bool = False,
+        debug: bool = False,
+        max_bytes: int | None = MemoryBuffer.MAX_DEFAULT_BYTES,
+        low_watermark: int | None = None,
+        sizer: Sizer = estimate_size,
+    ):
+        """Initialize a new async memory buffer.
+
+        Args:
+            max_size: The maximum number of items in the buffer.
+            fast: Whether to store items as compact records without schema validation.
+            debug: Whether to validate items against the schema in fast mode as well.
+            max_bytes: The high watermark of the estimated payload bytes, or None.
+            low_watermark: The payload bytes below which a throttled buffer accepts
+                pushes again. Defaults to half of max_bytes.
+            sizer: Function estimating the size of a payload in bytes.
+        """
+        super().__init__(
+            MemoryBuffer(
+                max_size,
+                fast=fast,
+                debug=debug,
+                max_bytes=max_bytes,
+                low_watermark=low_watermark,
+                sizer=sizer,
+            )
+        )
+
+
+class AsyncRateLimitedBuffer(AsyncBuffer):
+    """Asyncio variant of the RateLimitedBuffer.
+
+    Producers waiting in put sleep until enough tokens have accrued for their item, or
+    until a consumer makes room if the buffer is full.
+    """
+
+    _buffer: RateLimitedBuffer
+
+    def __init__(
+        self,
+        max_size: int = MemoryBuffer.MAX_DEFAULT_SIZE,
+        tokens_per_second: float | None = None,
+        chars_per_token: int = RateLimitedBuffer.DEFAULT_CHARS_PER_TOKEN,
+        initial_token_budget: float | None = None,
+        fast: bool = False,
+        debug: bool = False,
+        max_bytes: int | None = MemoryBuffer.MAX_DEFAULT_BYTES,
+        low_watermark: int | None = None,
+        sizer: Sizer = estimate_size,
+    ):
+        """Initialize a new async rate-limited buffer.
+
+        Args:
+            max_size: The maximum number of items in the buffer.
+            tokens_per_second: The maximum tokens per second rate.
+            chars_per_token: The number of characters per token.
+            initial_token_budget: Optional initial token budget. If None, a default
+                                value will be calculated based on other parameters.
+            fast: Whether to store items as compact records without schema validation.
+            debug: Whether to validate items against the schema in fast mode as well.
+            max_bytes: The high watermark of the estimated payload bytes, or None.
+            low_watermark: The payload bytes below which a throttled buffer accepts
+                pushes again. Defaults to half of max_bytes.
+            sizer: Function estimating the size of a payload in bytes.
+        """
+        super().__init__(
+            RateLimitedBuffer(
+                max_size,
+                tokens_per_second=tokens_per_second,
+                chars_per_token=chars_per_token,
+                initial_token_budget=initial_token_budget,
+                fast=fast,
+                debug=debug,
+                max_bytes=max_bytes,
+                low_watermark=low_watermark,
+                sizer=sizer,
+            )
+        )
+
+    def _push_delay(self, item: dict[str, Any]) -> float | None:
+        """Get the time until enough tokens accrue to push an item.
+
+        Args:
+            item: The item that was rejected.
+
+        Returns:
+            The delay in seconds, or None if the buffer is full, paused or not rate
+            limited.
+
+        Raises:
+            BufferError: If the item costs more tokens than the budget can ever hold.
+        """
+        rate = self._buffer.tokens_per_second
+        if rate is None or self._buffer.is_full or self._buffer.is_paused:
+            return None
+
+        token_cost = self._buffer.calculate_token_cost(item)
+        max_budget = self._buffer.max_token_budget
+        if max_budget is not None and token_cost > max_budget:
+            raise BufferError(
+                f"Item costs {token_cost:.1f} tokens, more than the budget of {max_budget:.1f}"
+            )
+        return max(0.0, (token_cost - self._buffer.token_budget) / rate)
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        """Get the token rate of the buffer.
+
+        Returns:
+            The maximum tokens per second, or None if the buffer is not rate limited.
+        """
+        return self._buffer.tokens_per_second
+
+    @property
+    def chars_per_token(self) -> int:
+        """Get the number of characters counted as one token.
+
+        Returns:
+            The number of characters per token.
+        """
+        return self._buffer.chars_per_token
+
+    @property
+    def token_budget(self) -> float:
+        """Get the tokens currently available for pushes.
+
+        Returns:
+            The token budget, including the tokens accrued since the last push.
+        """
+        return self._buffer.token_budget
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get rate limiting metrics.
+
+        Returns:
+            Dictionary with the rate, budget and spending metrics of the buffer.
+        """
+        return self._buffer.get_metrics()
+
+
+class AsyncBatchingBuffer(AsyncBuffer):
+    """Asyncio variant of the BatchingBuffer.
+
+    Consumers waiting in get receive a batch as soon as a push completes one, or when
+    the pending items time out into one.
+    """
+
+    _buffer: BatchingBuffer
+
+    def __init__(
+        self,
+        max_size: int = MemoryBuffer.MAX_DEFAULT_SIZE,
+        batch_size: int | None = BatchingBuffer.DEFAULT_BATCH_SIZE,
+        batch_timeout: float | None = BatchingBuffer.DEFAULT_BATCH_TIMEOUT,
+        batch_delimiter: str | None = None,
+        fast: bool = False,
+        debug: bool = False,
+        max_bytes: int | None = MemoryBuffer.MAX_DEFAULT_BYTES,
+        low_watermark: int | None = None,
+        sizer: Sizer = estimate_size,
+    ):
+        """Initialize a new async batching buffer.
+
+        Args:
+            max_size: The maximum number of items in the buffer.
+            batch_size: The number of items to include in a batch.
+            batch_timeout: The maximum time to wait for a full batch in seconds.
+            batch_delimiter: An optional delimiter to add between batched items.
+            fast: Whether to store items as compact records without schema validation.
+            debug: Whether to validate items against the schema in fast mode as well.
+            max_bytes: The high watermark of the estimated payload bytes, or None.
+            low_watermark: The payload bytes below which a throttled buffer accepts
+                pushes again. Defaults to half of max_bytes.
+            sizer: Function estimating the size of a payload in bytes.
+        """
+        super().__init__(
+            BatchingBuffer(
+                max_size,
+                batch_size=batch_size,
+                batch_timeout=batch_timeout,
+                batch_delimiter=batch_delimiter,
+                fast=fast,
+                debug=debug,
+                max_bytes=max_bytes,
+                low_watermark=low_watermark,
+                sizer=sizer,
+            )
+        )
+
+    def push(self, item: dict[str, Any]) -> bool:
+        """Push an item, waking consumers only when it starts or completes a batch.
+
+        Args:
+            item: The item to push to the buffer.
+
+        Returns:
+            True if the item was pushed, False otherwise.
+
+        Raises:
+            ClosedBufferError: If the buffer is closed.
+            BufferError: If there is an error pushing the item.
+        """
+        pushed: bool = self._buffer.push(item)
+        if pushed:
+            pending = self._buffer.size
+            if pending == 1 or pending == self._buffer.batch_size:
+                self._wake(self._getters)
+        return pushed
+
+    def pop_batch(self) -> list[dict[str, Any]]:
+        """Pop a batch of items without merging them into a single item.
+
+        Returns:
+            The items of the batch in order, empty if no batch is ready.
+        """
+        batch_items = self._buffer.pop_batch()
+        if batch_items:
+            self._wake(self._putters)
+        return batch_items
+
+    async def get_batch(self, timeout: float | None = None) -> list[dict[str, Any]]:
+        """Pop a batch of items without merging them, waiting until one is ready.
+
+        Args:
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            The items of the batch in order, empty if the timeout expired or the buffer is
+            closed and drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            batch_items = self.pop_batch()
+            if batch_items or not await self._wait_for_items(deadline):
+                return batch_items
+
+    async def wait_for_batch(self, timeout: float | None = None) -> bool:
+        """Wait until a batch is ready.
+
+        Args:
+            timeout: The maximum time to wait in seconds.
+
+        Returns:
+            True if a batch is ready, False if timeout occurred.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        # A zero timeout only checks the batch status without blocking the event loop
+        while not self._buffer.wait_for_batch(0):
+            if not await self._wait_for_items(deadline):
+                return False
+        return True
+
+    @property
+    def batch_size(self) -> int | None:
+        """Get the number of items in a full batch.
+
+        Returns:
+            The batch size, or None if batches are only formed by timeout.
+        """
+        return self._buffer.batch_size
+
+    @property
+    def batch_timeout(self) -> float | None:
+        """Get the time after which pending items form a batch.
+
+        Returns:
+            The batch timeout in seconds, or None if batches are only formed by size.
+        """
+        return self._buffer.batch_timeout
+
+    @property
+    def batch_delimiter(self) -> str | None:
+        """Get the delimiter placed between the texts of batched items.
+
+        Returns:
+            The batch delimiter, or None if texts are not combined.
+        """
+        return self._buffer.batch_delimiter
+
+
+def is_async_buffer(obj: Any) -> TypeGuard[AsyncBuffer]:
+    """Check if an object is an AsyncBuffer.
+
+    Args:
+        obj: The object to check.
+
+    Returns:
+        True if the object is an AsyncBuffer, False otherwise.
+    """
+    return isinstance(obj, AsyncBuffer)
@@ -6,12 +6,14 @@ communication, streaming, and other data flow needs. The implementations are
 thread-safe and support features like rate limiting and batching.
 """
 
+import itertools
 import time
 import uuid
 from collections import deque
+from collections.abc import Callable
 from datetime import datetime
 from functools import wraps
-from threading import Event, RLock
+from threading import Condition, Event, RLock
 from typing import Any, ClassVar, Self, TypeAlias, TypeGuard
 
 from atlas.core.errors import BufferError, ClosedBufferError
@@ -29,6 +31,11 @@ BufferItem: TypeAlias = dict[str, Any]
 BufferSize: TypeAlias = int
 TokenRate: TypeAlias = float
 CharCount: TypeAlias = int
+# Function estimating the payload bytes of an item
+Sizer = Callable[[Any], int]
+
+# Estimated bytes of bookkeeping per container entry and of scalars like numbers
+ENTRY_OVERHEAD = 8
 
 # Create a logger for this module
 logger = get_logger(__name__)
@@ -101,36 +108,232 @@ def _ensure_not_paused(method):
     return wrapper
 
 
+def estimate_size(payload: Any) -> int:
+    """Estimate the memory taken up by a payload without serializing it.
+
+    Strings count one byte per character and bytes their length, while containers add a
+    fixed overhead per entry to the sizes of their contents. The estimate tracks how
+    payloads grow rather than the exact footprint of the Python objects.
+
+    Args:
+        payload: The payload to measure.
+
+    Returns:
+        The estimated size in bytes.
+    """
+    if isinstance(payload, (str, bytes, bytearray)):
+        return len(payload)
+    if isinstance(payload, dict):
+        size = ENTRY_OVERHEAD * len(payload)
+        for key, value in payload.items():
+            size += estimate_size(key) + estimate_size(value)
+        return size
+    if isinstance(payload, (list, tuple, set, frozenset)):
+        return ENTRY_OVERHEAD * len(payload) + sum(estimate_size(value) for value in payload)
+    return ENTRY_OVERHEAD
+
+
+def validate_buffer_item(item: dict[str, Any]) -> BufferItem:
+    """Validate a payload and wrap it into a buffer item.
+
+    Args:
+        item: The payload to validate.
+
+    Returns:
+        The validated buffer item with a unique ID and timestamp.
+
+    Raises:
+        BufferError: If the payload is not a valid buffer item.
+    """
+    try:
+        validated: BufferItem = buffer_item_schema.load(
+            {
+                "item_id": str(uuid.uuid4()),
+                "timestamp": datetime.now().isoformat(),
+                "data": item,
+                "metadata": {},
+            }
+        )
+    except Exception as e:
+        logger.error(f"Error validating buffer item: {e}")
+        raise BufferError(f"Invalid buffer item: {e}")
+    return validated
+
+
+class BufferRecord:
+    """Compact record of an item stored by a buffer in fast mode.
+
+    Records keep a sequence number, a monotonic timestamp and the payload in slots
+    instead of a validated item dictionary with a UUID and a formatted timestamp. They
+    stay inside the buffer and are turned into buffer item dictionaries when they leave
+    it, so consumers get the same kind of item whichever mode the buffer runs in.
+    """
+
+    __slots__ = ("data", "seq", "timestamp")
+
+    def __init__(self, seq: int, timestamp: float, data: dict[str, Any]):
+        """Initialize a record.
+
+        Args:
+            seq: Sequence number of the item, increasing in push order.
+            timestamp: Monotonic time of the push in seconds.
+            data: The item payload.
+        """
+        self.seq = seq
+        self.timestamp = timestamp
+        self.data = data
+
+    def to_item(self) -> BufferItem:
+        """Convert the record into a buffer item.
+
+        Returns:
+            A buffer item with the sequence number as string item ID, the monotonic
+            timestamp and empty metadata.
+        """
+        return {
+            "item_id": str(self.seq),
+            "timestamp": self.timestamp,
+            "data": self.data,
+            "metadata": {},
+        }
+
+    def __repr__(self) -> str:
+        """Get a debug representation of the record."""
+        return f"BufferRecord(seq={self.seq}, timestamp={self.timestamp}, data={self.data!r})"
+
+
+def _as_buffer_item(item: BufferItem | BufferRecord) -> BufferItem:
+    """Convert a stored item into the buffer item returned to consumers.
+
+    Args:
+        item: A validated buffer item or a fast mode record.
+
+    Returns:
+        The buffer item.
+    """
+    if isinstance(item, BufferRecord):
+        return item.to_item()
+    return item
+
+
 class MemoryBuffer(BufferProtocol):
     """Thread-safe in-memory buffer implementation.
 
     This buffer provides a thread-safe mechanism for passing data between
     concurrent processes. It supports pushing, popping, and peeking at items,
     as well as pausing and resuming the buffer flow.
+
+    Besides the non-blocking push and pop, put, get and get_many block until there is
+    space or an item. They wait on conditions sharing the buffer lock, so waiting
+    threads wake as soon as the buffer changes instead of polling it.
+
+    In fast mode, pushed payloads are only checked to be dictionaries and stored as
+    BufferRecord objects, skipping schema validation unless debug is enabled. Popped
+    records are returned as buffer items with the sequence number as string item ID and
+    the monotonic push time as timestamp.
+
+    Besides the number of items, the buffer bounds the estimated bytes of the payloads
+    it holds. Once a push would take it past the high watermark of max_bytes, it rejects
+    pushes until consumers have drained it to the low watermark, so bursts of large
+    payloads are throttled without waking producers for every single pop.
     """
 
     # Class constants
     MAX_DEFAULT_SIZE: ClassVar[int] = 1024 * 1024
+    MAX_DEFAULT_BYTES: ClassVar[int] = 64 * 1024 * 1024
 
-    def __init__(self, max_size: int = MAX_DEFAULT_SIZE):
+    def __init__(
+        self,
+        max_size: int = MAX_DEFAULT_SIZE,
+        fast: bool = False,
+        debug: bool = False,
+        max_bytes: int | None = MAX_DEFAULT_BYTES,
+        low_watermark: int | None = None,
+        sizer: Sizer = estimate_size,
+    ):
         """Initialize a new memory buffer.
 
         Args:
-            max_size: The maximum size of the buffer in bytes.
+            max_size: The maximum number of items in the buffer.
+            fast: Whether to store items as compact records without schema validation.
+            debug: Whether to validate items against the schema in fast mode as well.
+            max_bytes: The high watermark of the estimated payload bytes, or None to only
+                bound the number of items. Payloads are not measured without it.
+            low_watermark: The payload bytes below which a throttled buffer accepts
+                pushes again. Defaults to half of max_bytes.
+            sizer: Function estimating the size of a payload in bytes.
+
+        Raises:
+            ValueError: If the low watermark exceeds max_bytes.
         """
-        self._buffer = deque()
+        if max_bytes is not None:
+            if low_watermark is None:
+                low_watermark = max_bytes // 2
+            elif low_watermark > max_bytes:
+                raise ValueError(
+                    f"Low watermark {low_watermark} exceeds the high watermark {max_bytes}"
+                )
+
+        self._buffer: deque[BufferItem | BufferRecord] = deque()
+        # Estimated payload bytes of the items, in buffer order
+        self._sizes: deque[int] = deque()
         self._lock = RLock()
-        self._not_empty = Event()
-        self._not_full = Event()
+        # Conditions share the lock, so checking the buffer and waiting on it is atomic
+        self._not_empty = Condition(self._lock)
+        self._not_full = Condition(self._lock)
         self._closed = False
         self._paused = False
         self._max_size = max_size
         self._current_size = 0
+        self._max_bytes = max_bytes
+        self._low_watermark = low_watermark
+        self._current_bytes = 0
+        self._throttled = False
+        self._sizer = sizer
+        self._fast = fast
+        self._debug = debug
+        self._sequence = itertools.count()
 
-        # Set initial event states
-        self._not_full.set()
+        logger.debug(
+            f"Created MemoryBuffer with max_size={max_size}, max_bytes={max_bytes}, fast={fast}"
+        )
+
+    def _payload_size(self, item: dict[str, Any]) -> int:
+        """Estimate the size of a payload if the buffer bounds its bytes.
+
+        Args:
+            item: The pushed payload.
+
+        Returns:
+            The estimated size in bytes, 0 if the buffer only bounds the number of items.
+        """
+        if self._max_bytes is None:
+            return 0
+        return self._sizer(item)
 
-        logger.debug(f"Created MemoryBuffer with max_size={max_size}")
+    def _make_item(self, item: dict[str, Any]) -> BufferItem | BufferRecord:
+        """Turn a pushed payload into the item stored in the buffer.
+
+        Args:
+            item: The pushed payload.
+
+        Returns:
+            A validated buffer item, or a record in fast mode.
+
+        Raises:
+            BufferError: If the payload is not a valid buffer item.
+        """
+        if not self._fast:
+            return validate_buffer_item(item)
+
+        # Only the type is checked at the boundary, the schema only in debug mode
+        if not isinstance(item, dict):
+            raise BufferError(f"Invalid buffer item: expected a dict, got {type(item).__name__}")
+        if self._debug:
+            validate_buffer_item(item)
+
+        # The counter is advanced atomically, so no lock is needed
+        return BufferRecord(next(self._sequence), time.monotonic(), item)
 
     @_ensure_open
     @_ensure_not_paused
@@ -147,42 +350,213 @@ class MemoryBuffer(BufferProtocol):
             ClosedBufferError: If the buffer is closed.
             BufferError: If there is an error pushing the item.
         """
-
-        # Validate using schema
-        try:
-            validated_item = buffer_item_schema.load(
-                {
-                    "item_id": str(uuid.uuid4()),
-                    "timestamp": datetime.now().isoformat(),
-                    "data": item,
-                    "metadata": {},
-                }
-            )
-        except Exception as e:
-            logger.error(f"Error validating buffer item: {e}")
-            raise BufferError(f"Invalid buffer item: {e}")
+        validated_item = self._make_item(item)
+        item_size = self._payload_size(item)
 
         with self._lock:
             # Check if buffer is full
-            if not self._not_full.is_set():
+            if not self._has_space(item_size):
                 logger.debug("Buffer is full, waiting for space")
                 return False
 
-            # Add item to buffer
-            self._buffer.append(validated_item)
+            self._append(validated_item, item_size)
+            return True
+
+    @_ensure_open
+    def put(self, item: dict[str, Any], timeout: float | None = None) -> bool:
+        """Push an item to the buffer, waiting while it is full or paused.
+
+        Args:
+            item: The item to push to the buffer.
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            True if the item was pushed, False if the timeout expired.
+
+        Raises:
+            ClosedBufferError: If the buffer is closed, also while waiting.
+            BufferError: If there is an error pushing the item.
+        """
+        validated_item = self._make_item(item)
+        item_size = self._payload_size(item)
+
+        with self._lock:
+            if not self._wait_for_space(item_size, timeout):
+                return False
+
+            self._append(validated_item, item_size)
+            return True
 
-            # Update size tracking
-            self._current_size += 1
+    def get(self, timeout: float | None = None) -> dict[str, Any] | None:
+        """Pop an item from the buffer, waiting until one is available.
 
-            # Update events
-            if self._current_size >= self._max_size:
-                self._not_full.clear()
+        Args:
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
 
-            # Signal that buffer is not empty
-            self._not_empty.set()
+        Returns:
+            The item, or None if the timeout expired or the buffer is closed and drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._lock:
+            while True:
+                item = self.pop()
+                if item is not None:
+                    return item
+                if not self._wait_for_items(deadline):
+                    return None
+
+    def get_many(self, max_items: int, timeout: float | None = None) -> list[dict[str, Any]]:
+        """Pop up to a number of items, waiting until at least one is available.
+
+        Args:
+            max_items: The maximum number of items to pop.
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            The popped items in order, empty if the timeout expired or the buffer is closed
+            and drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        items: list[dict[str, Any]] = []
+
+        with self._lock:
+            while True:
+                while len(items) < max_items:
+                    item = self.pop()
+                    if item is None:
+                        break
+                    items.append(item)
+
+                if items or not self._wait_for_items(deadline):
+                    return items
+
+    def _append(self, item: BufferItem | BufferRecord, item_size: int) -> None:
+        """Append an item and wake waiting consumers. Must be called with the lock held.
+
+        Args:
+            item: The item to store.
+            item_size: The estimated payload bytes of the item.
+        """
+        self._buffer.append(item)
+        self._sizes.append(item_size)
+        self._current_size += 1
+        self._current_bytes += item_size
+        self._notify_consumers()
 
-            logger.debug(f"Pushed item to buffer, size now {self._current_size}")
+        logger.debug(f"Pushed item to buffer, size now {self._current_size}")
+
+    def _notify_consumers(self) -> None:
+        """Wake consumers after an append. Must be called with the lock held."""
+        self._not_empty.notify_all()
+
+    def _popleft(self) -> BufferItem | BufferRecord:
+        """Remove the oldest item. Must be called with the lock held on a non-empty buffer.
+
+        Returns:
+            The removed item.
+        """
+        self._current_size -= 1
+        self._current_bytes -= self._sizes.popleft()
+        if (
+            self._throttled
+            and self._low_watermark is not None
+            and self._current_bytes <= self._low_watermark
+        ):
+            self._throttled = False
+            logger.debug(f"Buffer drained to {self._current_bytes} bytes, accepting pushes")
+        return self._buffer.popleft()
+
+    def _has_space(self, item_size: int) -> bool:
+        """Check whether an item fits into the buffer. Must be called with the lock held.
+
+        A payload that would take the buffer past its high watermark throttles the buffer
+        until it is drained to the low watermark. An empty buffer accepts any payload, so
+        payloads larger than max_bytes are not stuck forever.
+
+        Args:
+            item_size: The estimated payload bytes of the item.
+
+        Returns:
+            True if the item can be appended, False otherwise.
+        """
+        if self._current_size >= self._max_size or self._throttled:
+            return False
+        if (
+            self._max_bytes is not None
+            and self._current_bytes
+            and self._current_bytes + item_size > self._max_bytes
+        ):
+            self._throttled = True
+            logger.debug(f"Buffer reached {self._current_bytes} bytes, throttling pushes")
+            return False
+        return True
+
+    def _is_full(self) -> bool:
+        """Check whether the buffer rejects pushes. Must be called with the lock held.
+
+        Returns:
+            True if the buffer holds max_size items, is throttled or at its high watermark.
+        """
+        if self._current_size >= self._max_size or self._throttled:
             return True
+        return self._max_bytes is not None and self._current_bytes >= self._max_bytes
+
+    def _wait_for_space(self, item_size: int, timeout: float | None) -> bool:
+        """Wait until an item can be pushed. Must be called with the lock held.
+
+        Args:
+            item_size: The estimated payload bytes of the item.
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            True if there is space, False if the timeout expired.
+
+        Raises:
+            ClosedBufferError: If the buffer was closed.
+        """
+        ready = self._not_full.wait_for(
+            lambda: self._closed or (not self._paused and self._has_space(item_size)),
+            timeout,
+        )
+        if self._closed:
+            raise ClosedBufferError("Cannot perform operation on closed buffer")
+        return ready
+
+    def _wait_for_items(self, deadline: float | None) -> bool:
+        """Wait once for the buffer to change. Must be called with the lock held.
+
+        Args:
+            deadline: Monotonic time after which to stop waiting, or None.
+
+        Returns:
+            False if the deadline has passed or the buffer is closed and drained, True
+            after waking up, in which case the caller checks the buffer again.
+        """
+        if self._closed and not self._buffer:
+            return False
+
+        delay = self.ready_delay()
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            delay = remaining if delay is None else min(delay, remaining)
+
+        self._not_empty.wait(delay)
+        return True
+
+    def ready_delay(self) -> float | None:
+        """Get the time until buffered items become ready without further pushes.
+
+        Waiting consumers, including those of wrapping buffers, wake up after this delay
+        at the latest to check the buffer again. Subclasses that release items over time
+        override it.
+
+        Returns:
+            The delay in seconds, or None if only a push can make items ready.
+        """
+        return None
 
     def pop(self) -> dict[str, Any] | None:
         """Pop an item from the buffer.
@@ -196,21 +570,15 @@ class MemoryBuffer(BufferProtocol):
         """
         with self._lock:
             if not self._buffer:
-                self._not_empty.clear()
                 return None
 
-            item = self._buffer.popleft()
-            self._current_size -= 1
-
-            # Update events
-            if self._current_size == 0:
-                self._not_empty.clear()
+            item = self._popleft()
 
             # Signal that buffer is not full
-            self._not_full.set()
+            self._not_full.notify_all()
 
             logger.debug(f"Popped item from buffer, size now {self._current_size}")
-            return item
+            return _as_buffer_item(item)
 
     @_ensure_open
     def peek(self) -> dict[str, Any] | None:
@@ -228,7 +596,7 @@ class MemoryBuffer(BufferProtocol):
 
             item = self._buffer[0]
             logger.debug("Peeked at buffer")
-            return item
+            return _as_buffer_item(item)
 
     @_ensure_open
     def clear(self) -> None:
@@ -239,11 +607,13 @@ class MemoryBuffer(BufferProtocol):
         """
         with self._lock:
             self._buffer.clear()
+            self._sizes.clear()
             self._current_size = 0
+            self._current_bytes = 0
+            self._throttled = False
 
-            # Update events
-            self._not_empty.clear()
-            self._not_full.set()
+            # Wake up waiting producers
+            self._not_full.notify_all()
 
             logger.debug("Cleared buffer")
 
@@ -262,15 +632,15 @@ class MemoryBuffer(BufferProtocol):
         """
         with self._lock:
             self._closed = True
-            self._not_empty.set()  # Wake up any waiting consumers
-            self._not_full.set()  # Wake up any waiting producers
+            self._not_empty.notify_all()  # Wake up any waiting consumers
+            self._not_full.notify_all()  # Wake up any waiting producers
             logger.debug("Closed buffer")
 
     def pause(self) -> Self:
         """Pause the buffer.
 
-        While paused, push operations will be rejected, but pop operations
-        will continue to work until the buffer is empty.
+        While paused, push operations will be rejected and put operations wait,
+        but pop operations will continue to work until the buffer is empty.
 
         Returns:
             Self for method chaining.
@@ -288,6 +658,7 @@ class MemoryBuffer(BufferProtocol):
         """
         with self._lock:
             self._paused = False
+            self._not_full.notify_all()  # Wake up producers waiting in put
             logger.debug("Resumed buffer")
         return self
 
@@ -298,9 +669,12 @@ class MemoryBuffer(BufferProtocol):
             timeout: The maximum time to wait in seconds.
 
         Returns:
-            True if the buffer has items, False if timeout occurred.
+            True if the buffer has items or is closed, False if timeout occurred.
         """
-        return self._not_empty.wait(timeout)
+        with self._lock:
+            return self._not_empty.wait_for(
+                lambda: self._current_size > 0 or self._closed, timeout
+            )
 
     def wait_until_not_full(self, timeout: float | None = None) -> bool:
         """Wait until the buffer has space for more items.
@@ -309,9 +683,12 @@ class MemoryBuffer(BufferProtocol):
             timeout: The maximum time to wait in seconds.
 
         Returns:
-            True if the buffer has space, False if timeout occurred.
+            True if the buffer has space or is closed, False if timeout occurred.
         """
-        return self._not_full.wait(timeout)
+        with self._lock:
+            return self._not_full.wait_for(
+                lambda: not self._is_full() or self._closed, timeout
+            )
 
     @property
     def size(self) -> int:
@@ -332,6 +709,35 @@ class MemoryBuffer(BufferProtocol):
         """
         return self._max_size
 
+    @property
+    def size_bytes(self) -> int:
+        """Get the estimated payload bytes held by the buffer.
+
+        Returns:
+            The estimated bytes, always 0 if the buffer does not bound its bytes.
+        """
+        with self._lock:
+            return self._current_bytes
+
+    @property
+    def max_bytes(self) -> int | None:
+        """Get the high watermark of the buffer.
+
+        Returns:
+            The maximum estimated payload bytes, or None if only items are counted.
+        """
+        return self._max_bytes
+
+    @property
+    def low_watermark(self) -> int | None:
+        """Get the low watermark of the buffer.
+
+        Returns:
+            The payload bytes below which a throttled buffer accepts pushes again, or None
+            if only items are counted.
+        """
+        return self._low_watermark
+
     @property
     def is_empty(self) -> bool:
         """Check if the buffer is empty.
@@ -350,7 +756,7 @@ class MemoryBuffer(BufferProtocol):
             True if the buffer is full, False otherwise.
         """
         with self._lock:
-            return self._current_size >= self._max_size
+            return self._is_full()
 
     @property
     def is_paused(self) -> bool:
@@ -361,16 +767,32 @@ class MemoryBuffer(BufferProtocol):
         """
         return self._paused
 
+    @property
+    def is_fast(self) -> bool:
+        """Check if the buffer stores items as compact records.
+
+        Returns:
+            True if the buffer runs in fast mode, False otherwise.
+        """
+        return self._fast
+
 
 class RateLimitedBuffer(MemoryBuffer):
     """Thread-safe buffer with rate limiting capabilities.
 
     This buffer extends the basic memory buffer with rate limiting capabilities,
     allowing it to control the flow of data based on token rate and character count.
+
+    Tokens accrue in a bucket at tokens_per_second, holding at most BURST_SECONDS worth
+    of tokens, and every push spends the cost of its item. Costs are estimated from the
+    lengths of the payload strings, or supplied by the caller when they are known, for
+    example from a tokenizer. Pushes with a timeout sleep until the bucket holds enough
+    tokens instead of failing.
     """
 
     # Class constants
     DEFAULT_CHARS_PER_TOKEN: ClassVar[int] = 4
+    BURST_SECONDS: ClassVar[float] = 2.0
 
     def __init__(
         self,
@@ -378,22 +800,43 @@ class RateLimitedBuffer(MemoryBuffer):
         tokens_per_second: float | None = None,
         chars_per_token: int = DEFAULT_CHARS_PER_TOKEN,
         initial_token_budget: float | None = None,
+        fast: bool = False,
+        debug: bool = False,
+        max_bytes: int | None = MemoryBuffer.MAX_DEFAULT_BYTES,
+        low_watermark: int | None = None,
+        sizer: Sizer = estimate_size,
     ):
         """Initialize a new rate-limited buffer.
 
         Args:
-            max_size: The maximum size of the buffer in bytes.
+            max_size: The maximum number of items in the buffer.
             tokens_per_second: The maximum tokens per second rate.
             chars_per_token: The number of characters per token.
             initial_token_budget: Optional initial token budget. If None, a default
                                 value will be calculated based on other parameters.
+            fast: Whether to store items as compact records without schema validation.
+            debug: Whether to validate items against the schema in fast mode as well.
+            max_bytes: The high watermark of the estimated payload bytes, or None.
+            low_watermark: The payload bytes below which a throttled buffer accepts
+                pushes again. Defaults to half of max_bytes.
+            sizer: Function estimating the size of a payload in bytes.
         """
-        super().__init__(max_size)
+        super().__init__(
+            max_size,
+            fast=fast,
+            debug=debug,
+            max_bytes=max_bytes,
+            low_watermark=low_watermark,
+            sizer=sizer,
+        )
         self._tokens_per_second = tokens_per_second
         self._chars_per_token = chars_per_token
 
         # Initialize last_push_time to current time so first push gets proper budget
-        self._last_push_time = time.time()
+        self._last_push_time = time.monotonic()
+        self._created_time = self._last_push_time
+        self._tokens_spent = 0.0
+        self._rate_limited_pushes = 0
 
         # Initialize token budget
         if tokens_per_second is not None:
@@ -413,39 +856,54 @@ class RateLimitedBuffer(MemoryBuffer):
             f"chars_per_token={chars_per_token}, initial_budget={self._token_budget}"
         )
 
-    @_ensure_open
-    @_ensure_not_paused
-    def push(self, item: dict[str, Any]) -> bool:
+    def push(
+        self, item: dict[str, Any], timeout: float | None = 0.0, cost: float | None = None
+    ) -> bool:
         """Push an item to the buffer with rate limiting.
 
         Args:
             item: The item to push to the buffer.
+            timeout: The maximum time to wait for space and tokens in seconds, None to
+                wait indefinitely, or 0 to fail right away.
+            cost: The token cost of the item, estimated from its payload if None.
 
         Returns:
             True if the item was pushed, False otherwise.
 
         Raises:
             ClosedBufferError: If the buffer is closed.
-            BufferError: If there is an error pushing the item.
+            BufferError: If there is an error pushing the item, or if a waiting push
+                costs more tokens than the budget can ever hold.
         """
+        pushed: bool = (
+            self.put(item, timeout, cost) if timeout != 0 else self._push_now(item, cost)
+        )
+        return pushed
+
+    @_ensure_open
+    @_ensure_not_paused
+    def _push_now(self, item: dict[str, Any], cost: float | None) -> bool:
+        """Push an item if the buffer has space and the budget covers its cost.
+
+        Args:
+            item: The item to push to the buffer.
+            cost: The token cost of the item, estimated from its payload if None.
 
+        Returns:
+            True if the item was pushed, False otherwise.
+        """
         if self._tokens_per_second is None:
             # No rate limiting, use parent implementation
-            return super().push(item)
+            pushed: bool = super().push(item)
+            return pushed
+
+        # Calculate token cost based on item size
+        token_cost = self.calculate_token_cost(item) if cost is None else cost
 
         # Apply rate limiting
         with self._lock:
-            # Calculate token cost based on item size
-            token_cost = self._calculate_token_cost(item)
-
             # Update token budget based on elapsed time
-            current_time = time.time()
-            elapsed = current_time - self._last_push_time
-            self._token_budget += elapsed * self._tokens_per_second
-
-            # Cap token budget at max of 2 seconds worth of tokens
-            max_budget = 2 * self._tokens_per_second
-            self._token_budget = min(self._token_budget, max_budget)
+            elapsed = self._refill_tokens()
 
             # Log diagnostics at debug level
             logger.debug(
@@ -458,102 +916,323 @@ class RateLimitedBuffer(MemoryBuffer):
                 logger.debug(
                     f"Rate limit exceeded, need {token_cost} tokens but have {self._token_budget}"
                 )
+                self._rate_limited_pushes += 1
                 return False
 
-            # Deduct tokens and update time
+            # Deduct tokens, and refund them if the buffer turns out to be full
             self._token_budget -= token_cost
-            self._last_push_time = current_time
 
             # Push item using parent implementation
-            return super().push(item)
+            pushed = super().push(item)
+            if pushed:
+                self._tokens_spent += token_cost
+            else:
+                self._token_budget += token_cost
+            return pushed
 
-    def _calculate_token_cost(self, item: dict[str, Any]) -> float:
-        """Calculate the token cost for an item.
+    @_ensure_open
+    def put(
+        self, item: dict[str, Any], timeout: float | None = None, cost: float | None = None
+    ) -> bool:
+        """Push an item to the buffer, waiting for space and for enough tokens.
 
         Args:
-            item: The item to calculate the token cost for.
+            item: The item to push to the buffer.
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+            cost: The token cost of the item, estimated from its payload if None.
 
         Returns:
-            The token cost for the item.
-        """
-        # Simple implementation - estimate string length in serialized item
-        import json
+            True if the item was pushed, False if the timeout expired.
 
-        try:
-            str_representation = json.dumps(item)
-            token_count = len(str_representation) / self._chars_per_token
-            return token_count
-        except Exception:
-            # Fallback to a default estimation if serialization fails
-            return 10.0  # Default token cost
-
-
-class BatchingBuffer(MemoryBuffer):
-    """Thread-safe buffer with batching capabilities.
+        Raises:
+            ClosedBufferError: If the buffer is closed, also while waiting.
+            BufferError: If the item is invalid or costs more tokens than the budget
+                can ever hold.
+        """
+        tokens_per_second = self._tokens_per_second
+        if tokens_per_second is None:
+            # No rate limiting, use parent implementation
+            pushed: bool = super().put(item, timeout)
+            return pushed
+
+        validated_item = self._make_item(item)
+        item_size = self._payload_size(item)
+        token_cost = self.calculate_token_cost(item) if cost is None else cost
+        max_budget = self.BURST_SECONDS * tokens_per_second
+        if token_cost > max_budget:
+            raise BufferError(
+                f"Item costs {token_cost:.1f} tokens, more than the budget of {max_budget:.1f}"
+            )
 
-    This buffer extends the basic memory buffer with batching capabilities,
-    allowing it to group items together for more efficient processing.
-    """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while True:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if not self._wait_for_space(item_size, remaining):
+                    return False
+
+                self._refill_tokens()
+                if self._token_budget >= token_cost:
+                    self._token_budget -= token_cost
+                    self._tokens_spent += token_cost
+                    self._append(validated_item, item_size)
+                    return True
+
+                # Sleep until enough tokens accrue, unless the buffer changes first
+                delay = (token_cost - self._token_budget) / tokens_per_second
+                if remaining is not None:
+                    if remaining <= 0:
+                        return False
+                    delay = min(delay, remaining)
+                self._not_full.wait(delay)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get rate limiting metrics.
 
-    # Class constants
-    DEFAULT_BATCH_SIZE: ClassVar[int] = 10
-    DEFAULT_BATCH_TIMEOUT: ClassVar[float] = 1.0
+        Returns:
+            Dictionary with the configured rate, the current and maximum budget, the tokens
+            spent so far, their average rate since the buffer was created and the number
+            of pushes rejected for lack of tokens.
+        """
+        with self._lock:
+            if self._tokens_per_second is not None:
+                self._refill_tokens()
+            elapsed = time.monotonic() - self._created_time
+
+            return {
+                "tokens_per_second": self._tokens_per_second,
+                "token_budget": self._token_budget,
+                "max_token_budget": self.max_token_budget,
+                "tokens_spent": self._tokens_spent,
+                "spend_rate": self._tokens_spent / elapsed if elapsed > 0 else 0.0,
+                "rate_limited_pushes": self._rate_limited_pushes,
+            }
 
-    def __init__(
-        self,
-        max_size: int = MemoryBuffer.MAX_DEFAULT_SIZE,
-        batch_size: int | None = DEFAULT_BATCH_SIZE,
-        batch_timeout: float | None = DEFAULT_BATCH_TIMEOUT,
-        batch_delimiter: str | None = None,
-    ):
-        """Initialize a new batching buffer.
+    @property
+    def tokens_per_second(self) -> float | None:
+        """Get the token rate of the buffer.
 
-        Args:
-            max_size: The maximum size of the buffer in bytes.
-            batch_size: The number of items to include in a batch.
-            batch_timeout: The maximum time to wait for a full batch in seconds.
-            batch_delimiter: An optional delimiter to add between batched items.
+        Returns:
+            The maximum tokens per second, or None if the buffer is not rate limited.
         """
-        super().__init__(max_size)
-        self._batch_size = batch_size
-        self._batch_timeout = batch_timeout
-        self._batch_delimiter = batch_delimiter
-        self._batch_ready = Event()
-        self._last_batch_time = time.time()
+        return self._tokens_per_second
 
-        logger.debug(
-            f"Created BatchingBuffer with batch_size={batch_size}, "
-            f"batch_timeout={batch_timeout}, batch_delimiter={batch_delimiter}"
-        )
+    @property
+    def chars_per_token(self) -> int:
+        """Get the number of characters counted as one token.
 
-    @_ensure_open
-    @_ensure_not_paused
-    def push(self, item: dict[str, Any]) -> bool:
-        """Push an item to the buffer and update batch status.
+        Returns:
+            The number of characters per token.
+        """
+        return self._chars_per_token
 
-        Args:
-            item: The item to push.
+    @property
+    def max_token_budget(self) -> float | None:
+        """Get the capacity of the token bucket.
 
         Returns:
-            True if the item was pushed, False if the buffer is full.
+            BURST_SECONDS worth of tokens, or None if the buffer is not rate limited.
+        """
+        if self._tokens_per_second is None:
+            return None
+        return self.BURST_SECONDS * self._tokens_per_second
 
-        Raises:
-            ClosedBufferError: If the buffer is closed.
+    @property
+    def token_budget(self) -> float:
+        """Get the tokens currently available for pushes.
+
+        Returns:
+            The token budget, including the tokens accrued since the last push.
         """
-        success = super().push(item)
+        with self._lock:
+            if self._tokens_per_second is not None:
+                self._refill_tokens()
+            return self._token_budget
+
+    def _refill_tokens(self) -> float:
+        """Add the tokens accrued since the last refill. Must be called with the lock held.
 
-        # If push was successful, update batch state
-        if success:
-            with self._lock:
-                # Check if a batch is now ready
-                if self._batch_size and len(self._buffer) >= self._batch_size:
-                    self._batch_ready.set()
+        The budget is capped at the capacity of the bucket.
 
-                # Reset batch timeout on first item
-                if len(self._buffer) == 1:
-                    self._last_batch_time = time.time()
+        Returns:
+            The time in seconds since the last refill.
+        """
+        current_time = time.monotonic()
+        elapsed = current_time - self._last_push_time
+        self._last_push_time = current_time
 
-        return success
+        tokens_per_second = self._tokens_per_second
+        if tokens_per_second is not None:
+            self._token_budget = min(
+                self._token_budget + elapsed * tokens_per_second,
+                self.BURST_SECONDS * tokens_per_second,
+            )
+        return elapsed
+
+    def calculate_token_cost(self, item: dict[str, Any]) -> float:
+        """Calculate the token cost for an item.
+
+        The cost is derived from the estimated size of the payload, which adds up the
+        lengths of its strings and a small overhead per entry. That approximates the
+        length of the serialized item without serializing it.
+
+        Args:
+            item: The item to calculate the token cost for.
+
+        Returns:
+            The token cost for the item.
+        """
+        return estimate_size(item) / self._chars_per_token
+
+    def _calculate_token_cost(self, item: dict[str, Any]) -> float:
+        """Calculate the token cost for an item under its former private name.
+
+        Args:
+            item: The item to calculate the token cost for.
+
+        Returns:
+            The token cost for the item.
+        """
+        return self.calculate_token_cost(item)
+
+
+class BatchingBuffer(MemoryBuffer):
+    """Thread-safe buffer with batching capabilities.
+
+    This buffer extends the basic memory buffer with batching capabilities,
+    allowing it to group items together for more efficient processing.
+
+    Consumers are only woken when a push starts the timeout of a new batch or completes
+    a batch, and sleep until the timeout otherwise, so a batch is delivered as soon as
+    it reaches either threshold. pop merges a batch into a single item, while pop_batch
+    and get_batch return the batched items unchanged.
+    """
+
+    # Class constants
+    DEFAULT_BATCH_SIZE: ClassVar[int] = 10
+    DEFAULT_BATCH_TIMEOUT: ClassVar[float] = 1.0
+
+    def __init__(
+        self,
+        max_size: int = MemoryBuffer.MAX_DEFAULT_SIZE,
+        batch_size: int | None = DEFAULT_BATCH_SIZE,
+        batch_timeout: float | None = DEFAULT_BATCH_TIMEOUT,
+        batch_delimiter: str | None = None,
+        fast: bool = False,
+        debug: bool = False,
+        max_bytes: int | None = MemoryBuffer.MAX_DEFAULT_BYTES,
+        low_watermark: int | None = None,
+        sizer: Sizer = estimate_size,
+    ):
+        """Initialize a new batching buffer.
+
+        Args:
+            max_size: The maximum number of items in the buffer.
+            batch_size: The number of items to include in a batch.
+            batch_timeout: The maximum time to wait for a full batch in seconds.
+            batch_delimiter: An optional delimiter to add between batched items.
+            fast: Whether to store items as compact records without schema validation.
+            debug: Whether to validate items against the schema in fast mode as well.
+            max_bytes: The high watermark of the estimated payload bytes, or None.
+            low_watermark: The payload bytes below which a throttled buffer accepts
+                pushes again. Defaults to half of max_bytes.
+            sizer: Function estimating the size of a payload in bytes.
+        """
+        super().__init__(
+            max_size,
+            fast=fast,
+            debug=debug,
+            max_bytes=max_bytes,
+            low_watermark=low_watermark,
+            sizer=sizer,
+        )
+        self._batch_size = batch_size
+        self._batch_timeout = batch_timeout
+        self._batch_delimiter = batch_delimiter
+        self._last_batch_time = time.monotonic()
+
+        logger.debug(
+            f"Created BatchingBuffer with batch_size={batch_size}, "
+            f"batch_timeout={batch_timeout}, batch_delimiter={batch_delimiter}"
+        )
+
+    def _append(self, item: BufferItem | BufferRecord, item_size: int) -> None:
+        """Append an item and update the batch status. Must be called with the lock held.
+
+        Args:
+            item: The item to store.
+            item_size: The estimated payload bytes of the item.
+        """
+        # Reset batch timeout on first item
+        if not self._buffer:
+            self._last_batch_time = time.monotonic()
+        super()._append(item, item_size)
+
+    def _notify_consumers(self) -> None:
+        """Wake consumers when a batch timeout starts or a batch is complete.
+
+        Must be called with the lock held. Consumers waiting for a batch time out into
+        it by themselves, so the pushes in between need not wake them.
+        """
+        pending = len(self._buffer)
+        if pending == 1 or pending == self._batch_size:
+            super()._notify_consumers()
+
+    def _is_batch_ready(self, current_time: float) -> bool:
+        """Check whether a batch can be popped. Must be called with the lock held.
+
+        Args:
+            current_time: The current time as returned by time.monotonic().
+
+        Returns:
+            True if the buffer holds a full batch or its oldest batch timed out.
+        """
+        if not self._buffer:
+            return False
+
+        # Handle cases where batch_timeout or batch_size might be None
+        if (
+            self._batch_timeout is not None
+            and current_time - self._last_batch_time >= self._batch_timeout
+        ):
+            return True
+        return self._batch_size is not None and len(self._buffer) >= self._batch_size
+
+    def ready_delay(self) -> float | None:
+        """Get the time until the pending items time out into a batch.
+
+        Returns:
+            The delay in seconds, or None if only a push can complete a batch.
+        """
+        with self._lock:
+            if not self._buffer or self._batch_timeout is None:
+                return None
+            return max(0.0, self._last_batch_time + self._batch_timeout - time.monotonic())
+
+    def _take_batch(self) -> list[BufferItem]:
+        """Remove the next batch if it is ready. Must be called with the lock held.
+
+        Returns:
+            The items of the batch in order, empty if no batch is ready.
+        """
+        # Check if we have a full batch or the timeout has expired
+        current_time = time.monotonic()
+        if not self._is_batch_ready(current_time):
+            # Not ready for a batch yet
+            return []
+
+        # Determine batch size
+        batch_count = min(self._batch_size or 1, len(self._buffer))
+
+        # Extract batch items
+        batch_items = [_as_buffer_item(self._popleft()) for _ in range(batch_count)]
+
+        # Signal that buffer is not full
+        self._not_full.notify_all()
+
+        # Reset batch timeout
+        self._last_batch_time = current_time
+        return batch_items
 
     def pop(self) -> dict[str, Any] | None:
         """Pop a batch of items from the buffer.
@@ -566,62 +1245,51 @@ class BatchingBuffer(MemoryBuffer):
             to drain remaining items before final cleanup.
         """
         with self._lock:
-            if not self._buffer:
-                self._not_empty.clear()
-                self._batch_ready.clear()
-                return None
-
-            # Check if we have a full batch or the timeout has expired
-            current_time = time.time()
-
-            # Handle cases where batch_timeout or batch_size might be None
-            timeout_exists = self._batch_timeout is not None
-            batch_timeout_expired = timeout_exists and (
-                current_time - self._last_batch_time >= self._batch_timeout
-            )
+            batch_items = self._take_batch()
 
-            size_exists = self._batch_size is not None
-            full_batch_available = size_exists and (len(self._buffer) >= self._batch_size)
+        # Combine batch into a single item
+        if not batch_items:
+            return None
 
-            if not (batch_timeout_expired or full_batch_available):
-                # Not ready for a batch yet
-                return None
+        if len(batch_items) == 1:
+            # Single item, no need to batch
+            return batch_items[0]
 
-            # Determine batch size
-            batch_count = min(self._batch_size or 1, len(self._buffer))
+        # Create a batch item outside the lock, so producers are not held up
+        batch_data = self._create_batch(batch_items)
 
-            # Extract batch items
-            batch_items = []
-            for _ in range(batch_count):
-                if not self._buffer:
-                    break
-                batch_items.append(self._buffer.popleft())
-                self._current_size -= 1
+        logger.debug(f"Created batch with {len(batch_items)} items")
+        return batch_data
 
-            # Update events
-            if self._current_size == 0:
-                self._not_empty.clear()
-                self._batch_ready.clear()
+    def pop_batch(self) -> list[dict[str, Any]]:
+        """Pop a batch of items without merging them into a single item.
 
-            # Signal that buffer is not full
-            self._not_full.set()
+        Returns:
+            The items of the batch in order, empty if no batch is ready.
 
-            # Reset batch timeout
-            self._last_batch_time = current_time
+        Note:
+            Like pop, pop_batch is allowed on closed buffers to drain remaining items.
+        """
+        with self._lock:
+            return self._take_batch()
 
-            # Combine batch into a single item
-            if not batch_items:
-                return None
+    def get_batch(self, timeout: float | None = None) -> list[dict[str, Any]]:
+        """Pop a batch of items without merging them, waiting until one is ready.
 
-            if len(batch_items) == 1:
-                # Single item, no need to batch
-                return batch_items[0]
+        Args:
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
 
-            # Create a batch item
-            batch_data = self._create_batch(batch_items)
+        Returns:
+            The items of the batch in order, empty if the timeout expired or the buffer is
+            closed and drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
 
-            logger.debug(f"Created batch with {len(batch_items)} items")
-            return batch_data
+        with self._lock:
+            while True:
+                batch_items = self._take_batch()
+                if batch_items or not self._wait_for_items(deadline):
+                    return batch_items
 
     def _create_batch(self, items: list[dict[str, Any]]) -> dict[str, Any]:
         """Create a batch from a list of items.
@@ -675,46 +1343,423 @@ class BatchingBuffer(MemoryBuffer):
 
         return batch_item
 
+    @property
+    def batch_size(self) -> int | None:
+        """Get the number of items in a full batch.
+
+        Returns:
+            The batch size, or None if batches are only formed by timeout.
+        """
+        return self._batch_size
+
+    @property
+    def batch_timeout(self) -> float | None:
+        """Get the time after which pending items form a batch.
+
+        Returns:
+            The batch timeout in seconds, or None if batches are only formed by size.
+        """
+        return self._batch_timeout
+
+    @property
+    def batch_delimiter(self) -> str | None:
+        """Get the delimiter placed between the texts of batched items.
+
+        Returns:
+            The batch delimiter, or None if texts are not combined.
+        """
+        return self._batch_delimiter
+
     def wait_for_batch(self, timeout: float | None = None) -> bool:
         """Wait until a batch is ready.
 
+        Waiting threads wake up when a push completes a batch or when the pending items
+        time out into one, without polling the buffer.
+
         Args:
             timeout: The maximum time to wait in seconds.
 
         Returns:
             True if a batch is ready, False if timeout occurred.
         """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
         with self._lock:
-            current_time = time.time()
+            while not self._is_batch_ready(time.monotonic()):
+                if not self._wait_for_items(deadline):
+                    return False
+            return True
 
-            # Handle cases where batch_timeout or batch_size might be None
-            timeout_exists = self._batch_timeout is not None
-            batch_timeout_expired = timeout_exists and (
-                current_time - self._last_batch_time >= self._batch_timeout
-            )
 
-            size_exists = self._batch_size is not None
-            full_batch_available = size_exists and (len(self._buffer) >= self._batch_size)
+class RingBuffer(BufferProtocol):
+    """Preallocated ring buffer for a single producer and a single consumer thread.
 
-            if batch_timeout_expired or full_batch_available:
-                return True
+    The buffer keeps its items in a fixed list of slots with a read index that only the
+    consumer advances and a write index that only the producer advances. Push and pop
+    take no lock. They rely on single attribute and list stores being atomic, which
+    CPython guarantees, and on each index having a single writer. Payloads are only
+    checked to be dictionaries and stored as BufferRecord objects, which are returned
+    as buffer items, as in the fast mode of MemoryBuffer.
 
-        # Calculate remaining timeout time
-        if timeout is not None and self._batch_timeout is not None:
-            elapsed = time.time() - self._last_batch_time
-            remaining = min(timeout, max(0, self._batch_timeout - elapsed))
-        else:
-            remaining = timeout
+    put, get and get_many block on events that are only set when the other side has
+    announced that it waits, so the non-blocking path never signals. Using the buffer
+    from more than one producer or consumer thread at a time corrupts it. Use a
+    MemoryBuffer for that.
+    """
+
+    # Class constants
+    DEFAULT_CAPACITY: ClassVar[int] = 1024
+
+    def __init__(self, max_size: int = DEFAULT_CAPACITY, debug: bool = False):
+        """Initialize a new ring buffer.
+
+        Args:
+            max_size: The number of slots, which is the maximum number of items.
+            debug: Whether to validate items against the schema as well.
+
+        Raises:
+            ValueError: If max_size is not positive.
+        """
+        if max_size <= 0:
+            raise ValueError("Maximum buffer size must be greater than 0")
+
+        self._slots: list[BufferRecord | None] = [None] * max_size
+        self._max_size = max_size
+        self._debug = debug
+        # Total number of items popped and pushed, each written by one thread only
+        self._head = 0
+        self._tail = 0
+        self._closed = False
+        self._paused = False
+        # Signalled to a consumer waiting for items and a producer waiting for space
+        self._not_empty = Event()
+        self._not_full = Event()
+        self._consumer_waiting = False
+        self._producer_waiting = False
+
+        logger.debug(f"Created RingBuffer with max_size={max_size}")
+
+    def push(self, item: dict[str, Any]) -> bool:
+        """Push an item to the buffer. Must only be called by the producer thread.
 
-        # Wait for either not_empty or batch_ready
-        return self._not_empty.wait(remaining)
+        Args:
+            item: The item to push to the buffer.
+
+        Returns:
+            True if the item was pushed, False if the buffer is full or paused.
+
+        Raises:
+            ClosedBufferError: If the buffer is closed.
+            BufferError: If the item is not a dictionary, or invalid in debug mode.
+        """
+        if self._closed:
+            raise ClosedBufferError("Cannot perform operation on closed buffer")
+        if self._paused:
+            return False
+        if not isinstance(item, dict):
+            raise BufferError(f"Invalid buffer item: expected a dict, got {type(item).__name__}")
+        if self._debug:
+            validate_buffer_item(item)
+
+        tail = self._tail
+        if tail - self._head >= self._max_size:
+            return False
+
+        # The slot is filled before the write index publishes it to the consumer
+        self._slots[tail % self._max_size] = BufferRecord(tail, time.monotonic(), item)
+        self._tail = tail + 1
+        if self._consumer_waiting:
+            self._not_empty.set()
+        return True
+
+    def pop(self) -> dict[str, Any] | None:
+        """Pop an item from the buffer. Must only be called by the consumer thread.
+
+        Returns:
+            The item if available, None if the buffer is empty.
+
+        Note:
+            Unlike other operations, pop is allowed on closed buffers
+            to drain remaining items before final cleanup.
+        """
+        head = self._head
+        if head == self._tail:
+            return None
+
+        index = head % self._max_size
+        record = self._slots[index]
+        self._slots[index] = None
+        self._head = head + 1
+        if self._producer_waiting:
+            self._not_full.set()
+        return None if record is None else record.to_item()
+
+    def peek(self) -> dict[str, Any] | None:
+        """Peek at the next item. Must only be called by the consumer thread.
+
+        Returns:
+            The next item if available, None if the buffer is empty.
+
+        Raises:
+            ClosedBufferError: If the buffer is closed.
+        """
+        if self._closed:
+            raise ClosedBufferError("Cannot perform operation on closed buffer")
+
+        head = self._head
+        if head == self._tail:
+            return None
+        record = self._slots[head % self._max_size]
+        return None if record is None else record.to_item()
+
+    def clear(self) -> None:
+        """Clear all items from the buffer. Must only be called by the consumer thread.
+
+        Raises:
+            ClosedBufferError: If the buffer is closed.
+        """
+        if self._closed:
+            raise ClosedBufferError("Cannot perform operation on closed buffer")
+
+        while self.pop() is not None:
+            pass
+
+    def is_closed(self) -> bool:
+        """Check if the buffer is closed.
+
+        Returns:
+            True if the buffer is closed, False otherwise.
+        """
+        return self._closed
+
+    def close(self) -> None:
+        """Close the buffer and wake a waiting producer and consumer."""
+        self._closed = True
+        self._not_empty.set()
+        self._not_full.set()
+        logger.debug("Closed buffer")
+
+    def pause(self) -> Self:
+        """Pause the buffer.
+
+        While paused, push operations will be rejected and put operations wait,
+        but pop operations will continue to work until the buffer is empty.
+
+        Returns:
+            Self for method chaining.
+        """
+        self._paused = True
+        return self
+
+    def resume(self) -> Self:
+        """Resume the buffer.
+
+        Returns:
+            Self for method chaining.
+        """
+        self._paused = False
+        self._not_full.set()
+        return self
+
+    def put(self, item: dict[str, Any], timeout: float | None = None) -> bool:
+        """Push an item, waiting while the buffer is full or paused. Producer only.
+
+        Args:
+            item: The item to push to the buffer.
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            True if the item was pushed, False if the timeout expired.
+
+        Raises:
+            ClosedBufferError: If the buffer is closed, also while waiting.
+            BufferError: If the item is not a dictionary, or invalid in debug mode.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while not self.push(item):
+            if not self._wait_for_space(deadline):
+                return False
+        return True
+
+    def get(self, timeout: float | None = None) -> dict[str, Any] | None:
+        """Pop an item, waiting until one is available. Consumer only.
+
+        Args:
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            The item, or None if the timeout expired or the buffer is closed and drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            item = self.pop()
+            if item is not None:
+                return item
+            if not self._wait_for_items(deadline):
+                return None
+
+    def get_many(self, max_items: int, timeout: float | None = None) -> list[dict[str, Any]]:
+        """Pop up to a number of items, waiting until at least one is available.
+
+        Must only be called by the consumer thread.
+
+        Args:
+            max_items: The maximum number of items to pop.
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            The popped items in order, empty if the timeout expired or the buffer is closed
+            and drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        items: list[dict[str, Any]] = []
+
+        while True:
+            while len(items) < max_items:
+                item = self.pop()
+                if item is None:
+                    break
+                items.append(item)
+
+            if items or not self._wait_for_items(deadline):
+                return items
+
+    def wait_until_not_empty(self, timeout: float | None = None) -> bool:
+        """Wait until the buffer has at least one item. Consumer only.
+
+        Args:
+            timeout: The maximum time to wait in seconds.
+
+        Returns:
+            True if the buffer has items or is closed, False if timeout occurred.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while self._head == self._tail and not self._closed:
+            if not self._wait_for_items(deadline):
+                return False
+        return True
+
+    def wait_until_not_full(self, timeout: float | None = None) -> bool:
+        """Wait until the buffer has space for more items. Producer only.
+
+        Args:
+            timeout: The maximum time to wait in seconds.
+
+        Returns:
+            True if the buffer has space or is closed, False if timeout occurred.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while self.is_full and not self._closed:
+            if not self._wait_for_space(deadline):
+                return False
+        return True
+
+    def _wait_for_items(self, deadline: float | None) -> bool:
+        """Wait once for the producer to push an item. Consumer only.
+
+        Args:
+            deadline: Monotonic time after which to stop waiting, or None.
+
+        Returns:
+            False if the deadline has passed or the buffer is closed and drained, True
+            after waking up, in which case the caller checks the buffer again.
+        """
+        if self._closed and self._head == self._tail:
+            return False
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            return False
+
+        self._not_empty.clear()
+        self._consumer_waiting = True
+        try:
+            # Check again after announcing the wait, so a push in between is not missed
+            if self._head == self._tail and not self._closed:
+                self._not_empty.wait(remaining)
+        finally:
+            self._consumer_waiting = False
+        return True
+
+    def _wait_for_space(self, deadline: float | None) -> bool:
+        """Wait once for the consumer to make room or the buffer to resume. Producer only.
+
+        Args:
+            deadline: Monotonic time after which to stop waiting, or None.
+
+        Returns:
+            False if the deadline has passed, True after waking up, in which case the
+            caller tries to push again.
+        """
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            return False
+
+        self._not_full.clear()
+        self._producer_waiting = True
+        try:
+            # Check again after announcing the wait, so a pop in between is not missed
+            if (self.is_full or self._paused) and not self._closed:
+                self._not_full.wait(remaining)
+        finally:
+            self._producer_waiting = False
+        return True
+
+    @property
+    def size(self) -> int:
+        """Get the current size of the buffer.
+
+        Returns:
+            The number of items in the buffer.
+        """
+        return self._tail - self._head
+
+    @property
+    def max_size(self) -> int:
+        """Get the maximum size of the buffer.
+
+        Returns:
+            The number of slots of the buffer.
+        """
+        return self._max_size
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if the buffer is empty.
+
+        Returns:
+            True if the buffer is empty, False otherwise.
+        """
+        return self._tail == self._head
+
+    @property
+    def is_full(self) -> bool:
+        """Check if the buffer is full.
+
+        Returns:
+            True if every slot holds an item, False otherwise.
+        """
+        return self._tail - self._head >= self._max_size
+
+    @property
+    def is_paused(self) -> bool:
+        """Check if the buffer is paused.
+
+        Returns:
+            True if the buffer is paused, False otherwise.
+        """
+        return self._paused
 
 
 def create_buffer(config: dict[str, Any]) -> BufferProtocol:
     """Create a buffer based on configuration.
 
     Args:
-        config: The buffer configuration.
+        config: The buffer configuration. With "asynchronous" set, the asyncio variant of
+            the buffer type is created.
 
     Returns:
         A buffer instance.
@@ -725,33 +1770,70 @@ def create_buffer(config: dict[str, Any]) -> BufferProtocol:
     try:
         # Validate with schema
         buffer_type = config.get("buffer_type", "memory")
+        buffer_class: type[MemoryBuffer]
 
-        if buffer_type == "rate_limited":
+        if buffer_type == "ring":
+            config_data = buffer_config_schema.load(config)
+            if config_data.get("asynchronous", False):
+                raise ValueError("Ring buffers have no asyncio variant")
+
+            # Slots are preallocated, so the schema default for memory buffers would be
+            # wasteful when no size is given
+            if "max_size" not in config:
+                config_data["max_size"] = RingBuffer.DEFAULT_CAPACITY
+            return RingBuffer(
+                max_size=config_data["max_size"],
+                debug=config_data.get("debug", False),
+            )
+        elif buffer_type == "rate_limited":
             config_data = rate_limited_buffer_config_schema.load(config)
-            return RateLimitedBuffer(
-                max_size=config_data.get("max_size", MemoryBuffer.MAX_DEFAULT_SIZE),
-                tokens_per_second=config_data.get("tokens_per_second"),
-                chars_per_token=config_data.get(
+            buffer_class = RateLimitedBuffer
+            options = {
+                "tokens_per_second": config_data.get("tokens_per_second"),
+                "chars_per_token": config_data.get(
                     "chars_per_token", RateLimitedBuffer.DEFAULT_CHARS_PER_TOKEN
                 ),
-                initial_token_budget=config_data.get(
-                    "initial_token_budget"
-                ),  # Include new parameter
-            )
+                "initial_token_budget": config_data.get("initial_token_budget"),
+            }
         elif buffer_type == "batching":
             config_data = batching_buffer_config_schema.load(config)
-            return BatchingBuffer(
-                max_size=config_data.get("max_size", MemoryBuffer.MAX_DEFAULT_SIZE),
-                batch_size=config_data.get("batch_size", BatchingBuffer.DEFAULT_BATCH_SIZE),
-                batch_timeout=config_data.get(
+            buffer_class = BatchingBuffer
+            options = {
+                "batch_size": config_data.get("batch_size", BatchingBuffer.DEFAULT_BATCH_SIZE),
+                "batch_timeout": config_data.get(
                     "batch_timeout", BatchingBuffer.DEFAULT_BATCH_TIMEOUT
                 ),
-                batch_delimiter=config_data.get("batch_delimiter"),
-            )
+                "batch_delimiter": config_data.get("batch_delimiter"),
+            }
         else:
             # Default to memory buffer
             config_data = buffer_config_schema.load(config)
-            return MemoryBuffer(max_size=config_data.get("max_size", MemoryBuffer.MAX_DEFAULT_SIZE))
+            buffer_class = MemoryBuffer
+            options = {}
+
+        options["max_size"] = config_data.get("max_size", MemoryBuffer.MAX_DEFAULT_SIZE)
+        options["max_bytes"] = config_data.get("max_bytes", MemoryBuffer.MAX_DEFAULT_BYTES)
+        options["low_watermark"] = config_data.get("low_watermark")
+        options["fast"] = config_data.get("fast", False)
+        options["debug"] = config_data.get("debug", False)
+
+        if config_data.get("asynchronous", False):
+            # Imported here since the async buffers are built on the buffers of this module
+            from atlas.services.async_buffer import (
+                AsyncBatchingBuffer,
+                AsyncBuffer,
+                AsyncMemoryBuffer,
+                AsyncRateLimitedBuffer,
+            )
+
+            async_classes: dict[type[MemoryBuffer], type[AsyncBuffer]] = {
+                MemoryBuffer: AsyncMemoryBuffer,
+                RateLimitedBuffer: AsyncRateLimitedBuffer,
+                BatchingBuffer: AsyncBatchingBuffer,
+            }
+            return async_classes[buffer_class](**options)
+
+        return buffer_class(**options)
     except Exception as e:
         logger.error(f"Error creating buffer: {e}")
         raise BufferError(f"Could not create buffer: {e}")
@@ -791,3 +1873,15 @@ def is_batching_buffer(obj: Any) -> TypeGuard[BatchingBuffer]:
         True if the object is a BatchingBuffer, False otherwise.
     """
     return isinstance(obj, BatchingBuffer)
+
+
+def is_ring_buffer(obj: Any) -> TypeGuard[RingBuffer]:
+    """Check if an object is a RingBuffer.
+
+    Args:
+        obj: The object to check.
+
+    Returns:
+        True if the object is a RingBuffer, False otherwise.
+    """
+    return isinstance(obj, RingBuffer)
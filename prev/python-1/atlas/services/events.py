@@ -7,9 +7,11 @@ is thread-safe and supports wildcard pattern matching for event types.
 """
 
 import fnmatch
+import itertools
 import re
 import uuid
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from functools import wraps
 from threading import RLock
@@ -146,8 +148,10 @@ class EventSubscription:
         self.callback = callback
         self.source_filter = source_filter
 
-        # Convert the event type pattern to a regex for faster matching
+        # Convert the event type pattern and source filter to compiled regexes once
         self._pattern = self._create_match_pattern(event_type)
+        self._regex = re.compile(self._pattern)
+        self._source_regex = re.compile(fnmatch.translate(source_filter)) if source_filter else None
 
         logger.debug(
             f"Created subscription {subscription_id} for event type {event_type} "
@@ -180,15 +184,24 @@ class EventSubscription:
             True if the subscription matches, False otherwise.
         """
         # Check event type pattern
-        if not re.match(self._pattern, event_type):
+        if not self._regex.match(event_type):
             return False
 
-        # Check source filter if provided
-        if self.source_filter and source:
-            if not fnmatch.fnmatch(source, self.source_filter):
-                return False
+        return self.matches_source(source)
 
-        return True
+    def matches_source(self, source: str | None) -> bool:
+        """Check if the source filter of this subscription accepts an event source.
+
+        Args:
+            source: The event source to check.
+
+        Returns:
+            True if there is no source filter or no source, or the source matches the
+            filter, False otherwise.
+        """
+        if self._source_regex is None or not source:
+            return True
+        return self._source_regex.match(source) is not None
 
     def notify(self, event: dict[str, Any]) -> None:
         """Notify this subscription of an event.
@@ -205,6 +218,316 @@ class EventSubscription:
             )
 
 
+class _PrefixNode:
+    """Node of the segment trie of prefix subscriptions."""
+
+    __slots__ = ("children", "entries")
+
+    def __init__(self):
+        """Initialize an empty node."""
+        # Child nodes by the next segment of the prefix
+        self.children: dict[str, _PrefixNode] = {}
+        # Subscriptions by ID, with the part of their prefix after the last full segment
+        self.entries: dict[SubscriptionId, tuple[str, EventSubscription]] = {}
+
+
+class SubscriptionIndex:
+    """Index of subscriptions by the event types they match.
+
+    Subscriptions to exact event types are kept in a dictionary, and subscriptions to
+    prefix patterns such as "agent.*" in a trie of dotted segments. Finding the
+    subscribers of an event type then takes a lookup per segment instead of a regex
+    match per subscription. Other patterns, such as "system.*.started", are matched
+    one by one. Results are cached per event type until the subscriptions change.
+
+    The index is not thread-safe, EventSystem guards it with its lock.
+    """
+
+    # Class constants
+    MAX_CACHED_TYPES: ClassVar[int] = 4096
+    # Characters with a regex meaning in patterns, which are matched by regex
+    REGEX_CHARS: ClassVar[frozenset[str]] = frozenset("\\^$+?{}[]|()")
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._exact: dict[EventType, dict[SubscriptionId, EventSubscription]] = {}
+        self._prefixes = _PrefixNode()
+        self._patterns: dict[SubscriptionId, EventSubscription] = {}
+        # Subscription order, so subscribers are notified in the order they subscribed
+        self._order: dict[SubscriptionId, int] = {}
+        self._sequence = itertools.count()
+        self._cache: dict[EventType, tuple[EventSubscription, ...]] = {}
+
+    def __len__(self) -> int:
+        """Get the number of indexed subscriptions."""
+        return len(self._order)
+
+    def _classify(self, pattern: str) -> str:
+        """Determine how a subscription pattern is indexed.
+
+        Args:
+            pattern: The event type pattern of the subscription.
+
+        Returns:
+            "exact", "prefix" or "pattern".
+        """
+        if not self.REGEX_CHARS.isdisjoint(pattern):
+            return "pattern"
+        wildcards = pattern.count("*")
+        if wildcards == 0:
+            return "exact"
+        if wildcards == 1 and pattern.endswith("*"):
+            return "prefix"
+        return "pattern"
+
+    def _prefix_path(self, prefix: str) -> tuple[list[str], str]:
+        """Split a prefix into its full segments and the remaining partial segment.
+
+        Args:
+            prefix: The pattern without its trailing wildcard.
+
+        Returns:
+            The full segments and the partial segment after them.
+        """
+        head, dot, tail = prefix.rpartition(".")
+        if not dot:
+            return [], prefix
+        return head.split("."), tail
+
+    def add(self, subscription: EventSubscription) -> None:
+        """Add a subscription to the index.
+
+        Args:
+            subscription: The subscription to add.
+        """
+        subscription_id = subscription.subscription_id
+        pattern = subscription.event_type
+        self._order[subscription_id] = next(self._sequence)
+
+        kind = self._classify(pattern)
+        if kind == "exact":
+            self._exact.setdefault(pattern, {})[subscription_id] = subscription
+        elif kind == "prefix":
+            segments, tail = self._prefix_path(pattern[:-1])
+            node = self._prefixes
+            for segment in segments:
+                node = node.children.setdefault(segment, _PrefixNode())
+            node.entries[subscription_id] = (tail, subscription)
+        else:
+            self._patterns[subscription_id] = subscription
+
+        self._cache.clear()
+
+    def remove(self, subscription: EventSubscription) -> None:
+        """Remove a subscription from the index.
+
+        Args:
+            subscription: The subscription to remove.
+        """
+        subscription_id = subscription.subscription_id
+        pattern = subscription.event_type
+        if self._order.pop(subscription_id, None) is None:
+            return
+
+        kind = self._classify(pattern)
+        if kind == "exact":
+            subscribers = self._exact[pattern]
+            del subscribers[subscription_id]
+            if not subscribers:
+                del self._exact[pattern]
+        elif kind == "prefix":
+            segments, _ = self._prefix_path(pattern[:-1])
+            path = [self._prefixes]
+            for segment in segments:
+                path.append(path[-1].children[segment])
+            del path[-1].entries[subscription_id]
+
+            # Prune the nodes that no longer lead to any subscription
+            for depth in range(len(segments), 0, -1):
+                node = path[depth]
+                if node.entries or node.children:
+                    break
+                del path[depth - 1].children[segments[depth - 1]]
+        else:
+            del self._patterns[subscription_id]
+
+        self._cache.clear()
+
+    def match(self, event_type: EventType) -> tuple[EventSubscription, ...]:
+        """Find the subscriptions whose pattern matches an event type.
+
+        Source filters are not applied, since they depend on the event.
+
+        Args:
+            event_type: The event type to match.
+
+        Returns:
+            The matching subscriptions in subscription order.
+        """
+        cached = self._cache.get(event_type)
+        if cached is not None:
+            return cached
+
+        matched = list(self._exact.get(event_type, {}).values())
+
+        # Walk the trie along the segments of the event type
+        node = self._prefixes
+        start = 0
+        while True:
+            if node.entries:
+                rest = event_type[start:]
+                matched.extend(
+                    subscription
+                    for tail, subscription in node.entries.values()
+                    if rest.startswith(tail)
+                )
+            dot = event_type.find(".", start)
+            if dot < 0:
+                break
+            child = node.children.get(event_type[start:dot])
+            if child is None:
+                break
+            node = child
+            start = dot + 1
+
+        matched.extend(
+            subscription
+            for subscription in self._patterns.values()
+            if subscription.matches(event_type)
+        )
+        matched.sort(key=lambda subscription: self._order[subscription.subscription_id])
+
+        if len(self._cache) >= self.MAX_CACHED_TYPES:
+            self._cache.clear()
+        result = self._cache[event_type] = tuple(matched)
+        return result
+
+
+class EventHistory:
+    """Bounded history of published events.
+
+    Events are kept in a deque in publication order, with secondary indexes by event
+    type, by source and by ID. Appending and evicting the oldest event take constant
+    time, and filtered queries only visit the events of the requested type or source.
+
+    The history is not thread-safe, EventSystem guards it with its lock.
+    """
+
+    def __init__(self, max_size: int):
+        """Initialize an empty history.
+
+        Args:
+            max_size: Maximum number of events to keep, or 0 to keep every event.
+
+        Raises:
+            ValueError: If max_size is negative.
+        """
+        if max_size < 0:
+            raise ValueError("Maximum history size must not be negative")
+
+        self._max_size = max_size
+        # Events with the type and source they were indexed under
+        self._events: deque[tuple[EventType, str, dict[str, Any]]] = deque()
+        self._by_type: dict[EventType, deque[dict[str, Any]]] = {}
+        self._by_source: dict[str, deque[dict[str, Any]]] = {}
+        self._by_id: dict[EventId, dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        """Get the number of events in the history."""
+        return len(self._events)
+
+    def append(self, event: dict[str, Any]) -> None:
+        """Add an event, evicting the oldest events beyond the maximum size.
+
+        Args:
+            event: The event to add.
+        """
+        event_type = event["event_type"]
+        source = event["source"]
+        self._events.append((event_type, source, event))
+        self._by_type.setdefault(event_type, deque()).append(event)
+        self._by_source.setdefault(source, deque()).append(event)
+        # Keep the oldest event for duplicate IDs, like a scan from the oldest event
+        self._by_id.setdefault(event["event_id"], event)
+
+        while self._max_size and len(self._events) > self._max_size:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove the oldest event from the history and its indexes."""
+        event_type, source, event = self._events.popleft()
+
+        # The oldest event is also the oldest event of its type and of its source
+        for index, key in ((self._by_type, event_type), (self._by_source, source)):
+            events = index[key]
+            events.popleft()
+            if not events:
+                del index[key]
+
+        if self._by_id.get(event["event_id"]) is event:
+            del self._by_id[event["event_id"]]
+
+    def get_events(
+        self,
+        event_type: str | None = None,
+        source: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get events with optional filtering.
+
+        Args:
+            event_type: Optional event type filter.
+            source: Optional source filter.
+            limit: Maximum number of events to return, None or 0 for all of them.
+
+        Returns:
+            List of matching events, newest first.
+
+        Raises:
+            ValueError: If limit is negative.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("Event limit must not be negative")
+
+        events: Iterable[dict[str, Any]]
+        if event_type and source:
+            # Scan the smaller index and filter by the other field
+            by_type = self._by_type.get(event_type, ())
+            by_source = self._by_source.get(source, ())
+            if len(by_type) <= len(by_source):
+                events = (event for event in reversed(by_type) if event["source"] == source)
+            else:
+                events = (
+                    event for event in reversed(by_source) if event["event_type"] == event_type
+                )
+        elif event_type:
+            events = reversed(self._by_type.get(event_type, ()))
+        elif source:
+            events = reversed(self._by_source.get(source, ()))
+        else:
+            events = (event for _, _, event in reversed(self._events))
+
+        return list(itertools.islice(events, limit or None))
+
+    def get_event(self, event_id: str) -> dict[str, Any] | None:
+        """Get an event by ID.
+
+        Args:
+            event_id: The event ID to retrieve.
+
+        Returns:
+            The event data or None if not found.
+        """
+        return self._by_id.get(event_id)
+
+    def clear(self) -> None:
+        """Remove all events."""
+        self._events.clear()
+        self._by_type.clear()
+        self._by_source.clear()
+        self._by_id.clear()
+
+
 class EventSystem:
     """Thread-safe event system with publish-subscribe pattern and middleware support."""
 
@@ -216,10 +539,15 @@ class EventSystem:
         """Initialize a new event system.
 
         Args:
-            max_history: Maximum number of events to keep in history.
+            max_history: Maximum number of events to keep in history, or 0 to keep every
+                event.
+
+        Raises:
+            ValueError: If max_history is negative.
         """
         self._subscriptions: dict[SubscriptionId, EventSubscription] = {}
-        self._events: list[dict[str, Any]] = []
+        self._index = SubscriptionIndex()
+        self._events = EventHistory(max_history)
         self._lock = RLock()
         self._max_history = max_history
 
@@ -283,6 +611,7 @@ class EventSystem:
             # Add to subscriptions
             with self._lock:
                 self._subscriptions[subscription_id] = subscription
+                self._index.add(subscription)
 
             logger.debug(
                 f"Added subscription {subscription_id} for event type {event_type} "
@@ -306,7 +635,7 @@ class EventSystem:
         """
         with self._lock:
             if subscription_id in self._subscriptions:
-                del self._subscriptions[subscription_id]
+                self._index.remove(self._subscriptions.pop(subscription_id))
                 logger.debug(f"Removed subscription {subscription_id}")
                 return True
             return False
@@ -362,18 +691,14 @@ class EventSystem:
             with self._lock:
                 self._events.append(event_data)
 
-                # Trim history if needed
-                if len(self._events) > self._max_history:
-                    self._events = self._events[-self._max_history :]
-
                 # Track stats
                 self._published_count += 1
 
-                # Get matching subscriptions
+                # Get matching subscriptions from the index, then apply source filters
                 matching_subscriptions = [
                     subscription
-                    for subscription in self._subscriptions.values()
-                    if subscription.matches(event_data["event_type"], event_data["source"])
+                    for subscription in self._index.match(event_data["event_type"])
+                    if subscription.matches_source(event_data["source"])
                 ]
 
             # Notify subscribers outside the lock
@@ -415,28 +740,16 @@ class EventSystem:
         Args:
             event_type: Optional event type filter.
             source: Optional source filter.
-            limit: Maximum number of events to return.
+            limit: Maximum number of events to return, None or 0 for all of them.
 
         Returns:
             List of matching events, newest first.
+
+        Raises:
+            ValueError: If limit is negative.
         """
         with self._lock:
-            # Start with all events
-            events = self._events.copy()
-
-            # Apply filters
-            if event_type:
-                events = [event for event in events if event["event_type"] == event_type]
-
-            if source:
-                events = [event for event in events if event["source"] == source]
-
-            # Apply limit and return newest first
-            if limit:
-                events = events[-limit:]
-
-            # Return newest first
-            return list(reversed(events))
+            return self._events.get_events(event_type, source, limit)
 
     def get_event(self, event_id: str) -> dict[str, Any] | None:
         """Get a specific event by ID.
@@ -448,15 +761,12 @@ class EventSystem:
             The event data or None if not found.
         """
         with self._lock:
-            for event in self._events:
-                if event["event_id"] == event_id:
-                    return event
-            return None
+            return self._events.get_event(event_id)
 
     def clear_events(self) -> None:
         """Clear all events from history."""
         with self._lock:
-            self._events = []
+            self._events.clear()
             logger.debug("Cleared event history")
 
     def add_middleware(self, middleware: EventMiddleware, priority: int = 0) -> None:
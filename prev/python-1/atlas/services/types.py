@@ -9,7 +9,7 @@ This module provides a centralized type system for Atlas core services, includin
 - Type validation utilities
 """
 
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from threading import Event, RLock
 from typing import (
     Any,
@@ -127,6 +127,11 @@ class BufferConfigDict(TypedDict):
     paused: bool
     closed: bool
     name: str | None
+    fast: bool  # Store items as compact records without schema validation
+    debug: bool  # Validate items against the schema in fast mode as well
+    asynchronous: bool  # Create the asyncio variant of the buffer
+    max_bytes: int | None  # High watermark of the estimated payload bytes
+    low_watermark: int | None  # Payload bytes at which a throttled buffer accepts pushes
 
 
 class RateLimitedBufferConfigDict(BufferConfigDict):
@@ -287,6 +292,11 @@ class StreamingBufferProtocol(BufferProtocol, Protocol):
     
     def wait_until_not_empty(self, timeout: float | None = None) -> bool: ...
     def wait_until_not_full(self, timeout: float | None = None) -> bool: ...
+    def put(self, item: dict[str, Any], timeout: float | None = None) -> bool: ...
+    def get(self, timeout: float | None = None) -> dict[str, Any] | None: ...
+    def get_many(
+        self, max_items: int, timeout: float | None = None
+    ) -> list[dict[str, Any]]: ...
 
 
 @runtime_checkable
@@ -302,6 +312,7 @@ class RateLimitedBufferProtocol(StreamingBufferProtocol, Protocol):
     @property
     def token_budget(self) -> float: ...
     
+    def calculate_token_cost(self, item: dict[str, Any]) -> float: ...
     def _calculate_token_cost(self, item: dict[str, Any]) -> float: ...
 
 
@@ -319,10 +330,25 @@ class BatchingBufferProtocol(StreamingBufferProtocol, Protocol):
     def batch_delimiter(self) -> str | None: ...
     
     def wait_for_batch(self, timeout: float | None = None) -> bool: ...
+    def pop_batch(self) -> list[dict[str, Any]]: ...
+    def get_batch(self, timeout: float | None = None) -> list[dict[str, Any]]: ...
     
     def _create_batch(self, items: list[dict[str, Any]]) -> dict[str, Any]: ...
 
 
+@runtime_checkable
+class AsyncBufferProtocol(BufferProtocol, Protocol):
+    """Protocol for buffers with awaitable operations, used from a single event loop."""
+    
+    async def put(self, item: dict[str, Any], timeout: float | None = None) -> bool: ...
+    async def get(self, timeout: float | None = None) -> dict[str, Any] | None: ...
+    async def get_many(
+        self, max_items: int, timeout: float | None = None
+    ) -> list[dict[str, Any]]: ...
+    async def drain(self, timeout: float | None = None) -> bool: ...
+    def __aiter__(self) -> AsyncIterator[dict[str, Any]]: ...
+
+
 @runtime_checkable
 class MiddlewareProtocol(Protocol, Generic[T]):
     """Protocol for middleware components."""
@@ -613,6 +639,18 @@ def is_batching_buffer(obj: Any) -> TypeGuard[BatchingBufferProtocol]:
     return isinstance(obj, BatchingBufferProtocol)
 
 
+def is_async_buffer(obj: Any) -> TypeGuard[AsyncBufferProtocol]:
+    """Check if an object implements the AsyncBufferProtocol.
+    
+    Args:
+        obj: The object to check.
+        
+    Returns:
+        True if the object implements AsyncBufferProtocol, False otherwise.
+    """
+    return isinstance(obj, AsyncBufferProtocol)
+
+
 def is_event_system(obj: Any) -> TypeGuard[EventProtocol]:
     """Check if an object implements the EventProtocol.
     
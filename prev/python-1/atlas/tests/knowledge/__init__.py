@@ -0,0 +1 @@
+"""Knowledge module tests."""
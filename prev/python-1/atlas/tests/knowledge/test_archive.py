@@ -0,0 +1,115 @@
+"""
+Unit tests for archive sources.
+
+Tests member name normalization and streaming the members of tar and zip archives.
+"""
+
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+from atlas.knowledge.archive import ArchiveReader, is_archive, member_path, normalize_member_name
+from atlas.knowledge.reader import read_stream
+
+
+class TestMemberNames(unittest.TestCase):
+    """Tests for archive detection and member paths."""
+
+    def test_is_archive(self):
+        """Test that tar and zip archives are recognized by extension."""
+        for path in ("a.tar", "a.tar.gz", "A.TGZ", "a.tar.xz", "a.zip"):
+            self.assertTrue(is_archive(path), path)
+        for path in ("a.md", "a.gz", "tar"):
+            self.assertFalse(is_archive(path), path)
+
+    def test_normalize_member_name(self):
+        """Test that member names become relative POSIX paths inside the archive."""
+        self.assertEqual(normalize_member_name("./docs/a.md"), "docs/a.md")
+        self.assertEqual(normalize_member_name("/docs//b/../a.md"), "docs/a.md")
+        self.assertEqual(normalize_member_name("docs\\a.md"), "docs/a.md")
+        self.assertIsNone(normalize_member_name("../outside.md"))
+        self.assertIsNone(normalize_member_name("docs/../../outside.md"))
+        self.assertEqual(member_path("/data/a.zip", "docs/a.md"), "/data/a.zip!/docs/a.md")
+
+
+class TestArchiveReader(unittest.TestCase):
+    """Tests for the ArchiveReader class."""
+
+    FILES = {"docs/a.md": "# A\n\nAlpha.\n", "docs/nested/b.md": "# B\n\nBravo.\n"}
+
+    def setUp(self):
+        """Create a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def create_tar(self, name, mode):
+        """Create a tar archive with a directory, the test files and a symlink."""
+        path = os.path.join(self.tmp_dir.name, name)
+        with tarfile.open(path, mode) as tar:
+            directory = tarfile.TarInfo("docs")
+            directory.type = tarfile.DIRTYPE
+            tar.addfile(directory)
+            for member_name, text in self.FILES.items():
+                data = text.encode()
+                info = tarfile.TarInfo(f"./{member_name}")
+                info.size = len(data)
+                info.mtime = 1_700_000_000
+                tar.addfile(info, io.BytesIO(data))
+            link = tarfile.TarInfo("docs/link.md")
+            link.type = tarfile.SYMTYPE
+            link.linkname = "a.md"
+            tar.addfile(link)
+        return path
+
+    def test_tar_members_are_streamed(self):
+        """Test that regular files of plain and compressed tar archives are read."""
+        for name, mode in (("bundle.tar", "w"), ("bundle.tar.gz", "w:gz")):
+            with self.subTest(name=name):
+                path = self.create_tar(name, mode)
+                members = {}
+                for member in ArchiveReader(path):
+                    members[member.name] = member.read().text
+                    self.assertEqual(member.path, member_path(path, member.name))
+                    self.assertEqual(member.mtime_ns, 1_700_000_000 * 1_000_000_000)
+                self.assertEqual(members, self.FILES)
+
+    def test_skipped_tar_members_are_not_read(self):
+        """Test that members can be skipped without reading them in streaming mode."""
+        path = self.create_tar("bundle.tar.gz", "w:gz")
+        members = list(ArchiveReader(path))
+        self.assertEqual([member.name for member in members], list(self.FILES))
+        self.assertEqual(members[0].size, len(self.FILES["docs/a.md"]))
+
+    def test_zip_members(self):
+        """Test that regular files of zip archives are read with their metadata."""
+        path = os.path.join(self.tmp_dir.name, "bundle.zip")
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("docs/", "")
+            for member_name, text in self.FILES.items():
+                archive.writestr(zipfile.ZipInfo(member_name, (2024, 1, 2, 3, 4, 6)), text)
+
+        contents = {}
+        for member in ArchiveReader(path):
+            self.assertEqual(member.size, len(self.FILES[member.name]))
+            self.assertEqual(member.mtime_ns % 1_000_000_000, 0)
+            contents[member.name] = member.read()
+
+        # Members hash like the same bytes read from disk
+        self.assertEqual(list(contents), list(self.FILES))
+        data = self.FILES["docs/a.md"].encode()
+        self.assertEqual(contents["docs/a.md"], read_stream(io.BytesIO(data)))
+
+    def test_unsupported_archive(self):
+        """Test that paths without an archive extension are rejected."""
+        with self.assertRaises(ValueError):
+            ArchiveReader("bundle.rar")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Unit tests for ingestion checkpoints.
+
+Tests cursor tracking, persistence and completion of directory ingestion runs.
+"""
+
+import os
+import tempfile
+import unittest
+
+from atlas.knowledge.checkpoint import IngestionCheckpoint
+
+
+class TestIngestionCheckpoint(unittest.TestCase):
+    """Tests for the IngestionCheckpoint class."""
+
+    def setUp(self):
+        """Create a temporary directory for the checkpoint file."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "test.checkpoint.json")
+        self.docs = os.path.join(self.tmp_dir.name, "docs")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_cursor_marks_committed_files(self):
+        """Test that files up to the cursor in walk order are committed."""
+        checkpoint = IngestionCheckpoint()
+        checkpoint.start(self.docs)
+        self.assertFalse(checkpoint.is_committed(os.path.join(self.docs, "a.md")))
+
+        checkpoint.advance(os.path.join(self.docs, "b.md"), files=2, chunks=10)
+
+        self.assertTrue(checkpoint.is_committed(os.path.join(self.docs, "a.md")))
+        self.assertTrue(checkpoint.is_committed(os.path.join(self.docs, "b.md")))
+        self.assertFalse(checkpoint.is_committed(os.path.join(self.docs, "c.md")))
+        # Files in subdirectories are walked after the files of their parent
+        self.assertFalse(checkpoint.is_committed(os.path.join(self.docs, "a", "x.md")))
+
+    def test_checkpoint_is_persisted(self):
+        """Test that an interrupted run is reloaded with its progress."""
+        checkpoint = IngestionCheckpoint(self.path)
+        checkpoint.start(self.docs, recursive=False)
+        checkpoint.advance(os.path.join(self.docs, "b.md"), files=2, chunks=10)
+        checkpoint.save()
+
+        reloaded = IngestionCheckpoint(self.path)
+        self.assertTrue(reloaded.matches(self.docs, recursive=False))
+        self.assertFalse(reloaded.matches(self.docs, recursive=True))
+        self.assertEqual(reloaded.cursor, "b.md")
+        self.assertEqual(reloaded.files_committed, 2)
+        self.assertEqual(reloaded.batches_committed, 1)
+
+    def test_finish_removes_file(self):
+        """Test that finishing a run removes the checkpoint file."""
+        checkpoint = IngestionCheckpoint(self.path)
+        checkpoint.start(self.docs)
+        checkpoint.save()
+        self.assertTrue(os.path.exists(self.path))
+
+        checkpoint.finish()
+        checkpoint.save()
+
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(IngestionCheckpoint(self.path).active)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Unit tests for near-duplicate chunk detection.
+
+Tests SimHash signatures, the blocked signature index and its persistence.
+"""
+
+import os
+import tempfile
+import unittest
+
+from atlas.knowledge.dedup import NearDuplicateDetector, simhash
+from atlas.knowledge.ingest import DocumentChunk
+
+TEMPLATE = (
+    "This page is part of the Atlas reference documentation. For installation steps, "
+    "configuration options and troubleshooting advice see the getting started guide, "
+    "and report problems through the issue tracker of the project repository. "
+)
+
+
+def make_chunk(chunk_id, text):
+    """Create a chunk with empty metadata."""
+    return DocumentChunk(id=chunk_id, text=text, metadata={})
+
+
+class TestSimHash(unittest.TestCase):
+    """Tests for the simhash function."""
+
+    def test_similar_texts_have_close_signatures(self):
+        """Test that a small edit flips few bits while unrelated texts differ widely."""
+        original = simhash(TEMPLATE * 3 + "Section about providers.")
+        edited = simhash(TEMPLATE * 3 + "Section about agents.")
+        unrelated = simhash("Completely different content about vector stores and ranking.")
+
+        self.assertLessEqual((original ^ edited).bit_count(), 3)
+        self.assertGreater((original ^ unrelated).bit_count(), 10)
+
+    def test_signature_ignores_case_and_whitespace(self):
+        """Test that case and whitespace changes do not change the signature."""
+        self.assertEqual(simhash("Hello  World\nagain"), simhash("hello world again"))
+
+
+class TestNearDuplicateDetector(unittest.TestCase):
+    """Tests for the NearDuplicateDetector class."""
+
+    def test_near_duplicates_are_marked(self):
+        """Test that near-duplicates point at the first chunk and are not indexed."""
+        detector = NearDuplicateDetector(max_distance=3)
+        chunks = [
+            make_chunk("a.md#0", TEMPLATE * 3 + "Section about providers."),
+            make_chunk("b.md#0", TEMPLATE * 3 + "Section about agents."),
+            make_chunk("c.md#0", "Completely different content about vector stores."),
+        ]
+
+        detector.process_chunks(chunks)
+
+        self.assertNotIn("duplicate_of", chunks[0].metadata)
+        self.assertEqual(chunks[1].metadata["duplicate_of"], "a.md#0")
+        self.assertNotIn("duplicate_of", chunks[2].metadata)
+        self.assertEqual(detector.get_unique_chunk_count(), 2)
+
+    def test_reprocessed_chunk_is_not_its_own_duplicate(self):
+        """Test that seeing the same chunk again does not mark it as a duplicate."""
+        detector = NearDuplicateDetector()
+        detector.process_chunks([make_chunk("a.md#0", TEMPLATE)])
+        chunk = make_chunk("a.md#0", TEMPLATE)
+
+        detector.process_chunks([chunk])
+
+        self.assertNotIn("duplicate_of", chunk.metadata)
+        self.assertEqual(len(detector), 1)
+
+    def test_removed_chunks_are_not_matched(self):
+        """Test that removed chunks can no longer be the original of a duplicate."""
+        detector = NearDuplicateDetector()
+        detector.process_chunks([make_chunk("a.md#0", TEMPLATE)])
+        detector.remove(["a.md#0"])
+        chunk = make_chunk("b.md#0", TEMPLATE)
+
+        detector.process_chunks([chunk])
+
+        self.assertNotIn("duplicate_of", chunk.metadata)
+
+    def test_excluded_chunks_are_not_matched(self):
+        """Test that excluded chunks are only originals once a chunk reuses their ID."""
+        detector = NearDuplicateDetector()
+        detector.process_chunks([make_chunk("a.md#1", TEMPLATE)])
+        chunks = [make_chunk("a.md#0", TEMPLATE), make_chunk("a.md#1", TEMPLATE)]
+
+        detector.process_chunks(chunks, exclude_ids=["a.md#0", "a.md#1"])
+
+        self.assertNotIn("duplicate_of", chunks[0].metadata)
+        self.assertEqual(chunks[1].metadata["duplicate_of"], "a.md#0")
+
+    def test_index_is_persisted(self):
+        """Test that a saved index recognizes duplicates in a new detector."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "index.simhash.json")
+            detector = NearDuplicateDetector(path=path)
+            detector.process_chunks([make_chunk("a.md#0", TEMPLATE)])
+            detector.save()
+
+            reloaded = NearDuplicateDetector(path=path)
+            chunk = make_chunk("b.md#0", TEMPLATE)
+            reloaded.process_chunks([chunk])
+
+            self.assertEqual(chunk.metadata["duplicate_of"], "a.md#0")
+
+    def test_invalid_distance(self):
+        """Test that distances the index cannot support are rejected."""
+        with self.assertRaises(ValueError):
+            NearDuplicateDetector(max_distance=-1)
+        with self.assertRaises(ValueError):
+            NearDuplicateDetector(max_distance=40)
+
+
+if __name__ == "__main__":
+    unittest.main()
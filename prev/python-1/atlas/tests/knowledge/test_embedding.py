@@ -0,0 +1,346 @@
+"""
+Unit tests for embedding strategies.
+
+Tests batching, bounded concurrency, rate limit handling and failure reporting of the
+AnthropicEmbeddingStrategy against a local stand-in HTTP server, query coalescing and
+the local hashing strategy.
+"""
+
+import json
+import math
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import anthropic
+import httpx
+
+from atlas.core.errors import APIError
+from atlas.core.retry import RetryConfig
+from atlas.knowledge.embedding import (
+    NUMPY_AVAILABLE,
+    AnthropicEmbeddingStrategy,
+    CoalescingEmbeddingStrategy,
+    EmbeddingStrategy,
+    EmbeddingStrategyFactory,
+    HashingEmbeddingStrategy,
+)
+
+
+class StandInEmbeddingServer:
+    """Local HTTP server that answers embedding requests with deterministic vectors.
+
+    Each text is embedded as [len(text), request number]. Responses listed in
+    `scripted_statuses` are returned, in order, before any successful response.
+    """
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests = []
+        self.scripted_statuses = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with server.lock:
+                    server.requests.append(body)
+                    request_number = len(server.requests)
+                    status = server.scripted_statuses.pop(0) if server.scripted_statuses else 200
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+
+                try:
+                    time.sleep(server.delay)
+                    if status == 200:
+                        # Return items out of order to check that indexes are honored
+                        data = [
+                            {"index": i, "embedding": [float(len(text)), float(request_number)]}
+                            for i, text in enumerate(body["input"])
+                        ]
+                        self._send(200, {"data": list(reversed(data))})
+                    else:
+                        headers = {"retry-after": "0.2"} if status == 429 else {}
+                        self._send(status, {"error": {"message": "scripted"}}, headers)
+                finally:
+                    with server.lock:
+                        server.in_flight -= 1
+
+            def _send(self, status, payload, headers=None):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestAnthropicEmbeddingStrategy(unittest.TestCase):
+    """Tests for the AnthropicEmbeddingStrategy class."""
+
+    def setUp(self):
+        """Start the stand-in server."""
+        self.server = StandInEmbeddingServer()
+
+    def tearDown(self):
+        """Stop the stand-in server."""
+        self.server.close()
+
+    def create_strategy(self, **kwargs):
+        """Create a strategy pointed at the stand-in server with fast retries."""
+        kwargs.setdefault("retry_config", RetryConfig(max_retries=2, initial_delay=0.01))
+        return AnthropicEmbeddingStrategy(
+            api_key="test", base_url=self.server.base_url, dimensions=2, **kwargs
+        )
+
+    def test_texts_are_sent_in_batches(self):
+        """Test that texts are grouped into multi-input requests in order."""
+        strategy = self.create_strategy(batch_size=4)
+        texts = ["x" * n for n in range(1, 11)]
+
+        embeddings = strategy.embed_documents(texts)
+
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(sorted(len(r["input"]) for r in self.server.requests), [2, 4, 4])
+        self.assertEqual([e[0] for e in embeddings], [float(n) for n in range(1, 11)])
+
+    def test_concurrency_is_bounded(self):
+        """Test that requests run concurrently but never beyond max_concurrency."""
+        self.server.delay = 0.1
+        strategy = self.create_strategy(batch_size=1, max_concurrency=3)
+
+        start = time.monotonic()
+        strategy.embed_documents([f"text {i}" for i in range(9)])
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(self.server.max_in_flight, 3)
+        self.assertLess(elapsed, 0.6)  # Nine serial requests would take 0.9s
+
+    def test_rate_limits_are_retried(self):
+        """Test that a rate limited request waits for retry-after and then succeeds."""
+        self.server.scripted_statuses = [429]
+        strategy = self.create_strategy()
+
+        start = time.monotonic()
+        embedding = strategy.embed_query("hello")
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+        self.assertEqual(embedding, [5.0, 2.0])
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_persistent_failures_raise(self):
+        """Test that failures are reported instead of returning zero vectors."""
+        self.server.scripted_statuses = [503, 503, 503]
+        strategy = self.create_strategy()
+
+        with self.assertRaises(APIError) as context:
+            strategy.embed_documents(["a", "b"])
+
+        self.assertEqual(context.exception.details["status_code"], 503)
+        self.assertEqual(len(self.server.requests), 3)  # Initial attempt plus two retries
+
+    def test_connection_errors_are_retried(self):
+        """Test that requests that could not reach the API are retried."""
+        strategy = self.create_strategy()
+        post = strategy.client.post
+        attempts = []
+
+        def flaky_post(*args, **kwargs):
+            attempts.append(args)
+            if len(attempts) == 1:
+                request = httpx.Request("POST", self.server.base_url)
+                raise anthropic.APIConnectionError(request=request)
+            return post(*args, **kwargs)
+
+        with mock.patch.object(strategy.client, "post", side_effect=flaky_post):
+            embedding = strategy.embed_query("hello")
+
+        self.assertEqual(embedding, [5.0, 1.0])
+        self.assertEqual(len(attempts), 2)
+
+    def test_client_errors_are_not_retried(self):
+        """Test that non-retryable errors fail immediately."""
+        self.server.scripted_statuses = [400]
+        strategy = self.create_strategy()
+
+        with self.assertRaises(APIError):
+            strategy.embed_query("hello")
+        self.assertEqual(len(self.server.requests), 1)
+
+
+class RecordingStrategy(EmbeddingStrategy):
+    """Strategy that records embed_documents calls and embeds texts by length."""
+
+    def __init__(self, delay: float = 0.0, error: Exception | None = None):
+        self.delay = delay
+        self.error = error
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def embed_documents(self, texts):
+        with self.lock:
+            self.calls.append(list(texts))
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [[float(len(text))] for text in texts]
+
+    def embed_query(self, query):
+        return self.embed_documents([query])[0]
+
+
+class TestCoalescingEmbeddingStrategy(unittest.TestCase):
+    """Tests for the CoalescingEmbeddingStrategy class."""
+
+    def run_concurrently(self, strategy, queries):
+        """Call embed_query from one thread per query and collect results or errors."""
+        results = [None] * len(queries)
+        barrier = threading.Barrier(len(queries))
+
+        def worker(i):
+            barrier.wait()
+            try:
+                results[i] = strategy.embed_query(queries[i])
+            except Exception as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(queries))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        return results
+
+    def test_concurrent_queries_are_coalesced(self):
+        """Test that concurrent queries share batched calls and get their own vectors."""
+        inner = RecordingStrategy(delay=0.02)
+        strategy = CoalescingEmbeddingStrategy(inner, max_batch_size=8, max_wait=0.05)
+        queries = ["q" * (i + 1) for i in range(32)]
+
+        results = self.run_concurrently(strategy, queries)
+        strategy.close()
+
+        self.assertEqual(results, [[float(i + 1)] for i in range(32)])
+        self.assertLess(len(inner.calls), 32)
+        self.assertTrue(all(len(call) <= 8 for call in inner.calls))
+        self.assertEqual(strategy.get_stats()["queries"], 32)
+
+    def test_duplicate_queries_are_embedded_once(self):
+        """Test that identical queries in a batch are only sent once."""
+        inner = RecordingStrategy()
+        strategy = CoalescingEmbeddingStrategy(inner, max_wait=0.1)
+
+        results = self.run_concurrently(strategy, ["same"] * 4)
+        strategy.close()
+
+        self.assertEqual(results, [[4.0]] * 4)
+        self.assertEqual(sum(len(call) for call in inner.calls), len(inner.calls))
+
+    def test_errors_reach_every_caller(self):
+        """Test that a failed batch raises in every waiting caller."""
+        inner = RecordingStrategy(error=APIError("boom"))
+        strategy = CoalescingEmbeddingStrategy(inner, max_wait=0.05)
+
+        results = self.run_concurrently(strategy, ["a", "b", "c"])
+        strategy.close()
+
+        self.assertTrue(all(isinstance(result, APIError) for result in results))
+
+    def test_closed_strategy_embeds_directly(self):
+        """Test that queries after close bypass the dispatcher."""
+        inner = RecordingStrategy()
+        strategy = CoalescingEmbeddingStrategy(inner)
+        strategy.close()
+
+        self.assertEqual(strategy.embed_query("abc"), [3.0])
+        self.assertEqual(strategy.embed_documents(["ab", "c"]), [[2.0], [1.0]])
+
+    def test_factory_passes_coalescing_options(self):
+        """Test that the factory configures the coalescing wrapper it creates."""
+        strategy = EmbeddingStrategyFactory.create_strategy(
+            "default", coalesce_queries=True, coalesce_max_batch_size=8, coalesce_max_wait=0.1
+        )
+        self.assertIsInstance(strategy, CoalescingEmbeddingStrategy)
+        self.assertEqual(strategy.max_batch_size, 8)
+        self.assertEqual(strategy.max_wait, 0.1)
+        strategy.close()
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is not installed")
+class TestHashingEmbeddingStrategy(unittest.TestCase):
+    """Tests for the HashingEmbeddingStrategy class."""
+
+    def cosine(self, a, b):
+        """Cosine similarity of two normalized vectors."""
+        return sum(x * y for x, y in zip(a, b, strict=True))
+
+    def test_embeddings_are_normalized_and_sized(self):
+        """Test that every embedding has the configured dimension and unit length."""
+        strategy = HashingEmbeddingStrategy(dimensions=64)
+        embeddings = strategy.embed_documents(["alpha beta", "gamma gamma gamma", ""])
+
+        self.assertEqual([len(e) for e in embeddings], [64, 64, 64])
+        self.assertAlmostEqual(math.sqrt(sum(x * x for x in embeddings[0])), 1.0, places=5)
+        self.assertAlmostEqual(math.sqrt(sum(x * x for x in embeddings[1])), 1.0, places=5)
+        self.assertEqual(embeddings[2], [0.0] * 64)
+
+    def test_embeddings_are_deterministic(self):
+        """Test that separate instances and batch positions produce identical vectors."""
+        text = "The quick brown fox jumps over the lazy dog"
+        batch = HashingEmbeddingStrategy().embed_documents(["other text", text])
+        self.assertEqual(batch[1], HashingEmbeddingStrategy().embed_query(text))
+        self.assertEqual(HashingEmbeddingStrategy().embed_query(text.upper()), batch[1])
+
+    def test_similar_texts_are_closer(self):
+        """Test that texts sharing tokens are more similar than unrelated texts."""
+        strategy = HashingEmbeddingStrategy()
+        query, similar, unrelated = strategy.embed_documents(
+            [
+                "configure the embedding batch size",
+                "the embedding batch size can be configured",
+                "rename watched markdown files",
+            ]
+        )
+        self.assertGreater(self.cosine(query, similar), self.cosine(query, unrelated))
+
+    def test_term_frequency_is_sublinear(self):
+        """Test that repeating a token does not scale its weight linearly."""
+        strategy = HashingEmbeddingStrategy()
+        once = strategy.embed_query("alpha beta")
+        repeated = strategy.embed_query("alpha alpha alpha alpha beta")
+        ratio = max(map(abs, repeated)) / min(abs(x) for x in repeated if x)
+        self.assertAlmostEqual(ratio, 1 + math.log(4), places=4)
+        self.assertGreater(self.cosine(once, repeated), 0.9)
+
+    def test_factory_creates_hashing_strategy(self):
+        """Test that the factory creates the hashing strategy with its options."""
+        strategy = EmbeddingStrategyFactory.create_strategy("hashing", dimensions=32)
+        self.assertIsInstance(strategy, HashingEmbeddingStrategy)
+        self.assertEqual(len(strategy.embed_query("hello")), 32)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,764 @@
+"""
+Unit tests for document ingestion.
+
+Tests file selection, document type routing and incremental processing of directories
+and archives in the DocumentProcessor, using a temporary ChromaDB collection and a fake
+embedding strategy.
+"""
+
+import io
+import os
+import sys
+import tarfile
+import tempfile
+import unittest
+from unittest import mock
+
+from atlas.knowledge.embedding import EmbeddingStrategy
+from atlas.knowledge.ingest import (
+    ChunkingStrategyFactory,
+    CodeChunker,
+    DocumentProcessor,
+    FixedSizeChunker,
+    MarkdownChunker,
+    SemanticChunker,
+)
+from atlas.knowledge.tokens import HeuristicTokenEstimator, TokenEstimator
+from atlas.knowledge.watcher import IngestionQueue
+
+
+class FakeEmbeddingStrategy(EmbeddingStrategy):
+    """Embedding strategy that returns constant vectors and counts embedded texts."""
+
+    def __init__(self):
+        self.embedded = 0
+
+    def embed_documents(self, texts):
+        self.embedded += len(texts)
+        return [[1.0, 0.0, 0.5] for _ in texts]
+
+    def embed_query(self, query):
+        return [1.0, 0.0, 0.5]
+
+
+class IngestTestCase(unittest.TestCase):
+    """Base class that sets up a temporary working tree and ChromaDB directory."""
+
+    def setUp(self):
+        """Create the temporary directories and switch into the working tree."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.tmp_dir.name)
+        self.embedding = FakeEmbeddingStrategy()
+
+    def tearDown(self):
+        """Restore the working directory and remove the temporary directories."""
+        os.chdir(self.original_cwd)
+        self.tmp_dir.cleanup()
+        self.db_dir.cleanup()
+
+    def write(self, rel_path, content):
+        """Write a file relative to the working tree and return its path."""
+        path = os.path.join(self.tmp_dir.name, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def create_processor(self, **kwargs):
+        """Create a DocumentProcessor backed by the temporary ChromaDB directory."""
+        return DocumentProcessor(
+            anthropic_api_key="test",
+            collection_name="test_collection",
+            db_path=self.db_dir.name,
+            embedding_strategy=self.embedding,
+            **kwargs,
+        )
+
+
+class TestFileSelection(IngestTestCase):
+    """Tests for include/exclude patterns and document type routing."""
+
+    def setUp(self):
+        """Create a small mixed-language tree."""
+        super().setUp()
+        self.readme = self.write("repo/README.md", "# Readme\n\nSome documentation.\n")
+        self.module = self.write("repo/src/app.py", "def main():\n    return 1\n")
+        self.component = self.write("repo/src/view.tsx", "export function View() {}\n")
+        self.generated = self.write("repo/src/gen/schema.py", "X = 1\n")
+        self.notes = self.write("repo/notes.txt", "plain text notes\n")
+
+    def test_default_includes_markdown_only(self):
+        """Test that only markdown files are selected by default."""
+        processor = self.create_processor()
+        self.assertEqual(processor.get_all_files("repo"), ["repo/README.md"])
+        self.assertFalse(processor.should_ingest(self.module))
+
+    def test_include_and_exclude_patterns(self):
+        """Test that include and exclude patterns select source files."""
+        processor = self.create_processor(
+            include_patterns=["*.md", "*.py", "*.tsx"], exclude_patterns=["gen/"]
+        )
+        files = sorted(processor.get_all_files("repo"))
+        self.assertEqual(files, ["repo/README.md", "repo/src/app.py", "repo/src/view.tsx"])
+        self.assertFalse(processor.should_ingest(self.generated))
+
+        # Non-recursive listing only sees the top level
+        self.assertEqual(processor.get_all_files("repo", recursive=False), ["repo/README.md"])
+
+    def test_document_type_routing(self):
+        """Test that configured type routing overrides detection."""
+        processor = self.create_processor(document_types={"*.txt": "markdown"})
+        self.assertEqual(processor.get_document_type(self.notes), "markdown")
+        self.assertEqual(processor.get_document_type(self.component), "code")
+        self.assertEqual(processor.get_document_type(self.readme), "markdown")
+
+    def test_detect_document_type_extensions(self):
+        """Test that every extension the code chunker understands is detected as code."""
+        for name in ("a.jsx", "a.tsx", "a.kt", "a.scala", "a.hpp", "a.cc", "A.PY"):
+            self.assertEqual(ChunkingStrategyFactory.detect_document_type(name), "code", name)
+
+    def test_chunking_strategies_are_cached(self):
+        """Test that one chunker instance is reused per document type."""
+        processor = self.create_processor()
+        markdown = processor.get_chunking_strategy("markdown")
+        self.assertIsInstance(markdown, MarkdownChunker)
+        self.assertIs(processor.get_chunking_strategy("markdown"), markdown)
+        self.assertIsInstance(processor.get_chunking_strategy("code"), CodeChunker)
+
+    def test_incremental_code_ingestion(self):
+        """Test that code files use the same change detection as markdown."""
+        processor = self.create_processor(include_patterns=["*.py"])
+        processor.process_directory("repo")
+        self.assertGreater(self.embedding.embedded, 0)
+        self.assertEqual(len(processor.manifest), 2)
+
+        counters = processor.get_ingestion_metrics()["counters"]
+        self.assertEqual(counters["files_read"], 2)
+        self.assertEqual(counters["chunks_embedded"], self.embedding.embedded)
+        self.assertEqual(counters["chunks_stored"], counters["chunks_produced"])
+
+        self.embedding.embedded = 0
+        processor.process_directory("repo")
+        self.assertEqual(self.embedding.embedded, 0)
+        self.assertEqual(processor.get_ingestion_metrics()["counters"]["files_skipped"], 2)
+
+
+    def test_duplicate_basenames_keep_their_content(self):
+        """Test that same-named files across packages each keep their own chunks."""
+        files = {
+            "repo/lib/one/pkg/__init__.py": "FIRST = 1\n",
+            "repo/lib/two/pkg/__init__.py": "SECOND = 2\n",
+            "repo/lib/one/pkg/README.md": "# One\n\nThe first package.\n",
+            "repo/lib/two/pkg/README.md": "# Two\n\nThe second package.\n",
+        }
+        for rel_path, content in files.items():
+            self.write(rel_path, content)
+        processor = self.create_processor(include_patterns=["*.py", "*.md"])
+
+        def check_texts():
+            for rel_path, content in files.items():
+                chunk_ids = processor.manifest.get(rel_path).chunk_ids
+                texts = processor.collection.get(ids=chunk_ids)["documents"]
+                self.assertEqual(len(texts), 1, rel_path)
+                self.assertIn(content.splitlines()[-1], texts[0], rel_path)
+
+        processor.process_directory("repo")
+        check_texts()
+
+        # Editing one of the files leaves the chunks of its namesake alone
+        files["repo/lib/one/pkg/__init__.py"] = "FIRST = 3\n"
+        self.write("repo/lib/one/pkg/__init__.py", "FIRST = 3\n")
+        processor.process_directory("repo")
+        check_texts()
+
+
+class TestChangeDetection(IngestTestCase):
+    """Tests for single-pass change detection."""
+
+    def test_read_changed_file(self):
+        """Test that files are only read when their content changed."""
+        path = self.write("docs/a.md", "# A\n\nFirst version.\n")
+        processor = self.create_processor()
+
+        content = processor.read_changed_file(path)
+        self.assertEqual(content.text, "# A\n\nFirst version.\n")
+        self.assertIsNotNone(processor.manifest.get_staged(path))
+        processor.manifest.commit()
+
+        # Unchanged stat skips the read entirely
+        self.assertIsNone(processor.read_changed_file(path))
+
+        # Touching the file only refreshes the recorded stat
+        file_stat = os.stat(path)
+        os.utime(path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+        self.assertIsNone(processor.read_changed_file(path))
+        self.assertTrue(processor.manifest.get(path).matches_stat(os.stat(path)))
+
+        self.write("docs/a.md", "# A\n\nSecond version.\n")
+        self.assertEqual(processor.read_changed_file(path).text, "# A\n\nSecond version.\n")
+        self.assertTrue(processor.has_file_changed(path))
+
+    def test_undecodable_file_is_skipped(self):
+        """Test that a file that is not valid UTF-8 produces no chunks."""
+        path = os.path.join(self.tmp_dir.name, "docs/bad.md")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(b"\xff\xfe bad")
+
+        processor = self.create_processor()
+        self.assertEqual(processor.process_file(path), [])
+        self.assertIsNone(processor.manifest.get_staged(path))
+
+
+    def test_deleted_files_are_removed(self):
+        """Test that files deleted between runs lose their manifest entries and chunks."""
+        kept = self.write("docs/kept.md", "# Kept\n\nThis page stays.\n")
+        deleted = self.write("docs/deleted.md", "# Deleted\n\nThis page goes away.\n")
+        nested = self.write("docs/nested/page.md", "# Nested\n\nOutside a flat walk.\n")
+        processor = self.create_processor()
+        processor.process_directory("docs")
+        self.assertEqual(processor.collection.count(), 3)
+
+        os.remove(deleted)
+        processor = self.create_processor()
+        processor.process_directory("docs", recursive=False)
+
+        self.assertNotIn(deleted, processor.manifest)
+        self.assertIn(kept, processor.manifest)
+        self.assertIn(nested, processor.manifest)
+        self.assertEqual(processor.collection.count(), 2)
+        self.assertEqual(processor.get_ingestion_metrics()["counters"]["chunks_deleted"], 1)
+
+
+class TestChunkIds(IngestTestCase):
+    """Tests for chunk IDs of files that share a name."""
+
+    def setUp(self):
+        """Create two files with the same name in different directories."""
+        super().setUp()
+        self.first = self.write("site/guide/docs/index.md", "# First\n\nThe first index page.\n")
+        self.second = self.write("site/api/docs/index.md", "# Second\n\nThe second index page.\n")
+
+    def stored_texts(self, processor, path):
+        """Get the stored chunk texts of a file by the chunk IDs in its manifest entry."""
+        chunk_ids = processor.manifest.get(path).chunk_ids
+        return processor.collection.get(ids=chunk_ids)["documents"]
+
+    def test_same_named_files_keep_their_chunks(self):
+        """Test that files with the same name get distinct chunk IDs."""
+        processor = self.create_processor()
+        processor.process_directory("site")
+
+        self.assertEqual(processor.collection.count(), 2)
+        self.assertIn("site/guide/docs/index.md#0", processor.manifest.get(self.first).chunk_ids)
+        self.assertIn("The first index page.", self.stored_texts(processor, self.first)[0])
+        self.assertIn("The second index page.", self.stored_texts(processor, self.second)[0])
+
+    def test_removing_a_file_keeps_same_named_file(self):
+        """Test that deleting the chunks of a file leaves a same-named file intact."""
+        processor = self.create_processor()
+        processor.process_directory("site")
+
+        self.assertEqual(processor.remove_files([self.first]), 1)
+        self.assertEqual(processor.collection.count(), 1)
+        self.assertIn("The second index page.", self.stored_texts(processor, self.second)[0])
+
+
+class TestDuplicateHandling(IngestTestCase):
+    """Tests for reusing embeddings of duplicate chunks or dropping them."""
+
+    BOILERPLATE = (
+        "# Reference\n\nThis page is part of the Atlas reference documentation. For "
+        "installation steps, configuration options and troubleshooting advice see the "
+        "getting started guide, and report problems through the issue tracker.\n"
+    )
+
+    def setUp(self):
+        """Create pages that share templated content."""
+        super().setUp()
+        self.write("docs/a.md", self.BOILERPLATE)
+        self.write("docs/b.md", self.BOILERPLATE.replace("issue tracker", "bug tracker"))
+        self.write("docs/c.md", "# Other\n\nUnrelated content about vector stores.\n")
+
+    def test_near_duplicates_reuse_embeddings(self):
+        """Test that near-duplicates are stored without being embedded."""
+        processor = self.create_processor(near_duplicate_distance=8)
+        processor.process_directory("docs")
+
+        self.assertEqual(self.embedding.embedded, 2)
+        self.assertEqual(processor.collection.count(), 3)
+        duplicate = processor.collection.get(ids=["docs/b.md#0"])["metadatas"][0]
+        self.assertEqual(duplicate["duplicate_of"], "docs/a.md#0")
+
+        counters = processor.get_ingestion_metrics()["counters"]
+        self.assertEqual(counters["chunks_duplicate"], 1)
+        self.assertEqual(counters["chunks_reused"], 1)
+
+    def test_near_duplicates_are_dropped(self):
+        """Test that dropped near-duplicates are neither embedded nor stored."""
+        processor = self.create_processor(near_duplicate_distance=8, duplicate_action="drop")
+        processor.process_directory("docs")
+
+        self.assertEqual(self.embedding.embedded, 2)
+        self.assertEqual(processor.collection.count(), 2)
+        self.assertEqual(processor.manifest.get("docs/b.md").chunk_ids, [])
+
+    def test_index_persists_across_runs(self):
+        """Test that a later run recognizes duplicates of chunks stored earlier."""
+        os.rename("docs/b.md", "b.md")
+        self.create_processor(near_duplicate_distance=8).process_directory("docs")
+        os.rename("b.md", "docs/b.md")
+
+        self.embedding.embedded = 0
+        processor = self.create_processor(near_duplicate_distance=8)
+        processor.process_directory("docs")
+
+        self.assertEqual(self.embedding.embedded, 0)
+        self.assertEqual(processor.get_ingestion_metrics()["counters"]["chunks_reused"], 1)
+
+    def test_exact_duplicates_reuse_embeddings(self):
+        """Test that exact duplicates reuse embeddings without near-duplicate detection."""
+        self.write("docs/b.md", self.BOILERPLATE)
+        processor = self.create_processor()
+        processor.process_directory("docs")
+
+        self.assertEqual(self.embedding.embedded, 2)
+        self.assertEqual(processor.collection.count(), 3)
+
+    def assert_shifted_sections_kept(self, **kwargs):
+        """Remove the first section of a page and check that the others keep their chunks."""
+        sections = [
+            f"# Section {n}\n\n" + " ".join(f"word{n}_{i}" for i in range(60)) + "\n\n"
+            for n in range(3)
+        ]
+        self.write("docs/d.md", "".join(sections))
+        processor = self.create_processor(**kwargs)
+        processor.process_directory("docs")
+
+        self.write("docs/d.md", "".join(sections[1:]))
+        self.embedding.embedded = 0
+        processor.process_directory("docs")
+
+        # The shifted chunks reuse their own embeddings and are not duplicates of themselves
+        chunk_ids = ["docs/d.md#0", "docs/d.md#1"]
+        stored = processor.collection.get(ids=[*chunk_ids, "docs/d.md#2"])
+        self.assertEqual(sorted(stored["ids"]), chunk_ids)
+        for metadata in stored["metadatas"]:
+            self.assertNotIn("duplicate_of", metadata)
+        self.assertEqual(self.embedding.embedded, 0)
+        self.assertEqual(sorted(processor.manifest.get("docs/d.md").chunk_ids), chunk_ids)
+
+    def test_shifted_sections_are_kept_when_dropping(self):
+        """Test that removing a leading section does not drop the sections after it."""
+        self.assert_shifted_sections_kept(duplicate_action="drop")
+
+    def test_shifted_sections_are_kept_when_dropping_near_duplicates(self):
+        """Test that shifted sections are not near-duplicates of their old chunks."""
+        self.assert_shifted_sections_kept(duplicate_action="drop", near_duplicate_distance=8)
+
+    def test_shifted_sections_do_not_reference_deleted_chunks(self):
+        """Test that shifted sections stored for reuse do not point at deleted chunks."""
+        self.assert_shifted_sections_kept(duplicate_action="reuse")
+
+    def test_invalid_duplicate_action(self):
+        """Test that unknown duplicate actions are rejected."""
+        with self.assertRaises(ValueError):
+            self.create_processor(duplicate_action="merge")
+
+
+class TestConcurrentIngestion(IngestTestCase):
+    """Tests for files chunked concurrently by the ingestion queue."""
+
+    def test_batch_of_files_sharing_content(self):
+        """Test that a coalesced batch chunked on the worker pool deduplicates consistently."""
+        shared = TestDuplicateHandling.BOILERPLATE
+        paths = [
+            self.write(f"docs/page{index}.md", f"{shared}\n# Page {index}\n\nPage {index}.\n")
+            for index in range(24)
+        ]
+        processor = self.create_processor()
+        queue = IngestionQueue(processor, debounce=60, max_workers=8)
+        queue.start()
+
+        # Switch threads as often as possible to provoke races between the workers
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for path in paths:
+                queue.enqueue(path, "upsert")
+            queue.flush()
+        finally:
+            sys.setswitchinterval(switch_interval)
+            queue.stop()
+
+        metrics = queue.get_metrics()
+        self.assertEqual(metrics["batches"], 1)
+        self.assertEqual(metrics["errors"], 0)
+        self.assertTrue(all(path in processor.manifest for path in paths))
+
+        # Every copy of the shared section reuses the embedding of one stored original
+        stored = processor.collection.get(include=["metadatas"])
+        originals = {
+            metadata.get("duplicate_of")
+            for metadata in stored["metadatas"]
+            if metadata.get("duplicate_of")
+        }
+        self.assertEqual(len(stored["ids"]), 48)
+        self.assertEqual(len(originals), 1)
+        self.assertIn(originals.pop(), stored["ids"])
+        self.assertEqual(self.embedding.embedded, 25)
+
+
+class TestMarkdownChunker(unittest.TestCase):
+    """Tests for the single-pass MarkdownChunker."""
+
+    METADATA = {"simple_id": "docs/guide.md", "source": "docs"}
+
+    def legacy_chunks(self, chunker, content):
+        """Chunk a document the way the SemanticChunker-based implementation did."""
+        frontmatter, body = chunker._extract_frontmatter(content)
+        chunks = SemanticChunker.chunk_document(chunker, body, self.METADATA)
+        if frontmatter and chunks:
+            chunks[0].text = frontmatter + "\n\n" + chunks[0].text
+        return [(c.id, c.text, c.metadata, c.content_hash) for c in chunks]
+
+    def assert_same_chunks(self, chunker, content):
+        """Assert that a document is chunked exactly like the previous implementation."""
+        chunks = chunker.chunk_document(content, self.METADATA)
+        self.assertEqual(
+            [(c.id, c.text, dict(c.metadata), c.content_hash) for c in chunks],
+            self.legacy_chunks(chunker, content),
+        )
+
+    def test_matches_previous_chunker(self):
+        """Test that chunk IDs, text, metadata and hashes are unchanged."""
+        paragraph = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4
+        documents = [
+            "",
+            "Just one line without headings",
+            "---\ntitle: Guide\n---\n# Intro\n\nWelcome.\n\n## Setup\n\nInstall it.\n",
+            "+++\ntitle = 'Guide'\n+++\nPreamble\n\n# Only\n\nBody\n",
+            "Preamble text\n\n# Title\n\n" + "\n\n".join([paragraph] * 12),
+            "#  Spaced\t\n\n\n" + "\n \n".join([paragraph] * 20) + "\n\n### Tail\n",
+            "\n\n".join([paragraph] * 15),
+        ]
+        for chunker in (
+            MarkdownChunker(),
+            MarkdownChunker(max_chunk_size=300, min_chunk_size=50),
+            MarkdownChunker(max_chunk_size=100, min_chunk_size=0),
+        ):
+            for content in documents:
+                with self.subTest(size=chunker.max_chunk_size, content=content[:20]):
+                    self.assert_same_chunks(chunker, content)
+
+    def test_file_metadata_is_shared(self):
+        """Test that chunks share one copy of the file metadata."""
+        metadata = dict(self.METADATA)
+        chunks = MarkdownChunker().chunk_document("# A\n\nOne\n\n# B\n\nTwo\n", metadata)
+        metadata["source"] = "changed"
+
+        self.assertEqual(len(chunks), 2)
+        self.assertIs(chunks[0].metadata.maps[1], chunks[1].metadata.maps[1])
+        self.assertEqual(chunks[1].metadata["source"], "docs")
+        self.assertEqual(chunks[1].metadata["section_title"], "B")
+
+        # Per-chunk additions do not leak into other chunks
+        chunks[0].metadata["duplicate_of"] = "x"
+        self.assertNotIn("duplicate_of", chunks[1].metadata)
+
+
+class TestCodeChunker(unittest.TestCase):
+    """Tests for syntax tree based chunking of Python code."""
+
+    METADATA = {"source": "pkg/module.py", "simple_id": "pkg/module.py"}
+
+    SOURCE = (
+        '"""Module docstring."""\n'
+        "\n"
+        "import os\n"
+        "\n"
+        "\n"
+        "# Helpers for the service\n"
+        "@cache\n"
+        "def helper():\n"
+        "    return os.getcwd()\n"
+        "\n"
+        "\n"
+        "class Service:\n"
+        '    """A service."""\n'
+        "\n"
+        + "".join(
+            f"    def method_{i}(self):\n        return {i} * {'x' * 40!r}\n\n"
+            for i in range(8)
+        )
+    )
+
+    def test_small_definitions_are_merged(self):
+        """Test that small neighbouring definitions share a chunk."""
+        chunks = CodeChunker().chunk_document(self.SOURCE, self.METADATA)
+
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(chunks[0].text, self.SOURCE)
+        self.assertEqual(chunks[0].metadata["definition_type"], "group")
+        self.assertEqual(chunks[0].metadata["line_start"], 1)
+
+    def test_definitions_keep_decorators_and_comments(self):
+        """Test that chunks start at the comments and decorators of a definition."""
+        chunker = CodeChunker(max_chunk_size=80)
+        chunks = chunker.chunk_document(self.SOURCE, self.METADATA)
+
+        helper = next(c for c in chunks if "def helper" in c.text)
+        self.assertTrue(helper.text.startswith("# Helpers for the service\n@cache\n"))
+        self.assertEqual(helper.metadata["definition_line"], "def helper():")
+
+    def test_large_classes_are_split_by_method(self):
+        """Test that an oversized class is split between methods with its header repeated."""
+        chunker = CodeChunker(max_chunk_size=250)
+        chunks = chunker.chunk_document(self.SOURCE, self.METADATA)
+
+        self.assertTrue(all(len(c.text) <= 250 for c in chunks))
+        methods = [c for c in chunks if "def method_" in c.text]
+        self.assertGreater(len(methods), 1)
+        for chunk in methods:
+            self.assertIn("class Service:", chunk.text)
+        self.assertEqual(sum(c.text.count("def method_") for c in chunks), 8)
+
+    def test_split_definitions_repeat_full_signature(self):
+        """Test that every part of a split function repeats its multi-line signature."""
+        signature = "def configure(\n    name: str,\n    value: int = 0,\n) -> dict:\n"
+        source = signature + "".join(f"    option_{i} = name * {i}\n" for i in range(20))
+        chunker = CodeChunker(max_chunk_size=200)
+        chunks = chunker.chunk_document(source, self.METADATA)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(c.text) <= 200 for c in chunks))
+        for chunk in chunks:
+            self.assertTrue(chunk.text.startswith(signature), chunk.text)
+        self.assertEqual(sum(c.text.count("option_") for c in chunks), 20)
+
+    def test_regex_fallback(self):
+        """Test that unparseable code and the regex mode use regex-based chunking."""
+        broken = "def broken(:\n    pass\n\ndef other():\n    pass\n"
+        ast_chunks = CodeChunker().chunk_document(broken, self.METADATA)
+        regex_chunks = CodeChunker(python_mode="regex").chunk_document(broken, self.METADATA)
+        self.assertEqual([c.text for c in ast_chunks], [c.text for c in regex_chunks])
+
+        with self.assertRaises(ValueError):
+            CodeChunker(python_mode="tokens")
+
+    def test_spans_are_cached_by_content(self):
+        """Test that identical content is only parsed once."""
+        chunker = CodeChunker(max_chunk_size=250)
+        with mock.patch.object(
+            chunker, "_plan_python_spans", wraps=chunker._plan_python_spans
+        ) as plan:
+            first = chunker.chunk_document(self.SOURCE, self.METADATA)
+            other = dict(self.METADATA, simple_id="copy/module.py")
+            second = chunker.chunk_document(self.SOURCE, other)
+
+        self.assertEqual(plan.call_count, 1)
+        self.assertEqual([c.text for c in first], [c.text for c in second])
+        self.assertEqual(second[0].id, "copy/module.py#0")
+
+
+class WordTokenEstimator(TokenEstimator):
+    """Estimator that counts one token per whitespace-separated word."""
+
+    def _count(self, text):
+        return len(text.split())
+
+
+class TestTokenBudgets(IngestTestCase):
+    """Tests for sizing chunks in tokens."""
+
+    TEXT = " ".join(f"word{i}" for i in range(100))
+
+    def test_fixed_size_chunks_fit_budget(self):
+        """Test that token-sized fixed chunks hold whole words and overlap in tokens."""
+        chunker = FixedSizeChunker(
+            chunk_size=30, chunk_overlap=5, token_estimator=WordTokenEstimator()
+        )
+        chunks = chunker.chunk_document(self.TEXT, {"simple_id": "a.txt"})
+
+        words = [chunk.text.split() for chunk in chunks]
+        self.assertEqual([len(w) for w in words], [30, 30, 30, 25])
+        self.assertEqual(words[1][:5], words[0][-5:])
+        self.assertEqual(words[-1][-1], "word99")
+
+    def test_markdown_sections_fit_budget(self):
+        """Test that markdown sections are split by token count instead of characters."""
+        paragraphs = "\n\n".join(" ".join(["lorem"] * 10) for _ in range(6))
+        content = f"# Title\n\n{paragraphs}\n"
+        estimator = WordTokenEstimator()
+
+        by_chars = MarkdownChunker(max_chunk_size=2000).chunk_document(content, {})
+        by_tokens = MarkdownChunker(
+            max_chunk_size=25, min_chunk_size=0, token_estimator=estimator
+        ).chunk_document(content, {})
+
+        self.assertEqual(len(by_chars), 1)
+        self.assertGreater(len(by_tokens), 1)
+        self.assertTrue(all(estimator.count(c.text) <= 25 for c in by_tokens))
+
+    def test_code_chunks_fit_budget(self):
+        """Test that Python chunks are planned by token count."""
+        source = "".join(f"def f{i}(a, b):\n    return a + b + {i}\n\n" for i in range(20))
+        estimator = WordTokenEstimator()
+        chunker = CodeChunker(max_chunk_size=40, min_chunk_size=0, token_estimator=estimator)
+        chunks = chunker.chunk_document(source, {"source": "m.py"})
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(estimator.count(c.text) <= 40 for c in chunks))
+
+    def test_processor_configures_chunkers(self):
+        """Test that a token budget gives every chunker the processor's estimator."""
+        processor = self.create_processor(chunk_token_budget=256, token_estimator="heuristic")
+        self.assertIsInstance(processor.token_estimator, HeuristicTokenEstimator)
+
+        markdown = processor.get_chunking_strategy("markdown")
+        self.assertIs(markdown.token_estimator, processor.token_estimator)
+        self.assertEqual(markdown.max_chunk_size, 256)
+        fixed = processor.get_chunking_strategy("fixed")
+        self.assertEqual((fixed.chunk_size, fixed.chunk_overlap), (256, 51))
+
+        self.assertIsNone(self.create_processor().get_chunking_strategy("code").token_estimator)
+
+
+class FailingEmbeddingStrategy(FakeEmbeddingStrategy):
+    """Embedding strategy that fails once a number of texts were embedded."""
+
+    def __init__(self, fail_after):
+        super().__init__()
+        self.fail_after = fail_after
+
+    def embed_documents(self, texts):
+        if self.embedded + len(texts) > self.fail_after:
+            raise RuntimeError("provider outage")
+        return super().embed_documents(texts)
+
+
+class TestCheckpointing(IngestTestCase):
+    """Tests for batched commits and resuming interrupted directory ingestion."""
+
+    def setUp(self):
+        """Create a tree with one chunk per file."""
+        super().setUp()
+        for name in ("a", "b", "c", "d"):
+            self.write(f"docs/{name}.md", f"# {name}\n\nContent of {name}.\n")
+
+    @mock.patch("atlas.knowledge.ingest.CHECKPOINT_CHUNK_INTERVAL", 1)
+    def test_interrupted_run_is_resumed(self):
+        """Test that a resumed run skips files committed before a failure."""
+        self.embedding = FailingEmbeddingStrategy(fail_after=2)
+        processor = self.create_processor()
+        processor.process_directory("docs")
+
+        self.assertEqual(processor.checkpoint.cursor, "b.md")
+        self.assertEqual(processor.collection.count(), 2)
+
+        self.embedding = FakeEmbeddingStrategy()
+        resumed = self.create_processor()
+        self.assertTrue(resumed.checkpoint.matches("docs"))
+        resumed.process_directory("docs", resume=True)
+
+        self.assertEqual(self.embedding.embedded, 2)
+        self.assertEqual(resumed.get_ingestion_metrics()["counters"]["files_seen"], 2)
+        self.assertEqual(resumed.collection.count(), 4)
+        self.assertFalse(resumed.checkpoint.active)
+        self.assertEqual(len(resumed.manifest), 4)
+
+    def test_completed_run_leaves_no_checkpoint(self):
+        """Test that a complete run finishes its checkpoint."""
+        processor = self.create_processor()
+        processor.process_directory("docs")
+
+        self.assertFalse(processor.checkpoint.active)
+        self.assertFalse(os.path.exists(processor.checkpoint.path))
+
+        # Resuming without an interrupted run processes the directory normally
+        processor.process_directory("docs", resume=True)
+        self.assertEqual(processor.get_ingestion_metrics()["counters"]["files_skipped"], 4)
+
+
+class TestArchiveIngestion(IngestTestCase):
+    """Tests for ingesting the members of an archive without extracting it."""
+
+    def write_tar(self, files, mtime=1_700_000_000):
+        """Write a gzipped tar archive of members to the working tree."""
+        path = os.path.join(self.tmp_dir.name, "bundle.tar.gz")
+        with tarfile.open(path, "w:gz") as tar:
+            for name, text in files.items():
+                data = text.encode()
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mtime = mtime
+                tar.addfile(info, io.BytesIO(data))
+        return path
+
+    def test_archive_is_ingested_incrementally(self):
+        """Test that archive members follow the manifest's change detection."""
+        files = {
+            "docs/a.md": "# A\n\nAlpha.\n",
+            "docs/b.md": "# B\n\nBravo.\n",
+            "src/skipped.py": "x = 1\n",
+        }
+        path = self.write_tar(files)
+        processor = self.create_processor()
+
+        self.assertEqual(processor.process_archive(path), 2)
+        self.assertEqual(self.embedding.embedded, 2)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp_dir.name, "docs")))
+
+        stored = processor.collection.get(include=["metadatas"])
+        self.assertIn("bundle.tar.gz!/docs/a.md#0", stored["ids"])
+        sources = {metadata["source"] for metadata in stored["metadatas"]}
+        self.assertEqual(sources, {"bundle.tar.gz!/docs/a.md", "bundle.tar.gz!/docs/b.md"})
+
+        # Unchanged members are skipped by their recorded size and mtime
+        processor.process_archive(path)
+        counters = processor.get_ingestion_metrics()["counters"]
+        self.assertEqual(counters["files_read"], 2)
+        self.assertEqual(counters["files_skipped"], 2)
+
+        # A repacked archive with one edited member and one removed member
+        self.write_tar({"docs/a.md": "# A\n\nAlpha, edited.\n"}, mtime=1_700_000_100)
+        processor.process_archive(path)
+
+        self.assertEqual(self.embedding.embedded, 3)
+        self.assertEqual(processor.collection.count(), 1)
+        self.assertEqual(processor.manifest.paths(), [os.path.abspath(path) + "!/docs/a.md"])
+
+    def test_same_named_members(self):
+        """Test that same-named members in different directories keep their content."""
+        files = {
+            "one/docs/index.md": "# One\n\nFirst.\n",
+            "two/docs/index.md": "# Two\n\nSecond.\n",
+        }
+        path = self.write_tar(files)
+        processor = self.create_processor()
+        processor.process_archive(path)
+
+        self.assertEqual(processor.collection.count(), 2)
+        for name, content in files.items():
+            entry = processor.manifest.get(os.path.abspath(path) + "!/" + name)
+            texts = processor.collection.get(ids=entry.chunk_ids)["documents"]
+            self.assertEqual(texts, [content.strip()])
+
+    def test_damaged_archive(self):
+        """Test that a truncated archive is reported without committing anything."""
+        path = self.write_tar({"docs/a.md": "# A\n\nAlpha.\n" * 1000})
+        with open(path, "rb") as f:
+            data = f.read()
+        with open(path, "wb") as f:
+            f.write(data[: len(data) // 2])
+
+        processor = self.create_processor()
+        self.assertEqual(processor.process_archive(path), 0)
+        self.assertEqual(len(processor.manifest), 0)
+        self.assertEqual(processor.get_ingestion_metrics()["counters"]["errors"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit tests for the ingestion manifest.
+
+Tests staging, committing and persisting file records, and the stat-based
+change detection used to skip unchanged files.
+"""
+
+import os
+import tempfile
+import unittest
+
+from atlas.knowledge.manifest import IngestionManifest, ManifestEntry
+
+
+class TestManifestEntry(unittest.TestCase):
+    """Tests for the ManifestEntry class."""
+
+    def test_matches_stat(self):
+        """Test that matching size and mtime are detected."""
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"hello")
+            path = f.name
+        try:
+            file_stat = os.stat(path)
+            entry = ManifestEntry(
+                size=file_stat.st_size, mtime_ns=file_stat.st_mtime_ns, content_hash="x"
+            )
+            self.assertTrue(entry.matches_stat(file_stat))
+
+            # Changing the modification time invalidates the entry
+            os.utime(path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+            self.assertFalse(entry.matches_stat(os.stat(path)))
+        finally:
+            os.unlink(path)
+
+
+class TestIngestionManifest(unittest.TestCase):
+    """Tests for the IngestionManifest class."""
+
+    def setUp(self):
+        """Create a temporary directory for the manifest file."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "test.manifest.json")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_stage_and_commit(self):
+        """Test that staged entries only become visible once committed."""
+        manifest = IngestionManifest(self.path)
+        manifest.stage("docs/a.md", ManifestEntry(size=1, mtime_ns=2, content_hash="h"))
+        manifest.stage_chunks("docs/a.md", {"a.md#0": "h0", "a.md#1": "h1"})
+
+        self.assertIsNone(manifest.get("docs/a.md"))
+        self.assertEqual(manifest.get_staged("docs/a.md").chunk_ids, ["a.md#0", "a.md#1"])
+
+        self.assertEqual(manifest.commit(["docs/a.md"]), 1)
+        self.assertEqual(manifest.get("docs/a.md").chunk_ids, ["a.md#0", "a.md#1"])
+        self.assertIsNone(manifest.get_staged("docs/a.md"))
+        self.assertIn("docs/a.md", manifest)
+
+    def test_discard(self):
+        """Test that discarded entries are never committed."""
+        manifest = IngestionManifest(self.path)
+        manifest.stage("a.md", ManifestEntry(size=1, mtime_ns=2, content_hash="h"))
+        manifest.discard(["a.md"])
+
+        self.assertEqual(manifest.commit(), 0)
+        self.assertEqual(len(manifest), 0)
+
+    def test_persistence(self):
+        """Test that committed entries survive a reload."""
+        manifest = IngestionManifest(self.path)
+        manifest.stage("a.md", ManifestEntry(size=10, mtime_ns=20, content_hash="abc"))
+        manifest.stage_chunks("a.md", {"a.md#0": "h0"})
+        manifest.stage("b.md", ManifestEntry(size=1, mtime_ns=1, content_hash="def"))
+        manifest.commit(["a.md"])
+        manifest.save()
+
+        reloaded = IngestionManifest(self.path)
+        self.assertEqual(len(reloaded), 1)
+        entry = reloaded.get("a.md")
+        self.assertEqual(entry.size, 10)
+        self.assertEqual(entry.mtime_ns, 20)
+        self.assertEqual(entry.content_hash, "abc")
+        self.assertEqual(entry.chunk_hashes, {"a.md#0": "h0"})
+
+        # Staged entries are not persisted
+        self.assertIsNone(reloaded.get("b.md"))
+
+    def test_remove(self):
+        """Test removing a committed entry."""
+        manifest = IngestionManifest(self.path)
+        manifest.update("a.md", ManifestEntry(size=1, mtime_ns=1, content_hash="h"))
+
+        removed = manifest.remove("a.md")
+        self.assertEqual(removed.content_hash, "h")
+        self.assertIsNone(manifest.remove("a.md"))
+        self.assertNotIn("a.md", manifest)
+
+    def test_unreadable_manifest_is_ignored(self):
+        """Test that a corrupt manifest file starts an empty manifest."""
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        manifest = IngestionManifest(self.path)
+        self.assertEqual(len(manifest), 0)
+
+    def test_in_memory_manifest(self):
+        """Test that a manifest without a path never writes to disk."""
+        manifest = IngestionManifest()
+        manifest.update("a.md", ManifestEntry(size=1, mtime_ns=1, content_hash="h"))
+        manifest.save()
+
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Unit tests for ingestion metrics.
+
+Tests counters, latency histograms and throughput-based ETA estimation.
+"""
+
+import time
+import unittest
+
+from atlas.knowledge.metrics import IngestionMetrics, LatencyHistogram
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Tests for the LatencyHistogram class."""
+
+    def test_summary(self):
+        """Test count, mean, percentiles and max of recorded latencies."""
+        histogram = LatencyHistogram()
+        for duration_ms in (1, 3, 3, 8, 40):
+            histogram.record(duration_ms)
+
+        summary = histogram.summary()
+        self.assertEqual(summary["count"], 5)
+        self.assertAlmostEqual(summary["mean_ms"], 11.0)
+        self.assertEqual(summary["p50_ms"], 5)
+        self.assertEqual(summary["p95_ms"], 40)
+        self.assertEqual(summary["max_ms"], 40)
+
+    def test_empty_histogram(self):
+        """Test that an empty histogram summarizes to zeros."""
+        summary = LatencyHistogram().summary()
+        self.assertEqual(summary["count"], 0)
+        self.assertEqual(summary["p95_ms"], 0.0)
+
+
+class TestIngestionMetrics(unittest.TestCase):
+    """Tests for the IngestionMetrics class."""
+
+    def test_counters_and_stages(self):
+        """Test that counters and stage timings appear in the snapshot."""
+        metrics = IngestionMetrics()
+        metrics.increment("files_read")
+        metrics.increment("bytes_read", 1024)
+        with metrics.time_stage("read"):
+            pass
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["counters"]["files_read"], 1)
+        self.assertEqual(snapshot["counters"]["bytes_read"], 1024)
+        self.assertEqual(snapshot["stages"]["read"]["count"], 1)
+        self.assertEqual(snapshot["stages"]["embed"]["count"], 0)
+        self.assertGreater(snapshot["throughput"]["bytes_per_second"], 0)
+
+    def test_eta_from_measured_throughput(self):
+        """Test that the ETA is derived from progress made since the target was set."""
+        metrics = IngestionMetrics()
+        metrics.increment("chunks_stored", 50)  # Earlier work does not count
+        metrics.expect("chunks_stored", 100)
+        self.assertIsNone(metrics.eta("chunks_stored"))
+
+        time.sleep(0.05)
+        metrics.increment("chunks_stored", 50)
+        eta = metrics.eta("chunks_stored")
+        self.assertIsNotNone(eta)
+        self.assertGreater(eta, 0)
+        self.assertEqual(metrics.progress("chunks_stored"), (50, 100))
+
+        metrics.increment("chunks_stored", 50)
+        self.assertEqual(metrics.eta("chunks_stored"), 0.0)
+        self.assertEqual(metrics.snapshot()["progress"]["chunks_stored"]["done"], 100)
+
+    def test_reset(self):
+        """Test that reset clears counters and targets."""
+        metrics = IngestionMetrics()
+        metrics.increment("errors")
+        metrics.expect("chunks_stored", 10)
+        metrics.reset()
+
+        self.assertEqual(metrics.snapshot()["counters"]["errors"], 0)
+        self.assertIsNone(metrics.eta("chunks_stored"))
+
+
+if __name__ == "__main__":
+    unittest.main()
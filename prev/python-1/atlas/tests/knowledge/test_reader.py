@@ -0,0 +1,86 @@
+"""
+Unit tests for single-pass file reading.
+
+Tests memory-mapped hashing and decoding, including empty files and newline handling,
+and single-pass reading of streams.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+import unittest
+
+from atlas.knowledge.reader import HASH_DIGEST_SIZE, hash_file, read_file, read_stream
+
+
+class TestReader(unittest.TestCase):
+    """Tests for hash_file, read_file and read_stream."""
+
+    def setUp(self):
+        """Create a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def write(self, name, data):
+        """Write raw bytes to a file in the temporary directory."""
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def expected_hash(self, data):
+        """Hash bytes the way the reader is expected to."""
+        return hashlib.blake2b(data, digest_size=HASH_DIGEST_SIZE).hexdigest()
+
+    def test_hash_is_independent_of_block_size(self):
+        """Test that incremental hashing matches hashing the whole file at once."""
+        data = os.urandom(10_000)
+        path = self.write("random.bin", data)
+        self.assertEqual(hash_file(path), self.expected_hash(data))
+        self.assertEqual(hash_file(path, block_size=7), self.expected_hash(data))
+
+    def test_read_file(self):
+        """Test that hashing and decoding come from the same read."""
+        data = "# Título\n\nCafé ☕\n".encode()
+        path = self.write("doc.md", data)
+
+        content = read_file(path, block_size=3)
+        self.assertEqual(content.text, "# Título\n\nCafé ☕\n")
+        self.assertEqual(content.content_hash, self.expected_hash(data))
+        self.assertEqual(content.size, len(data))
+
+    def test_empty_file(self):
+        """Test that empty files, which cannot be mapped, are read as empty."""
+        path = self.write("empty.md", b"")
+        content = read_file(path)
+        self.assertEqual(content.text, "")
+        self.assertEqual(content.size, 0)
+        self.assertEqual(content.content_hash, self.expected_hash(b""))
+
+    def test_newlines_are_normalized(self):
+        """Test that Windows and old Mac newlines are translated like text-mode reads."""
+        path = self.write("crlf.md", b"a\r\nb\rc\n")
+        self.assertEqual(read_file(path).text, "a\nb\nc\n")
+
+    def test_invalid_utf8_raises(self):
+        """Test that undecodable files raise UnicodeDecodeError."""
+        path = self.write("binary.md", b"\xff\xfe\x00")
+        with self.assertRaises(UnicodeDecodeError):
+            read_file(path)
+
+    def test_read_stream_matches_read_file(self):
+        """Test that a stream is hashed and decoded exactly like the same file."""
+        data = "# Título\r\n\nCafé ☕\n".encode()
+        path = self.write("doc.md", data)
+
+        content = read_stream(io.BytesIO(data), block_size=5)
+        self.assertEqual(content, read_file(path))
+        self.assertEqual(content.text, "# Título\n\nCafé ☕\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
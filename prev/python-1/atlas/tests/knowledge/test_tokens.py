@@ -0,0 +1,104 @@
+"""
+Unit tests for token count estimation.
+
+Tests caching, the heuristic estimator and its calibration, and estimator creation.
+"""
+
+import unittest
+
+from atlas.knowledge.tokens import (
+    TIKTOKEN_AVAILABLE,
+    HeuristicTokenEstimator,
+    TiktokenEstimator,
+    TokenEstimator,
+    TokenEstimatorFactory,
+)
+
+
+class WordCountEstimator(TokenEstimator):
+    """Estimator that counts whitespace-separated words and records its calls."""
+
+    def __init__(self):
+        super().__init__(cache_size=8)
+        self.calls = 0
+
+    def _count(self, text):
+        self.calls += 1
+        return len(text.split())
+
+
+class TestTokenEstimator(unittest.TestCase):
+    """Tests for the caching in the TokenEstimator base class."""
+
+    def test_counts_are_cached(self):
+        """Test that counting the same short text twice only measures it once."""
+        estimator = WordCountEstimator()
+        self.assertEqual(estimator.count("one two three"), 3)
+        self.assertEqual(estimator.count("one two three"), 3)
+        self.assertEqual(estimator.calls, 1)
+
+        estimator.clear_cache()
+        estimator.count("one two three")
+        self.assertEqual(estimator.calls, 2)
+
+    def test_long_texts_are_not_cached(self):
+        """Test that texts beyond the cached length are measured every time."""
+        estimator = WordCountEstimator()
+        text = "word " * TokenEstimator.MAX_CACHED_LENGTH
+        estimator.count(text)
+        estimator.count(text)
+        self.assertEqual(estimator.calls, 2)
+
+
+class TestHeuristicTokenEstimator(unittest.TestCase):
+    """Tests for the HeuristicTokenEstimator class."""
+
+    def test_estimates(self):
+        """Test that estimates grow with words, word length and symbols."""
+        estimator = HeuristicTokenEstimator()
+        self.assertEqual(estimator.count(""), 0)
+        self.assertEqual(estimator.count("   \n"), 0)
+        self.assertEqual(estimator.count("the"), 2)  # ceil(0.75 + 0.3)
+
+        short = estimator.count("the cat sat on the mat")
+        self.assertLess(short, estimator.count("the caterpillar sat on the doormat"))
+        self.assertLess(short, estimator.count("the (cat) sat on the [mat]!"))
+
+    def test_calibration(self):
+        """Test that calibration scales estimates to match a reference on average."""
+        estimator = HeuristicTokenEstimator()
+        texts = ["a-b-c-d-e-f-g-h", "i/j/k/l/m/n/o/p", "alpha beta gamma"]
+        reference = WordCountEstimator()
+        self.assertEqual(estimator.count(texts[0]), 11)  # 8 words, 8 characters, 7 symbols
+
+        scale = estimator.calibrate(texts, reference)
+
+        self.assertLess(scale, 1.0)
+        self.assertEqual(estimator.count(texts[0]), 3)  # Cached count was cleared
+        total = sum(estimator._raw_count(text) * estimator.scale for text in texts)
+        self.assertAlmostEqual(total, sum(len(text.split()) for text in texts))
+
+
+class TestTokenEstimatorFactory(unittest.TestCase):
+    """Tests for the TokenEstimatorFactory class."""
+
+    def test_create_estimator(self):
+        """Test that the factory creates the requested estimator type."""
+        heuristic = TokenEstimatorFactory.create_estimator("heuristic", scale=2.0)
+        self.assertIsInstance(heuristic, HeuristicTokenEstimator)
+        self.assertEqual(heuristic.scale, 2.0)
+
+        with self.assertRaises(ValueError):
+            TokenEstimatorFactory.create_estimator("unknown")
+
+    @unittest.skipIf(TIKTOKEN_AVAILABLE, "tiktoken is installed")
+    def test_auto_without_tiktoken(self):
+        """Test that auto falls back to the heuristic without tiktoken."""
+        estimator = TokenEstimatorFactory.create_estimator("auto")
+        self.assertIsInstance(estimator, HeuristicTokenEstimator)
+        with self.assertRaises(ImportError):
+            TiktokenEstimator()
+
+
+if __name__ == "__main__":
+    unittest.main()
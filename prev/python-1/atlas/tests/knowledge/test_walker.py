@@ -0,0 +1,138 @@
+"""
+Unit tests for the gitignore-aware directory walker.
+
+Tests directory-level pruning, nested .gitignore files and lazy traversal.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pathspec
+
+from atlas.knowledge.walker import GitignoreWalker, walk_order_key
+
+
+class TestGitignoreWalker(unittest.TestCase):
+    """Tests for the GitignoreWalker class."""
+
+    def setUp(self):
+        """Create a temporary tree with ignored directories and nested .gitignore files."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = self.tmp_dir.name
+        for rel_path in (
+            "README.md",
+            "docs/guide.md",
+            "docs/drafts/wip.md",
+            "node_modules/pkg/index.md",
+            "pkg/src/module.py",
+            "pkg/build/output.md",
+            "pkg/notes.log",
+        ):
+            self.write(rel_path, "content\n")
+        self.write("docs/.gitignore", "drafts/\n")
+        self.write("pkg/.gitignore", "*.log\nbuild/\n")
+
+        self.base_spec = pathspec.PathSpec.from_lines("gitwildmatch", ["node_modules/"])
+
+    def tearDown(self):
+        """Remove the temporary tree."""
+        self.tmp_dir.cleanup()
+
+    def write(self, rel_path, content):
+        """Write a file relative to the temporary root."""
+        path = os.path.join(self.root, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def rel(self, paths):
+        """Convert walked paths to sorted paths relative to the root."""
+        return sorted(os.path.relpath(path, self.root) for path in paths)
+
+    def test_walk_applies_base_and_nested_patterns(self):
+        """Test that base patterns and nested .gitignore files are honored."""
+        walker = GitignoreWalker(root=self.root, base_specs=[self.base_spec])
+        files = self.rel(walker.walk(self.root))
+        self.assertEqual(
+            files,
+            [
+                "README.md",
+                "docs/.gitignore",
+                "docs/guide.md",
+                "pkg/.gitignore",
+                "pkg/src/module.py",
+            ],
+        )
+
+    def test_ignored_directories_are_not_read(self):
+        """Test that ignored directories are pruned before being scanned."""
+        scanned = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            scanned.append(os.path.relpath(path, self.root))
+            return real_scandir(path)
+
+        walker = GitignoreWalker(root=self.root, base_specs=[self.base_spec])
+        with mock.patch("os.scandir", side_effect=recording_scandir):
+            list(walker.walk(self.root))
+
+        self.assertNotIn("node_modules", scanned)
+        self.assertNotIn("docs/drafts", scanned)
+        self.assertNotIn("pkg/build", scanned)
+        self.assertIn("pkg/src", scanned)
+
+    def test_walk_is_lazy(self):
+        """Test that files are yielded before the whole tree is traversed."""
+        walker = GitignoreWalker(root=self.root, base_specs=[self.base_spec])
+        iterator = walker.walk(self.root)
+        self.assertEqual(os.path.relpath(next(iterator), self.root), "README.md")
+
+    def test_non_recursive_walk(self):
+        """Test that a non-recursive walk only yields top-level files."""
+        walker = GitignoreWalker(root=self.root)
+        self.assertEqual(self.rel(walker.walk(self.root, recursive=False)), ["README.md"])
+
+    def test_walk_below_root(self):
+        """Test that walking a subdirectory still applies the .gitignore files above it."""
+        walker = GitignoreWalker(root=self.root)
+        files = self.rel(walker.walk(os.path.join(self.root, "pkg")))
+        self.assertEqual(files, ["pkg/.gitignore", "pkg/src/module.py"])
+
+    def test_is_ignored(self):
+        """Test single-path checks against base and nested patterns."""
+        walker = GitignoreWalker(root=self.root, base_specs=[self.base_spec])
+        self.assertTrue(walker.is_ignored(os.path.join(self.root, "node_modules/pkg/index.md")))
+        self.assertTrue(walker.is_ignored(os.path.join(self.root, "docs/drafts/wip.md")))
+        self.assertTrue(walker.is_ignored(os.path.join(self.root, "pkg/notes.log")))
+        self.assertFalse(walker.is_ignored(os.path.join(self.root, "docs/guide.md")))
+
+    def test_invalidate(self):
+        """Test that edited .gitignore files are reloaded after invalidation."""
+        walker = GitignoreWalker(root=self.root)
+        guide = os.path.join(self.root, "docs/guide.md")
+        self.assertFalse(walker.is_ignored(guide))
+
+        self.write("docs/.gitignore", "drafts/\nguide.md\n")
+        self.assertFalse(walker.is_ignored(guide))
+
+        walker.invalidate(os.path.join(self.root, "docs"))
+        self.assertTrue(walker.is_ignored(guide))
+
+    def test_walk_order_key(self):
+        """Test that sorting by walk_order_key reproduces the walk order."""
+        self.write("docs.md", "content\n")
+        self.write("docs/a/deep.md", "content\n")
+        self.write("docs/z.md", "content\n")
+        walker = GitignoreWalker(root=self.root, nested_gitignore=False)
+
+        walked = [os.path.relpath(path, self.root) for path in walker.walk(self.root)]
+
+        self.assertEqual(walked, sorted(walked, key=walk_order_key))
+        self.assertNotEqual(walked, sorted(walked))
+
+
+if __name__ == "__main__":
+    unittest.main()
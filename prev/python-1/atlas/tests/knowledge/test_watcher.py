@@ -0,0 +1,181 @@
+"""
+Unit tests for the live ingestion queue.
+
+Tests coalescing and debouncing of file events, batched processing of updates,
+deletes and renames, and the queue metrics.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from atlas.knowledge.manifest import IngestionManifest, ManifestEntry
+from atlas.knowledge.metrics import IngestionMetrics
+from atlas.knowledge.watcher import IngestionQueue
+
+
+class FakeProcessor:
+    """Minimal stand-in for DocumentProcessor that records queue calls."""
+
+    def __init__(self):
+        self.manifest = IngestionManifest()
+        self.metrics = IngestionMetrics()
+        self.prepared = []
+        self.applied = []
+        self.removed = []
+        self.apply_result = True
+        self.unchanged = set()
+        self.lock = threading.Lock()
+
+    def prepare_file(self, file_path, previous_path=None):
+        with self.lock:
+            self.prepared.append((file_path, previous_path))
+        return None if file_path in self.unchanged else file_path
+
+    def apply_chunk_diffs(self, diffs):
+        with self.lock:
+            self.applied.append(list(diffs))
+        return self.apply_result
+
+    def remove_files(self, file_paths):
+        with self.lock:
+            self.removed.append(list(file_paths))
+        return len(file_paths)
+
+    def save_state(self):
+        self.manifest.save()
+
+
+class TestIngestionQueue(unittest.TestCase):
+    """Tests for the IngestionQueue class."""
+
+    def setUp(self):
+        """Create a temporary directory with a few files."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for name in ("a.md", "b.md", "c.md"):
+            path = os.path.join(self.tmp_dir.name, name)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"# {name}\n")
+            self.paths.append(path)
+        self.processor = FakeProcessor()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_events_are_coalesced(self):
+        """Test that repeated events for a path are processed once."""
+        queue = IngestionQueue(self.processor, debounce=10)
+        for _ in range(5):
+            queue.enqueue(self.paths[0], "upsert")
+        queue.enqueue(self.paths[1], "upsert")
+
+        self.assertEqual(queue.depth, 2)
+        queue.flush()
+
+        self.assertEqual(sorted(p for p, _ in self.processor.prepared), sorted(self.paths[:2]))
+        self.assertEqual(len(self.processor.applied), 1)
+        self.assertEqual(sorted(self.processor.applied[0]), sorted(self.paths[:2]))
+
+        metrics = queue.get_metrics()
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertEqual(metrics["events_received"], 6)
+        self.assertEqual(metrics["events_coalesced"], 4)
+        self.assertEqual(metrics["files_processed"], 2)
+        self.assertEqual(metrics["batches"], 1)
+
+    def test_deletes_and_renames(self):
+        """Test that deletes and renames remove the stored chunks of old paths."""
+        queue = IngestionQueue(self.processor, debounce=10)
+        missing = os.path.join(self.tmp_dir.name, "gone.md")
+        old = os.path.join(self.tmp_dir.name, "old.md")
+
+        queue.enqueue(self.paths[0], "delete")
+        queue.enqueue(missing, "upsert")  # Deleted again before it was processed
+        queue.enqueue(self.paths[1], "upsert", previous_path=old)
+        queue.flush()
+
+        self.assertEqual(self.processor.prepared, [(self.paths[1], old)])
+        self.assertEqual(len(self.processor.removed), 1)
+        self.assertEqual(sorted(self.processor.removed[0]), sorted([self.paths[0], missing, old]))
+        self.assertEqual(queue.get_metrics()["files_deleted"], 3)
+
+    def test_failed_rename_keeps_old_path(self):
+        """Test that the old path of a rename is only removed once the new one is stored."""
+        queue = IngestionQueue(self.processor, debounce=10)
+        old = os.path.join(self.tmp_dir.name, "old.md")
+
+        self.processor.apply_result = False
+        queue.enqueue(self.paths[0], "upsert", previous_path=old)
+        queue.flush()
+        self.assertEqual(self.processor.removed, [])
+        self.assertEqual(queue.get_metrics()["errors"], 1)
+
+        # Nothing to store for an unrecorded file means its content was not indexed
+        self.processor.apply_result = True
+        self.processor.unchanged.add(self.paths[1])
+        queue.enqueue(self.paths[1], "upsert", previous_path=old)
+        queue.flush()
+        self.assertEqual(self.processor.removed, [])
+
+        # An unchanged file the manifest already records is stored
+        entry = ManifestEntry(size=1, mtime_ns=1, content_hash="h")
+        self.processor.manifest.update(self.paths[1], entry)
+        queue.enqueue(self.paths[1], "upsert", previous_path=old)
+        queue.flush()
+        self.assertEqual(self.processor.removed, [[old]])
+
+    def test_latest_event_wins(self):
+        """Test that a file recreated after a delete is ingested, not removed."""
+        queue = IngestionQueue(self.processor, debounce=10)
+        queue.enqueue(self.paths[0], "delete")
+        queue.enqueue(self.paths[0], "upsert")
+        queue.flush()
+
+        self.assertEqual(self.processor.prepared, [(self.paths[0], None)])
+        self.assertEqual(self.processor.removed, [])
+
+    def test_batches_are_bounded(self):
+        """Test that a burst of changes is split into batches of max_batch_size."""
+        queue = IngestionQueue(self.processor, debounce=10, max_batch_size=2)
+        for path in self.paths:
+            queue.enqueue(path, "upsert")
+        queue.flush()
+
+        self.assertEqual([len(batch) for batch in self.processor.applied], [2, 1])
+
+    def test_debounced_background_processing(self):
+        """Test that the dispatcher thread waits for a quiet period before processing."""
+        processed = threading.Event()
+        queue = IngestionQueue(
+            self.processor, debounce=0.2, max_workers=2, callback=lambda path: processed.set()
+        )
+        queue.start()
+        try:
+            queue.enqueue(self.paths[0], "upsert")
+            time.sleep(0.05)
+            self.assertEqual(self.processor.prepared, [])
+
+            self.assertTrue(processed.wait(5))
+            self.assertEqual(self.processor.prepared, [(self.paths[0], None)])
+            self.assertGreaterEqual(queue.get_metrics()["last_lag"], 0.2)
+        finally:
+            queue.stop()
+
+    def test_stop_drains_pending_changes(self):
+        """Test that stopping the queue processes changes still waiting out the debounce."""
+        queue = IngestionQueue(self.processor, debounce=60)
+        queue.start()
+        for path in self.paths:
+            queue.enqueue(path, "upsert")
+        queue.stop(drain=True)
+
+        self.assertEqual(len(self.processor.prepared), 3)
+        self.assertEqual(queue.depth, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
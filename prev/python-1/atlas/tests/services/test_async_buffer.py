@@ -0,0 +1,203 @@
+"""
+Unit tests for the asyncio buffers in the core services module.
+
+Tests awaitable put and get, async iteration, closing and draining, and the async
+variants of the rate-limited and batching buffers.
+"""
+
+import asyncio
+import time
+import unittest
+
+from atlas.core.errors import BufferError, ClosedBufferError
+from atlas.services.async_buffer import (
+    AsyncBatchingBuffer,
+    AsyncMemoryBuffer,
+    AsyncRateLimitedBuffer,
+    is_async_buffer,
+)
+from atlas.services.buffer import create_buffer
+
+
+class TestAsyncMemoryBuffer(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AsyncMemoryBuffer class."""
+
+    def setUp(self):
+        """Set up a new buffer for each test."""
+        self.buffer = AsyncMemoryBuffer(max_size=2)
+
+    async def push_later(self, delay, item):
+        """Push an item after a delay."""
+        await asyncio.sleep(delay)
+        self.buffer.push(item)
+
+    async def test_get_waits_for_item(self):
+        """Test that get wakes up as soon as an item is pushed."""
+        task = asyncio.create_task(self.push_later(0.05, {"message": "late"}))
+
+        start = time.monotonic()
+        item = await self.buffer.get(timeout=2.0)
+        self.assertEqual(item["data"]["message"], "late")
+        self.assertLess(time.monotonic() - start, 1.0)
+        await task
+
+        # Timing out on an empty buffer returns None
+        self.assertIsNone(await self.buffer.get(timeout=0.01))
+
+    async def test_get_many(self):
+        """Test that get_many returns the available items up to a maximum."""
+        self.assertEqual(await self.buffer.get_many(5, timeout=0.01), [])
+        self.buffer.push({"index": 0})
+        self.buffer.push({"index": 1})
+
+        items = await self.buffer.get_many(5, timeout=0.01)
+        self.assertEqual([item["data"]["index"] for item in items], [0, 1])
+
+    async def test_put_waits_for_space(self):
+        """Test that put waits while the buffer is full or paused."""
+        await self.buffer.put({"index": 0})
+        await self.buffer.put({"index": 1})
+        self.assertFalse(await self.buffer.put({"index": 2}, timeout=0.01))
+
+        put = asyncio.create_task(self.buffer.put({"index": 2}, timeout=2.0))
+        await asyncio.sleep(0.01)
+        self.assertFalse(put.done())
+        self.buffer.pop()
+        self.assertTrue(await put)
+
+        self.buffer.clear()
+        self.buffer.pause()
+        put = asyncio.create_task(self.buffer.put({"index": 3}, timeout=2.0))
+        await asyncio.sleep(0.01)
+        self.assertFalse(put.done())
+        self.buffer.resume()
+        self.assertTrue(await put)
+
+    async def test_async_iteration(self):
+        """Test that iteration yields items until the buffer is closed and drained."""
+        buffer = AsyncMemoryBuffer(max_size=4, fast=True)
+
+        async def produce():
+            for index in range(10):
+                await buffer.put({"index": index})
+            buffer.close()
+
+        producer = asyncio.create_task(produce())
+        indexes = [item["data"]["index"] async for item in buffer]
+        await producer
+
+        self.assertEqual(indexes, list(range(10)))
+
+    async def test_close_wakes_waiters(self):
+        """Test that closing the buffer wakes waiting producers and consumers."""
+        get = asyncio.create_task(self.buffer.get())
+        await asyncio.sleep(0)
+        self.buffer.close()
+        self.assertIsNone(await get)
+
+        buffer = AsyncMemoryBuffer(max_size=1)
+        buffer.push({"index": 0})
+        put = asyncio.create_task(buffer.put({"index": 1}))
+        await asyncio.sleep(0)
+        buffer.close()
+        with self.assertRaises(ClosedBufferError):
+            await put
+
+        # Remaining items can still be drained
+        self.assertEqual((await buffer.get())["data"]["index"], 0)
+        self.assertIsNone(await buffer.get())
+
+    async def test_drain(self):
+        """Test that drain waits until consumers have taken every item."""
+        self.buffer.push({"index": 0})
+        self.assertFalse(await self.buffer.drain(timeout=0.01))
+
+        drain = asyncio.create_task(self.buffer.drain())
+        await asyncio.sleep(0)
+        self.assertFalse(drain.done())
+        await self.buffer.get()
+        self.assertTrue(await drain)
+
+
+class TestAsyncRateLimitedBuffer(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AsyncRateLimitedBuffer class."""
+
+    async def test_put_waits_for_tokens(self):
+        """Test that put sleeps until enough tokens accrue."""
+        buffer = AsyncRateLimitedBuffer(
+            max_size=10, tokens_per_second=100.0, chars_per_token=4, initial_token_budget=0.0
+        )
+        item = {"message": "x" * 40}
+        cost = buffer._buffer.calculate_token_cost(item)
+        self.assertFalse(buffer.push(item))
+
+        start = time.monotonic()
+        self.assertTrue(await buffer.put(item, timeout=2.0))
+        self.assertGreaterEqual(time.monotonic() - start, cost / 100.0 * 0.8)
+        self.assertEqual(buffer.tokens_per_second, 100.0)
+
+        with self.assertRaises(BufferError):
+            await buffer.put({"message": "x" * 1000})
+
+
+class TestAsyncBatchingBuffer(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AsyncBatchingBuffer class."""
+
+    async def test_get_waits_for_batch(self):
+        """Test that get returns a full batch at once and a partial one on timeout."""
+        buffer = AsyncBatchingBuffer(max_size=10, batch_size=2, batch_timeout=0.1)
+        buffer.push({"message": "item1"})
+        self.assertFalse(await buffer.wait_for_batch(timeout=0.01))
+        buffer.push({"message": "item2"})
+        self.assertTrue(await buffer.wait_for_batch(timeout=0.01))
+
+        batch = await buffer.get(timeout=0.01)
+        self.assertEqual(batch["metadata"]["batch_size"], 2)
+
+        buffer.push({"message": "item3"})
+        start = time.monotonic()
+        batch = await buffer.get(timeout=2.0)
+        self.assertEqual(batch["data"]["message"], "item3")
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    async def test_get_batch(self):
+        """Test that get_batch returns the batched items once a batch is complete."""
+        buffer = AsyncBatchingBuffer(max_size=10, batch_size=2, batch_timeout=None)
+
+        async def produce():
+            for index in range(3):
+                await asyncio.sleep(0.01)
+                buffer.push({"index": index})
+
+        producer = asyncio.create_task(produce())
+        batch = await buffer.get_batch(timeout=2.0)
+        self.assertEqual([item["data"]["index"] for item in batch], [0, 1])
+        await producer
+
+        self.assertEqual(buffer.pop_batch(), [])
+        self.assertEqual(await buffer.get_batch(timeout=0.01), [])
+
+
+class TestAsyncBufferCreation(unittest.TestCase):
+    """Tests for creating async buffers from configuration."""
+
+    def test_create_async_buffers(self):
+        """Test that the asynchronous flag selects the async variant of each type."""
+        for buffer_type, buffer_class in (
+            ("memory", AsyncMemoryBuffer),
+            ("rate_limited", AsyncRateLimitedBuffer),
+            ("batching", AsyncBatchingBuffer),
+        ):
+            with self.subTest(buffer_type=buffer_type):
+                buffer = create_buffer(
+                    {"buffer_type": buffer_type, "max_size": 100, "asynchronous": True}
+                )
+                self.assertIsInstance(buffer, buffer_class)
+                self.assertTrue(is_async_buffer(buffer))
+                self.assertEqual(buffer.max_size, 100)
+
+        self.assertFalse(is_async_buffer(create_buffer({"buffer_type": "memory"})))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ Tests the thread-safe buffer implementation, including memory buffer,
 rate-limited buffer, and batching buffer.
 """
 
+import json
 import threading
 import time
 import unittest
@@ -15,10 +16,13 @@ from atlas.services.buffer import (
     BatchingBuffer,
     MemoryBuffer,
     RateLimitedBuffer,
+    RingBuffer,
     create_buffer,
+    estimate_size,
     is_batching_buffer,
     is_memory_buffer,
     is_rate_limited_buffer,
+    is_ring_buffer,
 )
 
 
@@ -229,6 +233,73 @@ class TestMemoryBuffer(unittest.TestCase):
         self.assertTrue(self.buffer.is_closed())
 
 
+class TestFastMemoryBuffer(unittest.TestCase):
+    """Tests for MemoryBuffer in fast mode."""
+
+    def setUp(self):
+        """Set up a new fast buffer for each test."""
+        self.buffer = MemoryBuffer(max_size=10, fast=True)
+
+    def test_items_are_buffer_items(self):
+        """Test that stored records are returned as plain buffer items."""
+        self.assertTrue(self.buffer.is_fast)
+        self.buffer.push({"message": "first"})
+        self.buffer.push({"message": "second"})
+
+        peeked = self.buffer.peek()
+        first = self.buffer.pop()
+        second = self.buffer.pop()
+        self.assertIs(type(first), dict)
+        self.assertEqual(peeked, first)
+        self.assertEqual(first["data"]["message"], "first")
+        self.assertEqual(first["metadata"], {})
+        self.assertIsInstance(first["item_id"], str)
+        self.assertNotEqual(first["item_id"], second["item_id"])
+        self.assertLessEqual(first["timestamp"], second["timestamp"])
+        self.assertEqual(set(first), {"item_id", "timestamp", "data", "metadata"})
+
+        # Consumers may modify and serialize the items they get
+        first["metadata"]["seen"] = True
+        self.assertEqual(json.loads(json.dumps(first))["metadata"], {"seen": True})
+
+    def test_payload_type_is_checked(self):
+        """Test that non-dict payloads are rejected without schema validation."""
+        with patch("atlas.services.buffer.buffer_item_schema.load") as load:
+            with self.assertRaises(BufferError):
+                self.buffer.push(["not", "a", "dict"])
+            self.assertTrue(self.buffer.push({"message": "test"}))
+            load.assert_not_called()
+
+    def test_debug_mode_validates(self):
+        """Test that debug mode runs schema validation in fast mode."""
+        buffer = MemoryBuffer(max_size=10, fast=True, debug=True)
+        with patch(
+            "atlas.services.buffer.buffer_item_schema.load",
+            side_effect=ValueError("invalid"),
+        ):
+            with self.assertRaises(BufferError):
+                buffer.push({"message": "test"})
+        self.assertTrue(buffer.is_empty)
+
+    def test_batches_of_records(self):
+        """Test that batching buffers combine records like regular items."""
+        buffer = BatchingBuffer(max_size=10, batch_size=2, batch_delimiter=" ", fast=True)
+        buffer.push({"text": "hello"})
+        buffer.push({"text": "world"})
+
+        batch = buffer.pop()
+        self.assertEqual(batch["data"]["text"], "hello world")
+        self.assertEqual(
+            [item["item_id"] for item in batch["metadata"]["original_items"]], ["0", "1"]
+        )
+
+    def test_create_fast_buffer(self):
+        """Test that create_buffer passes the fast mode through."""
+        buffer = create_buffer({"buffer_type": "memory", "max_size": 100, "fast": True})
+        self.assertTrue(buffer.is_fast)
+        self.assertFalse(create_buffer({}).is_fast)
+
+
 class TestRateLimitedBuffer(unittest.TestCase):
     """Tests for the RateLimitedBuffer class."""
 
@@ -317,7 +388,7 @@ class TestRateLimitedBuffer(unittest.TestCase):
 
         # Set a non-zero last_push_time to simulate a previous push
         with rate_limited._lock:
-            rate_limited._last_push_time = time.time() - 0.1  # 100ms ago
+            rate_limited._last_push_time = time.monotonic() - 0.1  # 100ms ago
 
         # Create a test item that's small enough to succeed with our initial budget
         small_item = {"x": "y"}  # Very small
@@ -346,7 +417,7 @@ class TestRateLimitedBuffer(unittest.TestCase):
         )
 
         # Set up controlled timing values
-        controlled_start_time = time.time() - 2.0  # 2 seconds ago
+        controlled_start_time = time.monotonic() - 2.0  # 2 seconds ago
         with test_buffer._lock:
             test_buffer._token_budget = 10.0  # Start with 10 tokens
             test_buffer._last_push_time = controlled_start_time
@@ -419,6 +490,59 @@ class TestRateLimitedBuffer(unittest.TestCase):
         # Larger item should have higher token cost
         self.assertGreater(large_cost, small_cost)
 
+    def test_token_cost_from_payload_lengths(self):
+        """Test that costs follow the payload lengths and can be supplied by the caller."""
+        buffer = RateLimitedBuffer(
+            max_size=10, tokens_per_second=10.0, chars_per_token=4, initial_token_budget=5.0
+        )
+        # Eight bytes of entry overhead plus the key and value lengths
+        self.assertEqual(buffer._calculate_token_cost({"message": "x" * 41}), 14.0)
+
+        self.assertFalse(buffer.push({"message": "x" * 41}))
+        self.assertTrue(buffer.push({"message": "x" * 41}, cost=1.0))
+        self.assertAlmostEqual(buffer.token_budget, 4.0, places=1)
+
+    def test_blocking_push(self):
+        """Test that a push with a timeout sleeps until enough tokens accrue."""
+        buffer = RateLimitedBuffer(
+            max_size=10, tokens_per_second=100.0, initial_token_budget=0.0
+        )
+        self.assertFalse(buffer.push({"message": "x"}, cost=5.0))
+
+        start = time.monotonic()
+        self.assertTrue(buffer.push({"message": "x"}, timeout=2.0, cost=5.0))
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+        self.assertFalse(buffer.push({"message": "x"}, timeout=0.01, cost=100.0))
+
+        with self.assertRaises(BufferError):
+            buffer.push({"message": "x"}, timeout=None, cost=500.0)
+
+    def test_metrics(self):
+        """Test that metrics report the rate, budget and spent tokens."""
+        buffer = RateLimitedBuffer(
+            max_size=10, tokens_per_second=10.0, initial_token_budget=3.0
+        )
+        buffer.push({"message": "x"}, cost=2.0)
+        buffer.push({"message": "x"}, cost=2.0)
+
+        metrics = buffer.get_metrics()
+        self.assertEqual(metrics["tokens_per_second"], 10.0)
+        self.assertEqual(metrics["max_token_budget"], 20.0)
+        self.assertEqual(metrics["tokens_spent"], 2.0)
+        self.assertEqual(metrics["rate_limited_pushes"], 1)
+        self.assertLess(metrics["token_budget"], 2.0)
+        self.assertGreater(metrics["spend_rate"], 0.0)
+
+    def test_refill_ignores_wall_clock_jumps(self):
+        """Test that setting the system clock back neither drains nor stalls the bucket."""
+        buffer = RateLimitedBuffer(
+            max_size=10, tokens_per_second=10.0, initial_token_budget=5.0
+        )
+        with patch("time.time", return_value=0.0):
+            self.assertGreaterEqual(buffer.token_budget, 5.0)
+            self.assertTrue(buffer.push({"message": "x"}, cost=5.0))
+            self.assertGreaterEqual(buffer.get_metrics()["spend_rate"], 0.0)
+
 
 class TestBatchingBuffer(unittest.TestCase):
     """Tests for the BatchingBuffer class."""
@@ -491,6 +615,320 @@ class TestBatchingBuffer(unittest.TestCase):
         batch = self.buffer.pop()
         self.assertIsNotNone(batch)
 
+    def test_pop_batch(self):
+        """Test that pop_batch returns the batched items without merging them."""
+        self.assertEqual(self.buffer.pop_batch(), [])
+        for i in range(4):
+            self.buffer.push({"message": f"item{i}"})
+
+        batch = self.buffer.pop_batch()
+        self.assertEqual([item["data"]["message"] for item in batch], ["item0", "item1", "item2"])
+        self.assertEqual(self.buffer.size, 1)
+        self.assertEqual(self.buffer.pop_batch(), [])
+
+    def test_ready_delay(self):
+        """Test that the ready delay counts down the timeout of the pending batch."""
+        self.assertIsNone(self.buffer.ready_delay())
+        self.assertIsNone(MemoryBuffer(max_size=5).ready_delay())
+
+        self.buffer.push({"message": "item1"})
+        delay = self.buffer.ready_delay()
+        self.assertIsNotNone(delay)
+        self.assertGreater(delay, 0.0)
+        self.assertLessEqual(delay, 0.2)
+
+        time.sleep(0.25)
+        self.assertEqual(self.buffer.ready_delay(), 0.0)
+
+    def test_batch_timeout_ignores_wall_clock_jumps(self):
+        """Test that setting the system clock back does not hold pending items back."""
+        self.buffer.push({"message": "item"})
+        time.sleep(0.25)
+
+        with patch("time.time", return_value=0.0):
+            self.assertEqual(self.buffer.ready_delay(), 0.0)
+            self.assertTrue(self.buffer.wait_for_batch(timeout=0.1))
+            self.assertEqual(len(self.buffer.get_batch()), 1)
+
+    def test_get_batch_wakes_on_thresholds(self):
+        """Test that consumers are only woken when a batch starts or is complete."""
+        with patch.object(
+            self.buffer._not_empty, "notify_all", wraps=self.buffer._not_empty.notify_all
+        ) as notify_all:
+            for i in range(3):
+                self.buffer.push({"message": f"item{i}"})
+            self.assertEqual(notify_all.call_count, 2)
+
+        self.assertEqual(len(self.buffer.get_batch(timeout=0.01)), 3)
+
+        # A partial batch is returned once its timeout expires
+        self.buffer.push({"message": "late"})
+        start = time.monotonic()
+        batch = self.buffer.get_batch(timeout=2.0)
+        self.assertEqual([item["data"]["message"] for item in batch], ["late"])
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+        self.assertEqual(self.buffer.get_batch(timeout=0.01), [])
+
+
+class TestBlockingOperations(unittest.TestCase):
+    """Tests for the blocking put, get and get_many operations."""
+
+    def setUp(self):
+        """Set up a new buffer for each test."""
+        self.buffer = MemoryBuffer(max_size=2)
+
+    def run_later(self, delay, function, *args):
+        """Call a function from another thread after a delay."""
+        timer = threading.Timer(delay, function, args)
+        timer.start()
+        self.addCleanup(timer.join)
+
+    def test_get_waits_for_item(self):
+        """Test that get wakes up as soon as an item is pushed."""
+        self.run_later(0.05, self.buffer.push, {"message": "late"})
+
+        start = time.monotonic()
+        item = self.buffer.get(timeout=2.0)
+        self.assertEqual(item["data"]["message"], "late")
+        self.assertLess(time.monotonic() - start, 1.0)
+
+        # Timing out on an empty buffer returns None
+        self.assertIsNone(self.buffer.get(timeout=0.01))
+
+    def test_get_many(self):
+        """Test that get_many returns the available items up to a maximum."""
+        self.assertEqual(self.buffer.get_many(5, timeout=0.01), [])
+        self.buffer.push({"index": 0})
+        self.buffer.push({"index": 1})
+
+        items = self.buffer.get_many(5, timeout=0.01)
+        self.assertEqual([item["data"]["index"] for item in items], [0, 1])
+
+    def test_put_waits_for_space(self):
+        """Test that put blocks while the buffer is full."""
+        self.buffer.push({"index": 0})
+        self.buffer.push({"index": 1})
+        self.assertFalse(self.buffer.put({"index": 2}, timeout=0.01))
+
+        self.run_later(0.05, self.buffer.pop)
+        self.assertTrue(self.buffer.put({"index": 2}, timeout=2.0))
+        self.assertEqual(self.buffer.size, 2)
+
+    def test_put_waits_while_paused(self):
+        """Test that put waits for a paused buffer to resume."""
+        self.buffer.pause()
+        self.assertFalse(self.buffer.put({"index": 0}, timeout=0.01))
+
+        self.run_later(0.05, self.buffer.resume)
+        self.assertTrue(self.buffer.put({"index": 0}, timeout=2.0))
+
+    def test_close_wakes_waiters(self):
+        """Test that closing the buffer wakes blocked producers and consumers."""
+        self.run_later(0.05, self.buffer.close)
+        self.assertIsNone(self.buffer.get(timeout=2.0))
+
+        buffer = MemoryBuffer(max_size=1)
+        buffer.push({"index": 0})
+        self.run_later(0.05, buffer.close)
+        with self.assertRaises(ClosedBufferError):
+            buffer.put({"index": 1}, timeout=2.0)
+
+        # Remaining items can still be drained
+        self.assertEqual(buffer.get(timeout=0.01)["data"]["index"], 0)
+        self.assertIsNone(buffer.get(timeout=None))
+
+    def test_rate_limited_put_waits_for_tokens(self):
+        """Test that put sleeps until enough tokens accrue."""
+        buffer = RateLimitedBuffer(
+            max_size=10, tokens_per_second=100.0, chars_per_token=4, initial_token_budget=0.0
+        )
+        item = {"message": "x" * 40}
+        cost = buffer._calculate_token_cost(item)
+        self.assertFalse(buffer.push(item))
+
+        start = time.monotonic()
+        self.assertTrue(buffer.put(item, timeout=2.0))
+        self.assertGreaterEqual(time.monotonic() - start, cost / 100.0 * 0.8)
+
+        with self.assertRaises(BufferError):
+            buffer.put({"message": "x" * 1000})
+
+    def test_batching_get_waits_for_batch_timeout(self):
+        """Test that get returns a partial batch once it times out."""
+        buffer = BatchingBuffer(max_size=10, batch_size=3, batch_timeout=0.1)
+        buffer.push({"message": "item1"})
+
+        start = time.monotonic()
+        batch = buffer.get(timeout=2.0)
+        self.assertEqual(batch["data"]["message"], "item1")
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+
+class TestRingBuffer(unittest.TestCase):
+    """Tests for the single-producer single-consumer RingBuffer class."""
+
+    def setUp(self):
+        """Set up a new buffer for each test."""
+        self.buffer = RingBuffer(max_size=3)
+
+    def test_push_and_pop_wrap_around(self):
+        """Test that items keep their order as the indexes wrap around the slots."""
+        popped = []
+        for i in range(10):
+            self.assertTrue(self.buffer.push({"index": i}))
+            if self.buffer.size == 2:
+                popped.append(self.buffer.pop())
+        while not self.buffer.is_empty:
+            popped.append(self.buffer.pop())
+
+        self.assertEqual([item["data"]["index"] for item in popped], list(range(10)))
+        self.assertEqual([item["item_id"] for item in popped], [str(i) for i in range(10)])
+        self.assertIsNone(self.buffer.pop())
+
+    def test_full_and_paused(self):
+        """Test that pushes fail while the buffer is full or paused."""
+        for i in range(3):
+            self.buffer.push({"index": i})
+        self.assertTrue(self.buffer.is_full)
+        self.assertFalse(self.buffer.push({"index": 3}))
+        self.assertEqual(self.buffer.peek()["data"]["index"], 0)
+
+        self.buffer.clear()
+        self.assertEqual(self.buffer.size, 0)
+        self.buffer.pause()
+        self.assertFalse(self.buffer.push({"index": 4}))
+        self.buffer.resume()
+        self.assertTrue(self.buffer.push({"index": 4}))
+
+        with self.assertRaises(BufferError):
+            self.buffer.push("not a dict")
+
+    def test_close(self):
+        """Test that a closed buffer rejects pushes but can be drained."""
+        self.buffer.push({"index": 0})
+        self.buffer.close()
+        with self.assertRaises(ClosedBufferError):
+            self.buffer.push({"index": 1})
+
+        self.assertEqual(self.buffer.get(timeout=0.01)["data"]["index"], 0)
+        self.assertIsNone(self.buffer.get())
+
+    def test_producer_and_consumer_threads(self):
+        """Test that a producer and a consumer thread pass every item in order."""
+        count = 5000
+
+        def produce():
+            for i in range(count):
+                self.buffer.put({"index": i})
+            self.buffer.close()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        received = []
+        while True:
+            items = self.buffer.get_many(16, timeout=5.0)
+            if not items:
+                break
+            received.extend(item["data"]["index"] for item in items)
+        producer.join()
+
+        self.assertEqual(received, list(range(count)))
+
+    def test_create_ring_buffer(self):
+        """Test creating a ring buffer from configuration."""
+        buffer = create_buffer({"buffer_type": "ring"})
+        self.assertTrue(is_ring_buffer(buffer))
+        self.assertEqual(buffer.max_size, RingBuffer.DEFAULT_CAPACITY)
+        self.assertEqual(create_buffer({"buffer_type": "ring", "max_size": 8}).max_size, 8)
+        # The size is taken from the validated configuration
+        self.assertEqual(create_buffer({"buffer_type": "ring", "max_size": "16"}).max_size, 16)
+
+        for max_size in (0, "many"):
+            with self.subTest(max_size=max_size), self.assertRaises(BufferError):
+                create_buffer({"buffer_type": "ring", "max_size": max_size})
+        with self.assertRaises(BufferError):
+            create_buffer({"buffer_type": "ring", "asynchronous": True})
+
+
+def text(length):
+    """Build a payload with a text of the given length."""
+    return {"text": "x" * length}
+
+
+def text_size(item):
+    """Measure a payload by the length of its text."""
+    return len(item["text"])
+
+
+class TestByteAccounting(unittest.TestCase):
+    """Tests for bounding the estimated payload bytes with watermarks."""
+
+    def test_estimate_size(self):
+        """Test that payload estimates add up strings, bytes and container entries."""
+        self.assertEqual(estimate_size("abcd"), 4)
+        self.assertEqual(estimate_size(b"abcdef"), 6)
+        self.assertEqual(estimate_size(42), 8)
+        # Two entries with their overhead, keys and values
+        self.assertEqual(estimate_size({"text": "abc", "tags": ["a", "b"]}), 16 + 7 + 4 + 18)
+
+    def test_watermarks(self):
+        """Test that a buffer past its high watermark rejects pushes until drained."""
+        buffer = MemoryBuffer(max_size=100, max_bytes=100, low_watermark=40, sizer=text_size)
+        for _ in range(3):
+            self.assertTrue(buffer.push(text(30)))
+        self.assertEqual(buffer.size_bytes, 90)
+        self.assertFalse(buffer.is_full)
+
+        # Going past the high watermark throttles the buffer, even for small payloads
+        self.assertFalse(buffer.push(text(30)))
+        self.assertTrue(buffer.is_full)
+        self.assertFalse(buffer.push(text(1)))
+
+        buffer.pop()
+        self.assertEqual(buffer.size_bytes, 60)
+        self.assertFalse(buffer.push(text(1)))
+
+        # Draining to the low watermark lifts the throttling
+        buffer.pop()
+        self.assertFalse(buffer.is_full)
+        self.assertTrue(buffer.push(text(30)))
+        self.assertEqual(buffer.size_bytes, 60)
+
+    def test_oversized_payload(self):
+        """Test that an empty buffer accepts a payload larger than the high watermark."""
+        buffer = MemoryBuffer(max_bytes=10, fast=True)
+        self.assertTrue(buffer.push({"text": "x" * 100}))
+        self.assertTrue(buffer.is_full)
+        self.assertFalse(buffer.push({"text": ""}))
+
+        buffer.clear()
+        self.assertEqual(buffer.size_bytes, 0)
+        self.assertTrue(buffer.push({"text": ""}))
+
+    def test_put_waits_for_low_watermark(self):
+        """Test that put blocks until the buffer is drained to the low watermark."""
+        buffer = MemoryBuffer(max_bytes=100, low_watermark=0, sizer=text_size)
+        buffer.push(text(60))
+        buffer.push(text(30))
+        self.assertFalse(buffer.put(text(30), timeout=0.01))
+
+        buffer.pop()
+        self.assertFalse(buffer.put(text(30), timeout=0.01))
+        timer = threading.Timer(0.05, buffer.pop)
+        timer.start()
+        self.assertTrue(buffer.put(text(30), timeout=2.0))
+        timer.join()
+
+    def test_items_only(self):
+        """Test that payloads are not measured without a high watermark."""
+        buffer = MemoryBuffer(max_size=2, max_bytes=None, sizer=lambda item: 1 / 0)
+        self.assertTrue(buffer.push({"text": "x" * 1000}))
+        self.assertEqual(buffer.size_bytes, 0)
+        self.assertIsNone(buffer.low_watermark)
+
+        with self.assertRaises(ValueError):
+            MemoryBuffer(max_bytes=10, low_watermark=20)
+
 
 class TestBufferCreation(unittest.TestCase):
     """Tests for buffer creation and type checking functions."""
@@ -11,10 +11,12 @@ from unittest.mock import MagicMock
 
 from atlas.services.events import (
     EventError,
+    EventHistory,
     EventPublishError,
     EventSubscription,
     EventSubscriptionError,
     EventSystem,
+    SubscriptionIndex,
     create_event_system,
     emit_event,
     on_event,
@@ -151,6 +153,152 @@ class TestEventSubscription(unittest.TestCase):
             self.fail(f"notify() raised {e} unexpectedly!")
 
 
+class TestSubscriptionIndex(unittest.TestCase):
+    """Tests for the SubscriptionIndex class."""
+
+    PATTERNS = (
+        "*",
+        "test",
+        "test.event",
+        "test.*",
+        "test.ev*",
+        "te*",
+        "test.event.*",
+        "system.*.started",
+        "*.error",
+        "a+b.*",
+        "other.event",
+    )
+    EVENT_TYPES = (
+        "test",
+        "test.",
+        "test.event",
+        "test.events",
+        "test.event.sub",
+        "testing",
+        "system.agent.started",
+        "system.started",
+        "agent.error",
+        "a+b.c",
+        "aab.c",
+        "other",
+    )
+
+    def setUp(self):
+        """Set up an index with a subscription for each pattern."""
+        self.index = SubscriptionIndex()
+        self.subscriptions = [
+            EventSubscription(f"sub-{number}", pattern, MagicMock())
+            for number, pattern in enumerate(self.PATTERNS)
+        ]
+        for subscription in self.subscriptions:
+            self.index.add(subscription)
+
+    def test_match_agrees_with_patterns(self):
+        """Test that the index finds exactly the subscriptions whose pattern matches."""
+        for event_type in self.EVENT_TYPES:
+            with self.subTest(event_type=event_type):
+                expected = [sub for sub in self.subscriptions if sub.matches(event_type)]
+                self.assertEqual(list(self.index.match(event_type)), expected)
+
+    def test_cache_is_invalidated(self):
+        """Test that cached matches are updated when subscriptions change."""
+        before = self.index.match("test.event")
+        self.assertIs(self.index.match("test.event"), before)
+
+        removed = self.subscriptions[3]
+        self.index.remove(removed)
+        self.assertNotIn(removed, self.index.match("test.event"))
+        self.assertEqual(len(self.index), len(self.PATTERNS) - 1)
+
+        added = EventSubscription("sub-new", "test.*", MagicMock())
+        self.index.add(added)
+        self.assertEqual(self.index.match("test.event")[-1], added)
+
+    def test_remove_prunes_prefixes(self):
+        """Test that removing all prefix subscriptions leaves an empty trie."""
+        for subscription in self.subscriptions:
+            self.index.remove(subscription)
+
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index._prefixes.children, {})
+        self.assertEqual(self.index.match("test.event"), ())
+
+
+class TestEventHistory(unittest.TestCase):
+    """Tests for the EventHistory class."""
+
+    def setUp(self):
+        """Set up a history with events of two types from two sources."""
+        self.history = EventHistory(max_size=5)
+        for index in range(8):
+            self.history.append(
+                {
+                    "event_id": f"event-{index}",
+                    "event_type": "even" if index % 2 == 0 else "odd",
+                    "source": "first" if index < 6 else "second",
+                }
+            )
+
+    def ids(self, events):
+        """Get the IDs of a list of events."""
+        return [event["event_id"] for event in events]
+
+    def test_oldest_events_are_evicted(self):
+        """Test that the history keeps the newest events in every index."""
+        self.assertEqual(len(self.history), 5)
+        self.assertEqual(
+            self.ids(self.history.get_events()),
+            ["event-7", "event-6", "event-5", "event-4", "event-3"],
+        )
+        self.assertEqual(
+            self.ids(self.history.get_events(event_type="odd")), ["event-7", "event-5", "event-3"]
+        )
+        self.assertEqual(
+            self.ids(self.history.get_events(source="first")), ["event-5", "event-4", "event-3"]
+        )
+        self.assertIsNone(self.history.get_event("event-2"))
+        self.assertEqual(self.history.get_event("event-3")["event_id"], "event-3")
+
+    def test_filters_and_limit(self):
+        """Test combined filters and that the limit applies after filtering."""
+        self.assertEqual(
+            self.ids(self.history.get_events(event_type="even", source="second")), ["event-6"]
+        )
+        self.assertEqual(
+            self.ids(self.history.get_events(event_type="odd", source="first", limit=1)),
+            ["event-5"],
+        )
+        self.assertEqual(self.history.get_events(event_type="missing"), [])
+        self.assertEqual(self.ids(self.history.get_events(limit=2)), ["event-7", "event-6"])
+
+        self.history.clear()
+        self.assertEqual(len(self.history), 0)
+        self.assertEqual(self.history.get_events(source="first"), [])
+
+    def test_limit_edge_cases(self):
+        """Test that a zero limit returns every event and a negative one is rejected."""
+        self.assertEqual(len(self.history.get_events(limit=0)), 5)
+        self.assertEqual(len(self.history.get_events(limit=None)), 5)
+        self.assertEqual(len(self.history.get_events(source="second", limit=10)), 2)
+
+        for filters in ({}, {"event_type": "odd"}, {"event_type": "odd", "source": "first"}):
+            with self.subTest(filters=filters), self.assertRaises(ValueError):
+                self.history.get_events(limit=-1, **filters)
+
+    def test_unbounded_history(self):
+        """Test that a maximum size of 0 keeps every event and a negative one is rejected."""
+        history = EventHistory(max_size=0)
+        for index in range(3):
+            history.append({"event_id": f"event-{index}", "event_type": "test", "source": "s"})
+
+        self.assertEqual(len(history), 3)
+        self.assertEqual(self.ids(history.get_events()), ["event-2", "event-1", "event-0"])
+
+        with self.assertRaises(ValueError):
+            EventHistory(max_size=-1)
+
+
 class TestEventSystem(unittest.TestCase):
     """Tests for the EventSystem class."""
 
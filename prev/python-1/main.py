@@ -4,6 +4,7 @@ Atlas: Advanced Multi-Modal Learning & Guidance Framework
 Main entry point for the Atlas module.
 """
 
+import json
 import os
 import sys
 import time
@@ -86,7 +87,7 @@ def validate_provider_api_key(provider_name: str = "anthropic") -> bool:
 
 
 def ingest_documents(args: dict[str, Any]) -> bool:
-    """Ingest documents from the specified directory.
+    """Ingest documents from the specified directory or archive.
 
     Args:
         args: Command-line arguments as a dictionary
@@ -114,9 +115,44 @@ def ingest_documents(args: dict[str, Any]) -> bool:
     embedding_strategy = args.get("embedding", "default")
     enable_deduplication = not args.get("no_dedup", False)
     watch_mode = args.get("watch", False)
+    include_patterns = args.get("include")
+    exclude_patterns = args.get("exclude")
+    near_duplicate_distance = args.get("near_duplicates")
+    duplicate_action = args.get("duplicate_action", "reuse")
+    resume = args.get("resume", False)
+    chunk_token_budget = args.get("chunk_tokens")
+    token_estimator = args.get("token_estimator", "auto")
+
+    # Process an archive, a directory or the default directories
+    if args.get("archive"):
+        if watch_mode:
+            logger.error("Watch mode is not supported for archives")
+            return False
+
+        logger.info(f"Ingesting documents from archive {args['archive']}")
+        logger.info(f"Using ChromaDB at: {db_path}")
+        logger.info(f"Embedding strategy: {embedding_strategy}")
+
+        processor = DocumentProcessor(
+            anthropic_api_key=anthropic_api_key,
+            collection_name=args.get("collection", "atlas_knowledge_base"),
+            db_path=db_path,
+            enable_deduplication=enable_deduplication,
+            embedding_strategy=embedding_strategy,
+            include_patterns=include_patterns,
+            exclude_patterns=exclude_patterns,
+            near_duplicate_distance=near_duplicate_distance,
+            duplicate_action=duplicate_action,
+            chunk_token_budget=chunk_token_budget,
+            token_estimator=token_estimator,
+        )
 
-    # Process directory or default directories
-    if not args.get("directory"):
+        try:
+            processor.process_archive(args["archive"])
+        except ValueError as e:
+            logger.error(str(e))
+            return False
+    elif not args.get("directory"):
         # Use default directories if none specified
         default_dirs = [
             "./src-markdown/prev/v1",
@@ -140,12 +176,20 @@ def ingest_documents(args: dict[str, Any]) -> bool:
             db_path=db_path,
             enable_deduplication=enable_deduplication,
             embedding_strategy=embedding_strategy,
+            include_patterns=include_patterns,
+            exclude_patterns=exclude_patterns,
+            near_duplicate_distance=near_duplicate_distance,
+            duplicate_action=duplicate_action,
+            chunk_token_budget=chunk_token_budget,
+            token_estimator=token_estimator,
         )
 
         for dir_path in default_dirs:
             if os.path.exists(dir_path):
                 logger.info(f"Ingesting documents from {dir_path}")
-                processor.process_directory(dir_path, recursive=args.get("recursive", True))
+                processor.process_directory(
+                    dir_path, recursive=args.get("recursive", True), resume=resume
+                )
             else:
                 logger.warning(f"Directory not found: {dir_path}")
     else:
@@ -165,6 +209,13 @@ def ingest_documents(args: dict[str, Any]) -> bool:
                     db_path=db_path,
                     recursive=args.get("recursive", True),
                     enable_deduplication=enable_deduplication,
+                    include_patterns=include_patterns,
+                    exclude_patterns=exclude_patterns,
+                    near_duplicate_distance=near_duplicate_distance,
+                    duplicate_action=duplicate_action,
+                    resume=resume,
+                    chunk_token_budget=chunk_token_budget,
+                    token_estimator=token_estimator,
                 )
 
                 # Keep process running until interrupted
@@ -187,9 +238,20 @@ def ingest_documents(args: dict[str, Any]) -> bool:
                 db_path=db_path,
                 enable_deduplication=enable_deduplication,
                 embedding_strategy=embedding_strategy,
+                include_patterns=include_patterns,
+                exclude_patterns=exclude_patterns,
+                near_duplicate_distance=near_duplicate_distance,
+                duplicate_action=duplicate_action,
+                chunk_token_budget=chunk_token_budget,
+                token_estimator=token_estimator,
+            )
+
+            processor.process_directory(
+                args["directory"], recursive=args.get("recursive", True), resume=resume
             )
 
-            processor.process_directory(args["directory"], recursive=args.get("recursive", True))
+    if args.get("metrics"):
+        print(json.dumps(processor.get_ingestion_metrics(), indent=2))
 
     return True
 